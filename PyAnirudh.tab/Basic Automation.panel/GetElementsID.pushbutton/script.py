@@ -1,48 +1,78 @@
 # -*- coding: utf-8 -*-
 
 __title__ = "Get Elements ID"
-__doc__ = """Version = 1.0
+__doc__ = """Version = 2.0
 Description:
-Retrieve Element ID, Name and Category
+Inspect the selection: counts per Category / Family / Type in the output window,
+and a sortable table of every element with Id, Category, Family, Type and Name.
+Export the table to CSV or XLSX.
 _____________________________________________________________________
 How-to:
--> Select the Element 
+-> Select the Element
 -> Click on the button """
 
 #⬇️ IMPORTS
+import os
+import clr
+clr.AddReference("PresentationCore")
+clr.AddReference("PresentationFramework")
+clr.AddReference("WindowsBase")
+clr.AddReference("System.Xml")
+
 from Autodesk.Revit.DB import *
 from Autodesk.Revit.UI import TaskDialog
+from System.Windows.Markup import XamlReader
+from System.Collections.Generic import List
+from System.Xml import XmlReader
+from System.IO import StringReader
+from pyrevit import script, forms
+from Snippets._inspector import INSPECTOR_COLUMNS, inspect_elements, write_csv
+from Snippets._excel import write_excel_file
+from Snippets._trace import start_trace
 
 #📦 VARIABLES
 uidoc = __revit__.ActiveUIDocument
 doc = uidoc.Document
+output = script.get_output()
+tracer = start_trace(__title__)  # Off unless PYANIRUDH_TRACE is set
 
 #🎯 MAIN
 selected_element_ids = uidoc.Selection.GetElementIds()
 
 if not selected_element_ids:
     TaskDialog.Show("Selected Elements", "No elements selected.")
-else:
-    selected_elements = [doc.GetElement(eid) for eid in selected_element_ids]
-
-    display_info = []
-    for e in selected_elements:
-        try:
-            name = ""
-            if hasattr(e, "Name"):
-                name = e.Name
-            elif e.GetType():
-                name = e.GetType().Name
-
-            category = e.Category.Name if e.Category else "No Category"
-            element_id = e.Id.IntegerValue
-
-            display_info.append("ID: {}, Name: {}, Category: {}".format(element_id, name, category))
-        except Exception as ex:
-            display_info.append("ID: {}, Error: {}".format(e.Id, str(ex)))
-
-    # Final output
-    if display_info:
-        TaskDialog.Show("Selected Elements", "\n".join(display_info))
-    else:
-        TaskDialog.Show("Selected Elements", "No valid information to display.")
+    script.exit()
+
+rows, summary = inspect_elements(doc, selected_element_ids)
+
+# Summary: one line per Category / Family / Type
+output.print_md("### Selection: {} element(s), {} group(s)".format(len(rows), len(summary)))
+output.print_table(table_data=[[category, family, type_name, count] for (category, family, type_name), count in summary.items()],
+                   columns=["Category", "Family", "Type", "Count"])
+
+# Detail table
+xaml_path = os.path.join(os.path.dirname(__file__), 'Inspector.xaml')
+with open(xaml_path, 'r') as f:
+    xaml_str = f.read()
+window = XamlReader.Load(XmlReader.Create(StringReader(xaml_str)))
+
+window.FindName('txtSummary').Text = "{} element(s) in {} Category / Family / Type group(s)".format(len(rows), len(summary))
+window.FindName('dataGrid').ItemsSource = List[object](rows)
+
+
+def export(extension, writer):
+    path = forms.save_file(file_ext=extension, default_name="selection")
+    if not path:
+        return
+    try:
+        count = writer(path, INSPECTOR_COLUMNS, (row.values() for row in rows))
+        output.print_md("✅ **Exported {} row(s):** `{}`".format(count, path))
+    except Exception as e:
+        forms.alert("Export failed:\n{}".format(e))
+
+
+window.FindName('btnExportCsv').Click  += lambda s, a: export("csv", write_csv)
+window.FindName('btnExportXlsx').Click += lambda s, a: export("xlsx", write_excel_file)
+window.FindName('btnClose').Click      += lambda s, a: window.Close()
+window.ShowDialog()
+tracer.finish(output)
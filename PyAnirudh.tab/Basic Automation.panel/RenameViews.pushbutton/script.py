@@ -1,25 +1,34 @@
 # -*- coding: utf-8 -*-
 __title__ = "Rename Views"
-__doc__ = """Version = 1.0
+__doc__ = """Version = 2.0
 Date    = 31.07.2024
 _____________________________________________________________________
 Description:
-Rename Views in Revit by using Find/Replace Logic.
+Rename Views, Sheets, Families, Types or Levels with Find/Replace rules.
+Find can be a regular expression, Replace can use capture groups (\\1, \\g<name>)
+and tokens: {name} {level} {scale} {sheet_number} {view_type} {family}
+Rule chains can be loaded from a JSON file:
+{"prefix": "", "suffix": "", "rules": [{"find": "^Level (\\\\d+)", "replace": "L\\\\1", "regex": true}]}
 _____________________________________________________________________
 How-to:
 -> Click on the button
--> Select Views
--> Define Renaming Rules
--> Rename Views
+-> Select what to rename (selected views in Project Browser are used directly)
+-> Define Renaming Rules or load a rules file
+-> Check the preview and confirm
+Every batch is written to a rename journal - undo it later with Revert Rename.
 _____________________________________________________________________ """
 
 #⬇️ IMPORTS
 #------------------------------
 # Regular + Autodesk
+import re
 from Autodesk.Revit.DB import *
 
 # pyRevit
-from pyrevit import revit, forms
+from pyrevit import revit, forms, script
+from Snippets._rename import (RENAME_TARGETS, TOKENS, RuleChain, RenameRule, load_rename_rules,
+                              get_name, set_name, write_names, journal_entries, RenameJournal)
+from Snippets._trace import start_trace, span, TRANSACTION
 
 # .NET Imports (You often need List import)
 import clr
@@ -31,84 +40,127 @@ from System.Collections.Generic import List
 
 #📦 VARIABLES
 #------------------------------
-doc   = __revit__.ActiveUIDocument.Document
-uidoc = __revit__.ActiveUIDocument
-app   = __revit__.Application
+doc    = __revit__.ActiveUIDocument.Document
+uidoc  = __revit__.ActiveUIDocument
+app    = __revit__.Application
+output = script.get_output()
+tracer = start_trace(__title__)  # Off unless PYANIRUDH_TRACE is set
 
 
 
 #🎯 MAIN
 
-#1️⃣ Select Views
+#1️⃣ Select Elements
 
 #Get Views - Selected in Project Browser
 selected_ids = uidoc.Selection.GetElementIds()
 selected_elements = [doc.GetElement(eid) for eid in selected_ids]
-selected_views = [elem for elem in selected_elements if issubclass(type(elem), View)]
-
-# If None Selected - Prompt SelectViews from pyrevit.forms
-if not selected_views:
-    selected_views = forms.select_views()
-
-# Ensure Views Selected
-if not selected_views:
-    forms.alert('No Views Selected. Try Again', exitscript=True)
-
-
-# #2️⃣🅰️ Define Renaming Rules
-# prefix  = 'pre-'
-# find    = 'Level'
-# replace = 'A'
-# suffix  = '-suf'
-
-#2️⃣🅱️ Define Renaming Rules in Dynamic Way (UI Form)
-from rpw.ui.forms import (FlexForm, Label, TextBox, Separator, Button)
-components = [Label('Prefix:'),  TextBox('prefix'),
-              Label('Find:'),    TextBox('find'),
-              Label('Replace:'), TextBox('replace'),
-              Label('Suffix:'),  TextBox('suffix'),
-              Separator(),       Button('Rename Views')]
-
-# Show the form
-form = FlexForm('Title', components)
-form.show()
-
-# Check if form was cancelled or closed
-if not form.values:
-    alert('Form was cancelled or closed. Please try again.', title='No Input', exitscript=True)
-
-# Extract inputs
-user_inputs = form.values #type: dict
-prefix  = user_inputs.get('prefix', '')   # Default to empty string if not filled
-find    = user_inputs.get('find', '')
-replace = user_inputs.get('replace', '')
-suffix  = user_inputs.get('suffix', '')
-
-# If all fields are empty, exit the script
-if not any([prefix, find, replace, suffix]):
-    alert('All input fields are empty. Please enter at least one value.', title='No Rename Rules', exitscript=True)
-
-# Start Transaction to make changes in project
-
-t = Transaction(doc, 'A-Rename Views')
-t.Start()
-
-for view in selected_views:
-
-    #3️⃣ Create new view line
-    old_name= view.Name
-    new_name= prefix + old_name.replace(find,replace) + suffix
-
-    #4️⃣ Rename Views (Unique Name)
-    for i in range(20):
-        try:
-            view.Name = new_name
-            print('{} -> {}'.format(old_name, new_name))
-            break
-        except:
-            new_name += '*'
-
-t.Commit()
-
-print ('Done')
-
+selected_views = [elem for elem in selected_elements if issubclass(type(elem), View) and not isinstance(elem, ViewSheet)]
+
+if selected_views:
+    target   = RENAME_TARGETS["Views"]
+    elements = selected_views
+else:
+    target_name = forms.CommandSwitchWindow.show(list(RENAME_TARGETS), message="Rename:")
+    if not target_name:
+        script.exit()
+    target = RENAME_TARGETS[target_name]
+
+    # If None Selected - Prompt Select from pyrevit.forms
+    if target_name == "Views":
+        elements = forms.select_views()
+    elif target_name == "Sheets":
+        elements = forms.select_sheets()
+    else:
+        by_label = {}
+        for elem in target.collect(doc):
+            label = get_name(elem)
+            if target_name == "Types":
+                label = "{}: {}".format(elem.FamilyName, label)
+            by_label.setdefault(label, []).append(elem)
+        labels = forms.SelectFromList.show(sorted(by_label), title="Select {}".format(target_name),
+                                           button_name="Next", multiselect=True)
+        elements = [elem for label in labels or [] for elem in by_label[label]]
+
+# Ensure Elements Selected
+if not elements:
+    forms.alert('Nothing Selected. Try Again', exitscript=True)
+
+
+#2️⃣ Define Renaming Rules in Dynamic Way (UI Form) or from a rules file
+source = forms.CommandSwitchWindow.show(["Find / Replace", "Load Rules File"], message="Renaming rules:")
+if not source:
+    script.exit()
+
+try:
+    if source == "Load Rules File":
+        rules_path = forms.pick_file(file_ext="json")
+        if not rules_path:
+            script.exit()
+        chain = load_rename_rules(rules_path)
+    else:
+        from rpw.ui.forms import (FlexForm, Label, TextBox, CheckBox, Separator, Button)
+        components = [Label('Prefix:'),  TextBox('prefix'),
+                      Label('Find:'),    TextBox('find'),
+                      Label('Replace:'), TextBox('replace'),
+                      Label('Suffix:'),  TextBox('suffix'),
+                      CheckBox('regex', 'Regular expression'),
+                      CheckBox('ignore_case', 'Ignore case'),
+                      Label('Tokens: ' + ' '.join(TOKENS)),
+                      Separator(),       Button('Preview')]
+
+        # Show the form
+        form = FlexForm('Rename {}'.format(target.label), components)
+        form.show()
+
+        # Check if form was cancelled or closed
+        if not form.values:
+            alert('Form was cancelled or closed. Please try again.', title='No Input', exitscript=True)
+
+        # Extract inputs
+        user_inputs = form.values #type: dict
+        prefix  = user_inputs.get('prefix', '')   # Default to empty string if not filled
+        find    = user_inputs.get('find', '')
+        replace = user_inputs.get('replace', '')
+        suffix  = user_inputs.get('suffix', '')
+
+        # If all fields are empty, exit the script
+        if not any([prefix, find, replace, suffix]):
+            alert('All input fields are empty. Please enter at least one value.', title='No Rename Rules', exitscript=True)
+
+        rules = [RenameRule(find, replace, user_inputs.get('regex', False), user_inputs.get('ignore_case', False))] if find else []
+        chain = RuleChain(rules, prefix, suffix)
+except (re.error, ValueError, KeyError) as e:
+    alert('Invalid renaming rules:\n{}'.format(e), title='Rename', exitscript=True)
+
+
+#3️⃣ Preview: all new names are computed in memory (collisions get a " (2)" suffix)
+plan = target.plan(doc, chain.preview(doc, elements))
+
+if not plan:
+    alert('Rules do not change any of the selected names.', title='Nothing to Rename', exitscript=True)
+
+output.print_md('### Rename {}: {} of {} change'.format(target.label, len(plan), len(elements)))
+output.print_table(table_data=[[old_name, new_name] for _, _, old_name, new_name in plan],
+                   columns=['Before', 'After'])
+
+if not forms.alert('Rename {} {}? See the preview in the output window.'.format(len(plan), target.label.lower()),
+                   yes=True, no=True):
+    script.exit()
+
+
+#4️⃣ Rename in one pass
+with span('A-Rename {}'.format(target.label), TRANSACTION, names=len(plan)):
+    t = Transaction(doc, 'A-Rename {}'.format(target.label))
+    t.Start()
+    errors = write_names(plan, set_name)
+    t.Commit()
+
+for elem, current, new_name, message in errors:
+    print('❌ {} -> {}: {}'.format(current, new_name, message))
+
+#5️⃣ Journal the batch so it can be reverted after save/sync
+batch = RenameJournal(doc).append(target.label, journal_entries(plan, errors))
+
+print ('Done: {} renamed (rename batch #{})'.format(len(plan) - len(errors), batch))
+tracer.finish(output)
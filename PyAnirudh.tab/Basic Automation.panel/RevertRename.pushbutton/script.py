@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+__title__ = "Revert Rename"
+__doc__ = """Version = 1.0
+Date    = 19.10.2026
+_____________________________________________________________________
+Description:
+Reverts a batch from the rename journal written by Rename Views.
+Works after save and sync, when the Revit undo stack is gone.
+Elements deleted or renamed again since the batch are skipped and listed.
+Old names taken by other elements in the meantime get a " (2)" suffix.
+_____________________________________________________________________
+How-to:
+-> Click on the button
+-> Pick a rename batch
+-> Check the preview and confirm
+_____________________________________________________________________ """
+
+#⬇️ IMPORTS
+#------------------------------
+from Autodesk.Revit.DB import *
+from pyrevit import revit, forms, script
+from Snippets._rename import RenameJournal, plan_revert, set_name, write_names, journal_entries
+from Snippets._trace import start_trace, span, TRANSACTION
+
+
+#📦 VARIABLES
+#------------------------------
+doc    = __revit__.ActiveUIDocument.Document
+output = script.get_output()
+tracer = start_trace(__title__)  # Off unless PYANIRUDH_TRACE is set
+
+
+
+#🎯 MAIN
+
+#1️⃣ Pick a Batch (newest first)
+journal = RenameJournal(doc)
+if not journal.batches:
+    forms.alert('No rename batches recorded for this model.', exitscript=True)
+
+options = {}
+for info in reversed(journal.batches):
+    label = '#{batch}  {time}  {target}: {count} name(s)'.format(**info)
+    if info.get("reverts"):
+        label += '  (revert of #{})'.format(info["reverts"])
+    if info.get("reverted_by"):
+        label += '  [reverted by #{}]'.format(info["reverted_by"])
+    options[label] = info["batch"]
+
+selected = forms.SelectFromList.show(sorted(options, key=lambda l: -options[l]), title='Revert Rename Batch',
+                                     button_name='Preview', multiselect=False)
+if not selected:
+    script.exit()
+batch = options[selected]
+
+
+#2️⃣ Preview
+plan, conflicts = plan_revert(doc, journal, batch)
+
+output.print_md('### Revert rename batch #{}: {} name(s)'.format(batch, len(plan)))
+if plan:
+    output.print_table(table_data=[[current, old_name] for _, _, current, old_name in plan],
+                       columns=['Current', 'Reverted'])
+if conflicts:
+    output.print_md('#### ⚠️ {} conflict(s) skipped'.format(len(conflicts)))
+    output.print_table(table_data=[[old_name, new_name, reason] for _, old_name, new_name, reason in conflicts],
+                       columns=['Old Name', 'Renamed To', 'Reason'])
+
+if not plan:
+    forms.alert('Nothing to revert in batch #{}.'.format(batch), exitscript=True)
+if not forms.alert('Revert {} name(s) of batch #{}?'.format(len(plan), batch), yes=True, no=True):
+    script.exit()
+
+
+#3️⃣ Revert in one Transaction and journal the revert itself
+with span('A-Revert Rename #{}'.format(batch), TRANSACTION, names=len(plan)):
+    t = Transaction(doc, 'A-Revert Rename #{}'.format(batch))
+    t.Start()
+    errors = write_names(plan, set_name)
+    t.Commit()
+
+for elem, current, old_name, message in errors:
+    print('❌ {} -> {}: {}'.format(current, old_name, message))
+
+revert_batch = journal.append(journal.get(batch)["target"], journal_entries(plan, errors),
+                              label="Revert #{}".format(batch), reverts=batch)
+
+print ('Done: {} reverted (rename batch #{})'.format(len(plan) - len(errors), revert_batch))
+tracer.finish(output)
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+__title__ = "Color By Parameter"
+__author__ = "Anirudh"
+__doc__ = """Colors elements in the active view by the value of a parameter.
+Text/enum values get distinct palette colors, numeric values get a gradient.
+Elements are grouped by value, so there is one override setting per color instead of one per element.
+Reset with Reset Graphic Overrides > Recorded Overrides."""
+
+from Autodesk.Revit.DB import *
+from pyrevit import revit, script, forms
+from Snippets._heatmap import bucket_elements, apply_buckets
+from Snippets._overrides import OverrideRegistry
+from Snippets._trace import start_trace, span, TRANSACTION
+
+doc = revit.doc
+uidoc = revit.uidoc
+view = uidoc.ActiveView
+output = script.get_output()
+tracer = start_trace(__title__)  # Off unless PYANIRUDH_TRACE is set
+
+if not view.CanBePrinted:
+    script.exit("Please open a printable view (not a schedule, legend, or sheet).")
+
+# Model elements in the view, grouped by category
+elements_by_category = {}
+with span("Collect view elements"):
+    for elem in FilteredElementCollector(doc, view.Id).WhereElementIsNotElementType():
+        cat = elem.Category
+        if cat and cat.CategoryType == CategoryType.Model and elem.CanBeHidden(view):
+            elements_by_category.setdefault(cat.Name, []).append(elem)
+
+if not elements_by_category:
+    forms.alert("No model elements found in the active view.", exitscript=True)
+
+categories = forms.SelectFromList.show(sorted(elements_by_category), title="Select Categories",
+                                       button_name="Next", multiselect=True)
+if not categories:
+    script.exit()
+elements = [elem for cat in categories for elem in elements_by_category[cat]]
+
+# Parameter names from one element per category (instance + type)
+param_names = set()
+for cat in categories:
+    sample = elements_by_category[cat][0]
+    param_names.update(p.Definition.Name for p in sample.Parameters)
+    sample_type = doc.GetElement(sample.GetTypeId())
+    if sample_type:
+        param_names.update(p.Definition.Name for p in sample_type.Parameters)
+
+param_name = forms.SelectFromList.show(sorted(param_names), title="Color By Parameter",
+                                       button_name="Apply", multiselect=False)
+if not param_name:
+    script.exit()
+
+buckets = bucket_elements(doc, elements, param_name)
+registry = OverrideRegistry(doc)
+
+with span("Color By Parameter", TRANSACTION, elements=len(elements)):
+    t = Transaction(doc, "Color By Parameter: {}".format(param_name))
+    t.Start()
+    try:
+        overridden = apply_buckets(doc, view, buckets)
+        registry.record(view, overridden)
+        t.Commit()
+    except Exception as e:
+        t.RollBack()
+        forms.alert("Color By Parameter failed and was rolled back:\n{}".format(e), exitscript=True)
+registry.save()
+
+# Legend
+output.print_md("### {} ({} values, {} elements)".format(param_name, len(buckets), len(overridden)))
+output.print_table(table_data=[['<span style="background-color:rgb({},{},{})">&nbsp;&nbsp;&nbsp;&nbsp;</span>'.format(*b.rgb),
+                                b.label, len(b.element_ids)] for b in buckets],
+                   columns=["Color", "Value", "Elements"])
+tracer.finish(output)
@@ -1,180 +1,135 @@
 # -*- coding: utf-8 -*-
 __title__ = "Auto Graphic Overrides"
 __author__ = "Anirudh"
-__doc__ = "Applies graphic overrides to non-structural walls and all windows in the active view."
+__doc__ = """Applies graphic overrides to non-structural walls and all windows in the active view.
+Element Overrides: overrides every element individually.
+Batch: same as Element Overrides across picked views, sheets or views using picked view templates.
+View Filter: applies the same overrides through View Filters (one override per view, covers new elements too)."""
 
 from Autodesk.Revit.DB import *
 from pyrevit import revit, DB
-from pyrevit import script
-from System.Drawing import Color
+from pyrevit import script, forms, EXEC_PARAMS
+from Snippets._overrides import (TARGET_CATEGORIES, StructuralWallClassifier, build_override_settings,
+                                 apply_element_overrides, get_or_create_override_filters, apply_filter_overrides,
+                                 OverrideRegistry)
+from Snippets._runlog import RunLog, level_from_name, DEBUG
+from Snippets._snapshot import SnapshotStore, capture_view_overrides
+from Snippets._trace import start_trace, span, TRANSACTION
 
 doc = revit.doc
 uidoc = revit.uidoc
 view = uidoc.ActiveView
+output = script.get_output()
+tracer = start_trace(__title__)  # Off unless PYANIRUDH_TRACE is set
 
-if not view.CanBePrinted:
-    script.exit("Please open a printable view (not a schedule, legend, or sheet).")
-
-print("Active view: {0} (Type: {1})".format(view.Name, view.ViewType))
+# Log level: Shift+Click for debug output, otherwise "log_level" from the script config (summary/normal/debug)
+log_level = DEBUG if EXEC_PARAMS.config_mode else level_from_name(script.get_config().get_option("log_level", "summary"))
+log = RunLog(doc, level=log_level)
 
-t = Transaction(doc, "Auto Graphic Overrides")
-t.Start()
+# Snapshot of the view before its first run, restorable with View Snapshot.
+# Later runs keep it - delete it in View Snapshot to capture a new one.
+SNAPSHOT_NAME = "Before Auto Graphic Overrides"
 
 # Categories to process
-target_categories = [
-    BuiltInCategory.OST_Walls,
-    BuiltInCategory.OST_Doors,
-    BuiltInCategory.OST_Windows,
-    BuiltInCategory.OST_GenericModel,
-    BuiltInCategory.OST_MechanicalEquipment,
-    BuiltInCategory.OST_PlumbingFixtures,
-    BuiltInCategory.OST_ElectricalFixtures,
-    BuiltInCategory.OST_LightingFixtures
-]
+target_categories = TARGET_CATEGORIES
 
 # Graphic override settings
-gray = Color.FromArgb(180, 180, 180)
-revit_color = DB.Color(gray.R, gray.G, gray.B)
-
-override_settings = OverrideGraphicSettings()
-override_settings.SetProjectionLineColor(revit_color)
-override_settings.SetProjectionLineWeight(1)
-override_settings.SetSurfaceTransparency(60)
-
-# Helper function to check if a wall is structural
-def is_structural_wall(wall):
-    try:
-        wall_type = doc.GetElement(wall.GetTypeId())
-        if not wall_type:
-            print("No wall type found for wall ID={0}".format(wall.Id.IntegerValue))
-            return True  # Conservatively assume structural if type is missing
-
-        # Get wall type name for debugging
-        type_name = wall_type.get_Parameter(BuiltInParameter.SYMBOL_NAME_PARAM).AsString() if wall_type.get_Parameter(BuiltInParameter.SYMBOL_NAME_PARAM) else "Unknown"
-
-        # Check Structural Checkbox (type-level)
-        struct_param = wall_type.get_Parameter(BuiltInParameter.WALL_STRUCTURAL_SIGNIFICANT)
-        is_structural_type = struct_param.AsInteger() == 1 if struct_param else False
-        struct_param_found = struct_param is not None
-
-        # Check Structural Checkbox (instance-level)
-        is_structural_instance = False
-        struct_instance_param = wall.get_Parameter(BuiltInParameter.WALL_STRUCTURAL_SIGNIFICANT)
-        if struct_instance_param:
-            is_structural_instance = struct_instance_param.AsInteger() == 1
-        else:
-            struct_instance_param = None
-
-        # Check Structural Usage
-        struct_usage_param = wall_type.get_Parameter(BuiltInParameter.WALL_STRUCTURAL_USAGE_PARAM)
-        struct_usage_value = struct_usage_param.AsInteger() if struct_usage_param else -1
-        struct_usage_name = {0: "Non-Bearing", 1: "Bearing", 2: "Shear", 3: "Structural Combined"}.get(struct_usage_value, "Unknown")
-
-        # Check Wall Function
-        function_param = wall_type.get_Parameter(BuiltInParameter.FUNCTION_PARAM)
-        function_value = function_param.AsInteger() if function_param else -1
-        function_name = {0: "Interior", 1: "Exterior", 2: "Foundation", 3: "Retaining", 4: "Soffit", 5: "Core-Shaft"}.get(function_value, "Unknown")
-
-        # Check Structural Material
-        has_struct_material = False
-        struct_material_param = wall_type.get_Parameter(BuiltInParameter.STRUCTURAL_MATERIAL_PARAM)
-        if struct_material_param and struct_material_param.HasValue:
-            material = doc.GetElement(struct_material_param.AsElementId())
-            has_struct_material = material is not None and any(mat in material.Name for mat in ["Concrete", "Steel"])  # Adjust material names as needed
-
-        # Debug: Print parameter values
-        print("Checking wall ID={0}, Type={1}, Structural (Type)={2}, Structural Param Found={3}, Structural (Instance)={4}, Structural Usage={5} ({6}), Wall Function={7} ({8}), Has Structural Material={9}".format(
-            wall.Id.IntegerValue, type_name, is_structural_type, struct_param_found, is_structural_instance, struct_usage_value, struct_usage_name, function_value, function_name, has_struct_material))
-
-        # Wall is structural if:
-        # - Structural checkbox is checked (instance-level, since type-level is not found)
-        # - Structural Usage is Bearing, Shear, or Structural Combined
-        # - Wall Function is Foundation or Retaining
-        # - Has a structural material
-        if is_structural_instance:
-            return True
-        if struct_usage_value in [1, 2, 3]:  # Bearing, Shear, or Structural Combined
-            return True
-        if function_value in [2, 3]:  # Foundation or Retaining
-            return True
-        if has_struct_material:
-            return True
-
-        return False
-    except Exception as e:
-        print("Error checking structural status for wall ID={0}: {1}".format(wall.Id.IntegerValue, e))
-        return True  # Conservatively assume structural on error
-
-# Collect structural walls to exclude
-structural_wall_ids = set()
-wall_elements = FilteredElementCollector(doc, view.Id).OfCategory(BuiltInCategory.OST_Walls).WhereElementIsNotElementType().ToElements()
-for wall in wall_elements:
-    if is_structural_wall(wall):
-        structural_wall_ids.add(wall.Id)
-        # Debug: Print structural wall info
-        wall_type = doc.GetElement(wall.GetTypeId())
-        type_name = wall_type.get_Parameter(BuiltInParameter.SYMBOL_NAME_PARAM).AsString() if wall_type and wall_type.get_Parameter(BuiltInParameter.SYMBOL_NAME_PARAM) else "Unknown"
-        print("Identified structural wall: ID={0}, Type={1}".format(wall.Id.IntegerValue, type_name))
-
-# Apply overrides
-for bic in target_categories:
-    try:
-        print("Processing category: {0}".format(bic.ToString()))
-        elems = FilteredElementCollector(doc, view.Id).OfCategory(bic).WhereElementIsNotElementType().ToElements()
-        print("Found {0} elements in category {1}".format(len(elems), bic.ToString()))
-
-        for elem in elems:
-            # Check visibility
-            if not elem.CanBeHidden(view):
-                elem_type = doc.GetElement(elem.GetTypeId())
-                elem_type_name = elem_type.get_Parameter(BuiltInParameter.SYMBOL_NAME_PARAM).AsString() if elem_type and elem_type.get_Parameter(BuiltInParameter.SYMBOL_NAME_PARAM) else "Unknown"
-                print("Skipping element ID={0}, Type={1}: Cannot be hidden in view".format(elem.Id.IntegerValue, elem_type_name))
-                continue
-            if not elem.get_BoundingBox(view):
-                elem_type = doc.GetElement(elem.GetTypeId())
-                elem_type_name = elem_type.get_Parameter(BuiltInParameter.SYMBOL_NAME_PARAM).AsString() if elem_type and elem_type.get_Parameter(BuiltInParameter.SYMBOL_NAME_PARAM) else "Unknown"
-                print("Skipping element ID={0}, Type={1}: No bounding box in view".format(elem.Id.IntegerValue, elem_type_name))
-                continue
-
-            # Handle walls
-            if isinstance(elem, Wall):
-                if elem.Id in structural_wall_ids:
-                    wall_type = doc.GetElement(elem.GetTypeId())
-                    type_name = wall_type.get_Parameter(BuiltInParameter.SYMBOL_NAME_PARAM).AsString() if wall_type and wall_type.get_Parameter(BuiltInParameter.SYMBOL_NAME_PARAM) else "Unknown"
-                    print("Skipping structural wall: ID={0}, Type={1}".format(elem.Id.IntegerValue, type_name))
-                    continue
-                # Apply override to non-structural walls
-                view.SetElementOverrides(elem.Id, override_settings)
-                elem_type = doc.GetElement(elem.GetTypeId())
-                elem_type_name = elem_type.get_Parameter(BuiltInParameter.SYMBOL_NAME_PARAM).AsString() if elem_type and elem_type.get_Parameter(BuiltInParameter.SYMBOL_NAME_PARAM) else "Unknown"
-                print("Applied override to: ID={0}, Category={1}, Type={2}".format(elem.Id.IntegerValue, bic.ToString(), elem_type_name))
-                continue
-
-            # Handle windows (apply override to all windows)
-            if bic == BuiltInCategory.OST_Windows:
-                host = getattr(elem, "Host", None)
-                host_type = "Unknown"
-                host_id = "No Host"
-                if host and isinstance(host, Wall):
-                    host_wall_type = doc.GetElement(host.GetTypeId())
-                    host_type = host_wall_type.get_Parameter(BuiltInParameter.SYMBOL_NAME_PARAM).AsString() if host_wall_type and host_wall_type.get_Parameter(BuiltInParameter.SYMBOL_NAME_PARAM) else "Unknown"
-                    host_id = str(host.Id.IntegerValue)
-                # Apply override to all windows
-                view.SetElementOverrides(elem.Id, override_settings)
-                elem_type = doc.GetElement(elem.GetTypeId())
-                elem_type_name = elem_type.get_Parameter(BuiltInParameter.SYMBOL_NAME_PARAM).AsString() if elem_type and elem_type.get_Parameter(BuiltInParameter.SYMBOL_NAME_PARAM) else "Unknown"
-                print("Applied override to window: ID={0}, Type={1}, Host Wall Type={2}, Host Wall ID={3}".format(
-                    elem.Id.IntegerValue, elem_type_name, host_type, host_id))
-                continue
-
-            # Apply override to other categories
-            view.SetElementOverrides(elem.Id, override_settings)
-            elem_type = doc.GetElement(elem.GetTypeId())
-            elem_type_name = elem_type.get_Parameter(BuiltInParameter.SYMBOL_NAME_PARAM).AsString() if elem_type and elem_type.get_Parameter(BuiltInParameter.SYMBOL_NAME_PARAM) else "Unknown"
-            print("Applied override to: ID={0}, Category={1}, Type={2}".format(elem.Id.IntegerValue, bic.ToString(), elem_type_name))
-
-    except Exception as e:
-        print("Error in category {0}: {1}".format(bic, e))
-
-t.Commit()
-script.get_output().print_md("✅ **Overrides applied. Non-structural walls and all windows affected.**")
\ No newline at end of file
+override_settings = build_override_settings()
+
+
+def is_target_view(v):
+    return v and not v.IsTemplate and v.CanBePrinted and v.ViewType not in (ViewType.DrawingSheet, ViewType.Legend,
+                                                                             ViewType.Schedule)
+
+
+def pick_batch_views():
+    """Views picked directly, placed on picked sheets, or using picked view templates."""
+    source = forms.CommandSwitchWindow.show(["Views", "Sheets", "View Templates"], message="Apply overrides to:")
+    if source == "Views":
+        views = forms.select_views(filterfunc=is_target_view, use_selection=True) or []
+    elif source == "Sheets":
+        sheets = forms.select_sheets(use_selection=True) or []
+        views = [doc.GetElement(v_id) for sheet in sheets for v_id in sheet.GetAllPlacedViews()]
+    elif source == "View Templates":
+        templates = forms.select_viewtemplates(doc=doc) or []
+        template_ids = set(tmpl.Id.IntegerValue for tmpl in templates)
+        views = [v for v in FilteredElementCollector(doc).OfClass(View)
+                 if v.ViewTemplateId.IntegerValue in template_ids]
+    else:
+        return []
+
+    # Keep order, drop duplicates (same view on several picked sheets)
+    unique, seen = [], set()
+    for v in views:
+        if is_target_view(v) and v.Id.IntegerValue not in seen:
+            seen.add(v.Id.IntegerValue)
+            unique.append(v)
+    return unique
+
+
+mode = forms.CommandSwitchWindow.show(["Element Overrides", "Batch", "View Filter"], message="Override mode:")
+if not mode:
+    script.exit()
+
+if mode == "Batch":
+    views = pick_batch_views()
+    if not views:
+        forms.alert("No printable views selected.", exitscript=True)
+elif not view.CanBePrinted:
+    script.exit("Please open a printable view (not a schedule, legend, or sheet).")
+else:
+    views = [view]
+    print("Active view: {0} (Type: {1})".format(view.Name, view.ViewType))
+
+if mode == "View Filter":
+    with span("Auto Graphic Overrides (View Filter)", TRANSACTION):
+        t = Transaction(doc, "Auto Graphic Overrides (View Filter)")
+        t.Start()
+        try:
+            view_filters = get_or_create_override_filters(doc, target_categories)
+            apply_filter_overrides(view, view_filters, override_settings)
+            t.Commit()
+        except Exception as e:
+            t.RollBack()
+            forms.alert("Could not apply View Filter overrides:\n{}".format(e), exitscript=True)
+    output.print_md("✅ **View Filter overrides applied: {}**".format(", ".join(f.Name for f in view_filters)))
+    tracer.finish(output)
+    script.exit()
+
+# Structural wall check, cached per WallType (shared by all views)
+wall_classifier = StructuralWallClassifier(doc)
+
+# Remember overridden elements per view, so Reset touches only those
+registry = OverrideRegistry(doc)
+
+# All views in a single transaction
+cancelled = False
+with span("Auto Graphic Overrides", TRANSACTION, views=len(views)):
+    t = Transaction(doc, "Auto Graphic Overrides")
+    t.Start()
+    with forms.ProgressBar(title="Auto Graphic Overrides ({value} of {max_value} views)", cancellable=True) as pb:
+        for i, v in enumerate(views, 1):
+            if pb.cancelled:
+                cancelled = True
+                break
+            try:
+                with span(v.Name, view_id=v.Id.IntegerValue):
+                    store = SnapshotStore(doc, v)
+                    if store.get(SNAPSHOT_NAME) is None:
+                        store.save(SNAPSHOT_NAME, capture_view_overrides(doc, v, SNAPSHOT_NAME))
+                    overridden = apply_element_overrides(doc, v, override_settings, wall_classifier, log,
+                                                         target_categories)
+                    registry.record(v, overridden)
+            except Exception as e:
+                print("Error in view {0}: {1}".format(v.Name, e))
+            pb.update_progress(i, len(views))
+
+    if cancelled:
+        t.RollBack()
+        forms.alert("Cancelled. No overrides were applied.", exitscript=True)
+    t.Commit()
+registry.save()
+
+log.render(output, title="Auto Graphic Overrides")
+output.print_md("✅ **Overrides applied to {} view(s). Non-structural walls and all windows affected.**".format(len(views)))
+tracer.finish(output)
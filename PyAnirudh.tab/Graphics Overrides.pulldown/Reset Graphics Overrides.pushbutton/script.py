@@ -1,55 +1,61 @@
 # -*- coding: utf-8 -*-
 __title__ = "Reset Graphic Overrides"
 __author__ = "Anirudh"
-__doc__ = "Removes graphic overrides applied to non-structural categories in the active view."
+__doc__ = """Removes graphic overrides applied to non-structural categories in the active view.
+Recorded Overrides: resets only elements overridden by Auto Graphic Overrides.
+All Existing Overrides: resets every element that has any override in the view.
+View Filter: removes the Auto Overrides View Filters from the view."""
 
 from Autodesk.Revit.DB import *
 from pyrevit import revit, DB
-from pyrevit import script
+from pyrevit import script, forms, EXEC_PARAMS
+from Snippets._overrides import (OverrideRegistry, reset_recorded_overrides, reset_all_overrides,
+                                 remove_filter_overrides)
+from Snippets._runlog import RunLog, level_from_name, DEBUG
+from Snippets._trace import start_trace, span, TRANSACTION
 
 doc = revit.doc
 uidoc = revit.uidoc
 view = uidoc.ActiveView
+tracer = start_trace(__title__)  # Off unless PYANIRUDH_TRACE is set
+
+# Log level: Shift+Click for debug output, otherwise "log_level" from the script config (summary/normal/debug)
+log_level = DEBUG if EXEC_PARAMS.config_mode else level_from_name(script.get_config().get_option("log_level", "summary"))
+log = RunLog(doc, level=log_level)
 
 if not view.CanBePrinted:
     script.exit("Please open a printable view (not a schedule, legend, or sheet).")
 
-print("Active view: {0} (Type: {1})".format(view.Name, view.ViewType))
+mode = forms.CommandSwitchWindow.show(["Recorded Overrides", "All Existing Overrides", "View Filter"],
+                                      message="Reset mode:")
+if not mode:
+    script.exit()
 
-t = Transaction(doc, "Reset Graphic Overrides")
-t.Start()
-
-# Categories to reset (match those in AutoGraphicOverrides.py)
-target_categories = [
-    BuiltInCategory.OST_Walls,
-    BuiltInCategory.OST_Doors,
-    BuiltInCategory.OST_Windows,
-    BuiltInCategory.OST_GenericModel,
-    BuiltInCategory.OST_MechanicalEquipment,
-    BuiltInCategory.OST_PlumbingFixtures,
-    BuiltInCategory.OST_ElectricalFixtures,
-    BuiltInCategory.OST_LightingFixtures
-]
-
-# Empty override settings to reset to default
-reset_settings = OverrideGraphicSettings()
-
-# Reset overrides for each category
-for bic in target_categories:
-    try:
-        print("Processing category: {0}".format(bic.ToString()))
-        elems = FilteredElementCollector(doc, view.Id).OfCategory(bic).WhereElementIsNotElementType().ToElements()
-        print("Found {0} elements in category {1}".format(len(elems), bic.ToString()))
+print("Active view: {0} (Type: {1})".format(view.Name, view.ViewType))
 
-        for elem in elems:
-            # Apply reset (remove overrides)
-            view.SetElementOverrides(elem.Id, reset_settings)
-            elem_type = doc.GetElement(elem.GetTypeId())
-            elem_type_name = elem_type.get_Parameter(BuiltInParameter.SYMBOL_NAME_PARAM).AsString() if elem_type and elem_type.get_Parameter(BuiltInParameter.SYMBOL_NAME_PARAM) else "Unknown"
-            print("Reset override for: ID={0}, Category={1}, Type={2}".format(elem.Id.IntegerValue, bic.ToString(), elem_type_name))
+output = script.get_output()
+registry = OverrideRegistry(doc)
 
+with span("Reset Graphic Overrides", TRANSACTION, mode=mode):
+    t = Transaction(doc, "Reset Graphic Overrides")
+    t.Start()
+    try:
+        if mode == "View Filter":
+            removed = remove_filter_overrides(doc, view)
+            message = "Removed {} Auto Overrides View Filter(s) from the active view.".format(removed)
+        elif mode == "Recorded Overrides":
+            count = reset_recorded_overrides(doc, view, registry, log)
+            message = "Graphic overrides reset for {} recorded element(s) in the active view.".format(count)
+        else:
+            count = reset_all_overrides(doc, view, log)
+            registry.forget(view)
+            message = "Graphic overrides reset for {} element(s) in the active view.".format(count)
+        t.Commit()
     except Exception as e:
-        print("Error in category {0}: {1}".format(bic, e))
+        t.RollBack()
+        forms.alert("Reset failed and was rolled back:\n{}".format(e), exitscript=True)
 
-t.Commit()
-script.get_output().print_md("✅ **Graphic overrides reset for all elements in the active view.**")
\ No newline at end of file
+registry.save()
+log.render(output, title="Reset Graphic Overrides")
+output.print_md("✅ **{}**".format(message))
+tracer.finish(output)
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+__title__ = "Rule Overrides"
+__author__ = "Anirudh"
+__doc__ = """Applies graphic overrides to the active view from a rules config (JSON/YAML).
+Configs in the rules folder of this button are versioned presentation standards.
+Parameter and type rules are evaluated by Revit filters, only regex/python rules run in Python."""
+
+import os
+from Autodesk.Revit.DB import *
+from pyrevit import revit, script, forms
+from Snippets._overriderules import load_rules_config, compile_rules, apply_rules, RuleConfigError
+from Snippets._overrides import OverrideRegistry
+from Snippets._trace import start_trace, span, TRANSACTION
+
+doc = revit.doc
+uidoc = revit.uidoc
+view = uidoc.ActiveView
+output = script.get_output()
+tracer = start_trace(__title__)  # Off unless PYANIRUDH_TRACE is set
+
+RULES_FOLDER = os.path.join(os.path.dirname(__file__), "rules")
+BROWSE = "Browse..."
+
+if not view.CanBePrinted:
+    script.exit("Please open a printable view (not a schedule, legend, or sheet).")
+
+# Pick a rules config
+configs = sorted(f for f in os.listdir(RULES_FOLDER) if f.lower().endswith((".json", ".yaml", ".yml")))
+selected = forms.SelectFromList.show(configs + [BROWSE], title="Select Presentation Rules",
+                                     button_name="Apply", multiselect=False)
+if not selected:
+    script.exit()
+if selected == BROWSE:
+    config_path = forms.pick_file(files_filter="Rules (*.json;*.yaml;*.yml)|*.json;*.yaml;*.yml")
+    if not config_path:
+        script.exit()
+else:
+    config_path = os.path.join(RULES_FOLDER, selected)
+
+try:
+    config = load_rules_config(config_path)
+    rules = compile_rules(doc, config)
+except (RuleConfigError, ValueError, KeyError) as e:
+    forms.alert("Invalid rules config:\n{}\n\n{}".format(config_path, e), exitscript=True)
+
+registry = OverrideRegistry(doc)
+
+with span("Rule Overrides", TRANSACTION, rules=len(rules)):
+    t = Transaction(doc, "Rule Overrides: {}".format(config.get("name", os.path.basename(config_path))))
+    t.Start()
+    try:
+        matches, overridden = apply_rules(doc, view, rules)
+        registry.record(view, overridden)
+        t.Commit()
+    except Exception as e:
+        t.RollBack()
+        forms.alert("Rule Overrides failed and was rolled back:\n{}".format(e), exitscript=True)
+registry.save()
+
+output.print_table(table_data=[[name, "Native" if rule.is_native else "Native + Python", count]
+                               for rule, (name, count) in zip(rules, matches)],
+                   title="{} (v{})".format(config.get("name", ""), config.get("version", "-")),
+                   columns=["Rule", "Evaluation", "Elements"])
+output.print_md("✅ **Overrides applied to {} element(s) in '{}'.**".format(len(overridden), view.Name))
+tracer.finish(output)
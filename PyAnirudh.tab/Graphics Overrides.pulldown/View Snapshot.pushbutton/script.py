@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+__title__ = "View Snapshot"
+__author__ = "Anirudh"
+__doc__ = """Saves and restores the element- and category-level graphic overrides of the active view.
+Save: stores the current overrides under a name.
+Restore: brings the view back to a saved snapshot in one transaction.
+Compare: shows what changed since a snapshot.
+Auto Graphic Overrides saves a 'Before Auto Graphic Overrides' snapshot automatically."""
+
+from Autodesk.Revit.DB import *
+from pyrevit import revit, script, forms
+from Snippets._snapshot import SnapshotStore, capture_view_overrides, restore_view_overrides, diff_snapshots
+from Snippets._trace import start_trace, span, TRANSACTION
+
+doc = revit.doc
+uidoc = revit.uidoc
+view = uidoc.ActiveView
+output = script.get_output()
+tracer = start_trace(__title__)  # Off unless PYANIRUDH_TRACE is set
+
+if not view.CanBePrinted:
+    script.exit("Please open a printable view (not a schedule, legend, or sheet).")
+
+store = SnapshotStore(doc, view)
+action = forms.CommandSwitchWindow.show(["Save", "Restore", "Compare", "Delete"], message="View Snapshot:")
+if not action:
+    script.exit()
+
+if action == "Save":
+    name = forms.ask_for_string(prompt="Snapshot name:", title="Save View Snapshot",
+                                default="Snapshot {}".format(len(store.names()) + 1))
+    if not name:
+        script.exit()
+    snapshot = capture_view_overrides(doc, view, name)
+    store.save(name, snapshot)
+    output.print_md("✅ **Saved snapshot '{}' of '{}':** {} element override(s), {} category override(s), {} distinct setting(s).".format(
+        name, view.Name, len(snapshot["elements"]), len(snapshot["categories"]), len(snapshot["palette"])))
+    tracer.finish(output)
+    script.exit()
+
+if not store.names():
+    forms.alert("No snapshots saved for this view.", exitscript=True)
+
+name = forms.SelectFromList.show(store.names(), title="{} Snapshot".format(action), button_name=action,
+                                 multiselect=False)
+if not name:
+    script.exit()
+snapshot = store.get(name)
+
+if action == "Restore":
+    with span("Restore View Snapshot", TRANSACTION):
+        t = Transaction(doc, "Restore View Snapshot: {}".format(name))
+        t.Start()
+        try:
+            changes = restore_view_overrides(doc, view, snapshot)
+            t.Commit()
+        except Exception as e:
+            t.RollBack()
+            forms.alert("Restore failed and was rolled back:\n{}".format(e), exitscript=True)
+    output.print_md("✅ **Restored snapshot '{}' ({}). {} override(s) changed.**".format(name, snapshot["created"], changes))
+
+elif action == "Compare":
+    diff = diff_snapshots(snapshot, capture_view_overrides(doc, view))
+    output.print_table(table_data=[[key.title(), len(d["added"]), len(d["removed"]), len(d["changed"])]
+                                   for key, d in sorted(diff.items())],
+                       title="Current view vs. '{}' ({})".format(name, snapshot["created"]),
+                       columns=["", "Added", "Removed", "Changed"])
+
+elif action == "Delete":
+    store.delete(name)
+    output.print_md("✅ **Deleted snapshot '{}'.**".format(name))
+
+tracer.finish(output)
@@ -27,42 +27,16 @@ from System.Runtime.InteropServices import Marshal
 from pyrevit import script
 from pyrevit import forms
 from System.Threading import Thread
+from Snippets._params import safe_set_value, has_value, collect_similar_elements, apply_parameter_values
+from Snippets._trace import start_trace, span, TRANSACTION
+from Snippets._logger import get_logger
 
 doc = __revit__.ActiveUIDocument.Document
 uidoc = __revit__.ActiveUIDocument
 selection_ids = uidoc.Selection.GetElementIds()
 selected_elements = [doc.GetElement(eid) for eid in selection_ids if doc.GetElement(eid) is not None]
-
-def safe_set_value(param, value):
-    st = param.StorageType
-    try:
-        if st == StorageType.String:
-            param.Set(str(value))
-        elif st == StorageType.Integer:
-            valstr = str(value).strip().lower()
-            if valstr in ["yes", "true", "1"]:
-                param.Set(1)
-            elif valstr in ["no", "false", "0"]:
-                param.Set(0)
-            elif valstr.isdigit():
-                param.Set(int(valstr))
-            else:
-                pass # ignore non-numeric or enum labels (like "Vertical", "By Type", etc.)
-        elif st == StorageType.Double:
-            try:
-                valstr = str(value)
-                val_num = float(re.findall(r"[-+]?\d*\.\d+|\d+", valstr.replace(",", ""))[0])
-                param.Set(val_num)
-            except Exception:
-                pass
-        elif st == StorageType.ElementId:
-            try:
-                eid = int(value)
-                param.Set(ElementId(eid))
-            except Exception:
-                pass
-    except Exception:
-        pass
+tracer = start_trace(__title__)  # Off unless PYANIRUDH_TRACE is set
+log = get_logger("Parameters")  # Buffered, written by a background thread to %APPDATA%\PyAnirudh\logs
 
 # Mapping from Revit API enum to user-friendly labels
 BUILTINPARAMGROUP_TO_LABEL = {
@@ -233,6 +207,7 @@ def build_vm_for_element(elem):
 if not selected_elements:
     from System.Windows import MessageBox
     MessageBox.Show("Please select an element.", "No Selection")
+    tracer.finish(script.get_output())
     script.exit()
 
 all_vm = build_vm_for_element(selected_elements[0])
@@ -283,36 +258,27 @@ def apply_clicked(sender, args):
     dataGrid.CommitEdit()
     apply_to_all = chkApplyAllSimilar.IsChecked if hasattr(chkApplyAllSimilar, "IsChecked") else False
     from Autodesk.Revit.DB import Transaction, FilteredElementCollector
-    t = Transaction(doc, "Update Parameters")
-    t.Start()
-    try:
-        similar_elems = []
-        if apply_to_all:
-            base_elem = selected_elements[0]
-            cat_id = base_elem.Category.Id if base_elem.Category else None
-            base_type_id = base_elem.GetTypeId()
-            collector = FilteredElementCollector(doc).OfCategoryId(cat_id).WhereElementIsNotElementType()
-            for e in collector:
-                if e.GetTypeId() == base_type_id:
-                    similar_elems.append(e)
-        for vm in dataGrid.ItemsSource:
-            if not vm.Editable or not vm.IsSelected:
-                continue
-            param_name = vm.Name
-            new_value = vm.Value
+    with span("Update Parameters", TRANSACTION, similar=bool(apply_to_all)):
+        t = Transaction(doc, "Update Parameters")
+        t.Start()
+        try:
+            # Selected, editable rows: one {name: value} dict for all similar elements
+            values = {}
+            for vm in dataGrid.ItemsSource:
+                if vm.Editable and vm.IsSelected:
+                    values[vm.Name] = vm.Value
+            similar_elems = collect_similar_elements(doc, selected_elements[0]) if apply_to_all else []
             if apply_to_all and similar_elems:
-                for elem in similar_elems:
-                    for p in elem.Parameters:
-                        if p.Definition.Name == param_name and not p.IsReadOnly:
-                            safe_set_value(p, new_value)
+                apply_parameter_values(similar_elems, values)
             else:
-                p = vm.param
-                safe_set_value(p, new_value)
-        t.Commit()
-    except Exception as e:
-        t.RollBack()
-        from System.Windows import MessageBox
-        MessageBox.Show("Transaction rolled back:\n{}".format(e), "Error")
+                for vm in dataGrid.ItemsSource:
+                    if vm.Editable and vm.IsSelected:
+                        safe_set_value(vm.param, vm.Value)
+            t.Commit()
+        except Exception as e:
+            t.RollBack()
+            from System.Windows import MessageBox
+            MessageBox.Show("Transaction rolled back:\n{}".format(e), "Error")
     window.Close()
 
 def cancel_clicked(sender, args): window.Close()
@@ -490,19 +456,20 @@ def add_parameter_clicked(sender, args):
     else:
         MessageBox.Show("No element selected.", "Error")
         return
-    t = Transaction(doc, "Bind Shared Parameter")
-    t.Start()
-    try:
-        bindings = doc.ParameterBindings
-        if paramdata['bindas'] == "Instance":
-            bindings.Insert(defn, InstanceBinding(cat_set), paramdata['group'])
-        else:
-            bindings.Insert(defn, TypeBinding(cat_set), paramdata['group'])
-        t.Commit()
-    except Exception as ex:
-        t.RollBack()
-        MessageBox.Show("Failed to bind parameter:\n" + str(ex), "Error")
-        return
+    with span("Bind Shared Parameter", TRANSACTION, parameter=paramdata['name']):
+        t = Transaction(doc, "Bind Shared Parameter")
+        t.Start()
+        try:
+            bindings = doc.ParameterBindings
+            if paramdata['bindas'] == "Instance":
+                bindings.Insert(defn, InstanceBinding(cat_set), paramdata['group'])
+            else:
+                bindings.Insert(defn, TypeBinding(cat_set), paramdata['group'])
+            t.Commit()
+        except Exception as ex:
+            t.RollBack()
+            MessageBox.Show("Failed to bind parameter:\n" + str(ex), "Error")
+            return
     global all_vm
     all_vm = build_vm_for_element(selected_elements[0])
     refresh_grid()
@@ -560,15 +527,8 @@ def export_clicked(sender, args):
     except Exception as e:
         MessageBox.Show('Export failed: {}'.format(e), 'Error')
 
-def log_message(message):
-    try:
-        with open(r"C:\Temp\revit_script_log.txt", "a") as f:
-            f.write(message + "\n")
-    except:
-        pass
-
 def import_clicked(sender, args):
-    log_message("Starting import_clicked function...")
+    log.info("Starting import_clicked function...")
     # Import Excel interop
     import clr
     clr.AddReference('Microsoft.Office.Interop.Excel')
@@ -576,9 +536,9 @@ def import_clicked(sender, args):
     # Pick Excel file
     excel_path = forms.pick_file(file_ext='xlsx')
     if not excel_path:
-        log_message("No Excel file selected. Exiting.")
+        log.info("No Excel file selected. Exiting.")
         return
-    log_message("Excel file selected: {}".format(excel_path))
+    log.info("Excel file selected: {}", excel_path)
 
     excel = System.Type.GetTypeFromProgID('Excel.Application')
     excel_app = System.Activator.CreateInstance(excel)
@@ -593,7 +553,7 @@ def import_clicked(sender, args):
             sheet_name = "{}_{}".format(selected_elements[0].Category.Name, selected_elements[0].Id)[:31]
         except:
             sheet_name = "Element"
-    log_message("Using sheet name: {}".format(sheet_name))
+    log.info("Using sheet name: {}", sheet_name)
 
     # Access worksheet
     try:
@@ -610,7 +570,7 @@ def import_clicked(sender, args):
         h = ws.Cells[1, col].Value2
         if h:
             headers.append(h)
-    log_message("Headers found: {}".format(", ".join(headers)))
+    log.info("Headers found: {}", ", ".join(headers))
 
     def get_col_i(header):
         for i, h in enumerate(headers):
@@ -690,126 +650,107 @@ def import_clicked(sender, args):
     el = selected_elements[0]
     update_count = 0
     add_count = 0
-    t = Transaction(doc, "Import Parameters from Excel")
-    t.Start()
-    try:
-        row = 2
-        while ws.Cells[row, 1].Value2:
-            param_name = ws.Cells[row, name_i + 1].Value2
-            type_str   = ws.Cells[row, type_i + 1].Value2 if type_i is not None else ""
-            disc_str   = ws.Cells[row, disc_i + 1].Value2 if disc_i is not None else ""
-            group_str  = ws.Cells[row, group_i + 1].Value2 if group_i is not None else ""
-            bindas_str = ws.Cells[row, insttype_i + 1].Value2 if insttype_i is not None else ""
-            param_value= ws.Cells[row, val_i + 1].Value2
-
-            p = el.LookupParameter(param_name)
-            if p:
-                # Do NOT overwrite already-set values
-                already_set = False
-                try:
-                    if p.StorageType == StorageType.String:
-                        v = p.AsString()
-                        if v is not None and str(v).strip() != "":
-                            already_set = True
-                    elif p.StorageType == StorageType.Integer:
-                        v = p.AsInteger()
-                        if v is not None:
-                            already_set = True
-                    elif p.StorageType == StorageType.Double:
-                        v = p.AsDouble()
-                        if v is not None:
-                            already_set = True
-                    elif p.StorageType == StorageType.ElementId:
-                        v = p.AsElementId()
-                        if v is not None and v.IntegerValue != -1:
-                            already_set = True
-                except Exception:
-                    already_set = False
-                if already_set:
-                    row += 1
-                    continue
-                # Only set if value is not already there
-                try:
-                    safe_set_value(p, param_value)
-                    update_count += 1
-                except Exception:
-                    pass
-            else:
-                # Add/bind as needed
-                discipline = DISC_MAP.get(disc_str, DisciplineTypeId.Common)
-                spec_type = get_spec_type(type_str)
-                group_under = GROUP_MAP.get(group_str, BuiltInParameterGroup.INVALID)
-                bindas_instance = str(bindas_str).lower().startswith("inst")
-                param_name = param_name.strip()
-                shared_param_file = r"C:\Temp\revit_shared_params.txt"
-                doc.Application.SharedParametersFilename = shared_param_file
-                sp_file = doc.Application.OpenSharedParameterFile()
-                if sp_file is not None:
-                    group_name = "Scripted"
-                    sp_group = None
-                    for g in sp_file.Groups:
-                        if g.Name == group_name:
-                            sp_group = g
-                            break
-                    if not sp_group:
-                        sp_group = sp_file.Groups.Create(group_name)
-                    defn = None
-                    for d in sp_group.Definitions:
-                        if d.Name == param_name:
-                            defn = d
-                            break
-                    if defn is None:
-                        opt = ExternalDefinitionCreationOptions(param_name, spec_type)
-                        opt.Visible = True
-                        defn = sp_group.Definitions.Create(opt)
-                    cat_set = CategorySet()
-                    elem_cat = el.Category
-                    cat_set.Insert(elem_cat)
-                    bindings = doc.ParameterBindings
-                    if bindas_instance:
-                        bindings.Insert(defn, InstanceBinding(cat_set), group_under)
-                    else:
-                        bindings.Insert(defn, TypeBinding(cat_set), group_under)
-                    p_new = el.LookupParameter(param_name)
-                    if p_new:
-                        try:
-                            safe_set_value(p_new, param_value)
-                        except Exception:
-                            pass
-                    add_count += 1
-            row += 1
-        t.Commit()
-        log_message("Transaction committed successfully.")
-    except Exception as ex:
-        t.RollBack()
-        log_message("Import failed: {}".format(str(ex)))
-        MessageBox.Show("Import failed: {}".format(ex), "Import Error")
-        wb.Close(False)
-        excel_app.Quit()
-        return
+    with span("Import Parameters from Excel", TRANSACTION):
+        t = Transaction(doc, "Import Parameters from Excel")
+        t.Start()
+        try:
+            row = 2
+            while ws.Cells[row, 1].Value2:
+                param_name = ws.Cells[row, name_i + 1].Value2
+                type_str   = ws.Cells[row, type_i + 1].Value2 if type_i is not None else ""
+                disc_str   = ws.Cells[row, disc_i + 1].Value2 if disc_i is not None else ""
+                group_str  = ws.Cells[row, group_i + 1].Value2 if group_i is not None else ""
+                bindas_str = ws.Cells[row, insttype_i + 1].Value2 if insttype_i is not None else ""
+                param_value= ws.Cells[row, val_i + 1].Value2
+
+                p = el.LookupParameter(param_name)
+                if p:
+                    # Do NOT overwrite already-set values
+                    if has_value(p):
+                        row += 1
+                        continue
+                    # Only set if value is not already there
+                    try:
+                        safe_set_value(p, param_value)
+                        update_count += 1
+                    except Exception:
+                        pass
+                else:
+                    # Add/bind as needed
+                    discipline = DISC_MAP.get(disc_str, DisciplineTypeId.Common)
+                    spec_type = get_spec_type(type_str)
+                    group_under = GROUP_MAP.get(group_str, BuiltInParameterGroup.INVALID)
+                    bindas_instance = str(bindas_str).lower().startswith("inst")
+                    param_name = param_name.strip()
+                    shared_param_file = r"C:\Temp\revit_shared_params.txt"
+                    doc.Application.SharedParametersFilename = shared_param_file
+                    sp_file = doc.Application.OpenSharedParameterFile()
+                    if sp_file is not None:
+                        group_name = "Scripted"
+                        sp_group = None
+                        for g in sp_file.Groups:
+                            if g.Name == group_name:
+                                sp_group = g
+                                break
+                        if not sp_group:
+                            sp_group = sp_file.Groups.Create(group_name)
+                        defn = None
+                        for d in sp_group.Definitions:
+                            if d.Name == param_name:
+                                defn = d
+                                break
+                        if defn is None:
+                            opt = ExternalDefinitionCreationOptions(param_name, spec_type)
+                            opt.Visible = True
+                            defn = sp_group.Definitions.Create(opt)
+                        cat_set = CategorySet()
+                        elem_cat = el.Category
+                        cat_set.Insert(elem_cat)
+                        bindings = doc.ParameterBindings
+                        if bindas_instance:
+                            bindings.Insert(defn, InstanceBinding(cat_set), group_under)
+                        else:
+                            bindings.Insert(defn, TypeBinding(cat_set), group_under)
+                        p_new = el.LookupParameter(param_name)
+                        if p_new:
+                            try:
+                                safe_set_value(p_new, param_value)
+                            except Exception:
+                                pass
+                        add_count += 1
+                row += 1
+            t.Commit()
+            log.info("Transaction committed successfully.")
+        except Exception as ex:
+            t.RollBack()
+            log.error("Import failed: {}", str(ex))
+            MessageBox.Show("Import failed: {}".format(ex), "Import Error")
+            wb.Close(False)
+            excel_app.Quit()
+            return
 
     # Close Excel
     wb.Close(False)
     excel_app.Quit()
-    log_message("Excel application closed.")
+    log.info("Excel application closed.")
 
     # Update the view model and refresh the grid
-    log_message("Updating view model...")
+    log.info("Updating view model...")
     try:
         global all_vm
         all_vm = build_vm_for_element(selected_elements[0])
-        log_message("View model updated successfully.")
+        log.info("View model updated successfully.")
     except Exception as ex:
-        log_message("Error updating view model: {}".format(str(ex)))
+        log.error("Error updating view model: {}", str(ex))
         MessageBox.Show("Error updating view model: {}".format(str(ex)), "Error")
         return
 
-    log_message("Refreshing grid...")
+    log.info("Refreshing grid...")
     try:
         refresh_grid()
-        log_message("Grid refreshed successfully.")
+        log.info("Grid refreshed successfully.")
     except Exception as ex:
-        log_message("Error refreshing grid: {}".format(str(ex)))
+        log.error("Error refreshing grid: {}", str(ex))
         MessageBox.Show("Error refreshing grid: {}".format(str(ex)), "Error")
         return
 
@@ -818,18 +759,10 @@ def import_clicked(sender, args):
         "Imported parameters.\nUpdated: {}\nAdded (new/bound): {}".format(update_count, add_count),
         "Import Success"
     )
-    log_message("Import completed. Updated: {}, Added: {}".format(update_count, add_count))
-
-def log_message(message):
-    try:
-        with open(r"C:\Temp\revit_script_log.txt", "a") as f:
-            f.write(message + "\n")
-    except:
-        pass
-
+    log.info("Import completed. Updated: {}, Added: {}", update_count, add_count)
 
 def remove_parameter_clicked(sender, args):
-    log_message("Starting remove_parameter_clicked function...")
+    log.info("Starting remove_parameter_clicked function...")
     # Step 1: Gather selected VMs from the data grid
     vm_list = list(dataGrid.ItemsSource) if dataGrid.ItemsSource is not None else []
     selected_vms = [vm for vm in vm_list if
@@ -842,42 +775,41 @@ def remove_parameter_clicked(sender, args):
 
     # Step 2: Collect parameter names to delete
     names_to_delete = set(vm.Name for vm in selected_vms)
-    log_message("Selected Param Names: " + ", ".join(names_to_delete))
+    log.info("Selected Param Names: {}", ", ".join(names_to_delete))
 
     # Step 3: Check if parameters are used in schedules
-    log_message("Checking for schedule usage...")
+    log.info("Checking for schedule usage...")
     try:
         schedules = FilteredElementCollector(doc).OfClass(ViewSchedule).ToElements()
-        log_message("Found {} schedules to check.".format(len(schedules)))
+        log.info("Found {} schedules to check.", len(schedules))
         for i, sched in enumerate(schedules):
             try:
                 if not hasattr(sched, "Name"):
-                    log_message("Schedule at index {} has no Name attribute. Skipping.".format(i))
+                    log.debug("Schedule at index {} has no Name attribute. Skipping.", i)
                     continue
                 sched_name = sched.Name
-                log_message("Checking schedule: {}".format(sched_name))
+                log.debug("Checking schedule: {}", sched_name)
                 sched_def = sched.Definition
                 if sched_def is None:
-                    log_message("Schedule {} has no definition. Skipping.".format(sched_name))
+                    log.debug("Schedule {} has no definition. Skipping.", sched_name)
                     continue
                 field_order = sched_def.GetFieldOrder()
                 if not field_order:
-                    log_message("Schedule {} has no fields. Skipping.".format(sched_name))
+                    log.debug("Schedule {} has no fields. Skipping.", sched_name)
                     continue
-                log_message("Schedule {} has {} fields.".format(sched_name, len(field_order)))
+                log.debug("Schedule {} has {} fields.", sched_name, len(field_order))
                 for j, field in enumerate(field_order):
                     try:
                         field_param = sched_def.GetField(field)
                         if field_param is None:
-                            log_message("Field {} in schedule {} is None. Skipping.".format(j, sched_name))
+                            log.debug("Field {} in schedule {} is None. Skipping.", j, sched_name)
                             continue
                         if not hasattr(field_param, "ParameterName"):
-                            log_message("Field {} in schedule {} has no ParameterName. Skipping.".format(j, sched_name))
+                            log.debug("Field {} in schedule {} has no ParameterName. Skipping.", j, sched_name)
                             continue
                         param_name = field_param.ParameterName
                         if not param_name:
-                            log_message(
-                                "Field {} in schedule {} has empty ParameterName. Skipping.".format(j, sched_name))
+                            log.debug("Field {} in schedule {} has empty ParameterName. Skipping.", j, sched_name)
                             continue
                         if param_name in names_to_delete:
                             MessageBox.Show(
@@ -885,27 +817,27 @@ def remove_parameter_clicked(sender, args):
                                 "Cannot Delete")
                             return
                     except Exception as ex:
-                        log_message("Error checking field {} in schedule {}: {}".format(j, sched_name, str(ex)))
+                        log.error("Error checking field {} in schedule {}: {}", j, sched_name, str(ex))
                         continue
             except Exception as ex:
-                log_message("Error checking schedule at index {}: {}".format(i, str(ex)))
+                log.error("Error checking schedule at index {}: {}", i, str(ex))
                 continue
-        log_message("Finished checking schedules. No dependencies found.")
+        log.info("Finished checking schedules. No dependencies found.")
     except Exception as ex:
-        log_message("Error during schedule usage check: {}".format(str(ex)))
+        log.error("Error during schedule usage check: {}", str(ex))
         MessageBox.Show("Schedule check failed. Proceeding with deletion, but there may be dependencies.", "Warning")
 
     # Step 4: Confirm deletion with user
-    log_message("Prompting for user confirmation...")
+    log.info("Prompting for user confirmation...")
     result = MessageBox.Show("Are you sure you want to delete these parameters?\n{}".format("\n".join(names_to_delete)),
                              "Confirm Deletion", MessageBoxButton.YesNo)
-    log_message("Confirmation result: {}".format(str(result)))
+    log.info("Confirmation result: {}", str(result))
     if str(result) != "Yes":
         MessageBox.Show("Deletion canceled by user.", "Info")
         return
 
     # Step 5: Verify shared parameter file accessibility
-    log_message("Verifying shared parameter file...")
+    log.info("Verifying shared parameter file...")
     shared_param_file = r"C:\Temp\revit_shared_params.txt"
     try:
         if not os.path.exists(shared_param_file):
@@ -916,14 +848,14 @@ def remove_parameter_clicked(sender, args):
         if sp_file is None:
             MessageBox.Show("Failed to open shared parameter file: {}".format(shared_param_file), "Error")
             return
-        log_message("Shared parameter file opened successfully.")
+        log.info("Shared parameter file opened successfully.")
     except Exception as ex:
-        log_message("Error accessing shared parameter file: {}".format(str(ex)))
+        log.error("Error accessing shared parameter file: {}", str(ex))
         MessageBox.Show("Error accessing shared parameter file. Cannot proceed.", "Error")
         return
 
     # Step 6: Collect bindings to remove
-    log_message("Collecting parameter bindings to remove...")
+    log.info("Collecting parameter bindings to remove...")
     binding_map = doc.ParameterBindings
     bindings_to_remove = []
     binding_count = 0
@@ -932,63 +864,64 @@ def remove_parameter_clicked(sender, args):
         binding_count += 1
         definition = it.Key
         if not hasattr(definition, "Name"):
-            log_message("Binding {} has no Name attribute. Skipping.".format(binding_count))
+            log.debug("Binding {} has no Name attribute. Skipping.", binding_count)
             continue
         def_name = definition.Name
-        log_message("Found binding: {}".format(def_name))
+        log.info("Found binding: {}", def_name)
         if def_name in names_to_delete:
             bindings_to_remove.append((definition, def_name))
-    log_message("Total bindings found: {}".format(binding_count))
-    log_message("Bindings to remove: " + ", ".join(name for _, name in bindings_to_remove))
+    log.info("Total bindings found: {}", binding_count)
+    log.info("Bindings to remove: {}", ", ".join(name for _, name in bindings_to_remove))
 
     # Step 7: Remove bindings one by one
     deleted = []
     for definition, def_name in bindings_to_remove:
-        log_message("Starting transaction for removing binding: {}".format(def_name))
-        t = Transaction(doc, "Delete Parameter Binding: {}".format(def_name))
-        try:
-            t.Start()
-            log_message("Transaction started successfully for: {}".format(def_name))
-            log_message("Removing binding for parameter: {}".format(def_name))
-            if binding_map.Remove(definition):
-                deleted.append(def_name)
-                log_message("Successfully removed binding for: {}".format(def_name))
-            else:
-                log_message("Failed to remove binding for parameter: {}".format(def_name))
-                MessageBox.Show("Failed to remove binding for parameter: {}".format(def_name), "Warning")
-            log_message("Committing transaction for: {}".format(def_name))
-            t.Commit()
-            log_message("Transaction committed successfully for: {}".format(def_name))
-        except Exception as ex:
-            t.RollBack()
-            log_message("Delete operation failed for {}: {}".format(def_name, str(ex)))
-            MessageBox.Show("Delete operation failed for {}: {}".format(def_name, str(ex)), "Error")
-            return
+        log.info("Starting transaction for removing binding: {}", def_name)
+        with span("Delete Parameter Binding", TRANSACTION, parameter=def_name):
+            t = Transaction(doc, "Delete Parameter Binding: {}".format(def_name))
+            try:
+                t.Start()
+                log.info("Transaction started successfully for: {}", def_name)
+                log.info("Removing binding for parameter: {}", def_name)
+                if binding_map.Remove(definition):
+                    deleted.append(def_name)
+                    log.info("Successfully removed binding for: {}", def_name)
+                else:
+                    log.warning("Failed to remove binding for parameter: {}", def_name)
+                    MessageBox.Show("Failed to remove binding for parameter: {}".format(def_name), "Warning")
+                log.info("Committing transaction for: {}", def_name)
+                t.Commit()
+                log.info("Transaction committed successfully for: {}", def_name)
+            except Exception as ex:
+                t.RollBack()
+                log.error("Delete operation failed for {}: {}", def_name, str(ex))
+                MessageBox.Show("Delete operation failed for {}: {}".format(def_name, str(ex)), "Error")
+                return
         # Small delay to allow Revit to stabilize
         try:
             Thread.Sleep(100)  # 100ms delay
-            log_message("Delay completed after removing binding for: {}".format(def_name))
+            log.info("Delay completed after removing binding for: {}", def_name)
         except:
-            log_message("Delay failed after removing binding for: {}".format(def_name))
+            log.warning("Delay failed after removing binding for: {}", def_name)
 
     # Step 8: Finalize
     if deleted:
-        log_message("Parameters deleted: " + ", ".join(deleted))
+        log.info("Parameters deleted: {}", ", ".join(deleted))
     else:
-        log_message("No parameters were deleted.")
+        log.info("No parameters were deleted.")
         MessageBox.Show("No parameters were deleted.", "Info")
         return
 
     # Step 9: Refresh the data grid
-    log_message("Refreshing data grid...")
+    log.info("Refreshing data grid...")
     try:
         global all_vm
         all_vm = build_vm_for_element(selected_elements[0])
         refresh_grid()
-        log_message("Data grid refreshed successfully.")
+        log.info("Data grid refreshed successfully.")
         MessageBox.Show("Parameter deletion completed. Data grid refreshed.", "Success")
     except Exception as ex:
-        log_message("Error refreshing data grid: {}".format(str(ex)))
+        log.error("Error refreshing data grid: {}", str(ex))
         MessageBox.Show("Error refreshing data grid: {}".format(str(ex)), "Error")
 
 
@@ -1005,4 +938,6 @@ btnRemoveParameter = window.FindName("btnRemoveParameter")
 btnRemoveParameter.Click += remove_parameter_clicked
 
 refresh_grid()
-window.ShowDialog()
\ No newline at end of file
+window.ShowDialog()
+log.close()
+tracer.finish(script.get_output())
@@ -1,53 +1,240 @@
-# pyRevit script to set room numbers using a predefined list (IronPython-compatible)
+# -*- coding: utf-8 -*-
+__title__ = "RoomTAG"
+__author__ = "Anirudh"
+__doc__ = """Renumbers rooms.
+Spatial Numbering: level by level (lowest level first), using the selected rooms or all placed rooms.
+Ordering:
+- Snake: horizontal bands top to bottom, alternating left->right / right->left
+- Nearest neighbour: chain from a picked start room to the closest unnumbered room
+- Along path: order by distance along picked model/detail lines
+Number pattern tokens: {level} level prefix (digits of the level name, or its position by elevation
+from 1, zero-padded, when two levels share a number), {level_index}, {n} running number
+e.g. {level}{n:02d} -> 101, 102, ... / L{level}-{n:03d} -> L1-001
+Import Mapping: CSV/XLSX with a "New Number" column, matched to all placed rooms by
+Name, Number, Level + Name, or nearest X/Y point (meters, optional Level column).
+Only rooms whose number changes are written.
+Both modes check the new numbers against all rooms of the phase before writing
+and resolve collisions with a letter suffix, the next free number, or by skipping the room.
+Check Duplicates: lists rooms sharing a number (per phase, phase + level, or whole model)."""
 
-from Autodesk.Revit.DB import FilteredElementCollector, BuiltInCategory, Transaction
-from Autodesk.Revit.UI import TaskDialog
+#⬇️ IMPORTS
+#------------------------------
+import os
+from Autodesk.Revit.DB import *
 from Autodesk.Revit.DB.Architecture import Room
-from pyrevit import revit, script
-
-# Sample list of room numbers to assign (must match the number of rooms selected)
-room_numbers = ["101", "102", "103", "104", "105"]  # <-- Customize this list as needed
-
-# Get document and selection
-doc = revit.doc
-uidoc = revit.uidoc
-
-# Allow user to select rooms manually
-selection_ids = uidoc.Selection.GetElementIds()
-if not selection_ids:
-    TaskDialog.Show("Room Number Setter", "Please select rooms before running the script.")
-    script.exit()
-
-# Convert selected elements to Room objects
-rooms = []
-for eid in selection_ids:
-    elem = doc.GetElement(eid)
-    if isinstance(elem, Room):
-        rooms.append(elem)
-
-if not rooms:
-    TaskDialog.Show("Room Number Setter", "No valid room elements were selected.")
-    script.exit()
-
-# Ensure room count matches number list
-if len(rooms) != len(room_numbers):
-    msg = "Mismatch between selected rooms ({0}) and numbers in list ({1}).".format(len(rooms), len(room_numbers))
-    TaskDialog.Show("Room Number Setter", msg)
-    script.exit()
-
-# Sort rooms by element Id to ensure stable ordering (optional)
-rooms.sort(key=lambda r: r.Id.IntegerValue)
-
-# Start transaction to update room numbers
-t = Transaction(doc, "Set Room Numbers")
-t.Start()
-
-for i, room in enumerate(rooms):
+from Autodesk.Revit.UI.Selection import ObjectType, ISelectionFilter
+from pyrevit import revit, script, forms
+from Snippets._rooms import (ORDERINGS, ORDER_NEAREST, ORDER_PATH, DEFAULT_PATTERN, FEET_PER_METER,
+                             MATCH_COLUMNS, MATCH_POINT, NEW_NUMBER_COLUMN,
+                             get_placed_rooms, plan_room_numbers, apply_room_numbers,
+                             match_room_mapping, apply_room_mapping,
+                             RoomNumberIndex, get_all_rooms, POLICIES, SCOPES)
+from Snippets._excel import read_table_file
+from Snippets._report import ImportReport, ROOM_STATUSES, DUPLICATE
+from Snippets._trace import start_trace, span, TRANSACTION
+
+
+#📦 VARIABLES
+#------------------------------
+doc    = revit.doc
+uidoc  = revit.uidoc
+output = script.get_output()
+tracer = start_trace(__title__)  # Off unless PYANIRUDH_TRACE is set
+
+
+class _CategorySelectionFilter(ISelectionFilter):
+    def __init__(self, predicate):
+        self.predicate = predicate
+
+    def AllowElement(self, elem):
+        return self.predicate(elem)
+
+    def AllowReference(self, reference, position):
+        return False
+
+
+def pick_start_room():
+    """Pick the first room of the nearest neighbour chain. Esc -> bottom-left room of every level."""
+    try:
+        ref = uidoc.Selection.PickObject(ObjectType.Element, _CategorySelectionFilter(lambda e: isinstance(e, Room)),
+                                         "Pick the start room (Esc to start bottom-left)")
+        return doc.GetElement(ref)
+    except Exception:
+        return None
+
+
+def pick_path_points():
+    """Pick model/detail lines in path order. Returns list of (x, y)."""
+    try:
+        refs = uidoc.Selection.PickObjects(ObjectType.Element, _CategorySelectionFilter(lambda e: isinstance(e, CurveElement)),
+                                           "Pick path lines in order, then Finish")
+    except Exception:
+        return []
+    points = []
+    for ref in refs:
+        for pt in doc.GetElement(ref).GeometryCurve.Tessellate():
+            if not points or (points[-1][0], points[-1][1]) != (pt.X, pt.Y):
+                points.append((pt.X, pt.Y))
+    return points
+
+
+def print_resolutions(resolutions):
+    """Table of proposed numbers that collided with existing ones."""
+    if not resolutions:
+        return
+    output.print_md("### ⚡ {} duplicate number(s) resolved".format(len(resolutions)))
+    output.print_table(table_data=[[output.linkify(room.Id), proposed, final or "(skipped)"]
+                                   for room, proposed, final in resolutions],
+                       columns=["Room", "Proposed", "Written"])
+
+
+def check_plan(plan, policy):
+    """Validate a proposed numbering against all rooms of the phase; apply the policy only if numbers collide.
+    Returns (plan, resolutions)."""
+    index = RoomNumberIndex(get_all_rooms(doc))
+    collisions = index.validate(plan)
+    if not collisions:
+        return plan, []
+    output.print_md("### ⚠️ {} proposed number(s) already in use - {}".format(len(collisions), policy))
+    return index.resolve(plan, policy)
+
+
+#🎯 MAIN
+#------------------------------
+def spatial_numbering():
+    selected_ids = uidoc.Selection.GetElementIds()
+    rooms = get_placed_rooms(doc, selected_ids if selected_ids.Count else None)
+    if not rooms:
+        forms.alert("No placed rooms found in the selection or model.", exitscript=True)
+
+    from rpw.ui.forms import (FlexForm, Label, TextBox, ComboBox, Separator, Button)
+    components = [Label('Ordering:'),                ComboBox('ordering', ORDERINGS),
+                  Label('Number pattern:'),          TextBox('pattern', Text=DEFAULT_PATTERN),
+                  Label('Start:'),                   TextBox('start', Text="1"),
+                  Label('Increment:'),               TextBox('step', Text="1"),
+                  Label('Snake band height (m):'),   TextBox('band', Text="6"),
+                  Label('On duplicate numbers:'),    ComboBox('policy', POLICIES),
+                  Separator(),                       Button('Number {} Rooms'.format(len(rooms)))]
+    form = FlexForm('Room Numbering', components)
+    form.show()
+    if not form.values:
+        script.exit()
+
     try:
-        room.Number = room_numbers[i]
-    except Exception as e:
-        print("Failed to set number for Room ID {0}: {1}".format(room.Id, str(e)))
+        start       = int(form.values['start'])
+        step        = int(form.values['step'])
+        band_height = float(form.values['band']) * FEET_PER_METER
+        form.values['pattern'].format(level="1", level_index=0, n=1)
+    except (ValueError, KeyError, IndexError) as e:
+        forms.alert("Invalid input: {}".format(e), exitscript=True)
+
+    ordering    = form.values['ordering']
+    start_room  = pick_start_room() if ordering == ORDER_NEAREST else None
+    path_points = pick_path_points() if ordering == ORDER_PATH else None
+    if ordering == ORDER_PATH and len(path_points or []) < 2:
+        forms.alert("No path picked.", exitscript=True)
+
+    plan = plan_room_numbers(doc, rooms, ordering=ordering, pattern=form.values['pattern'], start=start, step=step,
+                             band_height=band_height, start_room=start_room, path_points=path_points)
+    plan, resolutions = check_plan(plan, form.values['policy'])
+
+    with span("Renumber Rooms", TRANSACTION, rooms=len(plan)):
+        t = Transaction(doc, "Renumber Rooms")
+        t.Start()
+        try:
+            changed, errors = apply_room_numbers(plan)
+            t.Commit()
+        except Exception as e:
+            t.RollBack()
+            forms.alert("Renumbering failed and was rolled back:\n{}".format(e), exitscript=True)
+
+    output.print_md("### ✅ Renumbered {} of {} room(s) ({})".format(changed, len(plan), ordering))
+    print_resolutions(resolutions)
+    for room, message in errors:
+        output.print_md("❌ Room {}: {}".format(output.linkify(room.Id), message))
+
+
+def import_mapping():
+    path = forms.pick_file(files_filter="Room Mapping (*.csv;*.xlsx;*.xls)|*.csv;*.xlsx;*.xls")
+    if not path:
+        script.exit()
+
+    mode = forms.CommandSwitchWindow.show(list(MATCH_COLUMNS), message="Match rooms by:")
+    if not mode:
+        script.exit()
+
+    tolerance = 1.0
+    if mode == MATCH_POINT:
+        value = forms.ask_for_string(default="1.0", prompt="Max distance from room point (m):", title="Nearest Point")
+        try:
+            tolerance = float(value)
+        except (TypeError, ValueError):
+            script.exit()
+
+    policy = forms.CommandSwitchWindow.show(POLICIES, message="On duplicate numbers:")
+    if not policy:
+        script.exit()
+
+    headers, rows = read_table_file(path)
+    rooms = get_placed_rooms(doc)
+    report = ImportReport("Room Mapping Import", key_label="Key / Number", key_field="key", statuses=ROOM_STATUSES)
+    try:
+        matches = match_room_mapping(doc, rooms, headers, rows, mode, report, tolerance)
+    except ValueError as e:
+        forms.alert("{}\nExpected columns: {} + '{}'".format(e, ", ".join(MATCH_COLUMNS[mode]), NEW_NUMBER_COLUMN),
+                    exitscript=True)
+
+    # Resolve collisions with rooms outside the mapping (and within it) before writing
+    plan, resolutions = check_plan([(room, number) for _, room, number in matches], policy)
+    final_numbers = {room.Id.IntegerValue: number for room, number in plan}
+    for row_number, room, number in matches:
+        if room.Id.IntegerValue not in final_numbers:
+            report.add(DUPLICATE, row_number, number, room.Number, "Number already used in the phase, skipped")
+    matches = [(row_number, room, final_numbers[room.Id.IntegerValue]) for row_number, room, _ in matches
+               if room.Id.IntegerValue in final_numbers]
+
+    with span("Import Room Numbers", TRANSACTION, rooms=len(matches)):
+        t = Transaction(doc, "Import Room Numbers")
+        t.Start()
+        try:
+            updated = apply_room_mapping(matches, report)
+            t.Commit()
+        except Exception as e:
+            t.RollBack()
+            forms.alert("Import failed and was rolled back:\n{}".format(e), exitscript=True)
+
+    report.render(output)
+    report.write_jsonl(os.path.splitext(path)[0] + "_import.jsonl")
+    output.print_md("✅ **Updated {} room number(s) from `{}`**".format(updated, path))
+    print_resolutions(resolutions)
+
+
+def check_duplicates():
+    scope = forms.CommandSwitchWindow.show(SCOPES, message="Room numbers must be unique:")
+    if not scope:
+        script.exit()
+
+    rooms = get_all_rooms(doc)
+    duplicates = RoomNumberIndex(rooms, scope).duplicates()
+    if not duplicates:
+        output.print_md("### ✅ No duplicate room numbers among {} room(s) ({})".format(len(rooms), scope))
+        return
+
+    output.print_md("### ⚠️ {} duplicate room number(s) among {} room(s) ({})".format(len(duplicates), len(rooms), scope))
+    table = []
+    for _, number, dup_rooms in duplicates:
+        level = doc.GetElement(dup_rooms[0].LevelId)
+        table.append([number, len(dup_rooms), level.Name if level else "(unplaced)",
+                      output.linkify([r.Id for r in dup_rooms])])
+    output.print_table(table_data=table, columns=["Number", "Rooms", "Level", "Select"])
 
-t.Commit()
 
-TaskDialog.Show("Room Number Setter", "Updated {0} room numbers successfully.".format(len(rooms)))
+selected_mode = forms.CommandSwitchWindow.show(["Spatial Numbering", "Import Mapping", "Check Duplicates"],
+                                               message="Room numbering:")
+if selected_mode == "Spatial Numbering":
+    spatial_numbering()
+elif selected_mode == "Import Mapping":
+    import_mapping()
+elif selected_mode == "Check Duplicates":
+    check_duplicates()
+tracer.finish(output)
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+__title__ = "Tag Rooms"
+__author__ = "Anirudh"
+__doc__ = """Tags all untagged rooms in the selected plan views.
+Rooms that already have a room tag in a view are skipped, so re-running only tags new rooms.
+Tags are placed at the room location point with the default room tag type,
+in batches of transactions grouped into one undo step.
+Cancelling keeps the tags created so far - run again to continue."""
+
+#⬇️ IMPORTS
+#------------------------------
+from Autodesk.Revit.DB import *
+from pyrevit import revit, script, forms
+from Snippets._rooms import find_untagged_rooms, tag_rooms, batched
+from Snippets._trace import start_trace, span, TRANSACTION
+
+
+#📦 VARIABLES
+#------------------------------
+doc    = revit.doc
+output = script.get_output()
+tracer = start_trace(__title__)  # Off unless PYANIRUDH_TRACE is set
+
+
+def is_plan_view(view):
+    return isinstance(view, ViewPlan) and not view.IsTemplate
+
+
+#🎯 MAIN
+#------------------------------
+views = forms.select_views(title="Select Plan Views to Tag", filterfunc=is_plan_view, use_selection=True)
+if not views:
+    script.exit()
+
+# Work list first, so the progress bar knows the total and views without untagged rooms cost nothing
+work = [(view, rooms) for view in views for rooms in [find_untagged_rooms(doc, view)] if rooms]
+total = sum(len(rooms) for _, rooms in work)
+if not total:
+    forms.alert("All rooms in the selected views are already tagged.", exitscript=True)
+
+results = []  # [view, created, errors]
+done = 0
+tg = TransactionGroup(doc, "Tag Rooms")
+tg.Start()
+with forms.ProgressBar(title="Tag Rooms ({value} of {max_value} rooms)", cancellable=True) as pb:
+    for view, rooms in work:
+        result = [view, 0, []]
+        results.append(result)
+        for chunk in batched(rooms):
+            if pb.cancelled:
+                break
+            with span("Tag Rooms: {}".format(view.Name), TRANSACTION, rooms=len(chunk)):
+                t = Transaction(doc, "Tag Rooms: {}".format(view.Name))
+                t.Start()
+                try:
+                    created, errors = tag_rooms(doc, view, chunk)
+                    t.Commit()
+                    result[1] += created
+                    result[2].extend(errors)
+                except Exception as e:
+                    t.RollBack()
+                    result[2].extend((room, str(e)) for room in chunk)
+            done += len(chunk)
+            pb.update_progress(done, total)
+        if pb.cancelled:
+            break
+tg.Assimilate()
+
+output.print_md("### 🏷️ Tagged {} of {} untagged room(s)".format(sum(r[1] for r in results), total))
+output.print_table(table_data=[[output.linkify(view.Id, view.Name), created, len(errors)] for view, created, errors in results],
+                   columns=["View", "Tags Created", "Errors"])
+for view, _, errors in results:
+    for room, message in errors:
+        output.print_md("❌ {} / Room {}: {}".format(view.Name, output.linkify(room.Id), message))
+tracer.finish(output)
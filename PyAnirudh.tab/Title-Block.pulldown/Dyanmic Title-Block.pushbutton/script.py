@@ -24,6 +24,8 @@ import re
 
 from System.Runtime.InteropServices import Marshal
 from System.Windows.Forms import OpenFileDialog, DialogResult
+from Snippets._report import ImportReport, UPDATED, UNCHANGED, MISSING_SHEET, MISSING_LEGEND, ERROR
+from Snippets._trace import start_trace, span, count, TRANSACTION, IO
 
 clr.AddReference("Microsoft.Office.Interop.Excel")
 import Microsoft.Office.Interop.Excel as Excel
@@ -33,8 +35,10 @@ print("Imports completed successfully")
 
 doc = __revit__.ActiveUIDocument.Document
 output = script.get_output()
+tracer = start_trace(__title__)  # Off unless PYANIRUDH_TRACE is set
 output_folder = os.path.expanduser("~\\Documents")
 excel_path = os.path.join(output_folder, "sheet_data_export.xlsx")
+import_log_path = os.path.join(output_folder, "legend_import.jsonl")  # Set to None to skip the JSON-lines log
 
 # Debug: Confirm output object is initialized
 output.print_md("ℹ️ Output initialized. Script is running...")
@@ -382,7 +386,8 @@ if selected_option == "Export to Excel":
         worksheet.Rows.AutoFit()
 
         # Save and close
-        workbook.SaveAs(excel_path)
+        with span("Save workbook", IO):
+            workbook.SaveAs(excel_path)
         output.print_md("✅ **Sheet data exported to Excel (with proper wrapping & auto height):** `%s`" % excel_path)
 
     except Exception as e:
@@ -415,6 +420,9 @@ else:
     # Get headers
     headers = [worksheet.Cells[1, col].Value2 for col in range(1, worksheet.UsedRange.Columns.Count + 1)]
 
+    report = ImportReport("Legend Import")
+    target = "Legend"
+
     # Process each row (skip header row)
     for row in range(2, worksheet.UsedRange.Rows.Count + 1):
         try:
@@ -425,12 +433,12 @@ else:
 
             # Skip if Sheet Number is empty
             if not sheet_number:
-                output.print_md("⚠️ Row %d: Sheet Number is empty. Skipping." % row)
+                report.add(ERROR, row, message="Sheet Number is empty")
                 continue
 
             # Find the corresponding sheet in Revit
             if sheet_number not in sheet_dict:
-                output.print_md("⚠️ Sheet with Sheet Number '%s' not found in Revit⚫️. Skipping." % sheet_number)
+                report.add(MISSING_SHEET, row, sheet_number, message="Sheet not found in Revit")
                 continue
             sheet = sheet_dict[sheet_number]
 
@@ -454,7 +462,7 @@ else:
 
             # Skip if no sections have content
             if not sections:
-                output.print_md("ℹ️ Row %d: No Legend sections content for sheet '%s'. Skipping." % (row, sheet_number))
+                report.add(UNCHANGED, row, sheet_number, target, "No Legend sections content")
                 continue
 
             # Find the first Legend view on the sheet
@@ -467,7 +475,7 @@ else:
                     break
 
             if not legend_view:
-                output.print_md("⚡ No Legend view found on sheet '%s'. Skipping." % sheet_number)
+                report.add(MISSING_LEGEND, row, sheet_number, target, "No Legend view found on sheet")
                 continue
 
             # Collect existing TextNotes elements
@@ -480,42 +488,45 @@ else:
 
             # Skip if the content hasn't changed
             if existing_content == new_content:
-                output.print_md("ℹ️ Row %d: Legend content for sheet '%s' has not changed. Skipping." % (row, sheet_number))
+                report.add(UNCHANGED, row, sheet_number, target)
                 continue
 
             # Start a transaction to modify TextNotes
-            t = Transaction(doc, "Update Legend on Sheet %s" % sheet_number)
-            t.Start()
-            try:
-                # Store properties of existing TextNotes
-                positions = [(tn.Coord.X, tn.Coord.Y) for tn in text_notes_sorted]
-                widths = [tn.Width for tn in text_notes_sorted]
-                alignments = [tn.HorizontalAlignment for tn in text_notes_sorted]
-                # Get the TextNoteType from existing notes or default
-                text_note_type_id = text_notes_sorted[0].TextNoteType.Id if text_notes_sorted else FilteredElementCollector(doc).OfClass(TextNoteType).FirstElement().Id
-
-                # Delete existing TextNotes
-                for tn in text_notes_sorted:
-                    doc.Delete(tn.Id)
-
-                # Recreate TextNotes for each section
-                current_y = positions[0][1] if positions else 0
-                current_x = positions[0][0] if positions else 0
-                text_note_options = TextNoteOptions(text_note_type_id)
-                text_note_options.HorizontalAlignment = alignments[0] if alignments else HorizontalTextAlignment.Left
-
-                for i, section in enumerate(sections):
-                    new_note = TextNote.Create(doc, legend_view.Id, XYZ(current_x, current_y - i * 0.5, 0), section, text_note_type_id)
-                    new_note.Width = widths[0] if widths else 1.0  # Preserve original width or default to 1.0 feet
-
-                t.Commit()
-                output.print_md("✅ Updated Legend on sheet '%s'" % sheet_number)
-
-            except Exception as e:
-                t.RollBack()
-                output.print_md("⚫️ Error updating Legend on sheet '%s': %s" % (sheet_number, str(e)))
+            with span("Update Legend on Sheet %s" % sheet_number, TRANSACTION):
+                t = Transaction(doc, "Update Legend on Sheet %s" % sheet_number)
+                t.Start()
+                try:
+                    # Store properties of existing TextNotes
+                    positions = [(tn.Coord.X, tn.Coord.Y) for tn in text_notes_sorted]
+                    widths = [tn.Width for tn in text_notes_sorted]
+                    alignments = [tn.HorizontalAlignment for tn in text_notes_sorted]
+                    # Get the TextNoteType from existing notes or default
+                    text_note_type_id = text_notes_sorted[0].TextNoteType.Id if text_notes_sorted else FilteredElementCollector(doc).OfClass(TextNoteType).FirstElement().Id
+
+                    # Delete existing TextNotes
+                    for tn in text_notes_sorted:
+                        doc.Delete(tn.Id)
+                    count("TextNote.Delete", len(text_notes_sorted))
+
+                    # Recreate TextNotes for each section
+                    current_y = positions[0][1] if positions else 0
+                    current_x = positions[0][0] if positions else 0
+                    text_note_options = TextNoteOptions(text_note_type_id)
+                    text_note_options.HorizontalAlignment = alignments[0] if alignments else HorizontalTextAlignment.Left
+
+                    for i, section in enumerate(sections):
+                        new_note = TextNote.Create(doc, legend_view.Id, XYZ(current_x, current_y - i * 0.5, 0), section, text_note_type_id)
+                        new_note.Width = widths[0] if widths else 1.0  # Preserve original width or default to 1.0 feet
+                    count("TextNote.Create", len(sections))
+
+                    t.Commit()
+                    report.add(UPDATED, row, sheet_number, target)
+
+                except Exception as e:
+                    t.RollBack()
+                    report.add(ERROR, row, sheet_number, target, str(e))
         except Exception as e:
-            output.print_md("⚠️ Error processing row %d: %s" % (row, str(e)))
+            report.add(ERROR, row, message="Error processing row: %s" % e)
             continue
 
     # Clean up Excel
@@ -530,4 +541,9 @@ else:
         if 'excel_app' in locals():
             Marshal.ReleaseComObject(excel_app)
 
-    output.print_md("✅ **Finished importing Legend sections from Excel: `%s`**" % excel_path)
\ No newline at end of file
+    report.render(output)
+    if import_log_path:
+        report.write_jsonl(import_log_path)
+    output.print_md("✅ **Finished importing Legend sections from Excel: `%s`**" % excel_path)
+
+tracer.finish(output)
@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 __title__ = "Title Block"
-__doc__ = '''Extracts parameters, general notes, revision table, and drawing details from selected sheets, or imports changes to General Notes from Excel back into Revit.'''
+__doc__ = '''Extracts parameters, general notes, revision table, and drawing details from selected sheets, or imports the editable sheet parameters and General Notes from Excel back into Revit.'''
 __author__ = 'Anirudh Pachore'
 
 from Autodesk.Revit.DB import *
@@ -9,37 +9,24 @@ from pyrevit import script, forms
 from pyrevit.forms import alert
 import os
 import clr
-import re
 import System
 from System.Runtime.InteropServices import Marshal
+from Snippets._excel import read_used_range, cell_to_text
+from Snippets._sheets import (EDITABLE_SHEET_COLUMNS, SHEET_EXPORT_HEADERS, TEXT_EXPORT_COLUMNS,
+                              normalize_sheet_number, resolve_column_parameters, plan_sheet_parameter_changes,
+                              apply_param_changes, update_general_notes, sheet_export_row)
+from Snippets._report import ImportReport, UPDATED, UNCHANGED, MISSING_SHEET, MISSING_LEGEND, ERROR
+from Snippets._trace import start_trace, span, count, TRANSACTION, IO
 
 clr.AddReference("Microsoft.Office.Interop.Excel")
 import Microsoft.Office.Interop.Excel as Excel
 
 doc = __revit__.ActiveUIDocument.Document
 output = script.get_output()
+tracer = start_trace(__title__)  # Off unless PYANIRUDH_TRACE is set
 output_folder = os.path.expanduser("~\\Documents")
 excel_path = os.path.join(output_folder, "sheet_data_export.xlsx")
-
-
-def get_param_value(element, param_name, built_in_param=None):
-    if not element:
-        return ""
-    if built_in_param:
-        param = element.get_Parameter(built_in_param)
-        if param and param.HasValue:
-            return param.AsString() or param.AsValueString() or ""
-    param = element.LookupParameter(param_name)
-    if param and not param.IsReadOnly:
-        if param.StorageType == StorageType.String:
-            return param.AsString() or ""
-        elif param.StorageType == StorageType.Integer:
-            return str(param.AsInteger())
-        elif param.StorageType == StorageType.Double:
-            return str(param.AsDouble())
-        elif param.StorageType == StorageType.ElementId:
-            return str(param.AsElementId().IntegerValue)
-    return ""
+import_log_path = os.path.join(output_folder, "sheet_data_import.jsonl")  # Set to None to skip the JSON-lines log
 
 
 # Show dialog to choose between Export and Import
@@ -86,50 +73,47 @@ if selected_option == "Export to Excel":
     sheets = [sheet_dict[sheet_name] for sheet_name in selected_sheet_names]
 
     # Get the TextNotes for Project ID, Pre., Check, Appro., and Date from the first Titleblock family
-    titleblock = None
-    for sheet in sheets:
-        titleblocks = [doc.GetElement(id) for id in sheet.GetDependentElements(ElementClassFilter(FamilyInstance)) if
-                       isinstance(doc.GetElement(id), FamilyInstance)]
-        titleblock = titleblocks[0] if titleblocks else None
+    with span("Read titleblock family", IO):
+        titleblock = None
+        for sheet in sheets:
+            titleblocks = [doc.GetElement(id) for id in sheet.GetDependentElements(ElementClassFilter(FamilyInstance)) if
+                           isinstance(doc.GetElement(id), FamilyInstance)]
+            titleblock = titleblocks[0] if titleblocks else None
+            if titleblock and titleblock.Symbol and titleblock.Symbol.Family:
+                break
+
+        titleblock_text = {}
+
         if titleblock and titleblock.Symbol and titleblock.Symbol.Family:
-            break
-
-    project_id_value = ""
-    pre_value = ""
-    check_value = ""
-    appro_value = ""
-    date_value = ""
-
-    if titleblock and titleblock.Symbol and titleblock.Symbol.Family:
-        family = titleblock.Symbol.Family
-        family_doc = doc.EditFamily(family)
-        if family_doc:
-            # Extract Project ID
-            project_id_element = family_doc.GetElement(ElementId(8193766))
-            if project_id_element and isinstance(project_id_element, TextNote):
-                project_id_value = project_id_element.Text or ""
-
-            # Extract Pre.
-            pre_element = family_doc.GetElement(ElementId(9999991))  # Placeholder ID
-            if pre_element and isinstance(pre_element, TextNote):
-                pre_value = pre_element.Text or ""
-
-            # Extract Check
-            check_element = family_doc.GetElement(ElementId(9999992))  # Placeholder ID
-            if check_element and isinstance(check_element, TextNote):
-                check_value = check_element.Text or ""
-
-            # Extract Appro.
-            appro_element = family_doc.GetElement(ElementId(9999993))  # Placeholder ID
-            if appro_element and isinstance(appro_element, TextNote):
-                appro_value = appro_element.Text or ""
-
-            # Extract Date
-            date_element = family_doc.GetElement(ElementId(9999994))  # Placeholder ID
-            if date_element and isinstance(date_element, TextNote):
-                date_value = date_element.Text or ""
-
-            family_doc.Close(False)
+            family = titleblock.Symbol.Family
+            family_doc = doc.EditFamily(family)
+            if family_doc:
+                # Extract Project ID
+                project_id_element = family_doc.GetElement(ElementId(8193766))
+                if project_id_element and isinstance(project_id_element, TextNote):
+                    titleblock_text["Project ID"] = project_id_element.Text or ""
+
+                # Extract Pre.
+                pre_element = family_doc.GetElement(ElementId(9999991))  # Placeholder ID
+                if pre_element and isinstance(pre_element, TextNote):
+                    titleblock_text["Pre."] = pre_element.Text or ""
+
+                # Extract Check
+                check_element = family_doc.GetElement(ElementId(9999992))  # Placeholder ID
+                if check_element and isinstance(check_element, TextNote):
+                    titleblock_text["Check"] = check_element.Text or ""
+
+                # Extract Appro.
+                appro_element = family_doc.GetElement(ElementId(9999993))  # Placeholder ID
+                if appro_element and isinstance(appro_element, TextNote):
+                    titleblock_text["Appro."] = appro_element.Text or ""
+
+                # Extract Date
+                date_element = family_doc.GetElement(ElementId(9999994))  # Placeholder ID
+                if date_element and isinstance(date_element, TextNote):
+                    titleblock_text["Date"] = date_element.Text or ""
+
+                family_doc.Close(False)
 
     # Start Excel export process
     excel_app = None
@@ -142,13 +126,7 @@ if selected_option == "Export to Excel":
         worksheet = workbook.Worksheets[1]
 
         # Headers
-        headers = [
-            "Sheet Number", "Sheet Name", "Sheet Issue Date", "Drawn By", "Checked By", "Designed By", "Approved By",
-            "Project ID", "Orig.", "Phas.", "Stag.", "Area", "Zone", "Doc Type", "Disc", "Ser No"
-        ]
-        headers.extend(
-            ["General Notes", "Internal Revision", "Sheet Revision", "Revision Descriptions", "Pre.", "Check", "Appro.",
-             "Date"])
+        headers = SHEET_EXPORT_HEADERS
         for col, header in enumerate(headers, 1):
             cell = worksheet.Cells[1, col]
             cell.Value2 = header
@@ -156,6 +134,10 @@ if selected_option == "Export to Excel":
             cell.Interior.Color = 0xB7DEE8  # Light blue background
             cell.WrapText = True
 
+        # Sheet Number and the editable columns are Text, so codes like "01" and dates survive the round trip
+        for col in TEXT_EXPORT_COLUMNS:
+            worksheet.Columns[col].NumberFormat = "@"
+
         # Autofit columns based on header text
         worksheet.Columns.AutoFit()
 
@@ -171,72 +153,13 @@ if selected_option == "Export to Excel":
 
         # Process each selected sheet
         for row_idx, sheet in enumerate(sheets, start=2):
-            titleblocks = [doc.GetElement(id) for id in sheet.GetDependentElements(ElementClassFilter(FamilyInstance))
-                           if isinstance(doc.GetElement(id), FamilyInstance)]
-            titleblock = titleblocks[0] if titleblocks else None
-
+            data_row = sheet_export_row(doc, sheet, titleblock_text)
 
-            def safe_param(element, name, built_in_param=None):
-                return get_param_value(element, name, built_in_param)
-
-
-            # General Notes
-            general_notes_text = ""
-            viewports = FilteredElementCollector(doc, sheet.Id).OfClass(Viewport).ToElements()
-            for vp in viewports:
-                view = doc.GetElement(vp.ViewId)
-                if isinstance(view, View) and view.ViewType == ViewType.Legend and "GENERAL NOTES" in view.Name.upper():
-                    text_notes = FilteredElementCollector(doc, view.Id).WhereElementIsNotElementType().OfClass(
-                        TextNote).ToElements()
-                    text_notes_sorted = sorted(text_notes, key=lambda x: (-x.Coord.Y, x.Coord.X))
-                    raw_notes = " ".join([tn.Text for tn in text_notes_sorted])
-                    raw_notes = re.sub(r'\s+', ' ', raw_notes).strip()
-                    numbered_items = re.findall(r'\d+\.\s?.*?(?=(?:\d+\.\s?)|$)', raw_notes)
-                    general_notes_text = "\n".join(item.strip() for item in numbered_items)
-                    break
-
-            # Revisions (only for Revision Descriptions)
-            rev_descs = []
-            for rev_id in sheet.GetAllRevisionIds():
-                rev = doc.GetElement(rev_id)
-                rev_descs.append(rev.Description)
-
-            # Extract parameters
-            data_row = [
-                sheet.SheetNumber,
-                sheet.Name,
-                get_param_value(sheet, "Sheet Issue Date"),
-                get_param_value(sheet, "Drawn By"),
-                get_param_value(sheet, "Checked By"),
-                get_param_value(sheet, "Designed By"),
-                get_param_value(sheet, "Approved By"),
-                project_id_value,
-                safe_param(sheet, "Sheet No._Origin"),
-                safe_param(sheet, "Sheet No._Project phase"),
-                safe_param(sheet, "Sheet No._Stage"),
-                safe_param(sheet, "Sheet No._Facility-Area"),
-                safe_param(sheet, "Sheet No._Floor-Zone-Street"),
-                safe_param(sheet, "Sheet No._Doc type"),
-                safe_param(sheet, "Sheet No._Discipline"),
-                sheet.SheetNumber,  # Ser No (same as Sheet Number)
-                general_notes_text,
-                safe_param(sheet, "Internal Revision"),
-                safe_param(sheet, "Sheet No._Revision"),
-                "\n".join(rev_descs),
-                pre_value,
-                check_value,
-                appro_value,
-                date_value
-            ]
-
-            # Write data to Excel, ensuring Sheet Number is treated as text
-            for col_idx, value in enumerate(data_row, 1):
-                cell = worksheet.Cells[row_idx, col_idx]
-                if col_idx == 1:  # Sheet Number column
-                    cell.Value2 = str(value)
-                    cell.NumberFormat = "@"  # Set format to text
-                else:
-                    cell.Value2 = value
+            # Write data to Excel (text columns were formatted above)
+            with span("Write Excel row", IO):
+                for col_idx, value in enumerate(data_row, 1):
+                    worksheet.Cells[row_idx, col_idx].Value2 = value
+            count("Excel cell writes", len(data_row))
 
         # Apply formatting to the entire used range
         used_range = worksheet.UsedRange
@@ -250,7 +173,8 @@ if selected_option == "Export to Excel":
         worksheet.Rows.AutoFit()
 
         # Save and close
-        workbook.SaveAs(excel_path)
+        with span("Save workbook", IO):
+            workbook.SaveAs(excel_path)
         output.print_md(
             "✅ **Sheet data exported to Excel (with proper wrapping & auto height):** `{}`".format(excel_path))
 
@@ -271,134 +195,93 @@ else:
     if not os.path.exists(excel_path):
         forms.alert("Excel file not found at: {}".format(excel_path), exitscript=True)
 
-    # Collect all sheets in Revit
+    # Collect all sheets in Revit (hash join by Sheet Number)
     all_sheets = FilteredElementCollector(doc).OfClass(ViewSheet).WhereElementIsNotElementType().ToElements()
     sheet_dict = {sheet.SheetNumber: sheet for sheet in all_sheets}
 
-    # Start Excel
-    excel_app = Excel.ApplicationClass()
-    excel_app.Visible = False
-    workbook = excel_app.Workbooks.Open(excel_path)
-    worksheet = workbook.Worksheets[1]
-
-    # Get headers
-    headers = [worksheet.Cells[1, col].Value2 for col in range(1, worksheet.UsedRange.Columns.Count + 1)]
-
-    # Process each row (skip header row)
-    for row in range(2, worksheet.UsedRange.Rows.Count + 1):
+    # Read the whole worksheet in one go
+    excel_app = None
+    workbook = None
+    worksheet = None
+    with span("Read workbook", IO):
         try:
-            # Get the Sheet Number and normalize it
-            sheet_number = str(worksheet.Cells[row, headers.index("Sheet Number") + 1].Value2)
-            if sheet_number.endswith(".0"):
-                sheet_number = sheet_number[:-2]  # Remove ".0"
-
-            # Skip if Sheet Number is empty
-            if not sheet_number:
-                output.print_md("⚠️ Row {}: Sheet Number is empty. Skipping.".format(row))
-                continue
-
-            # Find the corresponding sheet in Revit
-            if sheet_number not in sheet_dict:
-                output.print_md("⚠️ Sheet with Sheet Number '{}' not found in Revit⚫️. Skipping.".format(sheet_number))
-                continue
-            sheet = sheet_dict[sheet_number]
-
-            # Get the General Notes from Excel
-            general_notes_text = worksheet.Cells[row, headers.index("General Notes") + 1].Value2 or ""
-
-            # Reformat the General Notes to ensure proper line breaks
-            general_notes_text = re.sub(r'\s+', ' ', general_notes_text).strip()
-            if not general_notes_text:
-                output.print_md(
-                    "ℹ️ Row {}: General Notes for sheet '{}' is empty or contains only whitespace. Skipping.".format(
-                        row, sheet_number))
-                continue
-
-            numbered_items = re.findall(r'\d+\.\s?.*?(?=(?:\d+\.\s?)|$)', general_notes_text, re.DOTALL)
-            formatted_text = "\n".join(item.strip() for item in numbered_items)
-            if not formatted_text:
-                output.print_md(
-                    "ℹ️ Row {}: No numbered items found in General Notes for sheet '{}'. Skipping.".format(row,
-                                                                                                           sheet_number))
-                continue
-
-            # Find the general notes legend view
-            viewports = FilteredElementCollector(doc, sheet.Id).OfClass(Viewport).ToElements()
-            general_notes_view = None
-            for vp in viewports:
-                view = doc.GetElement(vp.ViewId)
-                if isinstance(view, View) and view.ViewType == ViewType.Legend and "GENERAL NOTES" in view.Name.upper():
-                    general_notes_view = view
-                    break
-
-            if not general_notes_view:
-                output.print_md("⚡ General Notes legend view not found on sheet '{}'. Skipping.".format(sheet_number))
-                continue
-
-            # Collect existing TextNotes elements
-            text_notes = FilteredElementCollector(doc, general_notes_view.Id).WhereElementIsNotElementType().OfClass(
-                TextNote).ToElements()
-            text_notes_sorted = sorted(text_notes, key=lambda x: (-x.Coord.Y, x.Coord.X))
-
-            # Get existing General Notes content
-            existing_notes = ""
-            if text_notes_sorted:
-                raw_existing = " ".join([tn.Text for tn in text_notes_sorted])
-                raw_existing = re.sub(r'\s+', ' ', raw_existing).strip()
-                existing_numbered = re.findall(r'\d+\.\s?.*?(?=(?:\d+\.\s?)|$)', raw_existing, re.DOTALL)
-                existing_notes = "\n".join(item.strip() for item in existing_numbered)
-
-            # Skip if the General Notes haven't changed
-            if formatted_text == existing_notes:
-                output.print_md(
-                    "ℹ️ Row {}: General Notes for sheet '{}' have not changed. Skipping.".format(row, sheet_number))
-                continue
-
-            # Start a transaction to modify TextNotes
-            t = Transaction(doc, "Update General Notes on Sheet {}".format(sheet_number))
-            t.Start()
-            try:
-                # Store properties of existing TextNotes
-                positions = [(tn.Coord.X, tn.Coord.Y) for tn in text_notes_sorted]
-                widths = [tn.Width for tn in text_notes_sorted]
-                alignments = [tn.HorizontalAlignment for tn in text_notes_sorted]
-                # Get the TextNoteType from existing notes or default
-                text_note_type_id = text_notes_sorted[
-                    0].TextNoteType.Id if text_notes_sorted else FilteredElementCollector(doc).OfClass(
-                    TextNoteType).FirstElement().Id
-
-                # Delete existing TextNotes (we only need one)
-                for tn in text_notes_sorted:
-                    doc.Delete(tn.Id)
-
-                # Create a single TextNote with the formatted General Notes
-                x = positions[0][0] if positions else 0
-                y = positions[0][1] if positions else 0
-                text_note_options = TextNoteOptions(text_note_type_id)
-                text_note_options.HorizontalAlignment = alignments[0] if alignments else HorizontalTextAlignment.Left
-                new_note = TextNote.Create(doc, general_notes_view.Id, XYZ(x, y, 0), formatted_text, text_note_type_id)
-                new_note.Width = widths[0] if widths else 1.0  # Preserve original width or default to 1.0 feet
-
-                t.Commit()
-                output.print_md("✅ Updated General Notes on sheet '{}'".format(sheet_number))
-
-            except Exception as e:
-                t.RollBack()
-                output.print_md("⚫️ Error updating General Notes on sheet '{}': {}".format(sheet_number, str(e)))
+            excel_app = Excel.ApplicationClass()
+            excel_app.Visible = False
+            workbook = excel_app.Workbooks.Open(excel_path)
+            worksheet = workbook.Worksheets[1]
+            headers, rows = read_used_range(worksheet)
+        finally:
+            if worksheet:
+                Marshal.ReleaseComObject(worksheet)
+            if workbook:
+                workbook.Close(False)
+                Marshal.ReleaseComObject(workbook)
+            if excel_app:
+                excel_app.Quit()
+                Marshal.ReleaseComObject(excel_app)
+
+    if "Sheet Number" not in headers:
+        forms.alert("Column 'Sheet Number' not found in: {}".format(excel_path), exitscript=True)
+
+    sheet_number_idx = headers.index("Sheet Number")
+    general_notes_idx = headers.index("General Notes") if "General Notes" in headers else None
+
+    # Pre-resolve parameters once per column
+    column_indexes = {header: headers.index(header) for header, _ in EDITABLE_SHEET_COLUMNS if header in headers}
+    definitions = resolve_column_parameters(all_sheets)
+
+    report = ImportReport("Sheet Data Import")
+
+    # All writes go into a single transaction
+    with span("Import Sheet Data from Excel", TRANSACTION, rows=len(rows)):
+        t = Transaction(doc, "Import Sheet Data from Excel")
+        t.Start()
+        try:
+            for row_idx, row in enumerate(rows, start=2):
+                try:
+                    # Get the Sheet Number and normalize it
+                    sheet_number = normalize_sheet_number(row[sheet_number_idx])
+
+                    # Skip if Sheet Number is empty
+                    if not sheet_number:
+                        report.add(ERROR, row_idx, message="Sheet Number is empty")
+                        continue
+
+                    # Find the corresponding sheet in Revit
+                    if sheet_number not in sheet_dict:
+                        report.add(MISSING_SHEET, row_idx, sheet_number, message="Sheet not found in Revit")
+                        continue
+                    sheet = sheet_dict[sheet_number]
+
+                    # Sheet parameters - only true changes are written
+                    changes, errors = plan_sheet_parameter_changes(sheet, row, column_indexes, definitions)
+                    write_errors = apply_param_changes(changes)
+                    errors += write_errors
+                    for header, message in errors:
+                        report.add(ERROR, row_idx, sheet_number, header, message)
+                    failed = set(header for header, _ in write_errors)
+                    written = [header for header, _, _ in changes if header not in failed]
+                    if written:
+                        report.add(UPDATED, row_idx, sheet_number, "Parameters", ", ".join(written))
+                    elif not errors:
+                        report.add(UNCHANGED, row_idx, sheet_number, "Parameters")
+
+                    # General Notes
+                    if general_notes_idx is None:
+                        continue
+                    general_notes_text = cell_to_text(row[general_notes_idx])
+                    update_general_notes(doc, sheet, sheet_number, row_idx, general_notes_text, report)
+                except Exception as e:
+                    report.add(ERROR, row_idx, message="Error processing row: {}".format(e))
+                    continue
+            t.Commit()
         except Exception as e:
-            output.print_md("⚠️ Error processing row {}: {}".format(row, str(e)))
-            continue
+            t.RollBack()
+            forms.alert("Import failed and was rolled back:\n{}".format(e), exitscript=True)
 
-    # Clean up Excel
-    try:
-        workbook.Close(False)
-        excel_app.Quit()
-    finally:
-        if 'worksheet' in locals():
-            Marshal.ReleaseComObject(worksheet)
-        if 'workbook' in locals():
-            Marshal.ReleaseComObject(workbook)
-        if 'excel_app' in locals():
-            Marshal.ReleaseComObject(excel_app)
+    report.render(output)
+    if import_log_path:
+        report.write_jsonl(import_log_path)
+    output.print_md("✅ **Finished importing from Excel: `{}`**".format(excel_path))
 
-    output.print_md("✅ **Finished importing General Notes from Excel: `{}`**".format(excel_path))
\ No newline at end of file
+tracer.finish(output)
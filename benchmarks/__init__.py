@@ -0,0 +1,27 @@
+# -*- coding: utf-8 -*-
+"""Benchmarks for the pushbutton hot paths, run headless against fakerevit synthetic models.
+
+Every scenario builds a fresh model (not measured), then runs the same Snippets calls as its button
+and records wall time, Revit API call counts (fakerevit.CALLS) and peak memory (tracemalloc).
+Results are written to benchmarks/results/<timestamp>.json and compared with the previous run.
+
+e.g.
+python -m benchmarks                                  # small, medium and large tiers
+python -m benchmarks -s parameter-apply -s overrides  # selected scenarios only
+python -m benchmarks --tiers huge --repeat 1          # 1M elements
+python -m benchmarks --compare benchmarks/results/20240115-093000.json --fail-on-regression"""
+
+#⬇️ IMPORTS
+#------------------------------
+import os
+import sys
+
+# Snippets are imported as "Snippets._xxx", the way pyRevit puts lib/ on sys.path
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+LIB_DIR  = os.path.join(ROOT_DIR, "lib")
+for _path in (LIB_DIR, ROOT_DIR):
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
+
+import fakerevit
+fakerevit.install()
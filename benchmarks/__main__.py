@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+"""python -m benchmarks [-s SCENARIO ...] [--tiers small,medium,large] [--repeat 3] [--compare PATH]"""
+from __future__ import print_function
+
+#⬇️ IMPORTS
+#------------------------------
+import argparse
+import sys
+
+from benchmarks.runner import (DEFAULT_REPEAT, DEFAULT_THRESHOLD, RESULTS_DIR, run_suite, save_run, load_run,
+                               latest_run_path, compare_runs, format_table, format_results, format_comparison)
+from benchmarks.scenarios import SCENARIOS, DEFAULT_TIERS, ELEMENT_TIERS
+
+
+# Reusable Snippets
+
+def _progress(result):
+    print("{scenario} [{tier}]: {items} {unit} in {wall_time:.4f} s".format(**result))
+    sys.stdout.flush()
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Benchmark the pushbutton hot paths.")
+    parser.add_argument("-s", "--scenario", action="append", choices=list(SCENARIOS),
+                        help="scenario to run (repeatable, default: all)")
+    parser.add_argument("--tiers", default=",".join(DEFAULT_TIERS),
+                        help="comma-separated tiers out of {} (default: %(default)s)".format(", ".join(ELEMENT_TIERS)))
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="timed runs per measurement (fastest wins)")
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc peak memory run")
+    parser.add_argument("--output", default=RESULTS_DIR, help="folder for result files (default: %(default)s)")
+    parser.add_argument("--compare", help="result file to compare with (default: newest file in --output)")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="wall time increase counted as a regression (default: %(default)s)")
+    parser.add_argument("--fail-on-regression", action="store_true", help="exit with status 1 on a regression")
+    parser.add_argument("--list", action="store_true", help="list scenarios and exit")
+    return parser.parse_args(argv)
+
+
+#🎯 MAIN
+#------------------------------
+def main(argv=None):
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    if args.list:
+        print(format_table(["Scenario", "Button", "Unit"] + list(ELEMENT_TIERS),
+                           [[s.name, s.button, s.unit] + list(s.tiers.values()) for s in SCENARIOS.values()]))
+        return 0
+
+    tiers = [t.strip() for t in args.tiers.split(",") if t.strip()]
+    unknown = [t for t in tiers if t not in ELEMENT_TIERS]
+    if unknown:
+        print("Unknown tier(s): {}".format(", ".join(unknown)), file=sys.stderr)
+        return 2
+    scenarios = [SCENARIOS[name] for name in args.scenario] if args.scenario else list(SCENARIOS.values())
+
+    previous_path = args.compare or latest_run_path(args.output)
+
+    run = run_suite(scenarios, tiers, args.repeat, not args.no_memory, progress=_progress)
+    path = save_run(run, args.output)
+    print("\n" + format_results(run))
+    print("\nSaved {}".format(path))
+
+    if not previous_path:
+        return 0
+    rows = compare_runs(load_run(previous_path), run, args.threshold)
+    if not rows:
+        print("Nothing to compare in {}".format(previous_path))
+        return 0
+    print("\nCompared with {}\n".format(previous_path))
+    print(format_comparison(rows))
+    regressions = [r for r in rows if r["regression"]]
+    if regressions:
+        print("\n{} regression(s)".format(len(regressions)))
+        if args.fail_on_regression:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
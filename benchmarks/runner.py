@@ -0,0 +1,204 @@
+# -*- coding: utf-8 -*-
+"""Measuring, saving and comparing benchmark runs.
+
+A result file is plain JSON:
+{"created": "2024-01-15T09:30:00", "commit": "5bdd846", "python": "3.11.4", "platform": "...",
+ "results": [{"scenario": "overrides", "button": "Graphic Overrides", "tier": "small", "scale": 1000,
+              "items": 950, "unit": "elements", "wall_time": 0.012, "wall_times": [...],
+              "api_calls": 2900, "calls": {"View.SetElementOverrides": 950, ...}, "peak_memory": 183424}]}
+wall_time is the fastest repeat (seconds), peak_memory is in bytes (None without tracemalloc)."""
+
+#⬇️ IMPORTS
+#------------------------------
+import datetime
+import gc
+import io
+import json
+import os
+import platform
+import subprocess
+import time
+
+try:
+    import tracemalloc  # Python 3.4+
+except ImportError:
+    tracemalloc = None
+
+from fakerevit import CALLS, reset_calls
+from benchmarks import ROOT_DIR
+
+
+#📦 VARIABLES
+#------------------------------
+RESULTS_DIR = os.path.join(ROOT_DIR, "benchmarks", "results")
+
+DEFAULT_REPEAT    = 3
+DEFAULT_THRESHOLD = 0.10   # Slower by more than 10% counts as a regression ...
+MIN_TIME_DELTA    = 0.005  # ... if it is also more than 5 ms slower (timer noise on tiny runs)
+
+_timer = getattr(time, "perf_counter", time.time)
+
+
+# Reusable Snippets
+
+def _git_commit():
+    try:
+        out = subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT_DIR, stderr=subprocess.STDOUT)
+        return out.decode("utf-8").strip()
+    except Exception:
+        return None
+
+
+def measure(scenario, tier, repeat=DEFAULT_REPEAT, memory=True):
+    """Run one scenario at one tier. Every repeat gets a fresh model from setup.
+    Peak memory is taken in an extra run: tracemalloc slows the timed runs down too much."""
+    scale = scenario.tiers[tier]
+    wall_times, items, calls = [], 0, {}
+    for _ in range(repeat):
+        state = scenario.setup(scale)
+        gc.collect()
+        reset_calls()
+        start = _timer()
+        items = scenario.run(state)
+        wall_times.append(_timer() - start)
+        calls = dict(CALLS)
+        state = None
+
+    peak_memory = None
+    if memory and tracemalloc is not None:
+        state = scenario.setup(scale)
+        gc.collect()
+        tracemalloc.start()
+        try:
+            scenario.run(state)
+            peak_memory = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        state = None
+
+    return {
+        "scenario":    scenario.name,
+        "button":      scenario.button,
+        "tier":        tier,
+        "scale":       scale,
+        "items":       items,
+        "unit":        scenario.unit,
+        "wall_time":   min(wall_times),
+        "wall_times":  wall_times,
+        "api_calls":   sum(calls.values()),
+        "calls":       dict(sorted(calls.items())),
+        "peak_memory": peak_memory,
+    }
+
+
+def run_suite(scenarios, tiers, repeat=DEFAULT_REPEAT, memory=True, progress=None):
+    """measure() every scenario at every tier it defines. progress(result) is called after each measurement."""
+    results = []
+    for scenario in scenarios:
+        for tier in tiers:
+            if tier not in scenario.tiers:
+                continue
+            result = measure(scenario, tier, repeat, memory)
+            results.append(result)
+            if progress:
+                progress(result)
+    return {
+        "created":  datetime.datetime.now().replace(microsecond=0).isoformat(),
+        "commit":   _git_commit(),
+        "python":   platform.python_version(),
+        "platform": platform.platform(),
+        "results":  results,
+    }
+
+
+def save_run(run, folder=RESULTS_DIR):
+    """Write a run to <folder>/<timestamp>.json (-2, -3, ... for runs within the same second). Returns the path."""
+    if not os.path.isdir(folder):
+        os.makedirs(folder)
+    stem = os.path.join(folder, run["created"].replace("-", "").replace(":", "").replace("T", "-"))
+    path, n = stem + ".json", 1
+    while os.path.exists(path):
+        n += 1
+        path = "{}-{}.json".format(stem, n)
+    with io.open(path, "w", encoding="utf-8") as f:
+        f.write(json.dumps(run, indent=2, sort_keys=True))
+    return path
+
+
+def load_run(path):
+    with io.open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def latest_run_path(folder=RESULTS_DIR):
+    """Newest result file in folder (names sort by time), or None."""
+    if not os.path.isdir(folder):
+        return None
+    names = sorted((n for n in os.listdir(folder) if n.endswith(".json")), key=lambda n: os.path.splitext(n)[0])
+    return os.path.join(folder, names[-1]) if names else None
+
+
+def compare_runs(previous, current, threshold=DEFAULT_THRESHOLD):
+    """Match results by (scenario, scale) and flag regressions:
+    wall time slower by more than threshold (and MIN_TIME_DELTA), or more API calls than before.
+
+    Returns list of dicts with previous/current values, time_change (ratio - 1) and regression (bool)."""
+    before = {(r["scenario"], r["scale"]): r for r in previous["results"]}
+    rows = []
+    for result in current["results"]:
+        old = before.get((result["scenario"], result["scale"]))
+        if old is None:
+            continue
+        time_change = result["wall_time"] / old["wall_time"] - 1 if old["wall_time"] else 0.0
+        slower = time_change > threshold and result["wall_time"] - old["wall_time"] > MIN_TIME_DELTA
+        rows.append({
+            "scenario":    result["scenario"],
+            "scale":       result["scale"],
+            "old_time":    old["wall_time"],
+            "new_time":    result["wall_time"],
+            "time_change": time_change,
+            "old_calls":   old["api_calls"],
+            "new_calls":   result["api_calls"],
+            "regression":  slower or result["api_calls"] > old["api_calls"],
+        })
+    return rows
+
+
+#🖨️ OUTPUT
+#------------------------------
+def format_table(columns, rows):
+    """Plain-text table with left-aligned first column and right-aligned numbers."""
+    cells  = [[str(c) for c in columns]] + [[str(v) for v in row] for row in rows]
+    widths = [max(len(row[i]) for row in cells) for i in range(len(columns))]
+    lines  = []
+    for n, row in enumerate(cells):
+        parts = [row[0].ljust(widths[0])] + [value.rjust(width) for value, width in zip(row[1:], widths[1:])]
+        lines.append("  ".join(parts))
+        if n == 0:
+            lines.append("  ".join("-" * width for width in widths))
+    return "\n".join(lines)
+
+
+def _memory(value):
+    return "-" if value is None else "{:.2f} MB".format(value / 1048576.0)
+
+
+def result_row(result):
+    per_item = result["wall_time"] / result["items"] * 1e6 if result["items"] else 0.0
+    return [result["scenario"], result["tier"], "{} {}".format(result["items"], result["unit"]),
+            "{:.4f} s".format(result["wall_time"]), "{:.1f} us".format(per_item),
+            result["api_calls"], _memory(result["peak_memory"])]
+
+
+RESULT_COLUMNS = ["Scenario", "Tier", "Items", "Wall time", "Per item", "API calls", "Peak memory"]
+
+
+def format_results(run):
+    return format_table(RESULT_COLUMNS, [result_row(r) for r in run["results"]])
+
+
+def format_comparison(rows):
+    table = [[r["scenario"], r["scale"], "{:.4f} s".format(r["old_time"]), "{:.4f} s".format(r["new_time"]),
+              "{:+.1f}%".format(r["time_change"] * 100), r["old_calls"], r["new_calls"],
+              "REGRESSION" if r["regression"] else "ok"] for r in rows]
+    return format_table(["Scenario", "Scale", "Before", "After", "Change", "Calls before", "Calls after", "Status"], table)
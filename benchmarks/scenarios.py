@@ -0,0 +1,237 @@
+# -*- coding: utf-8 -*-
+"""One scenario per button: setup(scale) builds the model and inputs, run(state) is the measured hot path.
+run mirrors the button's script between its dialogs (pickers, Excel, output window are left out)
+and returns the number of items it processed."""
+
+#⬇️ IMPORTS
+#------------------------------
+from collections import OrderedDict
+
+from Autodesk.Revit.DB import *
+from fakerevit.model import generate_model
+
+from Snippets._excel import cell_to_text
+from Snippets._heatmap import bucket_elements, apply_buckets
+from Snippets._inspector import inspect_elements
+from Snippets._overriderules import compile_rules, apply_rules
+from Snippets._overrides import StructuralWallClassifier, build_override_settings, apply_element_overrides
+from Snippets._params import collect_similar_elements, apply_parameter_values
+from Snippets._rename import RENAME_TARGETS, RuleChain, RenameRule, write_names, set_name
+from Snippets._report import ImportReport
+from Snippets._rooms import find_untagged_rooms, tag_rooms, batched
+from Snippets._runlog import RunLog
+from Snippets._sheets import (EDITABLE_SHEET_COLUMNS, SHEET_EXPORT_HEADERS, normalize_sheet_number,
+                              resolve_column_parameters, plan_sheet_parameter_changes, apply_param_changes,
+                              update_general_notes, sheet_export_row)
+from Snippets._snapshot import capture_view_overrides
+
+
+#📦 VARIABLES
+#------------------------------
+# Scale per tier: model instances for element scenarios, sheets / rows for Title-Block scenarios
+ELEMENT_TIERS = OrderedDict([("small", 1000), ("medium", 10000), ("large", 100000), ("huge", 1000000)])
+SHEET_TIERS   = OrderedDict([("small", 10), ("medium", 100), ("large", 1000), ("huge", 10000)])
+DEFAULT_TIERS = ["small", "medium", "large"]
+
+# Para Manager: values of the selected grid rows
+PARAMETER_VALUES = {"Comments": "Benchmark", "Fire Rating": "60 min", "Cost": "1,200.50 EUR", "Is Existing": "Yes"}
+
+# Title-Block: text read once from the titleblock family
+TITLEBLOCK_TEXT = {"Project ID": "P-0001", "Pre.": "AP", "Check": "RS", "Appro.": "MK", "Date": "2024-01-15"}
+
+RULES_CONFIG = {"rules": [
+    {"name": "Partitions", "categories": ["OST_Walls"],
+     "types": [{"param": "SYMBOL_NAME_PARAM", "op": "contains", "value": "Partition"}],
+     "overrides": {"projection_line_weight": 3}},
+    {"name": "Marked doors", "categories": ["OST_Doors", "OST_Windows"],
+     "parameters": [{"param": "ALL_MODEL_MARK", "op": "regex", "value": "^DO-\\d+0$"}],
+     "overrides": {"halftone": True}},
+    {"name": "Non-structural walls", "categories": ["OST_Walls"],
+     "python": [{"predicate": "structural_wall", "negate": True}],
+     "overrides": {"surface_transparency": 50}},
+]}
+
+
+# Reusable Snippets
+
+class Scenario(object):
+    """A measured hot path.
+    tiers - {tier name: scale} passed to setup"""
+
+    def __init__(self, name, button, unit, tiers, setup, run):
+        self.name   = name
+        self.button = button
+        self.unit   = unit
+        self.tiers  = tiers
+        self.setup  = setup
+        self.run    = run
+
+
+def _quiet(message):
+    pass
+
+
+def _first(doc, bic):
+    return FilteredElementCollector(doc).OfCategory(bic).WhereElementIsNotElementType().FirstElement()
+
+
+def _sorted_sheets(doc):
+    return sorted(FilteredElementCollector(doc).OfClass(ViewSheet).ToElements(), key=lambda s: s.SheetNumber)
+
+
+#🧪 SCENARIOS
+#------------------------------
+def _setup_parameter_apply(scale):
+    doc = generate_model(scale, sheets=0)
+    return doc, _first(doc, BuiltInCategory.OST_LightingFixtures)  # One type: every fixture is "similar"
+
+
+def _run_parameter_apply(state):
+    """Para Manager: Apply to all similar elements."""
+    doc, elem = state
+    t = Transaction(doc, "Apply Parameters")
+    t.Start()
+    similar = collect_similar_elements(doc, elem)
+    apply_parameter_values(similar, PARAMETER_VALUES)
+    t.Commit()
+    return len(similar)
+
+
+def _setup_sheets(scale):
+    return generate_model(200, levels=1, sheets=scale)
+
+
+def _run_sheet_export(doc):
+    """Title-Block: export rows of every sheet (workbook writing left out)."""
+    rows = [sheet_export_row(doc, sheet, TITLEBLOCK_TEXT) for sheet in _sorted_sheets(doc)]
+    return len(rows)
+
+
+def _setup_notes_import(scale):
+    """Export rows with Drawn By and the General Notes changed on every other sheet."""
+    doc = _setup_sheets(scale)
+    headers = list(SHEET_EXPORT_HEADERS)
+    drawn_by_idx, notes_idx = headers.index("Drawn By"), headers.index("General Notes")
+    rows = []
+    for i, sheet in enumerate(_sorted_sheets(doc)):
+        row = sheet_export_row(doc, sheet, TITLEBLOCK_TEXT)
+        if i % 2 == 0:
+            row[drawn_by_idx] = "ZZ"
+            row[notes_idx] = "1. Revised note for {0}. 2. Second note. 3. Third note.".format(sheet.SheetNumber)
+        rows.append(row)
+    return doc, headers, rows
+
+
+def _run_notes_import(state):
+    """Title-Block: import sheet parameters and General Notes from Excel rows."""
+    doc, headers, rows = state
+    all_sheets = FilteredElementCollector(doc).OfClass(ViewSheet).ToElements()
+    sheet_dict = {s.SheetNumber: s for s in all_sheets}
+    sheet_number_idx, notes_idx = headers.index("Sheet Number"), headers.index("General Notes")
+    column_indexes = {header: headers.index(header) for header, _ in EDITABLE_SHEET_COLUMNS if header in headers}
+    definitions = resolve_column_parameters(all_sheets)
+    report = ImportReport("Sheet Data Import")
+
+    t = Transaction(doc, "Import Sheet Data from Excel")
+    t.Start()
+    for row_idx, row in enumerate(rows, start=2):
+        sheet_number = normalize_sheet_number(row[sheet_number_idx])
+        sheet = sheet_dict[sheet_number]
+        changes, errors = plan_sheet_parameter_changes(sheet, row, column_indexes, definitions)
+        apply_param_changes(changes)
+        update_general_notes(doc, sheet, sheet_number, row_idx, cell_to_text(row[notes_idx]), report)
+    t.Commit()
+    return len(rows)
+
+
+def _setup_view(scale):
+    return generate_model(scale, levels=1, sheets=0)  # One level: the active plan shows every instance
+
+
+def _run_overrides(doc):
+    """Graphic Overrides: halftone every visible target element except structural walls."""
+    view = doc.ActiveView
+    t = Transaction(doc, "Apply Graphic Overrides")
+    t.Start()
+    overridden = apply_element_overrides(doc, view, build_override_settings(), StructuralWallClassifier(doc),
+                                         RunLog(doc, write=_quiet))
+    t.Commit()
+    return len(overridden)
+
+
+def _run_rule_overrides(doc):
+    """Rule Overrides: compile the rules config and apply it to the active view."""
+    view = doc.ActiveView
+    t = Transaction(doc, "Rule Overrides")
+    t.Start()
+    matches, overridden = apply_rules(doc, view, compile_rules(doc, RULES_CONFIG))
+    t.Commit()
+    return len(overridden)
+
+
+def _run_color_by_parameter(doc):
+    """Color By Parameter: bucket the walls of the view by type and override each bucket."""
+    view = doc.ActiveView
+    elements = [e for e in FilteredElementCollector(doc, view.Id).WhereElementIsNotElementType()
+                if e.Category and e.Category.CategoryType == CategoryType.Model and e.CanBeHidden(view)]
+    t = Transaction(doc, "Color By Parameter")
+    t.Start()
+    overridden = apply_buckets(doc, view, bucket_elements(doc, elements, "Type"))
+    t.Commit()
+    return len(overridden)
+
+
+def _setup_snapshot(scale):
+    doc = _setup_view(scale)
+    _run_overrides(doc)
+    return doc
+
+
+def _run_snapshot(doc):
+    """View Snapshot: capture the overrides of the active view."""
+    return len(capture_view_overrides(doc, doc.ActiveView)["elements"])
+
+
+def _run_tag_rooms(doc):
+    """Tag Rooms: tag the untagged rooms of the plan in batches."""
+    view = doc.ActiveView
+    created = 0
+    for chunk in batched(find_untagged_rooms(doc, view)):
+        t = Transaction(doc, "Tag Rooms")
+        t.Start()
+        created += tag_rooms(doc, view, chunk)[0]
+        t.Commit()
+    return created
+
+
+def _run_inspector(doc):
+    """Selection Inspector: rows and grouped counts for a selection of every instance."""
+    ids = FilteredElementCollector(doc).WhereElementIsNotElementType().ToElementIds()
+    rows, summary = inspect_elements(doc, ids)
+    return len(rows)
+
+
+def _run_rename_views(doc):
+    """Rename Views: preview, plan and write new names for every legend view."""
+    target = RENAME_TARGETS["Views"]
+    chain = RuleChain([RenameRule("GENERAL NOTES", "General Notes", regex=False)], prefix="{view_type} - ")
+    plan = target.plan(doc, chain.preview(doc, target.collect(doc)))
+    t = Transaction(doc, "Rename Views")
+    t.Start()
+    write_names(plan, set_name)
+    t.Commit()
+    return len(plan)
+
+
+SCENARIOS = OrderedDict((s.name, s) for s in [
+    Scenario("parameter-apply",    "Para Manager",       "elements", ELEMENT_TIERS, _setup_parameter_apply, _run_parameter_apply),
+    Scenario("sheet-export",       "Title-Block",        "sheets",   SHEET_TIERS,   _setup_sheets,          _run_sheet_export),
+    Scenario("notes-import",       "Title-Block",        "rows",     SHEET_TIERS,   _setup_notes_import,    _run_notes_import),
+    Scenario("overrides",          "Graphic Overrides",  "elements", ELEMENT_TIERS, _setup_view,            _run_overrides),
+    Scenario("rule-overrides",     "Rule Overrides",     "elements", ELEMENT_TIERS, _setup_view,            _run_rule_overrides),
+    Scenario("color-by-parameter", "Color By Parameter", "elements", ELEMENT_TIERS, _setup_view,            _run_color_by_parameter),
+    Scenario("view-snapshot",      "View Snapshot",      "elements", ELEMENT_TIERS, _setup_snapshot,        _run_snapshot),
+    Scenario("tag-rooms",          "Tag Rooms",          "rooms",    ELEMENT_TIERS, _setup_view,            _run_tag_rooms),
+    Scenario("inspector",          "Selection Inspector", "elements", ELEMENT_TIERS, _setup_view,           _run_inspector),
+    Scenario("rename-views",       "Rename Views",       "views",    SHEET_TIERS,   _setup_sheets,          _run_rename_views),
+])
@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+"""Stand-in Revit API for running Snippets headless (tests, benchmarks, CI without Revit).
+
+install() registers fake modules for Autodesk.Revit.DB, Autodesk.Revit.DB.Architecture,
+Autodesk.Revit.Exceptions, clr, System and System.Collections.Generic, so
+"from Autodesk.Revit.DB import *" works in plain CPython. Call it before importing Snippets.
+
+e.g.
+import fakerevit
+fakerevit.install()
+from fakerevit.model import generate_model
+doc = generate_model(10000)
+
+from Snippets._overrides import collect_target_elements
+collect_target_elements(doc, doc.ActiveView)"""
+
+#⬇️ IMPORTS
+#------------------------------
+import sys
+import types
+
+from fakerevit import db, system
+from fakerevit.db import CALLS, reset_calls
+
+
+#📦 VARIABLES
+#------------------------------
+# Names in Autodesk.Revit.DB.Architecture (the rest lives in Autodesk.Revit.DB)
+ARCHITECTURE_NAMES = ["Room", "RoomTag"]
+EXCEPTION_NAMES    = ["InvalidOperationException", "ArgumentException", "ModificationOutsideTransactionException"]
+
+_installed = {}
+
+
+# Reusable Snippets
+
+def _public(module):
+    return dict((name, value) for name, value in vars(module).items() if not name.startswith("_"))
+
+
+def _module(name, attributes):
+    module = types.ModuleType(name)
+    module.__dict__.update(attributes)
+    return module
+
+
+def install():
+    """Register the fake modules in sys.modules. Safe to call more than once."""
+    if _installed:
+        return
+    db_names = _public(db)
+    modules = {
+        "Autodesk":                     {},
+        "Autodesk.Revit":               {},
+        "Autodesk.Revit.DB":            db_names,
+        "Autodesk.Revit.DB.Architecture": dict((n, db_names[n]) for n in ARCHITECTURE_NAMES),
+        "Autodesk.Revit.Exceptions":    dict((n, db_names[n]) for n in EXCEPTION_NAMES),
+        "clr":                          {"AddReference": system.AddReference, "GetClrType": system.GetClrType},
+        "System":                       {"Type": system.Type, "Object": system.Object, "String": system.String},
+        "System.Collections":           {},
+        "System.Collections.Generic":   {"List": system.List},
+    }
+    for name, attributes in modules.items():
+        _installed[name] = sys.modules.get(name)
+        sys.modules[name] = _module(name, attributes)
+    # Submodules are attributes of their parents too (import Autodesk.Revit.DB as DB)
+    for name in modules:
+        parent, _, child = name.rpartition(".")
+        if parent:
+            setattr(sys.modules[parent], child, sys.modules[name])
+
+
+def uninstall():
+    """Put back whatever was in sys.modules before install()."""
+    for name, previous in _installed.items():
+        if previous is None:
+            sys.modules.pop(name, None)
+        else:
+            sys.modules[name] = previous
+    _installed.clear()
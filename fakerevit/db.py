@@ -0,0 +1,1586 @@
+# -*- coding: utf-8 -*-
+"""In-memory stand-ins for the Autodesk.Revit.DB members the Snippets use.
+
+Only what PyAnirudh touches is modelled, with Revit's behaviour where it matters for tests:
+- model changes outside an open Transaction raise ModificationOutsideTransactionException
+- RollBack undoes every change made since Start (Transaction, SubTransaction, TransactionGroup)
+- Parameter.Set returns False for a value of the wrong StorageType
+- ElementMulticlassFilter refuses classes Revit can't filter natively (e.g. Room)
+
+API calls are counted in CALLS, e.g. CALLS["Parameter.Set"], so benchmarks can compare call counts."""
+
+#⬇️ IMPORTS
+#------------------------------
+import math
+import hashlib
+from collections import Counter, OrderedDict
+
+
+#📊 API CALL COUNTS
+#------------------------------
+CALLS = Counter()
+
+
+def reset_calls():
+    CALLS.clear()
+
+
+#❗ EXCEPTIONS
+#------------------------------
+class InvalidOperationException(Exception):
+    pass
+
+
+class ArgumentException(Exception):
+    pass
+
+
+class ModificationOutsideTransactionException(InvalidOperationException):
+    pass
+
+
+#🔢 ENUMS
+#------------------------------
+class EnumValue(int):
+    """int with a name, like a .NET enum value: str() and ToString() give the member name."""
+
+    def __new__(cls, value, name, enum_name):
+        obj = int.__new__(cls, value)
+        obj.name      = name
+        obj.enum_name = enum_name
+        return obj
+
+    def ToString(self):
+        return self.name
+
+    __str__ = ToString
+
+    def __repr__(self):
+        return "{}.{}".format(self.enum_name, self.name)
+
+    __hash__ = int.__hash__
+
+
+class Enum(object):
+    """Namespace of EnumValues, e.g. BuiltInCategory.OST_Walls."""
+
+    def __init__(self, enum_name, members):
+        self._name    = enum_name
+        self._members = OrderedDict()
+        for name, value in members:
+            member = EnumValue(value, name, enum_name)
+            self._members[name] = member
+            setattr(self, name, member)
+
+    def __iter__(self):
+        return iter(self._members.values())
+
+    def __repr__(self):
+        return self._name
+
+
+BuiltInCategory = Enum("BuiltInCategory", [
+    ("INVALID",                 -1),
+    ("OST_Walls",               -2000011),
+    ("OST_Windows",             -2000014),
+    ("OST_Doors",               -2000023),
+    ("OST_Floors",              -2000032),
+    ("OST_Ceilings",            -2000038),
+    ("OST_Roofs",               -2000035),
+    ("OST_Furniture",           -2000080),
+    ("OST_GenericModel",        -2000151),
+    ("OST_Rooms",               -2000160),
+    ("OST_Grids",               -2000220),
+    ("OST_Levels",              -2000240),
+    ("OST_Views",               -2000279),
+    ("OST_TitleBlocks",         -2000280),
+    ("OST_TextNotes",           -2000300),
+    ("OST_RoomTags",            -2000480),
+    ("OST_Viewports",           -2000510),
+    ("OST_RasterImages",        -2000560),
+    ("OST_Materials",           -2000700),
+    ("OST_StructuralColumns",   -2001330),
+    ("OST_StructuralFraming",   -2001320),
+    ("OST_MechanicalEquipment", -2001140),
+    ("OST_PlumbingFixtures",    -2001160),
+    ("OST_ElectricalFixtures",  -2001060),
+    ("OST_LightingFixtures",    -2001120),
+    ("OST_Sheets",              -2003100),
+    ("OST_Revisions",           -2006230),
+    ("OST_WallTags",            -2005301),
+    ("OST_WindowTags",          -2000614),
+    ("OST_SpotElevations",      -2000263),
+    ("OST_FilledRegion",        -2000590),
+])
+
+BuiltInParameter = Enum("BuiltInParameter", [
+    ("INVALID",                        -1),
+    ("SYMBOL_NAME_PARAM",              -1002002),
+    ("ELEM_TYPE_PARAM",                -1002052),
+    ("ALL_MODEL_INSTANCE_COMMENTS",    -1010106),
+    ("ALL_MODEL_MARK",                 -1001203),
+    ("FUNCTION_PARAM",                 -1001114),
+    ("WALL_STRUCTURAL_USAGE_PARAM",    -1001106),
+    ("WALL_STRUCTURAL_SIGNIFICANT",    -1001135),
+    ("STRUCTURAL_MATERIAL_PARAM",      -1005500),
+    ("WALL_USER_HEIGHT_PARAM",         -1001107),
+    ("CEILING_HEIGHTABOVELEVEL_PARAM", -1007301),
+    ("ROOM_NAME",                      -1006901),
+    ("ROOM_NUMBER",                    -1006902),
+    ("ROOM_AREA",                      -1006906),
+    ("ROOM_PHASE_ID",                  -1006912),
+    ("SHEET_NUMBER",                   -1007401),
+    ("SHEET_NAME",                     -1007400),
+    ("VIEW_NAME",                      -1005100),
+    ("VIEWPORT_SHEET_NUMBER",          -1153503),
+    ("LEVEL_ELEV",                     -1007000),
+])
+
+StorageType = Enum("StorageType", [("None", 0), ("Integer", 1), ("Double", 2), ("String", 3), ("ElementId", 4)])
+
+ViewType = Enum("ViewType", [
+    ("Undefined", 0), ("FloorPlan", 1), ("EngineeringPlan", 115), ("AreaPlan", 116), ("CeilingPlan", 2),
+    ("Elevation", 3), ("Section", 117), ("Detail", 118), ("ThreeD", 4), ("Schedule", 5),
+    ("DraftingView", 10), ("DrawingSheet", 6), ("Legend", 11), ("Report", 8), ("Walkthrough", 124),
+    ("Rendering", 125),
+])
+
+ViewDetailLevel   = Enum("ViewDetailLevel", [("Undefined", 0), ("Coarse", 1), ("Medium", 2), ("Fine", 3)])
+FillPatternTarget = Enum("FillPatternTarget", [("Drafting", 0), ("Model", 1)])
+CategoryType      = Enum("CategoryType", [("Invalid", 0), ("Model", 1), ("Annotation", 2), ("Internal", 3),
+                                          ("AnalyticalModel", 4)])
+HorizontalTextAlignment = Enum("HorizontalTextAlignment", [("Left", 1), ("Center", 2), ("Right", 4)])
+TransactionStatus = Enum("TransactionStatus", [("Uninitialized", 0), ("Started", 1), ("RolledBack", 2),
+                                               ("Committed", 3), ("Pending", 4), ("Error", 5), ("Proceed", 6)])
+
+
+#🆔 IDS
+#------------------------------
+class ElementId(object):
+    __slots__ = ("IntegerValue",)
+
+    def __init__(self, value):
+        self.IntegerValue = int(value)
+
+    @property
+    def Value(self):
+        return self.IntegerValue
+
+    def __eq__(self, other):
+        return isinstance(other, ElementId) and other.IntegerValue == self.IntegerValue
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __hash__(self):
+        return hash(self.IntegerValue)
+
+    def __repr__(self):
+        return "ElementId({})".format(self.IntegerValue)
+
+    def ToString(self):
+        return str(self.IntegerValue)
+
+    __str__ = ToString
+
+
+ElementId.InvalidElementId = ElementId(-1)
+
+
+class LinkElementId(object):
+    def __init__(self, host_element_id):
+        self.HostElementId = host_element_id
+
+
+#📐 GEOMETRY
+#------------------------------
+class XYZ(object):
+    __slots__ = ("X", "Y", "Z")
+
+    def __init__(self, x=0.0, y=0.0, z=0.0):
+        self.X, self.Y, self.Z = float(x), float(y), float(z)
+
+    def DistanceTo(self, other):
+        return math.sqrt((self.X - other.X) ** 2 + (self.Y - other.Y) ** 2 + (self.Z - other.Z) ** 2)
+
+    def __add__(self, other):
+        return XYZ(self.X + other.X, self.Y + other.Y, self.Z + other.Z)
+
+    def __sub__(self, other):
+        return XYZ(self.X - other.X, self.Y - other.Y, self.Z - other.Z)
+
+    def __repr__(self):
+        return "XYZ({}, {}, {})".format(self.X, self.Y, self.Z)
+
+
+class UV(object):
+    __slots__ = ("U", "V")
+
+    def __init__(self, u=0.0, v=0.0):
+        self.U, self.V = float(u), float(v)
+
+
+class LocationPoint(object):
+    __slots__ = ("Point",)
+
+    def __init__(self, point):
+        self.Point = point
+
+
+class BoundingBoxXYZ(object):
+    def __init__(self, minimum, maximum):
+        self.Min = minimum
+        self.Max = maximum
+
+
+#🎨 GRAPHICS
+#------------------------------
+class Color(object):
+    __slots__ = ("Red", "Green", "Blue", "IsValid")
+
+    def __init__(self, red, green, blue, is_valid=True):
+        self.Red, self.Green, self.Blue = int(red), int(green), int(blue)
+        self.IsValid = is_valid
+
+    def __eq__(self, other):
+        return (isinstance(other, Color) and self.IsValid == other.IsValid and
+                (self.Red, self.Green, self.Blue) == (other.Red, other.Green, other.Blue))
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def __hash__(self):
+        return hash((self.Red, self.Green, self.Blue, self.IsValid))
+
+
+Color.InvalidColorValue = Color(0, 0, 0, is_valid=False)
+
+
+class FillPattern(object):
+    def __init__(self, name, target=FillPatternTarget.Drafting, is_solid_fill=False):
+        self.Name        = name
+        self.Target      = target
+        self.IsSolidFill = is_solid_fill
+
+
+# (getter property, setter method, default) - getters and setters of OverrideGraphicSettings
+_OVERRIDE_MEMBERS = [
+    ("Halftone",                          "SetHalftone",                         False),
+    ("ProjectionLineColor",               "SetProjectionLineColor",              Color.InvalidColorValue),
+    ("ProjectionLinePatternId",           "SetProjectionLinePatternId",          ElementId.InvalidElementId),
+    ("ProjectionLineWeight",              "SetProjectionLineWeight",             -1),
+    ("SurfaceForegroundPatternId",        "SetSurfaceForegroundPatternId",       ElementId.InvalidElementId),
+    ("SurfaceForegroundPatternColor",     "SetSurfaceForegroundPatternColor",    Color.InvalidColorValue),
+    ("IsSurfaceForegroundPatternVisible", "SetSurfaceForegroundPatternVisible",  True),
+    ("SurfaceBackgroundPatternId",        "SetSurfaceBackgroundPatternId",       ElementId.InvalidElementId),
+    ("SurfaceBackgroundPatternColor",     "SetSurfaceBackgroundPatternColor",    Color.InvalidColorValue),
+    ("IsSurfaceBackgroundPatternVisible", "SetSurfaceBackgroundPatternVisible",  True),
+    ("Transparency",                      "SetSurfaceTransparency",              0),
+    ("CutLineColor",                      "SetCutLineColor",                     Color.InvalidColorValue),
+    ("CutLinePatternId",                  "SetCutLinePatternId",                 ElementId.InvalidElementId),
+    ("CutLineWeight",                     "SetCutLineWeight",                    -1),
+    ("CutForegroundPatternId",            "SetCutForegroundPatternId",           ElementId.InvalidElementId),
+    ("CutForegroundPatternColor",         "SetCutForegroundPatternColor",        Color.InvalidColorValue),
+    ("IsCutForegroundPatternVisible",     "SetCutForegroundPatternVisible",      True),
+    ("CutBackgroundPatternId",            "SetCutBackgroundPatternId",           ElementId.InvalidElementId),
+    ("CutBackgroundPatternColor",         "SetCutBackgroundPatternColor",        Color.InvalidColorValue),
+    ("IsCutBackgroundPatternVisible",     "SetCutBackgroundPatternVisible",      True),
+    ("DetailLevel",                       "SetDetailLevel",                      ViewDetailLevel.Undefined),
+]
+
+
+class OverrideGraphicSettings(object):
+    """Getters are properties, setters return the settings (as in the Revit API)."""
+
+    def __init__(self, other=None):
+        self._values = dict(other._values) if other is not None else {}
+
+    def __eq__(self, other):
+        return isinstance(other, OverrideGraphicSettings) and self._values == other._values
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    __hash__ = None
+
+
+def _override_member(getter, setter, default):
+    def get(self):
+        return self._values.get(getter, default)
+
+    def set_(self, value):
+        if value == default:
+            self._values.pop(getter, None)
+        else:
+            self._values[getter] = value
+        return self
+
+    setattr(OverrideGraphicSettings, getter, property(get))
+    setattr(OverrideGraphicSettings, setter, set_)
+
+
+for _getter, _setter, _default in _OVERRIDE_MEMBERS:
+    _override_member(_getter, _setter, _default)
+
+
+#📋 PARAMETERS
+#------------------------------
+class Definition(object):
+    """Parameter definition shared by every element of a ParameterSchema.
+    builtin        - BuiltInParameter for built-in parameters, None for project/shared parameters
+    getter, setter - for values computed from the element (e.g. Type Name from the type's name)"""
+
+    def __init__(self, name, storage_type, builtin=None, read_only=False, default=None, getter=None, setter=None):
+        self.Name        = name
+        self.StorageType = storage_type
+        self.BuiltInParameter = builtin if builtin is not None else BuiltInParameter.INVALID
+        self.read_only   = read_only
+        # Integer parameters always have a value in Revit (e.g. an unchecked Yes/No is 0)
+        self.default     = 0 if default is None and storage_type == StorageType.Integer else default
+        self.getter      = getter
+        self.setter      = setter
+
+
+try:
+    _string_types = basestring  # noqa: F821 (Python 2)
+except NameError:
+    _string_types = str
+
+# Values Parameter.Set accepts per StorageType (bool is an int, like .NET's implicit conversions in IronPython)
+_STORAGE_CHECKS = {
+    StorageType.String:    lambda v: v is None or isinstance(v, _string_types),
+    StorageType.Integer:   lambda v: isinstance(v, int),
+    StorageType.Double:    lambda v: isinstance(v, (int, float)) and not isinstance(v, bool),
+    StorageType.ElementId: lambda v: isinstance(v, ElementId),
+}
+
+
+class ParameterSchema(object):
+    """Definitions of the parameters an element carries, shared by many elements (e.g. all doors).
+
+    e.g.
+    schema = ParameterSchema([Definition("Comments", StorageType.String, BuiltInParameter.ALL_MODEL_INSTANCE_COMMENTS)])"""
+
+    def __init__(self, definitions=()):
+        self.by_name    = OrderedDict()
+        self.by_builtin = {}
+        for definition in definitions:
+            self.add(definition)
+
+    def add(self, definition):
+        self.by_name.setdefault(definition.Name, definition)
+        if definition.BuiltInParameter != BuiltInParameter.INVALID:
+            self.by_builtin[int(definition.BuiltInParameter)] = definition
+        return definition
+
+    def extend(self, definitions):
+        """New schema with extra definitions (the original stays untouched)."""
+        schema = ParameterSchema(self.by_name.values())
+        for definition in definitions:
+            schema.add(definition)
+        return schema
+
+    def __iter__(self):
+        return iter(self.by_name.values())
+
+
+EMPTY_SCHEMA = ParameterSchema()
+
+
+class Parameter(object):
+    """View on one value of an element. Values live in the element, so Parameters are cheap to hand out."""
+    __slots__ = ("Element", "Definition")
+
+    def __init__(self, element, definition):
+        self.Element    = element
+        self.Definition = definition
+
+    @property
+    def StorageType(self):
+        return self.Definition.StorageType
+
+    @property
+    def IsReadOnly(self):
+        return self.Definition.read_only
+
+    @property
+    def IsShared(self):
+        return self.Definition.BuiltInParameter == BuiltInParameter.INVALID
+
+    @property
+    def Id(self):
+        if self.Definition.BuiltInParameter != BuiltInParameter.INVALID:
+            return ElementId(self.Definition.BuiltInParameter)
+        return ElementId.InvalidElementId
+
+    def _value(self):
+        return self.Element._get_value(self.Definition)
+
+    @property
+    def HasValue(self):
+        return self._value() is not None
+
+    def AsString(self):
+        CALLS["Parameter.Get"] += 1
+        value = self._value()
+        return value if self.StorageType == StorageType.String else None
+
+    def AsInteger(self):
+        CALLS["Parameter.Get"] += 1
+        value = self._value()
+        return int(value) if self.StorageType == StorageType.Integer and value is not None else 0
+
+    def AsDouble(self):
+        CALLS["Parameter.Get"] += 1
+        value = self._value()
+        return float(value) if self.StorageType == StorageType.Double and value is not None else 0.0
+
+    def AsElementId(self):
+        CALLS["Parameter.Get"] += 1
+        value = self._value()
+        if self.StorageType == StorageType.ElementId and value is not None:
+            return value
+        return ElementId.InvalidElementId
+
+    def AsValueString(self):
+        CALLS["Parameter.Get"] += 1
+        value = self._value()
+        if value is None:
+            return None
+        if isinstance(value, ElementId):
+            elem = self.Element.Document.GetElement(value) if self.Element.Document else None
+            return Element.Name.GetValue(elem) if elem is not None else None
+        return str(value)
+
+    def Set(self, value):
+        """False for a value of the wrong StorageType; raises for read-only parameters or without a Transaction."""
+        CALLS["Parameter.Set"] += 1
+        if self.IsReadOnly:
+            raise InvalidOperationException("The parameter is read-only: {}".format(self.Definition.Name))
+        if not _STORAGE_CHECKS[self.StorageType](value):
+            return False
+        if self.StorageType == StorageType.Integer:
+            value = int(value)
+        elif self.StorageType == StorageType.Double:
+            value = float(value)
+        self.Element._set_value(self.Definition, value)
+        return True
+
+
+#🧱 ELEMENTS
+#------------------------------
+class _NameProperty(object):
+    """Element.Name, incl. Element.Name.GetValue(elem) / SetValue(elem, name) used for ElementType names in IronPython."""
+
+    def __get__(self, obj, cls):
+        if obj is None:
+            return self
+        return obj._get_name()
+
+    def __set__(self, obj, value):
+        obj._set_name(value)
+
+    def GetValue(self, obj):
+        return obj._get_name()
+
+    def SetValue(self, obj, value):
+        obj._set_name(value)
+
+
+class _ClrType(object):
+    """What .NET GetType() returns: only Name and FullName are used."""
+
+    def __init__(self, cls):
+        self.Name     = cls.__name__
+        self.FullName = "Autodesk.Revit.DB." + cls.__name__
+
+
+class Element(object):
+    __slots__ = ("Id", "Document", "Category", "_name", "_values", "_schema", "_type_id",
+                 "LevelId", "OwnerViewId", "Location", "_bbox", "__dict__", "__weakref__")
+    is_type = False
+
+    Name = _NameProperty()
+
+    def __init__(self, name="", category=None, schema=None, type_id=None, level_id=None, owner_view_id=None,
+                 location=None, bounding_box=None, values=None):
+        self.Id          = ElementId.InvalidElementId
+        self.Document    = None
+        self.Category    = category
+        self._name       = name
+        self._values     = dict(values) if values else None
+        self._schema     = schema or EMPTY_SCHEMA
+        self._type_id    = type_id
+        self.LevelId     = level_id or ElementId.InvalidElementId
+        self.OwnerViewId = owner_view_id or ElementId.InvalidElementId
+        self.Location    = location
+        self._bbox       = bounding_box
+
+    def __repr__(self):
+        return "<{} {} '{}'>".format(type(self).__name__, self.Id.IntegerValue, self._get_name())
+
+    # Values
+    def _get_value(self, definition):
+        if definition.getter is not None:
+            return definition.getter(self)
+        if self._values is not None and definition.Name in self._values:
+            return self._values[definition.Name]
+        return definition.default
+
+    def _set_value(self, definition, value):
+        if definition.setter is not None:
+            return definition.setter(self, value)
+        old = self._get_value(definition)
+        had = self._values is not None and definition.Name in self._values
+        self.Document._record(lambda: self._restore_value(definition.Name, old, had))
+        if self._values is None:
+            self._values = {}
+        self._values[definition.Name] = value
+
+    def _restore_value(self, name, old, had):
+        if had:
+            self._values[name] = old
+        elif self._values is not None:
+            self._values.pop(name, None)
+
+    def _get_name(self):
+        return self._name
+
+    def _set_name(self, name):
+        if not name:
+            raise ArgumentException("Name must not be empty")
+        if self.Document is not None:
+            old = self._name
+            self.Document._record(lambda: setattr(self, "_name", old))
+            self.Document._rename(self, name)
+        self._name = name
+
+    # Revit API
+    @property
+    def UniqueId(self):
+        return "{}-{:08x}".format(self.Document.unique_prefix, self.Id.IntegerValue)
+
+    @property
+    def IsValidObject(self):
+        return self.Document is not None
+
+    @property
+    def Parameters(self):
+        CALLS["Element.Parameters"] += 1
+        return [Parameter(self, d) for d in self._schema]
+
+    def LookupParameter(self, name):
+        CALLS["Element.LookupParameter"] += 1
+        definition = self._schema.by_name.get(name)
+        return Parameter(self, definition) if definition is not None else None
+
+    def get_Parameter(self, key):
+        CALLS["Element.get_Parameter"] += 1
+        if isinstance(key, Definition):
+            definition = self._schema.by_name.get(key.Name)
+        else:
+            definition = self._schema.by_builtin.get(int(key))
+        return Parameter(self, definition) if definition is not None else None
+
+    def GetTypeId(self):
+        return self._type_id or ElementId.InvalidElementId
+
+    def GetType(self):
+        return _ClrType(type(self))
+
+    def CanBeHidden(self, view):
+        return self.Category is not None and self.Category.CategoryType == CategoryType.Model
+
+    def get_BoundingBox(self, view):
+        CALLS["Element.get_BoundingBox"] += 1
+        return self._bbox
+
+    def GetDependentElements(self, element_filter):
+        """Elements owned by this one - for views and sheets the elements whose OwnerViewId it is."""
+        owned = self.Document._by_owner.get(self.Id.IntegerValue, {})
+        return [e.Id for e in owned.values() if element_filter is None or element_filter._passes(e)]
+
+
+class ElementType(Element):
+    __slots__ = ()
+    is_type = True
+
+    @property
+    def FamilyName(self):
+        return (self._values or {}).get("Family Name", "")
+
+
+class FamilySymbol(ElementType):
+    __slots__ = ()
+
+    @property
+    def Family(self):
+        family_id = (self._values or {}).get("Family")
+        return self.Document.GetElement(family_id) if family_id else None
+
+    @property
+    def FamilyName(self):
+        family = self.Family
+        return family.Name if family is not None else ""
+
+
+class WallType(ElementType):
+    __slots__ = ()
+
+    @property
+    def FamilyName(self):
+        return "Basic Wall"
+
+
+class TextNoteType(ElementType):
+    __slots__ = ()
+
+    @property
+    def FamilyName(self):
+        return "Text"
+
+
+class Family(Element):
+    """Families have no Category of their own (as in Revit): FamilyCategory is the category of their instances."""
+
+    def __init__(self, name="", family_category=None, **kwargs):
+        Element.__init__(self, name, **kwargs)
+        self.FamilyCategory = family_category
+
+
+class FamilyInstance(Element):
+    __slots__ = ()
+
+    @property
+    def Symbol(self):
+        return self.Document.GetElement(self.GetTypeId())
+
+    @property
+    def Host(self):
+        host_id = (self._values or {}).get("Host")
+        return self.Document.GetElement(host_id) if host_id else None
+
+
+class Wall(Element):
+    __slots__ = ()
+
+    @property
+    def WallType(self):
+        return self.Document.GetElement(self.GetTypeId())
+
+
+class Floor(Element):
+    __slots__ = ()
+
+
+class Level(Element):
+    __slots__ = ()
+
+    @property
+    def Elevation(self):
+        return (self._values or {}).get("Elevation", 0.0)
+
+
+class Material(Element):
+    __slots__ = ()
+
+
+class Phase(Element):
+    __slots__ = ()
+
+
+class FillPatternElement(Element):
+    def __init__(self, fill_pattern, **kwargs):
+        Element.__init__(self, fill_pattern.Name, **kwargs)
+        self._fill_pattern = fill_pattern
+
+    def GetFillPattern(self):
+        return self._fill_pattern
+
+
+class ParameterElement(Element):
+    def __init__(self, definition, **kwargs):
+        Element.__init__(self, definition.Name, **kwargs)
+        self._definition = definition
+
+    def GetDefinition(self):
+        return self._definition
+
+
+class SharedParameterElement(ParameterElement):
+    pass
+
+
+class Revision(Element):
+    __slots__ = ()
+
+    @property
+    def Description(self):
+        return (self._values or {}).get("Revision Description", "")
+
+
+class SpatialElement(Element):
+    __slots__ = ()
+
+    @property
+    def Number(self):
+        param = self.get_Parameter(BuiltInParameter.ROOM_NUMBER)
+        return param.AsString() if param else None
+
+    @Number.setter
+    def Number(self, value):
+        self.get_Parameter(BuiltInParameter.ROOM_NUMBER).Set(value)
+
+    @property
+    def Area(self):
+        return (self._values or {}).get("Area", 0.0)
+
+
+class Room(SpatialElement):
+    __slots__ = ()
+
+    def _get_name(self):
+        # Revit returns "Name Number" for rooms
+        param = self._schema.by_builtin.get(int(BuiltInParameter.ROOM_NAME))
+        name = self._get_value(param) if param else self._name
+        return "{} {}".format(name or "", self.Number or "").strip()
+
+
+class RoomTag(Element):
+    __slots__ = ()
+
+    @property
+    def TaggedLocalRoomId(self):
+        return (self._values or {}).get("Room", ElementId.InvalidElementId)
+
+    @property
+    def Room(self):
+        return self.Document.GetElement(self.TaggedLocalRoomId)
+
+
+class TextNote(Element):
+    def __init__(self, text="", coord=None, width=1.0, alignment=HorizontalTextAlignment.Left, **kwargs):
+        Element.__init__(self, "", **kwargs)
+        self._text               = text
+        self.Coord               = coord or XYZ()
+        self.Width               = width
+        self.HorizontalAlignment = alignment
+
+    @property
+    def Text(self):
+        return self._text
+
+    @Text.setter
+    def Text(self, value):
+        old = self._text
+        self.Document._record(lambda: setattr(self, "_text", old))
+        self._text = value
+
+    @property
+    def TextNoteType(self):
+        return self.Document.GetElement(self.GetTypeId())
+
+    @staticmethod
+    def Create(doc, view_id, position, text, type_id):
+        CALLS["TextNote.Create"] += 1
+        note = TextNote(text, position, category=doc.get_category(BuiltInCategory.OST_TextNotes),
+                        type_id=type_id, owner_view_id=view_id)
+        return doc.add(note)
+
+
+class TextNoteOptions(object):
+    def __init__(self, type_id=None):
+        self.TypeId = type_id
+        self.HorizontalAlignment = HorizontalTextAlignment.Left
+
+
+#🖼️ VIEWS
+#------------------------------
+class View(Element):
+    """Model elements show in a view when they are on its GenLevel (or always, without a GenLevel).
+    View-owned elements (annotations, viewports) only show in their owner view."""
+
+    def __init__(self, name="", view_type=ViewType.FloorPlan, gen_level=None, scale=100, is_template=False, **kwargs):
+        kwargs.setdefault("category", None)
+        Element.__init__(self, name, **kwargs)
+        self.ViewType          = view_type
+        self.Scale             = scale
+        self.IsTemplate        = is_template
+        self._gen_level_id     = gen_level.Id if gen_level is not None else None
+        self.hidden_ids        = set()
+        self._element_overrides  = {}
+        self._category_overrides = {}
+        self._filters          = OrderedDict()  # filter id (int) -> [OverrideGraphicSettings, visible]
+
+    @property
+    def GenLevel(self):
+        return self.Document.GetElement(self._gen_level_id) if self._gen_level_id is not None else None
+
+    @property
+    def CanBePrinted(self):
+        return not self.IsTemplate
+
+    def shows(self, elem):
+        """True if the element belongs in this view's collector (hidden elements included)."""
+        if elem.is_type:
+            return False
+        if elem.OwnerViewId.IntegerValue != -1:
+            return elem.OwnerViewId.IntegerValue == self.Id.IntegerValue
+        if isinstance(elem, View) or elem.Category is None or elem.Category.CategoryType != CategoryType.Model:
+            return False
+        if self._gen_level_id is None:
+            return self.ViewType == ViewType.ThreeD
+        return elem.LevelId.IntegerValue == self._gen_level_id.IntegerValue
+
+    @property
+    def _owned_only(self):
+        """Sheets, legends, drafting views: the collector only returns view-specific elements."""
+        return self._gen_level_id is None and self.ViewType != ViewType.ThreeD
+
+    def is_visible(self, elem):
+        return self.shows(elem) and elem.Id.IntegerValue not in self.hidden_ids
+
+    # Element / category overrides
+    def GetElementOverrides(self, element_id):
+        CALLS["View.GetElementOverrides"] += 1
+        return OverrideGraphicSettings(self._element_overrides.get(element_id.IntegerValue, OverrideGraphicSettings()))
+
+    def SetElementOverrides(self, element_id, override_settings):
+        CALLS["View.SetElementOverrides"] += 1
+        self._set_override(self._element_overrides, element_id.IntegerValue, override_settings)
+
+    def IsCategoryOverridable(self, category_id):
+        return category_id.IntegerValue < 0
+
+    def GetCategoryOverrides(self, category_id):
+        CALLS["View.GetCategoryOverrides"] += 1
+        return OverrideGraphicSettings(self._category_overrides.get(category_id.IntegerValue, OverrideGraphicSettings()))
+
+    def SetCategoryOverrides(self, category_id, override_settings):
+        CALLS["View.SetCategoryOverrides"] += 1
+        self._set_override(self._category_overrides, category_id.IntegerValue, override_settings)
+
+    def _set_override(self, store, key, override_settings):
+        old = store.get(key)
+        self.Document._record(lambda: store.__setitem__(key, old) if old is not None else store.pop(key, None))
+        if override_settings == OverrideGraphicSettings():
+            store.pop(key, None)
+        else:
+            store[key] = OverrideGraphicSettings(override_settings)
+
+    # View filters
+    def GetFilters(self):
+        return [ElementId(f_id) for f_id in self._filters]
+
+    def AddFilter(self, filter_id):
+        CALLS["View.AddFilter"] += 1
+        self.Document._record(lambda: self._filters.pop(filter_id.IntegerValue, None))
+        self._filters.setdefault(filter_id.IntegerValue, [OverrideGraphicSettings(), True])
+
+    def RemoveFilter(self, filter_id):
+        CALLS["View.RemoveFilter"] += 1
+        old = self._filters.get(filter_id.IntegerValue)
+        self.Document._record(lambda: self._filters.__setitem__(filter_id.IntegerValue, old))
+        self._filters.pop(filter_id.IntegerValue, None)
+
+    def _filter_entry(self, filter_id):
+        if filter_id.IntegerValue not in self._filters:
+            raise ArgumentException("Filter {} is not applied to the view".format(filter_id.IntegerValue))
+        return self._filters[filter_id.IntegerValue]
+
+    def SetFilterOverrides(self, filter_id, override_settings):
+        CALLS["View.SetFilterOverrides"] += 1
+        entry = self._filter_entry(filter_id)
+        old = entry[0]
+        self.Document._record(lambda: entry.__setitem__(0, old))
+        entry[0] = OverrideGraphicSettings(override_settings)
+
+    def GetFilterOverrides(self, filter_id):
+        return OverrideGraphicSettings(self._filter_entry(filter_id)[0])
+
+    def SetFilterVisibility(self, filter_id, visible):
+        entry = self._filter_entry(filter_id)
+        old = entry[1]
+        self.Document._record(lambda: entry.__setitem__(1, old))
+        entry[1] = bool(visible)
+
+    def GetFilterVisibility(self, filter_id):
+        return self._filter_entry(filter_id)[1]
+
+
+class ViewPlan(View):
+    pass
+
+
+class View3D(View):
+    def __init__(self, name="{3D}", **kwargs):
+        kwargs["view_type"] = ViewType.ThreeD
+        View.__init__(self, name, **kwargs)
+
+
+class ViewSection(View):
+    pass
+
+
+class ViewDrafting(View):
+    pass
+
+
+class ViewSheet(View):
+    def __init__(self, number, name, **kwargs):
+        kwargs["view_type"] = ViewType.DrawingSheet
+        View.__init__(self, name, **kwargs)
+        self._values = dict(self._values or {}, **{"Sheet Number": number})
+        self.revision_ids = []
+
+    @property
+    def SheetNumber(self):
+        param = self.get_Parameter(BuiltInParameter.SHEET_NUMBER)
+        return param.AsString() if param else (self._values or {}).get("Sheet Number")
+
+    @SheetNumber.setter
+    def SheetNumber(self, value):
+        self.get_Parameter(BuiltInParameter.SHEET_NUMBER).Set(value)
+
+    def GetAllRevisionIds(self):
+        return list(self.revision_ids)
+
+    def GetAllPlacedViews(self):
+        return set(vp.ViewId for vp in self.Document._elements.values()
+                   if isinstance(vp, Viewport) and vp.SheetId == self.Id)
+
+
+class Viewport(Element):
+    def __init__(self, sheet, view, **kwargs):
+        Element.__init__(self, "", owner_view_id=sheet.Id, **kwargs)
+        self.SheetId = sheet.Id
+        self.ViewId  = view.Id
+
+
+#🗂️ CATEGORIES
+#------------------------------
+class Category(object):
+    def __init__(self, bic, name, category_type=CategoryType.Model):
+        self.Id               = ElementId(bic)
+        self.Name             = name
+        self.CategoryType     = category_type
+        self.BuiltInCategory  = bic
+        self.SubCategories    = []
+
+
+# BuiltInCategory -> (display name, CategoryType)
+CATEGORY_INFO = {
+    BuiltInCategory.OST_Walls:               ("Walls", CategoryType.Model),
+    BuiltInCategory.OST_Windows:             ("Windows", CategoryType.Model),
+    BuiltInCategory.OST_Doors:               ("Doors", CategoryType.Model),
+    BuiltInCategory.OST_Floors:              ("Floors", CategoryType.Model),
+    BuiltInCategory.OST_Ceilings:            ("Ceilings", CategoryType.Model),
+    BuiltInCategory.OST_Roofs:               ("Roofs", CategoryType.Model),
+    BuiltInCategory.OST_Furniture:           ("Furniture", CategoryType.Model),
+    BuiltInCategory.OST_GenericModel:        ("Generic Models", CategoryType.Model),
+    BuiltInCategory.OST_Rooms:               ("Rooms", CategoryType.Model),
+    BuiltInCategory.OST_MechanicalEquipment: ("Mechanical Equipment", CategoryType.Model),
+    BuiltInCategory.OST_PlumbingFixtures:    ("Plumbing Fixtures", CategoryType.Model),
+    BuiltInCategory.OST_ElectricalFixtures:  ("Electrical Fixtures", CategoryType.Model),
+    BuiltInCategory.OST_LightingFixtures:    ("Lighting Fixtures", CategoryType.Model),
+    BuiltInCategory.OST_StructuralColumns:   ("Structural Columns", CategoryType.Model),
+    BuiltInCategory.OST_StructuralFraming:   ("Structural Framing", CategoryType.Model),
+    BuiltInCategory.OST_Levels:              ("Levels", CategoryType.Annotation),
+    BuiltInCategory.OST_Grids:               ("Grids", CategoryType.Annotation),
+    BuiltInCategory.OST_Views:               ("Views", CategoryType.Internal),
+    BuiltInCategory.OST_Sheets:              ("Sheets", CategoryType.Internal),
+    BuiltInCategory.OST_TitleBlocks:         ("Title Blocks", CategoryType.Annotation),
+    BuiltInCategory.OST_TextNotes:           ("Text Notes", CategoryType.Annotation),
+    BuiltInCategory.OST_RoomTags:            ("Room Tags", CategoryType.Annotation),
+    BuiltInCategory.OST_Viewports:           ("Viewports", CategoryType.Annotation),
+    BuiltInCategory.OST_Materials:           ("Materials", CategoryType.Internal),
+    BuiltInCategory.OST_Revisions:           ("Revisions", CategoryType.Internal),
+}
+
+
+class Categories(object):
+    """doc.Settings.Categories: iterable, with get_Item(BuiltInCategory)."""
+
+    def __init__(self):
+        self._by_id = OrderedDict()
+        for bic, (name, category_type) in CATEGORY_INFO.items():
+            self._by_id[int(bic)] = Category(bic, name, category_type)
+
+    def get_Item(self, key):
+        return self._by_id.get(int(key.IntegerValue if isinstance(key, ElementId) else key))
+
+    def __iter__(self):
+        return iter(self._by_id.values())
+
+    @property
+    def Size(self):
+        return len(self._by_id)
+
+
+class Settings(object):
+    def __init__(self):
+        self.Categories = Categories()
+
+
+class ParameterFilterUtilities(object):
+    @staticmethod
+    def GetAllFilterableCategories():
+        return [ElementId(bic) for bic, (_, category_type) in CATEGORY_INFO.items() if category_type == CategoryType.Model]
+
+
+#📄 DOCUMENT
+#------------------------------
+class _DocumentCreation(object):
+    def __init__(self, doc):
+        self.doc = doc
+
+    def NewRoomTag(self, room_id, point, view_id):
+        CALLS["Document.Create.NewRoomTag"] += 1
+        doc = self.doc
+        room = doc.GetElement(room_id.HostElementId)
+        if not isinstance(room, Room):
+            raise ArgumentException("Not a room: {}".format(room_id.HostElementId))
+        tag = RoomTag("", category=doc.get_category(BuiltInCategory.OST_RoomTags), owner_view_id=view_id,
+                      location=LocationPoint(XYZ(point.U, point.V, 0)), values={"Room": room.Id})
+        return doc.add(tag)
+
+
+class Document(object):
+    """In-memory model. Elements are added with doc.add(elem) (no Transaction needed while building a model).
+
+    e.g.
+    doc = Document("Sample")
+    level = doc.add(Level("Level 1", category=doc.get_category(BuiltInCategory.OST_Levels)))"""
+
+    FIRST_ID = 100000
+
+    def __init__(self, title="Project1", path_name=""):
+        self.Title            = title
+        self.PathName         = path_name
+        self.IsWorkshared     = False
+        self.IsFamilyDocument = False
+        self.Settings         = Settings()
+        self.Create           = _DocumentCreation(self)
+        self.ActiveView       = None
+        self._elements        = OrderedDict()      # id (int) -> element
+        self._by_category     = {}                 # category id (int) -> OrderedDict id -> element
+        self._by_owner        = {}                 # owner view id (int) -> OrderedDict id -> element
+        self._next_id         = self.FIRST_ID
+        self._scopes          = []                 # open Transaction / SubTransaction / TransactionGroup
+        self._undo            = []                 # callables restoring the state, newest last
+        self.unique_prefix    = hashlib.md5((title + path_name).encode("utf-8")).hexdigest()[:8]
+
+    def __repr__(self):
+        return "<Document '{}' ({} elements)>".format(self.Title, len(self._elements))
+
+    # Model building
+    def get_category(self, bic):
+        return self.Settings.Categories.get_Item(bic)
+
+    def add(self, elem):
+        """Give an element an id and register it. Inside a Transaction the addition can be rolled back."""
+        CALLS["Document.add"] += 1
+        elem.Id       = ElementId(self._next_id)
+        elem.Document = self
+        self._next_id += 1
+        self._register(elem)
+        if self._scopes:
+            self._record(lambda: self._unregister(elem))
+        return elem
+
+    def _register(self, elem):
+        key = elem.Id.IntegerValue
+        self._elements[key] = elem
+        cat_key = elem.Category.Id.IntegerValue if elem.Category is not None else None
+        self._by_category.setdefault(cat_key, OrderedDict())[key] = elem
+        if elem.OwnerViewId.IntegerValue != -1:
+            self._by_owner.setdefault(elem.OwnerViewId.IntegerValue, OrderedDict())[key] = elem
+
+    def _unregister(self, elem):
+        key = elem.Id.IntegerValue
+        self._elements.pop(key, None)
+        cat_key = elem.Category.Id.IntegerValue if elem.Category is not None else None
+        self._by_category.get(cat_key, {}).pop(key, None)
+        self._by_owner.get(elem.OwnerViewId.IntegerValue, {}).pop(key, None)
+
+    def _rename(self, elem, name):
+        """Element names that Revit keeps unique (views of a ViewType, levels, sheets are exempt)."""
+        if isinstance(elem, (View, Level)) and not isinstance(elem, ViewSheet):
+            for other in self._by_category.get(elem.Category.Id.IntegerValue if elem.Category else None, {}).values():
+                if (other is not elem and type(other) is type(elem) and other._name == name and
+                        getattr(other, "ViewType", None) == getattr(elem, "ViewType", None)):
+                    raise ArgumentException("Name '{}' is already in use".format(name))
+
+    # Transactions
+    @property
+    def IsModifiable(self):
+        return any(isinstance(s, (Transaction, SubTransaction)) for s in self._scopes)
+
+    def _record(self, undo):
+        if not self.IsModifiable:
+            raise ModificationOutsideTransactionException("Attempt to modify the model outside of transaction.")
+        self._undo.append(undo)
+
+    def _rollback_to(self, mark):
+        while len(self._undo) > mark:
+            self._undo.pop()()
+
+    # Revit API
+    def GetElement(self, key):
+        CALLS["Document.GetElement"] += 1
+        if key is None:
+            return None
+        if isinstance(key, ElementId):
+            return self._elements.get(key.IntegerValue)
+        if isinstance(key, int):
+            return self._elements.get(key)
+        prefix, _, number = str(key).rpartition("-")  # UniqueId
+        if prefix != self.unique_prefix:
+            return None
+        try:
+            return self._elements.get(int(number, 16))
+        except ValueError:
+            return None
+
+    def Delete(self, element_ids):
+        CALLS["Document.Delete"] += 1
+        if isinstance(element_ids, ElementId):
+            element_ids = [element_ids]
+        deleted = []
+        for e_id in element_ids:
+            elem = self._elements.get(e_id.IntegerValue)
+            if elem is None:
+                continue
+            self._record(lambda elem=elem: self._register(elem))
+            self._unregister(elem)
+            deleted.append(e_id)
+        return deleted
+
+    def Regenerate(self):
+        pass
+
+    @property
+    def element_count(self):
+        return len(self._elements)
+
+
+#🔁 TRANSACTIONS
+#------------------------------
+class _Scope(object):
+    def __init__(self, doc, name=""):
+        self.doc     = doc
+        self.name    = name
+        self._status = TransactionStatus.Uninitialized
+        self._mark   = None
+
+    def _start(self):
+        if self._status == TransactionStatus.Started:
+            raise InvalidOperationException("{} has already been started".format(type(self).__name__))
+        self._mark   = len(self.doc._undo)
+        self._status = TransactionStatus.Started
+        self.doc._scopes.append(self)
+        return self._status
+
+    def _close(self, status):
+        if self._status != TransactionStatus.Started or not self.doc._scopes or self.doc._scopes[-1] is not self:
+            raise InvalidOperationException("{} is not the innermost open scope".format(type(self).__name__))
+        self.doc._scopes.pop()
+        if status == TransactionStatus.RolledBack:
+            self.doc._rollback_to(self._mark)
+        elif not self.doc._scopes:
+            del self.doc._undo[:]  # Nothing outside can roll this back any more
+        self._status = status
+        return status
+
+    def GetStatus(self):
+        return self._status
+
+    def HasStarted(self):
+        return self._status != TransactionStatus.Uninitialized
+
+    def HasEnded(self):
+        return self._status in (TransactionStatus.Committed, TransactionStatus.RolledBack)
+
+    def Commit(self):
+        return self._close(TransactionStatus.Committed)
+
+    def RollBack(self):
+        return self._close(TransactionStatus.RolledBack)
+
+    def Dispose(self):
+        if self._status == TransactionStatus.Started:
+            self.RollBack()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.Dispose()
+
+
+class Transaction(_Scope):
+    def Start(self, name=None):
+        CALLS["Transaction.Start"] += 1
+        if any(isinstance(s, Transaction) for s in self.doc._scopes):
+            raise InvalidOperationException("Another Transaction is already open")
+        if name:
+            self.name = name
+        return self._start()
+
+    def GetName(self):
+        return self.name
+
+
+class SubTransaction(_Scope):
+    def __init__(self, doc):
+        _Scope.__init__(self, doc)
+
+    def Start(self):
+        if not any(isinstance(s, Transaction) for s in self.doc._scopes):
+            raise InvalidOperationException("SubTransaction needs an open Transaction")
+        return self._start()
+
+
+class TransactionGroup(_Scope):
+    def Start(self, name=None):
+        if any(isinstance(s, Transaction) for s in self.doc._scopes):
+            raise InvalidOperationException("A TransactionGroup can't start inside a Transaction")
+        if name:
+            self.name = name
+        return self._start()
+
+    def Assimilate(self):
+        return self.Commit()
+
+
+#🔎 FILTERS
+#------------------------------
+def _category_key(value):
+    return value.IntegerValue if isinstance(value, ElementId) else int(value)
+
+
+class ElementFilter(object):
+    def __init__(self, inverted=False):
+        self.Inverted = inverted
+
+    def _passes(self, elem):
+        return self._test(elem) != self.Inverted
+
+    def _test(self, elem):
+        raise NotImplementedError
+
+    def PassesFilter(self, doc_or_elem, element_id=None):
+        elem = doc_or_elem.GetElement(element_id) if element_id is not None else doc_or_elem
+        return elem is not None and self._passes(elem)
+
+    # Category ids the filter is limited to (None: any). Lets the collector start from the category index.
+    def _category_keys(self):
+        return None
+
+
+class ElementCategoryFilter(ElementFilter):
+    def __init__(self, category, inverted=False):
+        ElementFilter.__init__(self, inverted)
+        self.key = _category_key(category)
+
+    def _test(self, elem):
+        return elem.Category is not None and elem.Category.Id.IntegerValue == self.key
+
+    def _category_keys(self):
+        return None if self.Inverted else set([self.key])
+
+
+class ElementMulticategoryFilter(ElementFilter):
+    def __init__(self, categories, inverted=False):
+        ElementFilter.__init__(self, inverted)
+        self.keys = set(_category_key(c) for c in categories)
+        if not self.keys:
+            raise ArgumentException("categories must not be empty")
+
+    def _test(self, elem):
+        return elem.Category is not None and elem.Category.Id.IntegerValue in self.keys
+
+    def _category_keys(self):
+        return None if self.Inverted else self.keys
+
+
+class ElementClassFilter(ElementFilter):
+    def __init__(self, cls, inverted=False):
+        ElementFilter.__init__(self, inverted)
+        _check_filterable_class(cls)
+        self.cls = cls
+
+    def _test(self, elem):
+        return isinstance(elem, self.cls)
+
+
+class ElementMulticlassFilter(ElementFilter):
+    def __init__(self, classes, inverted=False):
+        ElementFilter.__init__(self, inverted)
+        classes = tuple(classes)
+        for cls in classes:
+            _check_filterable_class(cls)
+        self.classes = classes
+
+    def _test(self, elem):
+        return isinstance(elem, self.classes)
+
+
+def _check_filterable_class(cls):
+    # Revit only filters native classes; Room, RoomTag, ... must be filtered through their parent class
+    if cls in (Room, RoomTag):
+        raise ArgumentException("Input type ({}) is not a recognized Revit API type".format(cls.__name__))
+
+
+class ElementIsElementTypeFilter(ElementFilter):
+    def _test(self, elem):
+        return elem.is_type
+
+
+class VisibleInViewFilter(ElementFilter):
+    def __init__(self, doc, view_id, inverted=False):
+        ElementFilter.__init__(self, inverted)
+        self.view = doc.GetElement(view_id)
+
+    def _test(self, elem):
+        return self.view.is_visible(elem)
+
+
+class LogicalAndFilter(ElementFilter):
+    def __init__(self, *filters):
+        ElementFilter.__init__(self)
+        self.filters = list(filters[0]) if len(filters) == 1 else list(filters)
+
+    def _test(self, elem):
+        return all(f._passes(elem) for f in self.filters)
+
+
+class LogicalOrFilter(LogicalAndFilter):
+    def _test(self, elem):
+        return any(f._passes(elem) for f in self.filters)
+
+
+class ElementParameterFilter(ElementFilter):
+    def __init__(self, rules, inverted=False):
+        ElementFilter.__init__(self, inverted)
+        self.rules = [rules] if isinstance(rules, FilterRule) else list(rules)
+
+    def _test(self, elem):
+        return all(rule._passes(elem) for rule in self.rules)
+
+    def GetRules(self):
+        return list(self.rules)
+
+
+class FilterRule(object):
+    """Native rule on one parameter. param_id is ElementId(BuiltInParameter) or the id of a ParameterElement."""
+
+    def __init__(self, param_id, test, needs_value=True):
+        self.param_id    = param_id
+        self.test        = test
+        self.needs_value = needs_value
+
+    def _param(self, elem):
+        key = self.param_id.IntegerValue
+        if key < 0:
+            return elem.get_Parameter(key)
+        param_elem = elem.Document.GetElement(self.param_id)
+        return elem.get_Parameter(param_elem.GetDefinition()) if param_elem is not None else None
+
+    def _passes(self, elem):
+        param = self._param(elem)
+        if param is None:
+            return False
+        value = param._value()
+        if self.needs_value and value is None:
+            return False
+        try:
+            return self.test(value)
+        except TypeError:
+            return False  # e.g. a numeric rule on a text parameter
+
+
+def _numeric(value):
+    return value.IntegerValue if isinstance(value, ElementId) else value
+
+
+def _text(value, case_sensitive):
+    text = "" if value is None else str(value)
+    return text if case_sensitive else text.lower()
+
+
+def _compare_rule(compare):
+    """compare(actual, expected, epsilon). Strings compare case-insensitively unless caseSensitive is passed."""
+    def factory(param_id, value, *args):
+        if isinstance(value, _string_types):
+            case_sensitive = bool(args[0]) if args else False
+            expected = _text(value, case_sensitive)
+            return FilterRule(param_id, lambda v: compare(_text(v, case_sensitive), expected, 0), needs_value=False)
+        epsilon  = args[0] if args else 0
+        expected = _numeric(value)
+        return FilterRule(param_id, lambda v: compare(_numeric(v), expected, epsilon))
+    return factory
+
+
+def _string_rule(test):
+    def factory(param_id, value, *args):
+        case_sensitive = bool(args[0]) if args else False
+        expected = _text(value, case_sensitive)
+        return FilterRule(param_id, lambda v: test(_text(v, case_sensitive), expected), needs_value=False)
+    return factory
+
+
+class ParameterFilterRuleFactory(object):
+    CreateEqualsRule         = staticmethod(_compare_rule(lambda a, b, eps: abs(a - b) <= eps if eps else a == b))
+    CreateNotEqualsRule      = staticmethod(_compare_rule(lambda a, b, eps: abs(a - b) > eps if eps else a != b))
+    CreateGreaterRule        = staticmethod(_compare_rule(lambda a, b, eps: a > b))
+    CreateGreaterOrEqualRule = staticmethod(_compare_rule(lambda a, b, eps: a >= b))
+    CreateLessRule           = staticmethod(_compare_rule(lambda a, b, eps: a < b))
+    CreateLessOrEqualRule    = staticmethod(_compare_rule(lambda a, b, eps: a <= b))
+    CreateContainsRule       = staticmethod(_string_rule(lambda a, b: b in a))
+    CreateNotContainsRule    = staticmethod(_string_rule(lambda a, b: b not in a))
+    CreateBeginsWithRule     = staticmethod(_string_rule(lambda a, b: a.startswith(b)))
+    CreateNotBeginsWithRule  = staticmethod(_string_rule(lambda a, b: not a.startswith(b)))
+    CreateEndsWithRule       = staticmethod(_string_rule(lambda a, b: a.endswith(b)))
+    CreateNotEndsWithRule    = staticmethod(_string_rule(lambda a, b: not a.endswith(b)))
+
+    @staticmethod
+    def CreateHasValueParameterRule(param_id):
+        return FilterRule(param_id, lambda v: v not in (None, ""), needs_value=False)
+
+    @staticmethod
+    def CreateHasNoValueParameterRule(param_id):
+        return FilterRule(param_id, lambda v: v in (None, ""), needs_value=False)
+
+
+class ParameterFilterElement(Element):
+    def __init__(self, name, category_ids, element_filter=None, **kwargs):
+        Element.__init__(self, name, **kwargs)
+        self._category_ids   = list(category_ids)
+        self._element_filter = element_filter
+
+    @staticmethod
+    def Create(doc, name, category_ids, element_filter=None):
+        CALLS["ParameterFilterElement.Create"] += 1
+        return doc.add(ParameterFilterElement(name, category_ids, element_filter))
+
+    def GetCategories(self):
+        return list(self._category_ids)
+
+    def SetCategories(self, category_ids):
+        old = self._category_ids
+        self.Document._record(lambda: setattr(self, "_category_ids", old))
+        self._category_ids = list(category_ids)
+
+    def GetElementFilter(self):
+        return self._element_filter
+
+    def SetElementFilter(self, element_filter):
+        old = self._element_filter
+        self.Document._record(lambda: setattr(self, "_element_filter", old))
+        self._element_filter = element_filter
+
+
+#🧺 COLLECTOR
+#------------------------------
+class FilteredElementCollector(object):
+    """FilteredElementCollector(doc), (doc, view_id) or (doc, element_ids).
+    Filters are chained lazily and evaluated while iterating, like the native collector."""
+
+    def __init__(self, doc, scope=None, link_id=None):
+        CALLS["FilteredElementCollector"] += 1
+        self.doc      = doc
+        self._view    = None
+        self._ids     = None
+        self._filters = []
+        if isinstance(scope, ElementId):
+            self._view = doc.GetElement(scope)
+            if self._view is None:
+                raise ArgumentException("viewId is not a view")
+        elif scope is not None:
+            self._ids = [e_id.IntegerValue for e_id in scope]
+            if not self._ids:
+                raise ArgumentException("The input elementIds is empty.")
+
+    # Filters
+    def WherePasses(self, element_filter):
+        self._filters.append(element_filter)
+        return self
+
+    def OfClass(self, cls):
+        return self.WherePasses(ElementClassFilter(cls))
+
+    def OfCategory(self, bic):
+        return self.WherePasses(ElementCategoryFilter(bic))
+
+    def OfCategoryId(self, category_id):
+        return self.WherePasses(ElementCategoryFilter(category_id))
+
+    def WhereElementIsElementType(self):
+        return self.WherePasses(ElementIsElementTypeFilter())
+
+    def WhereElementIsNotElementType(self):
+        return self.WherePasses(ElementIsElementTypeFilter(inverted=True))
+
+    def Excluding(self, element_ids):
+        excluded = set(e_id.IntegerValue for e_id in element_ids)
+        return self.WherePasses(_PredicateFilter(lambda e: e.Id.IntegerValue not in excluded))
+
+    # Results
+    def _candidates(self):
+        doc = self.doc
+        if self._ids is not None:
+            return (doc._elements[i] for i in self._ids if i in doc._elements)
+        category_keys = None
+        for element_filter in self._filters:
+            keys = element_filter._category_keys()
+            if keys is not None:
+                category_keys = keys if category_keys is None else category_keys & keys
+        if self._view is not None and self._view._owned_only:
+            owned = doc._by_owner.get(self._view.Id.IntegerValue, {})
+            return (e for e in owned.values() if category_keys is None or
+                    (e.Category.Id.IntegerValue if e.Category else None) in category_keys)
+        if category_keys is not None:
+            elements = [e for key in sorted(category_keys) for e in doc._by_category.get(key, {}).values()]
+            elements.sort(key=lambda e: e.Id.IntegerValue)
+        else:
+            elements = list(doc._elements.values())
+        if self._view is not None:
+            view = self._view
+            return (e for e in elements if view.shows(e))
+        return iter(elements)
+
+    def __iter__(self):
+        filters = self._filters
+        for elem in self._candidates():
+            if all(f._passes(elem) for f in filters):
+                yield elem
+
+    def ToElements(self):
+        CALLS["FilteredElementCollector.ToElements"] += 1
+        return list(self)
+
+    def ToElementIds(self):
+        CALLS["FilteredElementCollector.ToElementIds"] += 1
+        return [e.Id for e in self]
+
+    def FirstElement(self):
+        for elem in self:
+            return elem
+        return None
+
+    def FirstElementId(self):
+        elem = self.FirstElement()
+        return elem.Id if elem is not None else ElementId.InvalidElementId
+
+    def GetElementCount(self):
+        return sum(1 for _ in self)
+
+
+class _PredicateFilter(ElementFilter):
+    def __init__(self, predicate):
+        ElementFilter.__init__(self)
+        self.predicate = predicate
+
+    def _test(self, elem):
+        return self.predicate(elem)
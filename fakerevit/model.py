@@ -0,0 +1,315 @@
+# -*- coding: utf-8 -*-
+"""Synthetic models for tests and benchmarks, from a few hundred to a million elements.
+
+generate_model(n) builds n model instances (walls, doors, windows, generic models, MEP fixtures, rooms)
+spread over levels, one floor plan per level and a 3D view, plus sheets with title blocks,
+General Notes legends and revisions. Everything is seeded, so the same arguments give the same model.
+
+e.g.
+doc = generate_model(100000, levels=10)
+doc = generate_model(1000, sheets=50)"""
+
+#⬇️ IMPORTS
+#------------------------------
+import random
+
+from fakerevit.db import *
+
+
+#📦 VARIABLES
+#------------------------------
+# Share of the model instances per category
+MIX = [
+    (BuiltInCategory.OST_Walls,               0.30),
+    (BuiltInCategory.OST_Doors,               0.14),
+    (BuiltInCategory.OST_Windows,             0.14),
+    (BuiltInCategory.OST_GenericModel,        0.10),
+    (BuiltInCategory.OST_MechanicalEquipment, 0.06),
+    (BuiltInCategory.OST_PlumbingFixtures,    0.06),
+    (BuiltInCategory.OST_ElectricalFixtures,  0.06),
+    (BuiltInCategory.OST_LightingFixtures,    0.09),
+    (BuiltInCategory.OST_Rooms,               0.05),
+]
+
+# Loadable families: category -> (family name, [type names])
+FAMILIES = {
+    BuiltInCategory.OST_Doors:               ("Single-Flush", ["0915 x 2134mm", "0864 x 2032mm"]),
+    BuiltInCategory.OST_Windows:             ("Fixed", ["0610 x 1220mm", "0915 x 1830mm"]),
+    BuiltInCategory.OST_GenericModel:        ("Box", ["Small", "Large"]),
+    BuiltInCategory.OST_MechanicalEquipment: ("AHU", ["AHU-1"]),
+    BuiltInCategory.OST_PlumbingFixtures:    ("Sink", ["Sink 600"]),
+    BuiltInCategory.OST_ElectricalFixtures:  ("Panel", ["Panel 400A"]),
+    BuiltInCategory.OST_LightingFixtures:    ("Downlight", ["DL-150"]),
+    BuiltInCategory.OST_TitleBlocks:         ("A1 Metric", ["A1"]),
+}
+
+# Wall types: (name, structural usage, function, material) - see Snippets._overrides STRUCTURAL_* for the meaning
+WALL_TYPES = [
+    ("Generic - 200mm",    0, 0, "Gypsum Wall Board"),
+    ("Exterior - Brick",   0, 1, None),
+    ("Partition - 100mm",  0, 0, "Gypsum Wall Board"),
+    ("Bearing - 300mm",    1, 1, "Concrete, Cast-in-Place"),
+    ("Retaining - 400mm",  0, 3, "Concrete, Cast-in-Place"),
+    ("Shear - Steel Stud", 2, 0, "Steel"),
+    ("Core - Concrete",    0, 5, "Concrete, Cast-in-Place"),
+]
+MATERIALS  = ["Concrete, Cast-in-Place", "Steel", "Gypsum Wall Board", "Glass"]
+ROOM_NAMES = ["Office", "Meeting", "Corridor", "Toilet", "Storage", "Lobby"]
+
+# Sheet parameters (Title-Block columns) and their values on generated sheets
+SHEET_PARAMETERS = [
+    ("Sheet Issue Date",            "2024-01-15"),
+    ("Drawn By",                    "AP"),
+    ("Checked By",                  "RS"),
+    ("Designed By",                 "AP"),
+    ("Approved By",                 "MK"),
+    ("Sheet No._Origin",            "PYA"),
+    ("Sheet No._Project phase",     "DD"),
+    ("Sheet No._Stage",             "S2"),
+    ("Sheet No._Facility-Area",     "A1"),
+    ("Sheet No._Floor-Zone-Street", "Z1"),
+    ("Sheet No._Doc type",          "DR"),
+    ("Sheet No._Discipline",        "AR"),
+    ("Internal Revision",           "P01"),
+    ("Sheet No._Revision",          "C01"),
+]
+
+LEVEL_HEIGHT = 12.0  # feet
+ROOM_SPACING = 20.0  # feet between room centres
+
+
+#🧩 SCHEMAS
+#------------------------------
+def _name_getter(elem):
+    return elem._name
+
+
+def _name_setter(elem, value):
+    elem._set_name(value)
+
+
+def _type_name():
+    return Definition("Type Name", StorageType.String, BuiltInParameter.SYMBOL_NAME_PARAM, read_only=True,
+                      getter=_name_getter)
+
+
+def _instance_definitions():
+    return [
+        Definition("Comments", StorageType.String, BuiltInParameter.ALL_MODEL_INSTANCE_COMMENTS),
+        Definition("Mark", StorageType.String, BuiltInParameter.ALL_MODEL_MARK),
+        Definition("Type", StorageType.ElementId, BuiltInParameter.ELEM_TYPE_PARAM, read_only=True,
+                   getter=lambda e: e.GetTypeId()),
+        Definition("Fire Rating", StorageType.String),
+        Definition("Cost", StorageType.Double),
+        Definition("Is Existing", StorageType.Integer),
+    ]
+
+
+class Schemas(object):
+    """One ParameterSchema per kind of element, shared by all elements of that kind."""
+
+    def __init__(self):
+        instance = _instance_definitions()
+        self.instance = ParameterSchema(instance)
+        self.wall = self.instance.extend([
+            Definition("Structural", StorageType.Integer, BuiltInParameter.WALL_STRUCTURAL_SIGNIFICANT),
+            Definition("Unconnected Height", StorageType.Double, BuiltInParameter.WALL_USER_HEIGHT_PARAM, default=10.0),
+        ])
+        self.wall_type = ParameterSchema([
+            _type_name(),
+            Definition("Structural Usage", StorageType.Integer, BuiltInParameter.WALL_STRUCTURAL_USAGE_PARAM),
+            Definition("Function", StorageType.Integer, BuiltInParameter.FUNCTION_PARAM),
+            Definition("Structural Material", StorageType.ElementId, BuiltInParameter.STRUCTURAL_MATERIAL_PARAM),
+        ])
+        self.symbol = ParameterSchema([
+            _type_name(),
+            Definition("Type Mark", StorageType.String),
+            Definition("Width", StorageType.Double, default=3.0),
+        ])
+        self.room = ParameterSchema([
+            Definition("Name", StorageType.String, BuiltInParameter.ROOM_NAME),
+            Definition("Number", StorageType.String, BuiltInParameter.ROOM_NUMBER),
+            Definition("Area", StorageType.Double, BuiltInParameter.ROOM_AREA, read_only=True,
+                       getter=lambda r: r.Area),
+            Definition("Phase", StorageType.ElementId, BuiltInParameter.ROOM_PHASE_ID, read_only=True),
+            instance[0],
+        ])
+        self.sheet = ParameterSchema(
+            [Definition("Sheet Number", StorageType.String, BuiltInParameter.SHEET_NUMBER),
+             Definition("Sheet Name", StorageType.String, BuiltInParameter.SHEET_NAME,
+                        getter=_name_getter, setter=_name_setter)] +
+            [Definition(name, StorageType.String) for name, _ in SHEET_PARAMETERS])
+        self.view = ParameterSchema([
+            Definition("View Name", StorageType.String, BuiltInParameter.VIEW_NAME,
+                       getter=_name_getter, setter=_name_setter),
+            Definition("Sheet Number", StorageType.String, BuiltInParameter.VIEWPORT_SHEET_NUMBER, read_only=True,
+                       getter=_placed_sheet_number),
+        ])
+        self.level = ParameterSchema([
+            Definition("Elevation", StorageType.Double, BuiltInParameter.LEVEL_ELEV, read_only=True,
+                       getter=lambda l: l.Elevation),
+        ])
+
+
+def _placed_sheet_number(view):
+    for elem in view.Document._by_category.get(int(BuiltInCategory.OST_Viewports), {}).values():
+        if elem.ViewId == view.Id:
+            return view.Document.GetElement(elem.SheetId).SheetNumber
+    return None
+
+
+#🏗️ GENERATOR
+#------------------------------
+class _Builder(object):
+    def __init__(self, doc, seed):
+        self.doc     = doc
+        self.rng     = random.Random(seed)
+        self.schemas = Schemas()
+
+    def category(self, bic):
+        return self.doc.get_category(bic)
+
+    def add(self, elem):
+        return self.doc.add(elem)
+
+    def named(self, cls, name, bic, **kwargs):
+        return self.add(cls(name, category=self.category(bic) if bic is not None else None, **kwargs))
+
+    def family_types(self, bic):
+        family_name, type_names = FAMILIES[bic]
+        family = self.add(Family(family_name, family_category=self.category(bic)))
+        return [self.add(FamilySymbol(name, category=self.category(bic), schema=self.schemas.symbol,
+                                      values={"Family": family.Id, "Type Mark": name[:2]}))
+                for name in type_names]
+
+
+def _split(n_elements):
+    """Number of instances per category, adding up to n_elements."""
+    counts = [(bic, int(n_elements * share)) for bic, share in MIX]
+    counts[0] = (counts[0][0], counts[0][1] + n_elements - sum(c for _, c in counts))
+    return counts
+
+
+def generate_model(n_elements=1000, levels=4, sheets=None, title="Synthetic Model", seed=0):
+    """Document with n_elements model instances over the given number of levels.
+    sheets defaults to one per 200 instances (at least 2). The first floor plan is the ActiveView."""
+    doc = Document(title, "C:\\Models\\{}.rvt".format(title))
+    b   = _Builder(doc, seed)
+    rng = b.rng
+    sch = b.schemas
+
+    # Project setup
+    phase     = b.named(Phase, "New Construction", None)
+    materials = dict((name, b.named(Material, name, BuiltInCategory.OST_Materials)) for name in MATERIALS)
+    b.add(FillPatternElement(FillPattern("<Solid fill>", FillPatternTarget.Drafting, is_solid_fill=True)))
+    b.add(FillPatternElement(FillPattern("Diagonal crosshatch", FillPatternTarget.Drafting)))
+    for definition in sch.instance:
+        if definition.BuiltInParameter == BuiltInParameter.INVALID:
+            b.add(SharedParameterElement(definition))
+
+    level_elems, plans = [], []
+    for i in range(levels):
+        level = b.add(Level("Level {}".format(i + 1), category=b.category(BuiltInCategory.OST_Levels),
+                            schema=sch.level, values={"Elevation": i * LEVEL_HEIGHT}))
+        level_elems.append(level)
+        plans.append(b.add(ViewPlan("Level {}".format(i + 1), view_type=ViewType.FloorPlan, gen_level=level,
+                                    category=b.category(BuiltInCategory.OST_Views), schema=sch.view)))
+    b.add(View3D(category=b.category(BuiltInCategory.OST_Views), schema=sch.view))
+    doc.ActiveView = plans[0] if plans else None
+
+    wall_types = []
+    for name, usage, function, material in WALL_TYPES:
+        values = {"Structural Usage": usage, "Function": function}
+        if material:
+            values["Structural Material"] = materials[material].Id
+        wall_types.append(b.add(WallType(name, category=b.category(BuiltInCategory.OST_Walls),
+                                         schema=sch.wall_type, values=values)))
+    symbols = dict((bic, b.family_types(bic)) for bic in FAMILIES)
+
+    # Model instances
+    box        = BoundingBoxXYZ(XYZ(0, 0, 0), XYZ(1, 1, 1))
+    walls      = []
+    room_count = [0] * levels
+    for bic, count in _split(n_elements):
+        category = b.category(bic)
+        for i in range(count):
+            level_index = i % levels
+            level_id    = level_elems[level_index].Id
+            values      = {}
+            if i % 10 == 0:
+                values["Comments"] = "Synthetic {}".format(i)
+            if i % 5 == 0:
+                values["Mark"] = "{}-{}".format(category.Name[:2].upper(), i)
+
+            if bic == BuiltInCategory.OST_Rooms:
+                room_count[level_index] += 1
+                n = room_count[level_index]
+                placed = n % 25 != 0  # A few unplaced rooms
+                row, col = divmod(n, 40)
+                point = XYZ(col * ROOM_SPACING + rng.uniform(-2, 2), row * ROOM_SPACING + rng.uniform(-2, 2),
+                            level_elems[level_index].Elevation)
+                values.update({"Name": ROOM_NAMES[n % len(ROOM_NAMES)],
+                               "Number": "{}{:02d}".format(level_index + 1, n),
+                               "Phase": phase.Id,
+                               "Area": rng.uniform(10, 40) if placed else 0.0})
+                b.add(Room("", category=category, schema=sch.room, level_id=level_id, values=values,
+                           location=LocationPoint(point) if placed else None))
+            elif bic == BuiltInCategory.OST_Walls:
+                if i % 20 == 0:
+                    values["Structural"] = 1
+                wall_type = wall_types[i % len(wall_types)]
+                walls.append(b.add(Wall(wall_type._name, category=category, schema=sch.wall, type_id=wall_type.Id,
+                                        level_id=level_id, bounding_box=box, values=values)))
+            else:
+                symbol = symbols[bic][i % len(symbols[bic])]
+                if bic in (BuiltInCategory.OST_Doors, BuiltInCategory.OST_Windows) and walls:
+                    values["Host"] = walls[i % len(walls)].Id
+                # Every 10th generic model is empty: no geometry in the view
+                bbox = None if bic == BuiltInCategory.OST_GenericModel and i % 10 == 0 else box
+                b.add(FamilyInstance(symbol._name, category=category, schema=sch.instance, type_id=symbol.Id,
+                                     level_id=level_id, bounding_box=bbox, values=values))
+
+    # Hide every 50th element per plan, tag every other placed room
+    by_level = {}
+    for elem in doc._elements.values():
+        if not elem.is_type and elem.LevelId.IntegerValue != -1:
+            by_level.setdefault(elem.LevelId.IntegerValue, []).append(elem)
+    for plan in plans:
+        on_level = by_level.get(plan._gen_level_id.IntegerValue, [])
+        plan.hidden_ids.update(e.Id.IntegerValue for e in on_level[::50])
+        rooms = [e for e in on_level if isinstance(e, Room) and e.Location is not None]
+        for room in rooms[::2]:
+            doc.add(RoomTag("", category=b.category(BuiltInCategory.OST_RoomTags), owner_view_id=plan.Id,
+                            location=LocationPoint(room.Location.Point), values={"Room": room.Id}))
+
+    _add_sheets(b, max(2, n_elements // 200) if sheets is None else sheets, plans, symbols)
+    return doc
+
+
+def _add_sheets(b, count, plans, symbols):
+    doc, sch = b.doc, b.schemas
+    note_type  = b.add(TextNoteType("2.5mm Arial", category=b.category(BuiltInCategory.OST_TextNotes)))
+    title_type = symbols[BuiltInCategory.OST_TitleBlocks][0]
+    revisions  = [b.add(Revision("Revision {}".format(i + 1), category=b.category(BuiltInCategory.OST_Revisions),
+                                 values={"Revision Description": "Issued for {}".format(purpose)}))
+                  for i, purpose in enumerate(["Review", "Construction"])]
+
+    for i in range(count):
+        values = dict(SHEET_PARAMETERS)
+        sheet = b.add(ViewSheet("A{:03d}".format(i + 1), "Sheet {}".format(i + 1),
+                                category=b.category(BuiltInCategory.OST_Sheets), schema=sch.sheet, values=values))
+        if i % 3 == 0:
+            sheet.revision_ids = [r.Id for r in revisions]
+        b.add(FamilyInstance(title_type._name, category=b.category(BuiltInCategory.OST_TitleBlocks),
+                             type_id=title_type.Id, owner_view_id=sheet.Id))
+
+        legend = b.add(View("GENERAL NOTES {}".format(i + 1), view_type=ViewType.Legend,
+                            category=b.category(BuiltInCategory.OST_Views), schema=sch.view))
+        b.add(Viewport(sheet, legend, category=b.category(BuiltInCategory.OST_Viewports)))
+        for n in range(3):
+            text = "{}. General note {} for sheet {}".format(n + 1, n + 1, sheet.SheetNumber)
+            b.add(TextNote(text, XYZ(0.1, 1.0 - n * 0.1, 0), width=0.5, type_id=note_type.Id, owner_view_id=legend.Id,
+                           category=b.category(BuiltInCategory.OST_TextNotes)))
+        if i < len(plans):
+            b.add(Viewport(sheet, plans[i], category=b.category(BuiltInCategory.OST_Viewports)))
+    return doc
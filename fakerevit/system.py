@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+"""The few .NET pieces the Snippets import next to the Revit API: clr, System.Type and the generic List."""
+
+
+#🧩 CLR
+#------------------------------
+def AddReference(name):
+    """Nothing to load: the stand-ins are plain Python."""
+
+
+def GetClrType(cls):
+    """Python classes stand in for their .NET types."""
+    return cls
+
+
+#📦 SYSTEM
+#------------------------------
+Type   = type
+Object = object
+String = str
+
+
+class _TypedList(list):
+    """System.Collections.Generic.List[T]: a Python list with the .NET members the Snippets call."""
+
+    def Add(self, item):
+        self.append(item)
+
+    def AddRange(self, items):
+        self.extend(items)
+
+    def Contains(self, item):
+        return item in self
+
+    def Clear(self):
+        del self[:]
+
+    @property
+    def Count(self):
+        return len(self)
+
+
+class _GenericList(object):
+    """List[ElementId](ids) -> _TypedList. The type argument is ignored."""
+
+    def __getitem__(self, item_type):
+        return _TypedList
+
+    def __call__(self, items=()):
+        return _TypedList(items)
+
+
+List = _GenericList()
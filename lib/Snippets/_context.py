@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+"""Lazy access to the Revit document, UI document and application.
+
+Snippets should not read __revit__ at import time: that binds to whichever document
+was active when the module first loaded and breaks outside a UI context.
+Use the shared context instead; everything is resolved on first access.
+
+e.g.
+from Snippets._context import get_context
+ctx = get_context()
+doc = ctx.doc
+type_names = ctx.cache("type_names", lambda: TypeNameCache(ctx.doc))  # once per document
+
+Tests and headless runs plug in a stand-in document:
+set_backend(StaticBackend(fake_doc))"""
+
+
+#📦 VARIABLES
+#------------------------------
+DOCUMENT_SCOPE = "document"
+VIEW_SCOPE     = "view"
+
+_context = None
+
+
+#🔌 BACKENDS
+#------------------------------
+class RevitBackend(object):
+    """Reads the running Revit session through pyRevit's __revit__ (UIApplication)."""
+
+    def uiapp(self):
+        try:
+            return __revit__
+        except NameError:
+            raise RuntimeError("No Revit session: __revit__ is not available (use StaticBackend headless)")
+
+    def uidoc(self):
+        return self.uiapp().ActiveUIDocument
+
+    def doc(self):
+        uidoc = self.uidoc()
+        return uidoc.Document if uidoc is not None else None
+
+    def app(self):
+        return self.uiapp().Application
+
+
+class StaticBackend(object):
+    """Fixed objects, e.g. a stand-in document in tests. Switch documents with .doc_ / .view_ attributes."""
+
+    def __init__(self, doc, uidoc=None, app=None, active_view=None):
+        self.doc_   = doc
+        self.uidoc_ = uidoc
+        self.app_   = app
+        self.view_  = active_view
+
+    def uidoc(self):
+        return self.uidoc_
+
+    def doc(self):
+        return self.doc_
+
+    def app(self):
+        return self.app_
+
+    def active_view(self):
+        return self.view_
+
+
+#🧭 CONTEXT
+#------------------------------
+def _document_key(doc):
+    if doc is None:
+        return None
+    # Not id(doc): Revit hands out a new wrapper object on every uidoc.Document access
+    return getattr(doc, "Title", None), getattr(doc, "PathName", None)
+
+
+def _view_key(view):
+    if view is None:
+        return None
+    view_id = getattr(view, "Id", None)
+    return getattr(view_id, "IntegerValue", view_id)
+
+
+class DocumentContext(object):
+    """doc / uidoc / app / active_view resolved lazily through a backend.
+    Per-document and per-view caches are dropped as soon as the active document or view changes."""
+
+    def __init__(self, backend=None):
+        self.backend = backend or RevitBackend()
+        self._doc_key  = None
+        self._view_key = None
+        self._caches   = {DOCUMENT_SCOPE: {}, VIEW_SCOPE: {}}
+
+    def _active_view(self, doc):
+        if hasattr(self.backend, "active_view"):
+            return self.backend.active_view()
+        uidoc = self.backend.uidoc()
+        if uidoc is not None:
+            return uidoc.ActiveView
+        return getattr(doc, "ActiveView", None)
+
+    def _sync(self):
+        """Reset caches if the active document or view changed since the last access."""
+        doc = self.backend.doc()
+        doc_key = _document_key(doc)
+        if doc_key != self._doc_key:
+            self._doc_key = doc_key
+            self._view_key = None
+            self._caches = {DOCUMENT_SCOPE: {}, VIEW_SCOPE: {}}
+        return doc
+
+    @property
+    def doc(self):
+        return self._sync()
+
+    @property
+    def uidoc(self):
+        self._sync()
+        return self.backend.uidoc()
+
+    @property
+    def app(self):
+        return self.backend.app()
+
+    @property
+    def active_view(self):
+        view = self._active_view(self._sync())
+        view_key = _view_key(view)
+        if view_key != self._view_key:
+            self._view_key = view_key
+            self._caches[VIEW_SCOPE] = {}
+        return view
+
+    def cache(self, name, factory, scope=DOCUMENT_SCOPE):
+        """Value of factory() computed once per active document (or per active view)."""
+        if scope == VIEW_SCOPE:
+            self.active_view  # Syncs the document too
+        else:
+            self._sync()
+        values = self._caches[scope]
+        if name not in values:
+            values[name] = factory()
+        return values[name]
+
+    def reset(self):
+        """Forget everything, e.g. after a script changed the model in a way caches don't see."""
+        self._doc_key  = None
+        self._view_key = None
+        self._caches   = {DOCUMENT_SCOPE: {}, VIEW_SCOPE: {}}
+
+
+def get_context():
+    """Shared DocumentContext (Revit backend unless set_backend was called)."""
+    global _context
+    if _context is None:
+        _context = DocumentContext()
+    return _context
+
+
+def set_backend(backend):
+    """Swap the backend of the shared context, e.g. StaticBackend(fake_doc) in tests. Returns the context."""
+    global _context
+    _context = DocumentContext(backend)
+    return _context
@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+
+#⬇️ IMPORTS
+#------------------------------
+import io
+import os
+import re
+import json
+import hashlib
+
+
+#📦 VARIABLES
+#------------------------------
+APP_FOLDER = "PyAnirudh"
+
+
+# Reusable Snippets
+
+def get_store_root():
+    """Per-user folder for local data (%APPDATA%\\PyAnirudh on Windows, ~/.pyanirudh elsewhere)."""
+    appdata = os.environ.get("APPDATA")
+    if appdata:
+        return os.path.join(appdata, APP_FOLDER)
+    return os.path.join(os.path.expanduser("~"), "." + APP_FOLDER.lower())
+
+
+def get_document_key(doc):
+    """Stable folder name for a document: sanitized title + short hash of its path.
+    Central models are keyed by their central path so every local copy shares the store."""
+    path = doc.PathName or doc.Title
+    try:
+        if doc.IsWorkshared:
+            from Autodesk.Revit.DB import ModelPathUtils
+            path = ModelPathUtils.ConvertModelPathToUserVisiblePath(doc.GetWorksharingCentralModelPath()) or path
+    except Exception:
+        pass
+    title  = re.sub(r'[^\w\-. ]', '_', doc.Title or "Untitled")
+    digest = hashlib.md5(path.encode("utf-8")).hexdigest()[:8]
+    return "{}_{}".format(title, digest)
+
+
+def get_document_store_dir(doc):
+    """Folder for per-document data. Created on first use."""
+    folder = os.path.join(get_store_root(), get_document_key(doc))
+    if not os.path.isdir(folder):
+        os.makedirs(folder)
+    return folder
+
+
+def get_document_store_path(doc, name):
+    return os.path.join(get_document_store_dir(doc), name)
+
+
+def load_json(doc, name, default=None):
+    """Load a JSON file from the document store. Returns default if missing or unreadable."""
+    path = get_document_store_path(doc, name)
+    if not os.path.exists(path):
+        return default
+    try:
+        with io.open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (IOError, OSError, ValueError):
+        return default
+
+
+def save_json(doc, name, data):
+    """Save JSON into the document store (written to a temp file first, then replaced)."""
+    path = get_document_store_path(doc, name)
+    tmp_path = path + ".tmp"
+    text = json.dumps(data, indent=1, sort_keys=True, ensure_ascii=False)
+    if not isinstance(text, type(u"")):
+        text = text.decode("utf-8")
+    with io.open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(text)
+    if os.path.exists(path):
+        os.remove(path)
+    os.rename(tmp_path, path)
+    return path
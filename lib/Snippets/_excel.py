@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+
+#⬇️ IMPORTS
+#------------------------------
+import io
+import os
+import csv
+
+# Custom Imports
+from Snippets._trace import traced, IO
+
+
+# Reusable Snippets
+
+@traced(category=IO)
+def read_used_range(worksheet):
+    """Read the whole UsedRange of a worksheet in a single COM call.
+    Reading Cells[row, col] one by one costs a COM round-trip per cell,
+    so large registers should always go through this helper.
+
+    Returns (headers, rows) where rows is a list of lists (header row excluded).
+
+    e.g.
+    headers, rows = read_used_range(workbook.Worksheets[1])"""
+    values = worksheet.UsedRange.Value2
+    if values is None:
+        return [], []
+
+    # Single cell ranges return a scalar instead of a 2D array
+    if not hasattr(values, 'GetLength'):
+        return [values], []
+
+    row_start = values.GetLowerBound(0)
+    col_start = values.GetLowerBound(1)
+    n_rows    = values.GetLength(0)
+    n_cols    = values.GetLength(1)
+
+    table = [[values[row_start + r, col_start + c] for c in range(n_cols)] for r in range(n_rows)]
+    return table[0], table[1:]
+
+
+def cell_to_text(value):
+    """Convert a Value2 cell value into text the way it was exported.
+    Excel turns numeric looking strings into floats (e.g. '12' -> 12.0)."""
+    if value is None:
+        return ""
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    try:
+        return unicode(value)
+    except NameError:
+        return str(value)
+
+
+@traced(category=IO)
+def read_csv_file(path):
+    """Read a CSV file (UTF-8, optional BOM). Returns (headers, rows) like read_used_range."""
+    with io.open(path, "r", encoding="utf-8-sig", newline="") as f:
+        table = [row for row in csv.reader(f) if any(cell.strip() for cell in row)]
+    if not table:
+        return [], []
+    return table[0], table[1:]
+
+
+@traced(category=IO)
+def read_excel_file(path, sheet_index=1):
+    """Read one worksheet of an Excel workbook through Excel interop (Windows + Excel only).
+    Returns (headers, rows) like read_used_range."""
+    import clr
+    clr.AddReference("Microsoft.Office.Interop.Excel")
+    import Microsoft.Office.Interop.Excel as Excel
+    from System.Runtime.InteropServices import Marshal
+
+    excel_app = None
+    workbook = None
+    worksheet = None
+    try:
+        excel_app = Excel.ApplicationClass()
+        excel_app.Visible = False
+        workbook = excel_app.Workbooks.Open(path)
+        worksheet = workbook.Worksheets[sheet_index]
+        return read_used_range(worksheet)
+    finally:
+        if worksheet:
+            Marshal.ReleaseComObject(worksheet)
+        if workbook:
+            workbook.Close(False)
+            Marshal.ReleaseComObject(workbook)
+        if excel_app:
+            excel_app.Quit()
+            Marshal.ReleaseComObject(excel_app)
+
+
+def read_table_file(path):
+    """Read a .csv or .xlsx/.xls file. Returns (headers, rows); headers are text, cells are raw values."""
+    if os.path.splitext(path)[1].lower() == ".csv":
+        headers, rows = read_csv_file(path)
+    else:
+        headers, rows = read_excel_file(path)
+    return [cell_to_text(h).strip() for h in headers], rows
+
+
+@traced(category=IO)
+def write_excel_file(path, columns, rows, chunk_size=5000):
+    """Write rows (iterable of value lists) to a new workbook through Excel interop.
+    Rows are sent in blocks of chunk_size through one Range.Value2 call each,
+    instead of one COM round-trip per cell. Returns number of rows written."""
+    import clr
+    clr.AddReference("Microsoft.Office.Interop.Excel")
+    import Microsoft.Office.Interop.Excel as Excel
+    from System import Array, Object
+    from System.Runtime.InteropServices import Marshal
+
+    def put(worksheet, first_row, block):
+        values = Array.CreateInstance(Object, len(block), len(columns))
+        for r, row in enumerate(block):
+            for c, value in enumerate(row):
+                values[r, c] = value
+        start = worksheet.Cells[first_row, 1]
+        end   = worksheet.Cells[first_row + len(block) - 1, len(columns)]
+        worksheet.Range[start, end].Value2 = values
+
+    excel_app = None
+    workbook = None
+    worksheet = None
+    count = 0
+    try:
+        excel_app = Excel.ApplicationClass()
+        excel_app.Visible = False
+        excel_app.DisplayAlerts = False
+        workbook = excel_app.Workbooks.Add()
+        worksheet = workbook.Worksheets[1]
+        put(worksheet, 1, [columns])
+
+        block = []
+        for row in rows:
+            block.append(row)
+            if len(block) == chunk_size:
+                put(worksheet, count + 2, block)
+                count += len(block)
+                block = []
+        if block:
+            put(worksheet, count + 2, block)
+            count += len(block)
+
+        worksheet.Rows[1].Font.Bold = True
+        worksheet.Columns.AutoFit()
+        workbook.SaveAs(path)
+        return count
+    finally:
+        if worksheet:
+            Marshal.ReleaseComObject(worksheet)
+        if workbook:
+            workbook.Close(False)
+            Marshal.ReleaseComObject(workbook)
+        if excel_app:
+            excel_app.Quit()
+            Marshal.ReleaseComObject(excel_app)
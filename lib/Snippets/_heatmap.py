@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*-
+
+#⬇️ IMPORTS
+#------------------------------
+import colorsys
+from collections import OrderedDict
+from Autodesk.Revit.DB import *
+
+# Custom Imports
+from Snippets._overrides import get_solid_fill_pattern_id
+from Snippets._trace import traced, count
+
+
+#📦 VARIABLES
+#------------------------------
+# Distinct colors for categorical values, extended with golden-ratio hues when there are more values
+CATEGORICAL_PALETTE = [
+    (31, 119, 180), (255, 127, 14), (44, 160, 44), (214, 39, 40), (148, 103, 189),
+    (140, 86, 75), (227, 119, 194), (127, 127, 127), (188, 189, 34), (23, 190, 207),
+    (174, 199, 232), (255, 187, 120), (152, 223, 138), (255, 152, 150), (197, 176, 213),
+    (196, 156, 148), (247, 182, 210), (199, 199, 199), (219, 219, 141), (158, 218, 229),
+]
+
+# Numeric gradient stops: blue -> green -> yellow -> red
+GRADIENT_STOPS = [(0.0, (44, 123, 182)), (0.33, (171, 221, 164)), (0.66, (253, 174, 97)), (1.0, (215, 25, 28))]
+
+NUMERIC_BINS = 10
+NO_VALUE = "<No Value>"
+
+
+# Reusable Snippets
+
+def categorical_color(index):
+    """Color for the n-th categorical value. Deterministic for any index."""
+    if index < len(CATEGORICAL_PALETTE):
+        return CATEGORICAL_PALETTE[index]
+    hue = (index * 0.618033988749895) % 1.0
+    r, g, b = colorsys.hsv_to_rgb(hue, 0.55 + 0.35 * ((index // 7) % 2), 0.9)
+    return int(r * 255), int(g * 255), int(b * 255)
+
+
+def gradient_color(t):
+    """Color at position t (0..1) of the numeric gradient."""
+    t = max(0.0, min(1.0, t))
+    for (t0, c0), (t1, c1) in zip(GRADIENT_STOPS, GRADIENT_STOPS[1:]):
+        if t <= t1:
+            f = (t - t0) / (t1 - t0) if t1 > t0 else 0.0
+            return tuple(int(round(a + (b - a) * f)) for a, b in zip(c0, c1))
+    return GRADIENT_STOPS[-1][1]
+
+
+class ParameterReader(object):
+    """Reads one parameter from many elements.
+    Whether it is an instance parameter is looked up once per category + type (LookupParameter is a name scan);
+    instance values are then read through the Definition and type parameters are read once per type."""
+
+    def __init__(self, doc, param_name):
+        self.doc        = doc
+        self.param_name = param_name
+        self._instance_definitions = {}  # (category id, type id) -> Definition, or None: not an instance parameter
+        self._type_values = {}
+
+    def _get_param(self, elem, type_key):
+        category = elem.Category
+        key = (category.Id.IntegerValue if category else None, type_key)
+        if key not in self._instance_definitions:
+            param = elem.LookupParameter(self.param_name)
+            self._instance_definitions[key] = param.Definition if param is not None else None
+            return param
+        definition = self._instance_definitions[key]
+        return elem.get_Parameter(definition) if definition is not None else None
+
+    def read(self, elem):
+        """Returns (is_numeric, value). value is None when the element has no value."""
+        type_id = elem.GetTypeId()
+        type_key = type_id.IntegerValue
+        param = self._get_param(elem, type_key)
+        if param is None:
+            if type_key not in self._type_values:
+                elem_type = self.doc.GetElement(type_id)
+                type_param = elem_type.LookupParameter(self.param_name) if elem_type else None
+                self._type_values[type_key] = self._value(type_param)
+            return self._type_values[type_key]
+        return self._value(param)
+
+    @staticmethod
+    def _value(param):
+        if param is None or not param.HasValue:
+            return False, None
+        st = param.StorageType
+        if st == StorageType.Double:
+            return True, param.AsDouble()
+        if st == StorageType.Integer and param.AsValueString() in (None, "", str(param.AsInteger())):
+            return True, float(param.AsInteger())
+        if st == StorageType.String:
+            return False, param.AsString() or None
+        return False, param.AsValueString() or None
+
+
+class Bucket(object):
+    """Elements sharing one color."""
+
+    def __init__(self, label, rgb):
+        self.label       = label
+        self.rgb         = rgb
+        self.element_ids = []
+
+
+@traced()
+def bucket_elements(doc, elements, param_name, bins=NUMERIC_BINS):
+    """Group elements by parameter value.
+    Categorical values get one bucket per distinct value, numeric values are binned into a gradient.
+    Returns list of Bucket (ordered by value)."""
+    reader = ParameterReader(doc, param_name)
+
+    values = OrderedDict()  # value -> [ids]
+    numeric = True
+    for elem in elements:
+        is_numeric, value = reader.read(elem)
+        if value is not None and not is_numeric:
+            numeric = False
+        values.setdefault(value, []).append(elem.Id)
+
+    empty_ids = values.pop(None, [])
+    buckets = []
+
+    if numeric and len(values) > bins:
+        low, high = min(values), max(values)
+        step = (high - low) / float(bins)
+        for i in range(bins):
+            label = "{:.2f} - {:.2f}".format(low + i * step, low + (i + 1) * step)
+            buckets.append(Bucket(label, gradient_color(i / float(bins - 1))))
+        for value, ids in values.items():
+            index = min(int((value - low) / step), bins - 1) if step else 0
+            buckets[index].element_ids.extend(ids)
+        buckets = [b for b in buckets if b.element_ids]
+    elif numeric:
+        ordered = sorted(values)
+        for i, value in enumerate(ordered):
+            bucket = Bucket("{:g}".format(value), gradient_color(i / float(max(len(ordered) - 1, 1))))
+            bucket.element_ids = values[value]
+            buckets.append(bucket)
+    else:
+        for i, value in enumerate(sorted(values, key=lambda v: str(v))):
+            bucket = Bucket(str(value), categorical_color(i))
+            bucket.element_ids = values[value]
+            buckets.append(bucket)
+
+    if empty_ids:
+        bucket = Bucket(NO_VALUE, (200, 200, 200))
+        bucket.element_ids = empty_ids
+        buckets.append(bucket)
+    return buckets
+
+
+@traced()
+def apply_buckets(doc, view, buckets):
+    """One OverrideGraphicSettings per bucket, reused for all its elements.
+    Must be called inside an open Transaction. Returns list of overridden ElementIds."""
+    solid_id   = get_solid_fill_pattern_id(doc)
+    overridden = []
+    for bucket in buckets:
+        color = Color(*bucket.rgb)
+        override_settings = OverrideGraphicSettings()
+        override_settings.SetProjectionLineColor(color)
+        if solid_id != ElementId.InvalidElementId:
+            override_settings.SetSurfaceForegroundPatternId(solid_id)
+            override_settings.SetSurfaceForegroundPatternColor(color)
+            override_settings.SetCutForegroundPatternId(solid_id)
+            override_settings.SetCutForegroundPatternColor(color)
+        for e_id in bucket.element_ids:
+            view.SetElementOverrides(e_id, override_settings)
+        overridden.extend(bucket.element_ids)
+    count("View.SetElementOverrides", len(overridden))
+    return overridden
@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+
+#⬇️ IMPORTS
+#------------------------------
+import io
+import csv
+from collections import OrderedDict
+from Autodesk.Revit.DB import *
+
+# Custom Imports
+from Snippets._trace import traced, IO
+
+
+#📦 VARIABLES
+#------------------------------
+INSPECTOR_COLUMNS = ["Id", "Category", "Family", "Type", "Name"]
+NO_CATEGORY = "No Category"
+
+
+# Reusable Snippets
+
+class InspectorRow(object):
+    """One element of the selection. Plain attributes, so WPF DataGrid columns can bind to them."""
+
+    def __init__(self, element_id, category, family, type_name, name):
+        self.Id       = element_id
+        self.Category = category
+        self.Family   = family
+        self.Type     = type_name
+        self.Name     = name
+
+    def values(self):
+        return [self.Id, self.Category, self.Family, self.Type, self.Name]
+
+
+class TypeInfoCache(object):
+    """(category, family, type name) resolved once per type; category names once per category."""
+
+    def __init__(self, doc):
+        self.doc         = doc
+        self._types      = {}
+        self._categories = {}
+
+    def category_name(self, elem):
+        cat = elem.Category
+        if cat is None:
+            return NO_CATEGORY
+        key = cat.Id.IntegerValue
+        if key not in self._categories:
+            self._categories[key] = cat.Name
+        return self._categories[key]
+
+    def type_info(self, elem):
+        """(category, family, type name) of the element's type, or None for elements without a type."""
+        type_id = elem.GetTypeId()
+        if type_id == ElementId.InvalidElementId:
+            return None
+        key = type_id.IntegerValue
+        if key not in self._types:
+            elem_type = self.doc.GetElement(type_id)
+            if elem_type is None:
+                self._types[key] = None
+            else:
+                self._types[key] = (self.category_name(elem),
+                                    getattr(elem_type, "FamilyName", "") or "",
+                                    Element.Name.GetValue(elem_type))
+        return self._types[key]
+
+
+@traced()
+def inspect_elements(doc, element_ids):
+    """Rows for the selected elements and counts per (category, family, type).
+    Returns (rows, summary) where summary is an OrderedDict sorted by count (largest first)."""
+    cache  = TypeInfoCache(doc)
+    rows   = []
+    counts = {}
+    for e_id in element_ids:
+        elem = doc.GetElement(e_id)
+        if elem is None:
+            continue
+        info = cache.type_info(elem)
+        if info is None:
+            # Views, levels, sheets, ... have no type: their own name is the only label
+            category, family, type_name = cache.category_name(elem), "", ""
+            name = Element.Name.GetValue(elem)
+        else:
+            category, family, type_name = info
+            name = type_name
+        rows.append(InspectorRow(e_id.IntegerValue, category, family, type_name, name))
+        key = (category, family, type_name)
+        counts[key] = counts.get(key, 0) + 1
+    summary = OrderedDict(sorted(counts.items(), key=lambda kv: (-kv[1], kv[0])))
+    return rows, summary
+
+
+@traced(category=IO)
+def write_csv(path, columns, rows):
+    """Stream rows (iterable of value lists) into a UTF-8 CSV file, one row at a time."""
+    with io.open(path, "w", encoding="utf-8-sig", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(columns)
+        count = 0
+        for row in rows:
+            writer.writerow([u"" if v is None else u"{}".format(v) for v in row])
+            count += 1
+    return count
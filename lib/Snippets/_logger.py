@@ -0,0 +1,192 @@
+# -*- coding: utf-8 -*-
+"""Buffered JSON-lines logger for button scripts.
+
+log.info() only appends a tuple to an in-memory buffer - no formatting, no file access.
+A background thread flushes the buffer every flush_interval seconds, and close() / interpreter exit flush the rest.
+Messages are formatted when flushed, so pass plain values (strings, numbers) as args - never Revit elements.
+debug() records are dropped unless the logger is created with level=DEBUG.
+
+e.g.
+log = get_logger("Parameters")
+log.info("Removing binding for parameter: {}", def_name, parameter=def_name)
+log.close()   # -> %APPDATA%\\PyAnirudh\\logs\\Parameters.jsonl
+{"ts": "2024-01-15T09:30:00.123", "level": "info", "logger": "Parameters", "message": "Removing ...", "parameter": "Fire Rating"}
+
+The folder can be moved with the PYANIRUDH_LOG_DIR environment variable."""
+from __future__ import print_function
+
+#⬇️ IMPORTS
+#------------------------------
+import io
+import os
+import json
+import time
+import atexit
+import datetime
+import threading
+from collections import deque, OrderedDict
+
+from Snippets._docstore import get_store_root
+
+
+#📦 VARIABLES
+#------------------------------
+LOG_DIR_ENV       = "PYANIRUDH_LOG_DIR"
+LOG_FOLDER        = "logs"
+DEFAULT_MAX_BYTES = 1024 * 1024  # Rotate once the file would grow past 1 MB ...
+DEFAULT_BACKUPS   = 3            # ... keeping <name>.jsonl.1 to .3
+FLUSH_INTERVAL    = 1.0          # Seconds between background flushes (None: only flush() / close())
+
+# Levels
+DEBUG   = "debug"
+INFO    = "info"
+WARNING = "warning"
+ERROR   = "error"
+LEVELS  = {DEBUG: 10, INFO: 20, WARNING: 30, ERROR: 40}
+
+_loggers = {}
+
+
+# Reusable Snippets
+
+def get_log_dir():
+    """PYANIRUDH_LOG_DIR if set, else <store root>/logs (%APPDATA%\\PyAnirudh\\logs on Windows)."""
+    return os.environ.get(LOG_DIR_ENV) or os.path.join(get_store_root(), LOG_FOLDER)
+
+
+def _format_record(name, record):
+    created, level, message, args, fields = record
+    if args:
+        try:
+            message = message.format(*args)
+        except Exception:
+            message = u"{} {}".format(message, args)
+    stamp = datetime.datetime.fromtimestamp(created)
+    entry = OrderedDict([("ts",      stamp.strftime("%Y-%m-%dT%H:%M:%S.") + "{:03d}".format(stamp.microsecond // 1000)),
+                         ("level",   level),
+                         ("logger",  name),
+                         ("message", message)])
+    if fields:
+        for key in sorted(fields):
+            value = fields[key]
+            entry[key] = value if isinstance(value, (int, float, bool, type(None))) else u"{}".format(value)
+    line = json.dumps(entry, ensure_ascii=False)
+    return line if isinstance(line, type(u"")) else line.decode("utf-8")
+
+
+class BufferedLogger(object):
+    """Records are (time, level, message, args, fields) tuples in a deque until flushed.
+    Records below level (INFO by default) are dropped before they are buffered.
+    File errors are counted in write_errors and never raised: logging must not break a button."""
+
+    def __init__(self, name, path=None, max_bytes=DEFAULT_MAX_BYTES, backups=DEFAULT_BACKUPS,
+                 flush_interval=FLUSH_INTERVAL, level=INFO):
+        self.name           = name
+        self.level          = level
+        self.path           = path or os.path.join(get_log_dir(), "{}.jsonl".format(name))
+        self.max_bytes      = max_bytes
+        self.backups        = backups
+        self.flush_interval = flush_interval
+        self.write_errors   = 0
+        self._buffer = deque()
+        self._lock   = threading.Lock()
+        self._wake   = threading.Event()
+        self._thread = None
+        self._closed = False
+
+    # Recording
+    def log(self, level, message, *args, **fields):
+        if LEVELS.get(level, 0) < LEVELS[self.level]:
+            return
+        self._buffer.append((time.time(), level, message, args, fields))
+        if self._thread is None and self.flush_interval and not self._closed:
+            self._start_thread()
+
+    def debug(self, message, *args, **fields):
+        self.log(DEBUG, message, *args, **fields)
+
+    def info(self, message, *args, **fields):
+        self.log(INFO, message, *args, **fields)
+
+    def warning(self, message, *args, **fields):
+        self.log(WARNING, message, *args, **fields)
+
+    def error(self, message, *args, **fields):
+        self.log(ERROR, message, *args, **fields)
+
+    # Flushing
+    def _start_thread(self):
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(target=self._run, name="{} log flush".format(self.name))
+            self._thread.daemon = True
+            self._thread.start()
+
+    def _run(self):
+        while not self._closed:
+            self._wake.wait(self.flush_interval)
+            self.flush()
+
+    def flush(self):
+        """Write all buffered records in one append. Returns the number of records written."""
+        with self._lock:
+            records = []
+            while self._buffer:
+                records.append(self._buffer.popleft())
+            if not records:
+                return 0
+            try:
+                text = u"".join(_format_record(self.name, record) + u"\n" for record in records)
+                folder = os.path.dirname(self.path)
+                if folder and not os.path.isdir(folder):
+                    os.makedirs(folder)
+                self._rotate_if_needed(len(text.encode("utf-8")))
+                with io.open(self.path, "a", encoding="utf-8") as f:
+                    f.write(text)
+            except Exception:
+                self.write_errors += 1
+                return 0
+            return len(records)
+
+    def _rotate_if_needed(self, incoming):
+        """<name>.jsonl -> .1 -> .2 ... once the file would pass max_bytes. The oldest backup is dropped."""
+        if not self.max_bytes or not os.path.exists(self.path):
+            return
+        size = os.path.getsize(self.path)
+        if not size or size + incoming <= self.max_bytes:
+            return
+        for n in range(self.backups, 0, -1):
+            older = "{}.{}".format(self.path, n)
+            newer = "{}.{}".format(self.path, n - 1) if n > 1 else self.path
+            if os.path.exists(newer):
+                if os.path.exists(older):
+                    os.remove(older)
+                os.rename(newer, older)
+        if not self.backups:
+            os.remove(self.path)
+
+    def close(self):
+        """Stop the flush thread and write what is left. Safe to call more than once."""
+        self._closed = True
+        self._wake.set()
+        thread, self._thread = self._thread, None
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(5.0)
+        return self.flush()
+
+
+def get_logger(name, **options):
+    """Shared BufferedLogger per name (options are used when it is first created)."""
+    logger = _loggers.get(name)
+    if logger is None or logger._closed:
+        logger = _loggers[name] = BufferedLogger(name, **options)
+    return logger
+
+
+def close_all():
+    for logger in list(_loggers.values()):
+        logger.close()
+
+
+atexit.register(close_all)
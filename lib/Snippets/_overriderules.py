@@ -0,0 +1,349 @@
+# -*- coding: utf-8 -*-
+"""Rule based graphic overrides driven by a JSON/YAML config.
+
+Config format:
+{
+  "name": "Gray Context",
+  "version": 1,
+  "category_sets": {"context": ["OST_Doors", "OST_Windows"]},
+  "rules": [
+    {
+      "name":       "Non-structural walls",
+      "categories": ["OST_Walls"],                    # list of BuiltInCategory names or "@category_set"
+      "parameters": [{"param": "FUNCTION_PARAM", "op": "not_equals", "value": 2}],
+      "types":      [{"param": "SYMBOL_NAME_PARAM", "op": "contains", "value": "Partition"}],
+      "python":     [{"predicate": "structural_wall", "negate": true}],
+      "overrides":  {"projection_line_color": [180, 180, 180], "projection_line_weight": 1}
+    }
+  ]
+}
+
+Parameter and type predicates are compiled into native ElementParameterFilters,
+so Revit evaluates them inside the collector. Only predicates Revit can't express
+(op "regex" and named python predicates) run in Python, in a single pass over the
+already filtered elements with results cached per type where possible.
+Later rules win when an element matches several rules."""
+
+#⬇️ IMPORTS
+#------------------------------
+import io
+import os
+import re
+import json
+from Autodesk.Revit.DB import *
+
+# .NET Imports
+import clr
+clr.AddReference("System")
+from System.Collections.Generic import List
+
+# Custom Imports
+from Snippets._trace import traced, count
+from Snippets._overrides import override_from_dict, StructuralWallClassifier
+
+
+#📦 VARIABLES
+#------------------------------
+NUMERIC_OPS = {
+    "equals":           "CreateEqualsRule",
+    "not_equals":       "CreateNotEqualsRule",
+    "greater":          "CreateGreaterRule",
+    "greater_or_equal": "CreateGreaterOrEqualRule",
+    "less":             "CreateLessRule",
+    "less_or_equal":    "CreateLessOrEqualRule",
+}
+STRING_OPS = dict(NUMERIC_OPS, **{
+    "contains":         "CreateContainsRule",
+    "not_contains":     "CreateNotContainsRule",
+    "begins_with":      "CreateBeginsWithRule",
+    "not_begins_with":  "CreateNotBeginsWithRule",
+    "ends_with":        "CreateEndsWithRule",
+    "not_ends_with":    "CreateNotEndsWithRule",
+})
+VALUE_OPS = {
+    "has_value":        "CreateHasValueParameterRule",
+    "has_no_value":     "CreateHasNoValueParameterRule",
+}
+DOUBLE_EPSILON = 1e-6
+
+try:
+    string_types = basestring  # IronPython 2.7
+except NameError:
+    string_types = str
+
+
+class RuleConfigError(Exception):
+    pass
+
+
+#🐍 PYTHON PREDICATES
+#------------------------------
+# Named predicates for conditions that can't be expressed as filter rules.
+# Each factory gets the document and returns (scope, function):
+# scope "type" functions get the element type and are cached per type id, "instance" runs per element.
+
+def _structural_wall_predicate(doc):
+    classifier = StructuralWallClassifier(doc)
+    return "instance", lambda elem: isinstance(elem, Wall) and classifier.is_structural(elem)
+
+
+PYTHON_PREDICATES = {
+    "structural_wall": _structural_wall_predicate,
+}
+
+
+# Reusable Snippets
+
+def load_rules_config(path):
+    """Read a rules config from .json, or .yaml/.yml (PyYAML or pyRevit yaml).
+    YAML syntax errors are raised as RuleConfigError."""
+    ext = os.path.splitext(path)[1].lower()
+    if ext in (".yaml", ".yml"):
+        try:
+            import yaml
+        except ImportError:
+            from pyrevit.coreutils import yaml as pyrevit_yaml
+            try:
+                return pyrevit_yaml.load_as_dict(path)
+            except Exception as e:  # pyRevit's loader has no dedicated error type
+                raise RuleConfigError("Invalid YAML: {}".format(e))
+        with io.open(path, "r", encoding="utf-8") as f:
+            try:
+                return yaml.safe_load(f)
+            except yaml.YAMLError as e:
+                raise RuleConfigError("Invalid YAML: {}".format(e))
+    with io.open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+class _ParameterResolver(object):
+    """Resolves parameter names once:
+    - ElementId used by filter rules (BuiltInParameter or ParameterElement)
+    - key for element.get_Parameter() used by Python predicates (BuiltInParameter or Definition)"""
+
+    def __init__(self, doc):
+        self.doc      = doc
+        self._by_name = None
+
+    def resolve(self, name):
+        if hasattr(BuiltInParameter, name):
+            bip = getattr(BuiltInParameter, name)
+            return ElementId(bip), bip
+        if self._by_name is None:
+            self._by_name = {p.Name: p for p in FilteredElementCollector(self.doc).OfClass(ParameterElement)}
+        if name not in self._by_name:
+            raise RuleConfigError("Unknown parameter: '{}'".format(name))
+        p_elem = self._by_name[name]
+        return p_elem.Id, p_elem.GetDefinition()
+
+
+def _create_rule(param_id, op, value):
+    """Build a native FilterRule. Returns None if the op/value can't be expressed natively."""
+    if op in VALUE_OPS:
+        factory = getattr(ParameterFilterRuleFactory, VALUE_OPS[op], None)
+        return factory(param_id) if factory else None
+
+    if isinstance(value, bool):
+        value = int(value)
+
+    if isinstance(value, int):
+        method = NUMERIC_OPS.get(op)
+        return getattr(ParameterFilterRuleFactory, method)(param_id, value) if method else None
+    if isinstance(value, float):
+        method = NUMERIC_OPS.get(op)
+        return getattr(ParameterFilterRuleFactory, method)(param_id, value, DOUBLE_EPSILON) if method else None
+
+    method = STRING_OPS.get(op)
+    if not method:
+        return None
+    factory = getattr(ParameterFilterRuleFactory, method)
+    try:
+        return factory(param_id, value)          # Revit 2023+
+    except TypeError:
+        return factory(param_id, value, False)   # Revit 2022 and older: caseSensitive argument
+
+
+def _param_as_text(elem, param_key):
+    param = elem.get_Parameter(param_key) if elem else None
+    if param is None or not param.HasValue:
+        return ""
+    if param.StorageType == StorageType.String:
+        return param.AsString() or ""
+    return param.AsValueString() or ""
+
+
+class CompiledRule(object):
+    """One config rule compiled into a native ElementFilter + optional Python predicates."""
+
+    def __init__(self, name, category_filter, native_filter, python_predicates, override_settings,
+                 matches_nothing=False):
+        self.name              = name
+        self.category_filter   = category_filter
+        self.native_filter     = native_filter
+        self.python_predicates = python_predicates  # [(scope, function, negate)]
+        self.override_settings = override_settings
+        self.matches_nothing   = matches_nothing    # No type passed the type predicates
+
+    @property
+    def is_native(self):
+        return not self.python_predicates
+
+    def collect(self, doc, view):
+        """Elements in view matching the rule. Native filters run first, Python only on what's left."""
+        if self.matches_nothing:
+            return []
+        collector = FilteredElementCollector(doc, view.Id).WherePasses(self.category_filter).WhereElementIsNotElementType()
+        if self.native_filter is not None:
+            collector = collector.WherePasses(self.native_filter)
+        if self.is_native:
+            return list(collector)
+
+        type_cache = [{} for _ in self.python_predicates]
+        matched = []
+        for elem in collector:
+            ok = True
+            for i, (scope, function, negate) in enumerate(self.python_predicates):
+                if scope == "type":
+                    type_id = elem.GetTypeId()
+                    key = type_id.IntegerValue
+                    if key not in type_cache[i]:
+                        type_cache[i][key] = bool(function(doc.GetElement(type_id)))
+                    result = type_cache[i][key]
+                else:
+                    result = bool(function(elem))
+                if result == negate:
+                    ok = False
+                    break
+            if ok:
+                matched.append(elem)
+        return matched
+
+
+def _category_list(config, categories):
+    if isinstance(categories, string_types) or not isinstance(categories, list):
+        categories = [categories]
+    names = []
+    for cat in categories:
+        if cat.startswith("@"):
+            cat_set = config.get("category_sets", {}).get(cat[1:])
+            if cat_set is None:
+                raise RuleConfigError("Unknown category set: '{}'".format(cat))
+            names.extend(cat_set)
+        else:
+            names.append(cat)
+
+    bics = List[BuiltInCategory]()
+    for name in names:
+        if not hasattr(BuiltInCategory, name):
+            raise RuleConfigError("Unknown category: '{}'".format(name))
+        bics.Add(getattr(BuiltInCategory, name))
+    return bics
+
+
+def _regex_predicate(param_key, pattern):
+    regex = re.compile(pattern)
+    return lambda elem: regex.search(_param_as_text(elem, param_key)) is not None
+
+
+def _type_predicate(doc, type_rules):
+    """Resolve matching types natively, then filter instances by their type id (ELEM_TYPE_PARAM)."""
+    type_ids = FilteredElementCollector(doc).WhereElementIsElementType().WherePasses(
+        ElementParameterFilter(type_rules)).ToElementIds()
+    type_param_id = ElementId(BuiltInParameter.ELEM_TYPE_PARAM)
+    filters = List[ElementFilter]()
+    for type_id in type_ids:
+        filters.Add(ElementParameterFilter(ParameterFilterRuleFactory.CreateEqualsRule(type_param_id, type_id)))
+    if filters.Count == 0:
+        return None
+    if filters.Count == 1:
+        return filters[0]
+    return LogicalOrFilter(filters)
+
+
+@traced()
+def compile_rules(doc, config):
+    """Compile a loaded rules config into [CompiledRule]. Raises RuleConfigError on bad config."""
+    resolver = _ParameterResolver(doc)
+    compiled = []
+    for i, rule in enumerate(config.get("rules", [])):
+        name = rule.get("name") or "Rule {}".format(i + 1)
+        if "categories" not in rule:
+            raise RuleConfigError("{}: 'categories' is required".format(name))
+        category_filter = ElementMulticategoryFilter(_category_list(config, rule["categories"]))
+
+        native_rules = List[FilterRule]()
+        python_predicates = []
+
+        # Instance parameter predicates
+        for pred in rule.get("parameters", []):
+            param_id, param_key = resolver.resolve(pred["param"])
+            if pred.get("op") == "regex":
+                python_predicates.append(("instance", _regex_predicate(param_key, pred["value"]), False))
+                continue
+            native = _create_rule(param_id, pred.get("op", "equals"), pred.get("value"))
+            if native is None:
+                raise RuleConfigError("{}: unsupported predicate {}".format(name, pred))
+            native_rules.Add(native)
+
+        filters = List[ElementFilter]()
+        if native_rules.Count:
+            filters.Add(ElementParameterFilter(native_rules))
+
+        # Type parameter predicates
+        type_rules = List[FilterRule]()
+        for pred in rule.get("types", []):
+            param_id, param_key = resolver.resolve(pred["param"])
+            if pred.get("op") == "regex":
+                python_predicates.append(("type", _regex_predicate(param_key, pred["value"]), False))
+                continue
+            native = _create_rule(param_id, pred.get("op", "equals"), pred.get("value"))
+            if native is None:
+                raise RuleConfigError("{}: unsupported type predicate {}".format(name, pred))
+            type_rules.Add(native)
+        matches_nothing = False
+        if type_rules.Count:
+            type_filter = _type_predicate(doc, type_rules)
+            if type_filter is None:
+                matches_nothing = True  # No type matches - kept so it is validated and reported with 0 matches
+            else:
+                filters.Add(type_filter)
+
+        # Named Python predicates
+        for pred in rule.get("python", []):
+            factory = PYTHON_PREDICATES.get(pred.get("predicate"))
+            if factory is None:
+                raise RuleConfigError("{}: unknown python predicate '{}'".format(name, pred.get("predicate")))
+            scope, function = factory(doc)
+            python_predicates.append((scope, function, bool(pred.get("negate", False))))
+
+        native_filter = None
+        if filters.Count == 1:
+            native_filter = filters[0]
+        elif filters.Count > 1:
+            native_filter = LogicalAndFilter(filters)
+
+        compiled.append(CompiledRule(name, category_filter, native_filter, python_predicates,
+                                     override_from_dict(rule.get("overrides", {})), matches_nothing))
+    return compiled
+
+
+@traced()
+def apply_rules(doc, view, rules):
+    """Apply compiled rules to a view. Must be called inside an open Transaction.
+    Every element gets one SetElementOverrides with the last rule it matches.
+
+    Returns (matches, overridden_ids) where matches is [(rule name, element count)]."""
+    winner = {}  # element id (int) -> rule index
+    for i, rule in enumerate(rules):
+        for elem in rule.collect(doc, view):
+            winner[elem.Id.IntegerValue] = i
+
+    matches = [[rule.name, 0] for rule in rules]
+    overridden = []
+    for e_id, i in winner.items():
+        element_id = ElementId(e_id)
+        view.SetElementOverrides(element_id, rules[i].override_settings)
+        matches[i][1] += 1
+        overridden.append(element_id)
+    count("View.SetElementOverrides", len(overridden))
+    return [tuple(m) for m in matches], overridden
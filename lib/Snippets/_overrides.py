@@ -0,0 +1,474 @@
+# -*- coding: utf-8 -*-
+
+#⬇️ IMPORTS
+#------------------------------
+from Autodesk.Revit.DB import *
+
+# .NET Imports
+import clr
+clr.AddReference("System")
+from System.Collections.Generic import List
+
+# Custom Imports
+from Snippets._docstore import load_json, save_json
+from Snippets._runlog import SUMMARY, DEBUG, APPLIED, RESET, NOT_HIDEABLE, NO_BBOX, STRUCTURAL, ERROR
+from Snippets._trace import traced, count
+
+
+#📦 VARIABLES
+#------------------------------
+# Categories handled by Auto Graphic Overrides / Reset Graphic Overrides
+TARGET_CATEGORIES = [
+    BuiltInCategory.OST_Walls,
+    BuiltInCategory.OST_Doors,
+    BuiltInCategory.OST_Windows,
+    BuiltInCategory.OST_GenericModel,
+    BuiltInCategory.OST_MechanicalEquipment,
+    BuiltInCategory.OST_PlumbingFixtures,
+    BuiltInCategory.OST_ElectricalFixtures,
+    BuiltInCategory.OST_LightingFixtures
+]
+
+# View Filters used by the View Filter mode
+FILTER_NAME       = "PyAnirudh - Auto Overrides"
+WALL_FILTER_NAME  = "PyAnirudh - Auto Overrides (Non-Structural Walls)"
+OVERRIDE_FILTER_NAMES = [FILTER_NAME, WALL_FILTER_NAME]
+
+# OverrideGraphicSettings fields: (key, getter property, setter method, kind)
+OVERRIDE_FIELDS = [
+    ("halftone",                "Halftone",                         "SetHalftone",                         "bool"),
+    ("projection_line_color",   "ProjectionLineColor",              "SetProjectionLineColor",              "color"),
+    ("projection_line_pattern", "ProjectionLinePatternId",          "SetProjectionLinePatternId",          "id"),
+    ("projection_line_weight",  "ProjectionLineWeight",             "SetProjectionLineWeight",             "int"),
+    ("surface_fg_pattern",      "SurfaceForegroundPatternId",       "SetSurfaceForegroundPatternId",       "id"),
+    ("surface_fg_color",        "SurfaceForegroundPatternColor",    "SetSurfaceForegroundPatternColor",    "color"),
+    ("surface_fg_visible",      "IsSurfaceForegroundPatternVisible", "SetSurfaceForegroundPatternVisible", "bool"),
+    ("surface_bg_pattern",      "SurfaceBackgroundPatternId",       "SetSurfaceBackgroundPatternId",       "id"),
+    ("surface_bg_color",        "SurfaceBackgroundPatternColor",    "SetSurfaceBackgroundPatternColor",    "color"),
+    ("surface_bg_visible",      "IsSurfaceBackgroundPatternVisible", "SetSurfaceBackgroundPatternVisible", "bool"),
+    ("surface_transparency",    "Transparency",                     "SetSurfaceTransparency",              "int"),
+    ("cut_line_color",          "CutLineColor",                     "SetCutLineColor",                     "color"),
+    ("cut_line_pattern",        "CutLinePatternId",                 "SetCutLinePatternId",                 "id"),
+    ("cut_line_weight",         "CutLineWeight",                    "SetCutLineWeight",                    "int"),
+    ("cut_fg_pattern",          "CutForegroundPatternId",           "SetCutForegroundPatternId",           "id"),
+    ("cut_fg_color",            "CutForegroundPatternColor",        "SetCutForegroundPatternColor",        "color"),
+    ("cut_fg_visible",          "IsCutForegroundPatternVisible",    "SetCutForegroundPatternVisible",      "bool"),
+    ("cut_bg_pattern",          "CutBackgroundPatternId",           "SetCutBackgroundPatternId",           "id"),
+    ("cut_bg_color",            "CutBackgroundPatternColor",        "SetCutBackgroundPatternColor",        "color"),
+    ("cut_bg_visible",          "IsCutBackgroundPatternVisible",    "SetCutBackgroundPatternVisible",      "bool"),
+    ("detail_level",            "DetailLevel",                      "SetDetailLevel",                      "enum"),
+]
+
+# Sidecar file of the override registry in the document store
+REGISTRY_FILE = "override_registry.json"
+
+# Categories whose elements can pass a view-scoped collector without any geometry in the view
+# (e.g. empty or nested Generic Models). Only these get the expensive get_BoundingBox(view) check.
+GEOMETRY_CHECK_CATEGORIES = [BuiltInCategory.OST_GenericModel]
+
+# Structural wall classification
+STRUCTURAL_USAGES            = (1, 2, 3)              # Bearing, Shear, Structural Combined
+STRUCTURAL_FUNCTIONS         = (2, 3)                 # Foundation, Retaining
+STRUCTURAL_MATERIAL_KEYWORDS = ("Concrete", "Steel")  # Adjust material names as needed
+
+
+# Reusable Snippets
+
+_SOLID_FILL_CACHE = {}
+
+
+def get_solid_fill_pattern_id(doc):
+    """ElementId of the drafting <Solid fill> pattern, looked up once per document.
+    Returns ElementId.InvalidElementId if the document has none."""
+    key = doc.PathName or doc.Title
+    pattern_id = _SOLID_FILL_CACHE.get(key)
+    if pattern_id is not None and doc.GetElement(pattern_id) is not None:
+        return pattern_id
+
+    pattern_id = ElementId.InvalidElementId
+    for pattern in FilteredElementCollector(doc).OfClass(FillPatternElement):
+        fill = pattern.GetFillPattern()
+        if fill.IsSolidFill and fill.Target == FillPatternTarget.Drafting:
+            pattern_id = pattern.Id
+            break
+    _SOLID_FILL_CACHE[key] = pattern_id
+    return pattern_id
+
+
+def build_override_settings(rgb=(180, 180, 180), line_weight=1, transparency=60):
+    """Default presentation of Auto Graphic Overrides: gray projection lines, thin, 60% transparent surfaces."""
+    override_settings = OverrideGraphicSettings()
+    override_settings.SetProjectionLineColor(Color(rgb[0], rgb[1], rgb[2]))
+    override_settings.SetProjectionLineWeight(line_weight)
+    override_settings.SetSurfaceTransparency(transparency)
+    return override_settings
+
+
+def _serialize_field(value, kind):
+    if value is None:
+        return None
+    if kind == "color":
+        return [value.Red, value.Green, value.Blue] if value.IsValid else None
+    if kind == "id":
+        return value.IntegerValue if value != ElementId.InvalidElementId else None
+    if kind == "int":
+        return int(value)
+    if kind == "bool":
+        return bool(value)
+    return str(value)
+
+
+def override_signature(override_settings):
+    """OverrideGraphicSettings as a hashable tuple of plain values (same order as OVERRIDE_FIELDS).
+    Fields missing in the running Revit version are None."""
+    values = []
+    for _, getter, _, kind in OVERRIDE_FIELDS:
+        value = getattr(override_settings, getter, None)
+        values.append(_serialize_field(value, kind))
+    return tuple(tuple(v) if isinstance(v, list) else v for v in values)
+
+
+def override_to_dict(override_settings, skip_defaults=True):
+    """OverrideGraphicSettings -> {field key: plain value}. Default values are left out unless skip_defaults=False."""
+    data = {}
+    default = override_signature(OverrideGraphicSettings()) if skip_defaults else None
+    for i, value in enumerate(override_signature(override_settings)):
+        if skip_defaults and value == default[i]:
+            continue
+        data[OVERRIDE_FIELDS[i][0]] = list(value) if isinstance(value, tuple) else value
+    return data
+
+
+def override_from_dict(data):
+    """{field key: plain value} -> OverrideGraphicSettings. Unknown keys are ignored.
+    Colors are [r, g, b], patterns are ElementId integers, detail_level is a ViewDetailLevel name."""
+    override_settings = OverrideGraphicSettings()
+    for key, _, setter, kind in OVERRIDE_FIELDS:
+        value = data.get(key)
+        if value is None or not hasattr(override_settings, setter):
+            continue
+        if kind == "color":
+            value = Color(int(value[0]), int(value[1]), int(value[2]))
+        elif kind == "id":
+            value = ElementId(int(value))
+        elif kind == "int":
+            value = int(value)
+        elif kind == "bool":
+            value = bool(value)
+        elif kind == "enum":
+            value = getattr(ViewDetailLevel, str(value))
+        getattr(override_settings, setter)(value)
+    return override_settings
+
+
+_DEFAULT_SIGNATURE = []
+
+
+def is_default_override(override_settings):
+    """True if the settings are equal to an empty OverrideGraphicSettings()."""
+    if not _DEFAULT_SIGNATURE:
+        _DEFAULT_SIGNATURE.append(override_signature(OverrideGraphicSettings()))
+    return override_signature(override_settings) == _DEFAULT_SIGNATURE[0]
+
+
+class OverrideRegistry(object):
+    """Which element ids Auto Graphic Overrides has overridden, per view.
+    Stored as a sidecar JSON in the document store (Snippets._docstore), keyed by view UniqueId,
+    so Reset touches exactly those elements.
+
+    e.g.
+    registry = OverrideRegistry(doc)
+    registry.record(view, overridden_ids)
+    registry.save()"""
+
+    def __init__(self, doc):
+        self.doc  = doc
+        self.data = load_json(doc, REGISTRY_FILE, {}) or {}
+
+    def record(self, view, element_ids):
+        ids = set(self.data.get(view.UniqueId, []))
+        ids.update(e_id.IntegerValue for e_id in element_ids)
+        self.data[view.UniqueId] = sorted(ids)
+
+    def get(self, view):
+        """Recorded ElementIds for a view."""
+        return [ElementId(i) for i in self.data.get(view.UniqueId, [])]
+
+    def forget(self, view):
+        self.data.pop(view.UniqueId, None)
+
+    def save(self):
+        return save_json(self.doc, REGISTRY_FILE, self.data)
+
+
+@traced()
+def reset_recorded_overrides(doc, view, registry, log=None):
+    """Reset only elements recorded in the registry. Must be called inside an open Transaction.
+    Returns number of reset elements."""
+    reset_settings = OverrideGraphicSettings()
+    count = 0
+    for e_id in registry.get(view):
+        elem = doc.GetElement(e_id)
+        if elem is None:
+            continue  # Deleted since
+        view.SetElementOverrides(e_id, reset_settings)
+        count += 1
+        if log:
+            log.element(RESET, elem.Category.Name if elem.Category else "Other", elem)
+    registry.forget(view)
+    return count
+
+
+@traced()
+def reset_all_overrides(doc, view, log=None):
+    """Reset every element override in a view, skipping elements that have none.
+    Must be called inside an open Transaction. Returns number of reset elements."""
+    reset_settings = OverrideGraphicSettings()
+    count = 0
+    for elem in FilteredElementCollector(doc, view.Id).WhereElementIsNotElementType():
+        if is_default_override(view.GetElementOverrides(elem.Id)):
+            continue
+        view.SetElementOverrides(elem.Id, reset_settings)
+        count += 1
+        if log:
+            log.element(RESET, elem.Category.Name if elem.Category else "Other", elem)
+    return count
+
+
+class StructuralWallClassifier(object):
+    """Decides whether walls are structural.
+    Everything except the instance Structural checkbox depends only on the WallType,
+    so the type verdict (usage, function, structural material) is computed once per
+    WallType and once per Material, then combined with the instance flag.
+
+    e.g.
+    classifier = StructuralWallClassifier(doc)
+    structural = [w for w in walls if classifier.is_structural(w)]"""
+
+    def __init__(self, doc, material_keywords=STRUCTURAL_MATERIAL_KEYWORDS):
+        self.doc               = doc
+        self.material_keywords = material_keywords
+        self._type_verdicts    = {}  # WallType Id (int) -> bool
+        self._material_verdicts = {}  # Material Id (int) -> bool
+
+    def _is_structural_material(self, material_id):
+        key = material_id.IntegerValue
+        if key not in self._material_verdicts:
+            material = self.doc.GetElement(material_id)
+            self._material_verdicts[key] = material is not None and any(
+                mat in material.Name for mat in self.material_keywords)
+        return self._material_verdicts[key]
+
+    def _compute_type_verdict(self, type_id):
+        wall_type = self.doc.GetElement(type_id)
+        if not wall_type:
+            return True  # Conservatively assume structural if type is missing
+
+        # Structural Usage is Bearing, Shear, or Structural Combined
+        struct_usage_param = wall_type.get_Parameter(BuiltInParameter.WALL_STRUCTURAL_USAGE_PARAM)
+        if struct_usage_param and struct_usage_param.AsInteger() in STRUCTURAL_USAGES:
+            return True
+
+        # Wall Function is Foundation or Retaining
+        function_param = wall_type.get_Parameter(BuiltInParameter.FUNCTION_PARAM)
+        if function_param and function_param.AsInteger() in STRUCTURAL_FUNCTIONS:
+            return True
+
+        # Has a structural material
+        struct_material_param = wall_type.get_Parameter(BuiltInParameter.STRUCTURAL_MATERIAL_PARAM)
+        if struct_material_param and struct_material_param.HasValue:
+            return self._is_structural_material(struct_material_param.AsElementId())
+        return False
+
+    def is_structural_type(self, type_id):
+        key = type_id.IntegerValue
+        verdict = self._type_verdicts.get(key)
+        if verdict is None:
+            try:
+                verdict = self._compute_type_verdict(type_id)
+            except Exception:
+                verdict = True  # Conservatively assume structural on error
+            self._type_verdicts[key] = verdict
+        return verdict
+
+    def is_structural(self, wall):
+        """Structural checkbox (instance-level) or a structural WallType."""
+        try:
+            struct_instance_param = wall.get_Parameter(BuiltInParameter.WALL_STRUCTURAL_SIGNIFICANT)
+            if struct_instance_param and struct_instance_param.AsInteger() == 1:
+                return True
+            return self.is_structural_type(wall.GetTypeId())
+        except Exception:
+            return True  # Conservatively assume structural on error
+
+
+class VisibilityStrategy(object):
+    """Visibility checks for override loops.
+    The view-scoped collector plus a VisibleInViewFilter already drop hidden elements natively,
+    so get_BoundingBox(view) - which can trigger geometry evaluation - only runs for
+    categories in geometry_check_categories. Checks run/skipped are counted in log.
+
+    e.g.
+    visibility = VisibilityStrategy(doc, view, log=log)
+    elems = visibility.filter(FilteredElementCollector(doc, view.Id))"""
+    CATEGORY = "(visibility)"
+    CHECKED  = "geometry-checked"
+    SKIPPED  = "geometry-check-skipped"
+
+    def __init__(self, doc, view, geometry_check_categories=GEOMETRY_CHECK_CATEGORIES, log=None):
+        self.doc  = doc
+        self.view = view
+        self.log  = log
+        self.geometry_check_ids = set(ElementId(bic).IntegerValue for bic in geometry_check_categories)
+
+    def filter(self, collector):
+        return collector.WherePasses(VisibleInViewFilter(self.doc, self.view.Id))
+
+    def needs_geometry_check(self, elem):
+        return elem.Category is not None and elem.Category.Id.IntegerValue in self.geometry_check_ids
+
+    def has_geometry(self, elem):
+        """get_BoundingBox(view) for categories that need it, True for everything else."""
+        if not self.needs_geometry_check(elem):
+            if self.log:
+                self.log.count(self.CATEGORY, self.SKIPPED)
+            return True
+        if self.log:
+            self.log.count(self.CATEGORY, self.CHECKED)
+        return elem.get_BoundingBox(self.view) is not None
+
+
+@traced()
+def collect_target_elements(doc, view, categories=TARGET_CATEGORIES, visibility=None):
+    """All target-category elements in a view, with one multi-category collector.
+    With a VisibilityStrategy, elements hidden in the view are dropped natively."""
+    cat_filter = ElementMulticategoryFilter(List[BuiltInCategory](categories))
+    collector = FilteredElementCollector(doc, view.Id).WherePasses(cat_filter).WhereElementIsNotElementType()
+    if visibility is not None:
+        collector = visibility.filter(collector)
+    return collector.ToElements()
+
+
+@traced()
+def apply_element_overrides(doc, view, override_settings, classifier, log, categories=TARGET_CATEGORIES,
+                            visibility=None):
+    """Override every visible target element in a view, skipping structural walls.
+    Outcomes are counted in log (Snippets._runlog.RunLog). Must be called inside an open Transaction.
+
+    Returns list of overridden ElementIds."""
+    if visibility is None:
+        visibility = VisibilityStrategy(doc, view, log=log)
+    category_names = {ElementId(bic).IntegerValue: bic.ToString() for bic in categories}
+    windows_id     = ElementId(BuiltInCategory.OST_Windows).IntegerValue
+    overridden     = []
+
+    for elem in collect_target_elements(doc, view, categories, visibility):
+        cat_key  = elem.Category.Id.IntegerValue if elem.Category else None
+        category = category_names.get(cat_key, "Other")
+        try:
+            # Check visibility
+            if not elem.CanBeHidden(view):
+                log.element(NOT_HIDEABLE, category, elem)
+                continue
+            if not visibility.has_geometry(elem):
+                log.element(NO_BBOX, category, elem)
+                continue
+
+            # Skip structural walls
+            if isinstance(elem, Wall) and classifier.is_structural(elem):
+                log.element(STRUCTURAL, category, elem)
+                continue
+
+            view.SetElementOverrides(elem.Id, override_settings)
+            overridden.append(elem.Id)
+
+            # Windows: report host wall in debug output
+            note = ""
+            if log.is_enabled(DEBUG) and cat_key == windows_id:
+                host = getattr(elem, "Host", None)
+                if host and isinstance(host, Wall):
+                    note = "Host Wall Type={0}, Host Wall ID={1}".format(log.type_names.get(host), host.Id.IntegerValue)
+                else:
+                    note = "No Host"
+            log.element(APPLIED, category, elem, note)
+        except Exception as e:
+            log.count(category, ERROR)
+            log.log(SUMMARY, "Error on element ID={0}: {1}", elem.Id.IntegerValue, e)
+    count("View.SetElementOverrides", len(overridden))
+    return overridden
+
+
+def _non_structural_wall_filter():
+    """Native version of the structural wall check:
+    - Structural checkbox is off
+    - Structural Usage is Non-Bearing
+    - Wall Function is not Foundation or Retaining
+    The structural material name check can't be expressed as a filter rule,
+    so walls flagged only by material are covered in Element Overrides mode only."""
+    rules = List[FilterRule]()
+    rules.Add(ParameterFilterRuleFactory.CreateNotEqualsRule(ElementId(BuiltInParameter.WALL_STRUCTURAL_SIGNIFICANT), 1))
+    rules.Add(ParameterFilterRuleFactory.CreateEqualsRule(ElementId(BuiltInParameter.WALL_STRUCTURAL_USAGE_PARAM), 0))
+    rules.Add(ParameterFilterRuleFactory.CreateNotEqualsRule(ElementId(BuiltInParameter.FUNCTION_PARAM), 2))
+    rules.Add(ParameterFilterRuleFactory.CreateNotEqualsRule(ElementId(BuiltInParameter.FUNCTION_PARAM), 3))
+    return ElementParameterFilter(rules)
+
+
+def _get_or_create_filter(doc, name, category_ids, element_filter=None):
+    cats = List[ElementId](category_ids)
+    existing = {f.Name: f for f in FilteredElementCollector(doc).OfClass(ParameterFilterElement)}
+    view_filter = existing.get(name)
+
+    if view_filter is None:
+        if element_filter is None:
+            return ParameterFilterElement.Create(doc, name, cats)
+        return ParameterFilterElement.Create(doc, name, cats, element_filter)
+
+    # Reuse existing filter, but keep categories and rules in sync
+    view_filter.SetCategories(cats)
+    if element_filter is not None:
+        view_filter.SetElementFilter(element_filter)
+    return view_filter
+
+
+@traced()
+def get_or_create_override_filters(doc, categories=TARGET_CATEGORIES):
+    """Create (or reuse) the View Filters covering target categories.
+    Walls get their own filter with the structural exclusion rules.
+    Must be called inside an open Transaction."""
+    filterable = set(cat_id.IntegerValue for cat_id in ParameterFilterUtilities.GetAllFilterableCategories())
+    cat_ids    = [ElementId(bic) for bic in categories if ElementId(bic).IntegerValue in filterable]
+
+    wall_id    = ElementId(BuiltInCategory.OST_Walls)
+    other_ids  = [cat_id for cat_id in cat_ids if cat_id != wall_id]
+
+    filters = []
+    if other_ids:
+        filters.append(_get_or_create_filter(doc, FILTER_NAME, other_ids))
+    if wall_id in cat_ids:
+        filters.append(_get_or_create_filter(doc, WALL_FILTER_NAME, [wall_id], _non_structural_wall_filter()))
+    return filters
+
+
+@traced()
+def apply_filter_overrides(view, view_filters, override_settings):
+    """One SetFilterOverrides per filter instead of one SetElementOverrides per element.
+    Must be called inside an open Transaction."""
+    applied = set(f_id.IntegerValue for f_id in view.GetFilters())
+    for view_filter in view_filters:
+        if view_filter.Id.IntegerValue not in applied:
+            view.AddFilter(view_filter.Id)
+        view.SetFilterOverrides(view_filter.Id, override_settings)
+        view.SetFilterVisibility(view_filter.Id, True)
+
+
+@traced()
+def remove_filter_overrides(doc, view):
+    """Remove the Auto Overrides View Filters from a view. Returns number of removed filters.
+    Must be called inside an open Transaction."""
+    removed = 0
+    for f_id in list(view.GetFilters()):
+        view_filter = doc.GetElement(f_id)
+        if view_filter and view_filter.Name in OVERRIDE_FILTER_NAMES:
+            view.RemoveFilter(f_id)
+            removed += 1
+    return removed
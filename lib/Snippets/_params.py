@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+
+#⬇️ IMPORTS
+#------------------------------
+import re
+from Autodesk.Revit.DB import *
+from Snippets._trace import traced, count
+
+
+# Reusable Snippets
+
+def safe_set_value(param, value):
+    """Set a parameter from a grid/Excel value, converted to its StorageType.
+    Yes/No text sets Integer parameters, numbers are pulled out of text like '1,200 mm'.
+    Values that can't be converted are ignored."""
+    st = param.StorageType
+    try:
+        if st == StorageType.String:
+            param.Set(str(value))
+        elif st == StorageType.Integer:
+            valstr = str(value).strip().lower()
+            if valstr in ["yes", "true", "1"]:
+                param.Set(1)
+            elif valstr in ["no", "false", "0"]:
+                param.Set(0)
+            elif valstr.isdigit():
+                param.Set(int(valstr))
+            else:
+                pass # ignore non-numeric or enum labels (like "Vertical", "By Type", etc.)
+        elif st == StorageType.Double:
+            try:
+                valstr = str(value)
+                val_num = float(re.findall(r"[-+]?\d*\.\d+|\d+", valstr.replace(",", ""))[0])
+                param.Set(val_num)
+            except Exception:
+                pass
+        elif st == StorageType.ElementId:
+            try:
+                eid = int(value)
+                param.Set(ElementId(eid))
+            except Exception:
+                pass
+    except Exception:
+        pass
+
+
+def has_value(param):
+    """True if the parameter already holds a value: non-empty text, any number or a valid ElementId."""
+    try:
+        st = param.StorageType
+        if st == StorageType.String:
+            v = param.AsString()
+            return v is not None and str(v).strip() != ""
+        elif st == StorageType.Integer:
+            return param.AsInteger() is not None
+        elif st == StorageType.Double:
+            return param.AsDouble() is not None
+        elif st == StorageType.ElementId:
+            v = param.AsElementId()
+            return v is not None and v.IntegerValue != -1
+    except Exception:
+        pass
+    return False
+
+
+@traced()
+def collect_similar_elements(doc, elem):
+    """Instances of the same category and type as elem (elem included).
+    The type check runs natively as an ELEM_TYPE_PARAM filter rule instead of GetTypeId() per element."""
+    if elem.Category is None:
+        return [elem]
+    rule = ParameterFilterRuleFactory.CreateEqualsRule(ElementId(BuiltInParameter.ELEM_TYPE_PARAM), elem.GetTypeId())
+    collector = FilteredElementCollector(doc).OfCategoryId(elem.Category.Id).WhereElementIsNotElementType()
+    return list(collector.WherePasses(ElementParameterFilter(rule)))
+
+
+@traced()
+def apply_parameter_values(elements, values):
+    """Write {parameter name: value} to every element with safe_set_value. Must be called inside an open Transaction.
+    Each element's parameters are scanned once for all names, not once per name. Read-only parameters are skipped.
+
+    e.g.
+    apply_parameter_values(collect_similar_elements(doc, door), {"Fire Rating": "60 min"})
+
+    Returns number of parameters written."""
+    written = 0
+    for elem in elements:
+        for p in elem.Parameters:
+            name = p.Definition.Name
+            if name in values and not p.IsReadOnly:
+                safe_set_value(p, values[name])
+                written += 1
+    count("Parameter.Set", written)
+    return written
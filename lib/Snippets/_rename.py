@@ -0,0 +1,417 @@
+# -*- coding: utf-8 -*-
+
+#⬇️ IMPORTS
+#------------------------------
+import io
+import os
+import re
+import json
+import datetime
+from collections import OrderedDict
+from Autodesk.Revit.DB import *
+
+# Custom Imports
+from Snippets._docstore import get_document_store_path, load_json, save_json
+from Snippets._trace import traced
+
+
+#📦 VARIABLES
+#------------------------------
+UNIQUE_SUFFIX = " ({})"  # e.g. "Level 1 - Plan (2)"
+
+TOKEN_PATTERN = re.compile(r"\{(name|level|scale|sheet_number|view_type|family)\}")
+TOKENS        = ["{name}", "{level}", "{scale}", "{sheet_number}", "{view_type}", "{family}"]
+
+JOURNAL_FILE       = "rename_journal.jsonl"       # append-only: [batch, UniqueId, old name, new name] per line
+JOURNAL_INDEX_FILE = "rename_journal_index.json"  # batch -> byte offset + line count
+
+
+# Reusable Snippets
+
+def view_namespace(view):
+    """View names only have to be unique among views of the same ViewType (e.g. floor and ceiling plans may share one)."""
+    return str(view.ViewType)
+
+
+def get_view_names(doc):
+    """(namespace, name) of every view in the model, templates included."""
+    return [(view_namespace(v), v.Name) for v in FilteredElementCollector(doc).OfClass(View)]
+
+
+class NamePlanner(object):
+    """Plans unique names in memory before anything is written.
+    Collisions get a numbering suffix; the same input always gives the same output.
+
+    e.g.
+    planner = NamePlanner(get_view_names(doc))
+    plan = planner.plan([(view, view_namespace(view), view.Name, "A-" + view.Name) for view in views])"""
+
+    def __init__(self, existing_names, suffix=UNIQUE_SUFFIX):
+        self.suffix = suffix
+        self.taken  = set(existing_names)
+        self._next  = {}  # (namespace, base name) -> next suffix number to try
+
+    def unique(self, namespace, name):
+        """Reserve and return name, or the first free 'name (n)'."""
+        if (namespace, name) not in self.taken:
+            self.taken.add((namespace, name))
+            return name
+        n = self._next.get((namespace, name), 2)
+        while (namespace, name + self.suffix.format(n)) in self.taken:
+            n += 1
+        self._next[(namespace, name)] = n + 1
+        final = name + self.suffix.format(n)
+        self.taken.add((namespace, final))
+        return final
+
+    def plan(self, renames):
+        """renames - list of (element, namespace, old name, new name)
+        Old names of renamed elements are released first, so names can move between elements in one batch.
+        Returns list of (element, namespace, old name, final name) for elements whose name actually changes."""
+        changing = [r for r in renames if r[3] != r[2]]
+        for _, namespace, old_name, _ in changing:
+            self.taken.discard((namespace, old_name))
+        # Unchanged elements keep their names before anyone else claims them
+        for _, namespace, old_name, new_name in renames:
+            if new_name == old_name:
+                self.taken.add((namespace, old_name))
+
+        plan = []
+        for elem, namespace, old_name, new_name in changing:
+            final = self.unique(namespace, new_name)
+            if final != old_name:
+                plan.append((elem, namespace, old_name, final))
+            else:
+                self.taken.add((namespace, old_name))
+        return plan
+
+
+@traced()
+def write_names(plan, set_name, temp_suffix=" ~renaming"):
+    """Write a plan from NamePlanner in one pass. Must be called inside an open Transaction.
+    Elements whose new name is still held by another element of the batch wait until it moves;
+    cycles (A -> B, B -> A) are broken with one temporary name.
+
+    set_name - function(element, name), e.g. lambda v, n: setattr(v, "Name", n)
+    A parked element whose final write fails is given its old name back. If that fails too,
+    it keeps the temporary name and that is reported as its current name.
+    Returns list of (element, current name, new name, error) for failed writes."""
+    holders = {(namespace, old_name): i for i, (_, namespace, old_name, _) in enumerate(plan)}
+    current = [(namespace, old_name) for _, namespace, old_name, _ in plan]
+    pending = list(range(len(plan)))
+    errors  = []
+
+    def move(i, name):
+        set_name(plan[i][0], name)
+        holders.pop(current[i], None)
+        current[i] = (plan[i][1], name)
+
+    while pending:
+        waiting = []
+        for i in pending:
+            elem, namespace, old_name, new_name = plan[i]
+            holder = holders.get((namespace, new_name))
+            if holder is not None and holder != i:
+                waiting.append(i)
+                continue
+            try:
+                move(i, new_name)
+            except Exception as e:
+                if current[i][1] != old_name:  # Parked under the temporary name
+                    try:
+                        move(i, old_name)
+                    except Exception:
+                        pass
+                errors.append((elem, current[i][1], new_name, str(e)))
+                holders.pop(current[i], None)  # Keeps its current name, nothing waits on it anymore
+
+        if waiting and len(waiting) == len(pending):
+            # Only cycles left: park the first element under a temporary name
+            i = waiting[0]
+            elem, namespace, old_name, new_name = plan[i]
+            try:
+                move(i, new_name + temp_suffix)
+            except Exception as e:
+                errors.append((elem, old_name, new_name, str(e)))
+                holders.pop(current[i], None)
+                waiting.remove(i)
+        pending = waiting
+    return errors
+
+
+def journal_entries(plan, errors):
+    """RenameJournal entries for a written plan: [(UniqueId, old name, name it has now)].
+    Failed elements are left out, unless they are stuck under the temporary name (so they can be reverted)."""
+    stuck = dict((elem.Id.IntegerValue, current) for elem, current, _, _ in errors)
+    entries = []
+    for elem, _, old_name, new_name in plan:
+        current = stuck.get(elem.Id.IntegerValue, new_name)
+        if current != old_name:
+            entries.append((elem.UniqueId, old_name, current))
+    return entries
+
+
+#🧩 NAME ACCESS
+#------------------------------
+def get_name(elem):
+    """Element.Name works for every element type in IronPython (ElementType.Name is hidden otherwise)."""
+    return Element.Name.GetValue(elem)
+
+
+def set_name(elem, name):
+    Element.Name.SetValue(elem, name)
+
+
+#🔤 RULES
+#------------------------------
+class TokenResolver(object):
+    """Values for {level} {scale} {sheet_number} {view_type} {family} tokens.
+    Only tokens used by the rules are resolved, and level names are looked up once per level."""
+
+    def __init__(self, doc):
+        self.doc     = doc
+        self._levels = {}
+
+    def _level_name(self, level_id):
+        if level_id is None or level_id == ElementId.InvalidElementId:
+            return ""
+        key = level_id.IntegerValue
+        if key not in self._levels:
+            level = self.doc.GetElement(level_id)
+            self._levels[key] = level.Name if level else ""
+        return self._levels[key]
+
+    def resolve(self, elem, token):
+        if token == "name":
+            return get_name(elem)
+        if token == "level":
+            if isinstance(elem, Level):
+                return elem.Name
+            if isinstance(elem, View):
+                return elem.GenLevel.Name if elem.GenLevel else ""
+            return self._level_name(getattr(elem, "LevelId", None))
+        if token == "scale":
+            return str(elem.Scale) if isinstance(elem, View) and not isinstance(elem, ViewSheet) else ""
+        if token == "sheet_number":
+            if isinstance(elem, ViewSheet):
+                return elem.SheetNumber
+            param = elem.get_Parameter(BuiltInParameter.VIEWPORT_SHEET_NUMBER)
+            return (param.AsString() or "") if param else ""
+        if token == "view_type":
+            return str(elem.ViewType) if isinstance(elem, View) else ""
+        if token == "family":
+            if isinstance(elem, ElementType):
+                return elem.FamilyName
+            return elem.FamilyCategory.Name if isinstance(elem, Family) and elem.FamilyCategory else ""
+        return ""
+
+
+class RenameRule(object):
+    """One find/replace step, compiled once.
+    find     - regex (or literal text with regex=False)
+    template - replacement with capture groups (\\1, \\g<name>) and tokens ({level}, {scale}, ...)
+
+    e.g.
+    RenameRule(r"^(\\d+) - (.*)$", r"{level} - \\2 [\\1]")"""
+
+    def __init__(self, find, template="", regex=True, ignore_case=False):
+        if not find:
+            raise ValueError("Rename rule without 'find' pattern")
+        self.find        = find
+        self.template    = template
+        flags            = re.IGNORECASE if ignore_case else 0
+        self.regex       = re.compile(find if regex else re.escape(find), flags)
+        self.tokens      = set(TOKEN_PATTERN.findall(template))
+        if not regex:
+            self.template = template.replace("\\", "\\\\")
+
+    def apply(self, name, elem=None, tokens=None):
+        template = self.template
+        if self.tokens and tokens is not None:
+            # Token values are literal text: escape backslashes so re.sub doesn't read them as groups
+            values = {t: tokens.resolve(elem, t).replace("\\", "\\\\") for t in self.tokens}
+            template = TOKEN_PATTERN.sub(lambda m: values[m.group(1)], template)
+        return self.regex.sub(template, name)
+
+
+class RuleChain(object):
+    """Rules applied in order, then prefix and suffix (which may use tokens too).
+
+    e.g.
+    chain = RuleChain([RenameRule("Level", "L")], prefix="{sheet_number} - ")
+    preview = chain.preview(doc, views)"""
+
+    def __init__(self, rules, prefix="", suffix=""):
+        self.rules  = rules
+        self.prefix = prefix
+        self.suffix = suffix
+        self._affix_tokens = set(TOKEN_PATTERN.findall(prefix + suffix))
+
+    @classmethod
+    def from_config(cls, config):
+        """{"prefix": "", "suffix": "", "rules": [{"find": ..., "replace": ..., "regex": true, "ignore_case": false}]}"""
+        rules = [RenameRule(r["find"], r.get("replace", ""), r.get("regex", True), r.get("ignore_case", False))
+                 for r in config.get("rules", [])]
+        return cls(rules, config.get("prefix", ""), config.get("suffix", ""))
+
+    def _affix(self, text, elem, tokens):
+        if not self._affix_tokens:
+            return text
+        return TOKEN_PATTERN.sub(lambda m: tokens.resolve(elem, m.group(1)), text)
+
+    def apply(self, name, elem=None, tokens=None):
+        for rule in self.rules:
+            name = rule.apply(name, elem, tokens)
+        return self._affix(self.prefix, elem, tokens) + name + self._affix(self.suffix, elem, tokens)
+
+    @traced("RuleChain.preview")
+    def preview(self, doc, elements):
+        """In-memory before/after: list of (element, old name, new name). Nothing is written."""
+        tokens = TokenResolver(doc)
+        result = []
+        for elem in elements:
+            old_name = get_name(elem)
+            result.append((elem, old_name, self.apply(old_name, elem, tokens)))
+        return result
+
+
+def load_rename_rules(path):
+    """Read a RuleChain from a JSON file."""
+    with io.open(path, "r", encoding="utf-8") as f:
+        return RuleChain.from_config(json.load(f))
+
+
+#🎯 TARGETS
+#------------------------------
+class RenameTarget(object):
+    """A kind of named element: how to collect it and in which scope its names must be unique.
+    namespace - function(element) -> key, or None when names don't have to be unique (sheet names)."""
+
+    def __init__(self, label, collect, namespace=None):
+        self.label     = label
+        self.collect   = collect
+        self.namespace = namespace
+
+    def existing_names(self, doc):
+        if self.namespace is None:
+            return []
+        return [(self.namespace(e), get_name(e)) for e in self.collect(doc)]
+
+    @traced("RenameTarget.plan")
+    def plan(self, doc, preview):
+        """NamePlanner plan for a preview from RuleChain.preview."""
+        namespace = self.namespace or (lambda e: e.Id.IntegerValue)  # No uniqueness: every element is its own scope
+        planner = NamePlanner(self.existing_names(doc))
+        return planner.plan([(elem, namespace(elem), old, new) for elem, old, new in preview])
+
+
+def _views(doc):
+    return [v for v in FilteredElementCollector(doc).OfClass(View) if not isinstance(v, ViewSheet)]
+
+
+def _family_category(family):
+    return family.FamilyCategory.Id.IntegerValue if family.FamilyCategory else None
+
+
+RENAME_TARGETS = OrderedDict([
+    ("Views",    RenameTarget("Views",    _views, view_namespace)),
+    ("Sheets",   RenameTarget("Sheets",   lambda doc: list(FilteredElementCollector(doc).OfClass(ViewSheet)))),
+    ("Families", RenameTarget("Families", lambda doc: list(FilteredElementCollector(doc).OfClass(Family)), _family_category)),
+    ("Types",    RenameTarget("Types",    lambda doc: list(FilteredElementCollector(doc).WhereElementIsElementType()),
+                              lambda t: (t.GetType().Name, t.FamilyName))),
+    ("Levels",   RenameTarget("Levels",   lambda doc: list(FilteredElementCollector(doc).OfClass(Level)), lambda l: "Level")),
+])
+
+
+#📒 JOURNAL
+#------------------------------
+class RenameJournal(object):
+    """Append-only log of rename batches in the document store, so renames can be reverted after save/sync.
+    The index keeps the byte offset of every batch, so reading one batch never scans the whole journal.
+
+    e.g.
+    journal = RenameJournal(doc)
+    journal.append("Views", [(view.UniqueId, old_name, new_name), ...])
+    journal.read(3)  # -> [(unique_id, old_name, new_name), ...]"""
+
+    def __init__(self, doc):
+        self.doc     = doc
+        self.path    = get_document_store_path(doc, JOURNAL_FILE)
+        self.index   = load_json(doc, JOURNAL_INDEX_FILE, {}) or {}
+        self.batches = self.index.setdefault("batches", [])
+
+    def get(self, batch):
+        for info in self.batches:
+            if info["batch"] == batch:
+                return info
+        return None
+
+    def append(self, target, entries, label="", reverts=None):
+        """Write one batch. entries - [(UniqueId, old name, new name)]. Returns the batch number."""
+        if not entries:
+            return None
+        batch = self.batches[-1]["batch"] + 1 if self.batches else 1
+        lines = []
+        for unique_id, old_name, new_name in entries:
+            line = json.dumps([batch, unique_id, old_name, new_name], ensure_ascii=False, separators=(",", ":"))
+            if not isinstance(line, type(u"")):
+                line = line.decode("utf-8")
+            lines.append(line + u"\n")
+
+        offset = os.path.getsize(self.path) if os.path.exists(self.path) else 0
+        if offset:
+            # A write cut short leaves a partial last line: start the batch on a line of its own
+            with io.open(self.path, "rb") as f:
+                f.seek(offset - 1)
+                if f.read(1) != b"\n":
+                    lines.insert(0, u"\n")
+                    offset += 1
+        with io.open(self.path, "a", encoding="utf-8", newline="\n") as f:
+            f.write(u"".join(lines))
+
+        self.batches.append({"batch":   batch,
+                             "offset":  offset,
+                             "count":   len(entries),
+                             "target":  target,
+                             "label":   label,
+                             "time":    datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                             "reverts": reverts})
+        if reverts is not None:
+            self.get(reverts)["reverted_by"] = batch
+        save_json(self.doc, JOURNAL_INDEX_FILE, self.index)
+        return batch
+
+    def read(self, batch):
+        """Entries of one batch: [(UniqueId, old name, new name)]."""
+        info = self.get(batch)
+        if info is None:
+            raise KeyError("Rename batch {} not found".format(batch))
+        entries = []
+        with io.open(self.path, "rb") as f:
+            f.seek(info["offset"])
+            for _ in range(info["count"]):
+                _, unique_id, old_name, new_name = json.loads(f.readline().decode("utf-8"))
+                entries.append((unique_id, old_name, new_name))
+        return entries
+
+
+@traced()
+def plan_revert(doc, journal, batch):
+    """Plan to give every element of a batch its old name back.
+    Elements deleted or renamed again since the batch are conflicts and stay untouched.
+    Old names taken by other elements in the meantime get a " (n)" suffix.
+
+    Returns (plan, conflicts) where conflicts is [(UniqueId, old name, new name, reason)]."""
+    target = RENAME_TARGETS[journal.get(batch)["target"]]
+    renames, conflicts = [], []
+    for unique_id, old_name, new_name in journal.read(batch):
+        elem = doc.GetElement(unique_id)
+        if elem is None:
+            conflicts.append((unique_id, old_name, new_name, "Element was deleted"))
+            continue
+        current = get_name(elem)
+        if current != new_name:
+            conflicts.append((unique_id, old_name, new_name, "Renamed since to '{}'".format(current)))
+            continue
+        renames.append((elem, current, old_name))
+    return target.plan(doc, renames), conflicts
@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+
+#⬇️ IMPORTS
+#------------------------------
+import io
+import json
+from collections import OrderedDict
+
+
+#📦 VARIABLES
+#------------------------------
+UPDATED        = "updated"
+UNCHANGED      = "unchanged"
+MISSING_SHEET  = "missing sheet"
+MISSING_LEGEND = "missing legend"
+UNMATCHED      = "unmatched"
+DUPLICATE      = "duplicate"
+ERROR          = "error"
+
+STATUSES      = [UPDATED, UNCHANGED, MISSING_SHEET, MISSING_LEGEND, ERROR]
+ROOM_STATUSES = [UPDATED, UNCHANGED, UNMATCHED, DUPLICATE, ERROR]
+STATUS_ICONS  = {UPDATED: "✅", UNCHANGED: "ℹ️", MISSING_SHEET: "⚠️", MISSING_LEGEND: "⚡",
+                 UNMATCHED: "⚠️", DUPLICATE: "⚡", ERROR: "⚫️"}
+
+
+def _html_escape(text):
+    return (text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+                .replace('"', "&quot;").replace("\n", "<br>"))
+
+
+class ImportReport(object):
+    """Collects row outcomes of an import and renders them once at the end.
+    Every output.print_md call marshals HTML into the output window,
+    so importers should never print per row.
+
+    e.g.
+    report = ImportReport("General Notes Import")
+    report.add(UPDATED, row=2, sheet_number="A101", target="General Notes")
+    report.render(output)
+    report.write_jsonl(path)
+
+    Other imports name their key column, e.g.
+    ImportReport("Room Mapping Import", key_label="Room", key_field="room", statuses=ROOM_STATUSES)"""
+
+    def __init__(self, title, key_label="Sheet", key_field="sheet_number", statuses=STATUSES):
+        self.title     = title
+        self.key_label = key_label
+        self.key_field = key_field
+        self.statuses  = statuses
+        self.records   = []
+
+    def add(self, status, row=None, key="", target="", message=""):
+        self.records.append(OrderedDict([("row",          row),
+                                         (self.key_field, key),
+                                         ("status",       status),
+                                         ("target",       target),
+                                         ("message",      message)]))
+
+    def counts(self):
+        counts = OrderedDict((status, 0) for status in self.statuses)
+        for record in self.records:
+            counts[record["status"]] = counts.get(record["status"], 0) + 1
+        return counts
+
+    def render(self, output, show_unchanged=False):
+        """Print one summary table and a collapsible detail section.
+        Unchanged rows are left out of the details unless show_unchanged=True."""
+        counts = self.counts()
+        output.print_md("### {}".format(self.title))
+        output.print_table(table_data=[[STATUS_ICONS.get(s, ""), s, n] for s, n in counts.items()],
+                           columns=["", "Outcome", "Count"])
+
+        details = [r for r in self.records if show_unchanged or r["status"] != UNCHANGED]
+        if not details:
+            return
+
+        html_rows = ["<tr><td>{}</td><td>{}</td><td>{} {}</td><td>{}</td><td>{}</td></tr>".format(
+            r["row"] if r["row"] is not None else "",
+            _html_escape(r[self.key_field] or ""),
+            STATUS_ICONS.get(r["status"], ""), r["status"],
+            _html_escape(r["target"] or ""),
+            _html_escape(r["message"] or "")) for r in details]
+
+        output.print_html(
+            "<details><summary>Details ({} rows)</summary>"
+            "<table><tr><th>Row</th><th>{}</th><th>Outcome</th><th>Target</th><th>Message</th></tr>"
+            "{}</table></details>".format(len(details), _html_escape(self.key_label), "".join(html_rows)))
+
+    def write_jsonl(self, path):
+        """Write one JSON object per record. Keys are ordered so runs can be diffed line by line."""
+        with io.open(path, "w", encoding="utf-8") as f:
+            for record in self.records:
+                line = json.dumps(record, ensure_ascii=False)
+                if not isinstance(line, type(u"")):
+                    line = line.decode("utf-8")
+                f.write(line + u"\n")
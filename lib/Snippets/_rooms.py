@@ -0,0 +1,587 @@
+# -*- coding: utf-8 -*-
+
+#⬇️ IMPORTS
+#------------------------------
+import re
+import math
+from collections import OrderedDict
+from Autodesk.Revit.DB import *
+
+# .NET Imports
+import clr
+clr.AddReference("System")
+from System.Collections.Generic import List
+
+# Custom Imports
+from Snippets._excel import cell_to_text
+from Snippets._report import UPDATED, UNCHANGED, UNMATCHED, DUPLICATE, ERROR
+from Snippets._trace import traced, count
+
+
+#📦 VARIABLES
+#------------------------------
+ORDER_SNAKE   = "Snake (serpentine sweep)"
+ORDER_NEAREST = "Nearest neighbour chain"
+ORDER_PATH    = "Along path"
+ORDERINGS     = [ORDER_SNAKE, ORDER_NEAREST, ORDER_PATH]
+
+DEFAULT_PATTERN = "{level}{n:02d}"
+
+# Mapping import: match mode -> key columns of the mapping file
+MATCH_NAME       = "Room Name"
+MATCH_NUMBER     = "Current Number"
+MATCH_LEVEL_NAME = "Level + Name"
+MATCH_POINT      = "Nearest Point"
+MATCH_COLUMNS    = OrderedDict([(MATCH_NAME,       ["Name"]),
+                                (MATCH_NUMBER,     ["Number"]),
+                                (MATCH_LEVEL_NAME, ["Level", "Name"]),
+                                (MATCH_POINT,      ["X", "Y"])])  # X/Y in meters, optional "Level" column
+NEW_NUMBER_COLUMN = "New Number"
+FEET_PER_METER    = 1 / 0.3048
+
+TAG_BATCH_SIZE = 250  # Room tags created per Transaction
+
+# Room number uniqueness: Revit warns about duplicates within a phase
+SCOPE_PHASE  = "Per Phase"
+SCOPE_LEVEL  = "Per Phase + Level"
+SCOPE_MODEL  = "Whole Model"
+SCOPES       = [SCOPE_PHASE, SCOPE_LEVEL, SCOPE_MODEL]
+
+# What to do when a proposed number is already taken
+POLICY_SUFFIX = "Add letter suffix (101 -> 101A)"
+POLICY_NEXT   = "Use next free number (101 -> 102)"
+POLICY_SKIP   = "Skip room (keep its number)"
+POLICIES      = [POLICY_SUFFIX, POLICY_NEXT, POLICY_SKIP]
+
+
+# Reusable Snippets
+
+def get_placed_rooms(doc, room_ids=None):
+    """Placed rooms (Area > 0 with a location point), from the given ids or the whole model."""
+    if room_ids:
+        collector = FilteredElementCollector(doc, room_ids)
+    else:
+        collector = FilteredElementCollector(doc)
+    rooms = collector.OfCategory(BuiltInCategory.OST_Rooms).WhereElementIsNotElementType()
+    return [r for r in rooms if r.Location is not None and r.Area > 0]
+
+
+def get_all_rooms(doc):
+    """All rooms, placed or not - every room holds on to its number."""
+    return list(FilteredElementCollector(doc).OfCategory(BuiltInCategory.OST_Rooms).WhereElementIsNotElementType())
+
+
+def room_point(room):
+    """(x, y) of the room location point."""
+    pt = room.Location.Point
+    return pt.X, pt.Y
+
+
+class GridIndex(object):
+    """Uniform grid over 2D points for nearest-neighbour queries.
+    Rooms are spread fairly evenly over a plan, so a grid beats a KD-tree in plain Python.
+
+    e.g.
+    index = GridIndex(cell_size=20)
+    index.insert("a", 0, 0)
+    index.nearest(1, 1)  # -> "a" """
+
+    def __init__(self, cell_size):
+        self.cell_size = float(cell_size) or 1.0
+        self.cells     = {}
+        self.points    = {}
+
+    @classmethod
+    def for_points(cls, points, per_cell=2):
+        """Pick a cell size so every cell holds ~per_cell points."""
+        xs = [p[0] for p in points]
+        ys = [p[1] for p in points]
+        if not points:
+            return cls(1.0)
+        area = max(max(xs) - min(xs), 1.0) * max(max(ys) - min(ys), 1.0)
+        return cls(math.sqrt(area * per_cell / float(len(points))))
+
+    def _cell(self, x, y):
+        return int(math.floor(x / self.cell_size)), int(math.floor(y / self.cell_size))
+
+    def insert(self, key, x, y):
+        self.points[key] = (x, y)
+        self.cells.setdefault(self._cell(x, y), []).append(key)
+
+    def remove(self, key):
+        x, y = self.points.pop(key)
+        cell = self.cells[self._cell(x, y)]
+        cell.remove(key)
+        if not cell:
+            del self.cells[self._cell(x, y)]
+
+    def __len__(self):
+        return len(self.points)
+
+    def nearest(self, x, y, max_distance=None):
+        """Closest key to (x, y) or None. Searches rings of cells outwards."""
+        if not self.points:
+            return None
+        cx, cy = self._cell(x, y)
+        best_key, best_d2 = None, None
+        ring = 0
+        max_ring = None if max_distance is None else int(math.ceil(max_distance / self.cell_size)) + 1
+        while True:
+            for gx in range(cx - ring, cx + ring + 1):
+                for gy in range(cy - ring, cy + ring + 1):
+                    if ring and abs(gx - cx) != ring and abs(gy - cy) != ring:
+                        continue  # Only the outer ring
+                    for key in self.cells.get((gx, gy), ()):
+                        px, py = self.points[key]
+                        d2 = (px - x) ** 2 + (py - y) ** 2
+                        if best_d2 is None or d2 < best_d2:
+                            best_key, best_d2 = key, d2
+            # Anything outside this ring is at least ring * cell_size away
+            if best_d2 is not None and best_d2 <= (ring * self.cell_size) ** 2:
+                break
+            if max_ring is not None and ring >= max_ring:
+                break
+            if best_d2 is None and not self.cells:
+                break
+            ring += 1
+        if max_distance is not None and best_d2 is not None and best_d2 > max_distance ** 2:
+            return None
+        return best_key
+
+
+#🧭 ORDERING
+#------------------------------
+def order_snake(items, band_height):
+    """Serpentine sweep: bands from top to bottom, left->right then right->left.
+    items - list of (key, x, y)"""
+    band_height = float(band_height) or 1.0
+    top = max(y for _, _, y in items) if items else 0
+    bands = {}
+    for key, x, y in items:
+        bands.setdefault(int((top - y) // band_height), []).append((x, key))
+    ordered = []
+    for i, band in enumerate(sorted(bands)):
+        row = sorted(bands[band], reverse=bool(i % 2))
+        ordered.extend(key for _, key in row)
+    return ordered
+
+
+def order_nearest(items, start_key=None):
+    """Nearest-neighbour chain from start_key (default: the bottom-left item).
+    items - list of (key, x, y)"""
+    if not items:
+        return []
+    index = GridIndex.for_points([(x, y) for _, x, y in items])
+    for key, x, y in items:
+        index.insert(key, x, y)
+    if start_key is None or start_key not in index.points:
+        start_key = min(items, key=lambda i: (i[1] + i[2], i[1]))[0]
+
+    ordered = [start_key]
+    x, y = index.points[start_key]
+    index.remove(start_key)
+    while len(index):
+        key = index.nearest(x, y)
+        ordered.append(key)
+        x, y = index.points[key]
+        index.remove(key)
+    return ordered
+
+
+def order_along_path(items, path_points):
+    """Order by distance along a polyline, then by distance from it.
+    items       - list of (key, x, y)
+    path_points - list of (x, y) defining the path"""
+    segments = []
+    station = 0.0
+    for (x0, y0), (x1, y1) in zip(path_points, path_points[1:]):
+        length = math.hypot(x1 - x0, y1 - y0)
+        if length > 0:
+            segments.append((x0, y0, x1, y1, length, station))
+            station += length
+
+    def project(x, y):
+        best = None
+        for x0, y0, x1, y1, length, start in segments:
+            t = ((x - x0) * (x1 - x0) + (y - y0) * (y1 - y0)) / (length ** 2)
+            t = max(0.0, min(1.0, t))
+            px, py = x0 + t * (x1 - x0), y0 + t * (y1 - y0)
+            offset = math.hypot(x - px, y - py)
+            if best is None or offset < best[1]:
+                best = (start + t * length, offset)
+        return best or (0.0, 0.0)
+
+    return [key for _, key in sorted((project(x, y), key) for key, x, y in items)]
+
+
+#🔢 NUMBERING
+#------------------------------
+def level_prefix(level_name, level_index):
+    """Digits of the level name ('Level 3' -> '3'), otherwise the level index."""
+    digits = re.findall(r'-?\d+', level_name or "")
+    return digits[0] if digits else str(level_index)
+
+
+def level_prefixes(doc):
+    """{level id: prefix} for every level of the model, so numbers can't collide across levels.
+    Prefixes come from level_prefix() with the level's position by elevation (from 1) as the index.
+    If two levels would get the same number ('B1' and 'Level 1', or 'Level 1' and 'Level 01'),
+    every level falls back to its position by elevation, zero-padded to one width (1, 2, ... or 01, 02, ... 12).
+    Equal-width prefixes keep "{level}{n}" unique across levels; prefixes taken from level names can still
+    produce the same number on two levels ('1' + '11' and '11' + '1'), so check plans with RoomNumberIndex."""
+    levels = sorted(FilteredElementCollector(doc).OfClass(Level), key=lambda l: l.Elevation)
+    prefixes = OrderedDict((level.Id.IntegerValue, level_prefix(level.Name, i))
+                           for i, level in enumerate(levels, 1))
+    if len(set(int(p) for p in prefixes.values())) < len(prefixes):
+        width = len(str(len(levels)))
+        prefixes = OrderedDict((level.Id.IntegerValue, str(i).zfill(width)) for i, level in enumerate(levels, 1))
+    return prefixes
+
+
+def group_by_level(doc, rooms):
+    """OrderedDict {Level: [rooms]} sorted by level elevation."""
+    levels = {}
+    for room in rooms:
+        levels.setdefault(room.LevelId.IntegerValue, []).append(room)
+    level_elems = [doc.GetElement(ElementId(l_id)) for l_id in levels]
+    level_elems.sort(key=lambda l: l.Elevation if l else 0)
+    return OrderedDict((level, levels[level.Id.IntegerValue]) for level in level_elems if level)
+
+
+@traced()
+def plan_room_numbers(doc, rooms, ordering=ORDER_SNAKE, pattern=DEFAULT_PATTERN, start=1, step=1,
+                      band_height=30.0, start_room=None, path_points=None):
+    """Compute new numbers for rooms, level by level.
+
+    pattern tokens: {level} level prefix (see level_prefixes), {level_index}, {n} running number (restarts per level).
+    e.g. "{level}{n:02d}" -> 101, 102, ... on Level 1
+
+    Returns list of (room, new_number) in numbering order."""
+    plan = []
+    prefixes = level_prefixes(doc)
+    for level_index, (level, level_rooms) in enumerate(group_by_level(doc, rooms).items()):
+        items = [(room.Id.IntegerValue,) + room_point(room) for room in level_rooms]
+        by_id = {room.Id.IntegerValue: room for room in level_rooms}
+
+        if ordering == ORDER_NEAREST:
+            start_key = start_room.Id.IntegerValue if start_room is not None else None
+            ordered = order_nearest(items, start_key)
+        elif ordering == ORDER_PATH and path_points:
+            ordered = order_along_path(items, path_points)
+        else:
+            ordered = order_snake(items, band_height)
+
+        prefix = prefixes.get(level.Id.IntegerValue) or level_prefix(level.Name, level_index)
+        for i, key in enumerate(ordered):
+            number = pattern.format(level=prefix, level_index=level_index, n=start + i * step)
+            plan.append((by_id[key], number))
+    return plan
+
+
+@traced()
+def apply_room_numbers(plan):
+    """Write planned numbers, skipping rooms that already have them. Must be called inside an open Transaction.
+    Returns (changed, errors) where errors is [(room, message)]."""
+    changed, errors = 0, []
+    for room, number in plan:
+        if room.Number == number:
+            continue
+        try:
+            room.Number = number
+            changed += 1
+        except Exception as e:
+            errors.append((room, str(e)))
+    count("Room.Number", changed)
+    return changed, errors
+
+
+#📥 MAPPING IMPORT
+#------------------------------
+def room_name(room):
+    """Room name without the number (Room.Name returns 'Name Number')."""
+    param = room.get_Parameter(BuiltInParameter.ROOM_NAME)
+    return (param.AsString() if param else "") or ""
+
+
+def _norm(text):
+    return cell_to_text(text).strip().lower()
+
+
+def _level_names(doc, rooms):
+    names = {}
+    for room in rooms:
+        key = room.LevelId.IntegerValue
+        if key not in names:
+            level = doc.GetElement(room.LevelId)
+            names[key] = level.Name if level else ""
+    return names
+
+
+def _room_key(room, mode, level_names):
+    if mode == MATCH_NAME:
+        return _norm(room_name(room))
+    if mode == MATCH_NUMBER:
+        return _norm(room.Number)
+    return _norm(level_names[room.LevelId.IntegerValue]), _norm(room_name(room))
+
+
+def _row_key(row, mode, indexes):
+    values = tuple(_norm(row[i]) if i < len(row) else "" for i in indexes)
+    return values if mode == MATCH_LEVEL_NAME else values[0]
+
+
+@traced()
+def match_room_mapping(doc, rooms, headers, rows, mode, report, tolerance=1.0):
+    """Join mapping rows to rooms in one pass.
+    Key modes hash-join through a dict, MATCH_POINT uses one GridIndex per level (tolerance in meters).
+    Unmatched rows, keys shared by several rooms and rooms matched by several rows go to the report.
+
+    Returns list of (row number, room, new number)."""
+    missing = [c for c in MATCH_COLUMNS[mode] + [NEW_NUMBER_COLUMN] if c not in headers]
+    if missing:
+        raise ValueError("Missing column(s): {}".format(", ".join(missing)))
+    key_indexes = [headers.index(c) for c in MATCH_COLUMNS[mode]]
+    new_idx     = headers.index(NEW_NUMBER_COLUMN)
+    level_idx   = headers.index("Level") if "Level" in headers else None
+    level_names = _level_names(doc, rooms)
+    by_id       = {room.Id.IntegerValue: room for room in rooms}
+
+    if mode == MATCH_POINT:
+        indexes = {}  # normalized level name (or None for all levels) -> GridIndex
+        points = [(room.Id.IntegerValue,) + room_point(room) for room in rooms]
+        groups = {None: points}
+        for item in points:
+            groups.setdefault(_norm(level_names[by_id[item[0]].LevelId.IntegerValue]), []).append(item)
+        for level, items in groups.items():
+            indexes[level] = GridIndex.for_points([(x, y) for _, x, y in items])
+            for key, x, y in items:
+                indexes[level].insert(key, x, y)
+    else:
+        lookup = {}
+        for room in rooms:
+            lookup.setdefault(_room_key(room, mode, level_names), []).append(room)
+
+    matches = []
+    matched_rows = {}  # room id -> first row number
+    for i, row in enumerate(rows):
+        row_number = i + 2  # Header is row 1
+        new_number = cell_to_text(row[new_idx] if new_idx < len(row) else None).strip()
+        label = " / ".join(cell_to_text(row[k]) for k in key_indexes if k < len(row))
+        if not new_number:
+            report.add(ERROR, row_number, label, message="'{}' is empty".format(NEW_NUMBER_COLUMN))
+            continue
+
+        if mode == MATCH_POINT:
+            try:
+                x = float(row[key_indexes[0]]) * FEET_PER_METER
+                y = float(row[key_indexes[1]]) * FEET_PER_METER
+            except (TypeError, ValueError, IndexError):
+                report.add(ERROR, row_number, label, message="X/Y are not numbers")
+                continue
+            level = _norm(row[level_idx]) if level_idx is not None and level_idx < len(row) else None
+            index = indexes.get(level or None)
+            room_id = index.nearest(x, y, max_distance=tolerance * FEET_PER_METER) if index else None
+            candidates = [by_id[room_id]] if room_id is not None else []
+        else:
+            candidates = lookup.get(_row_key(row, mode, key_indexes), [])
+
+        if not candidates:
+            report.add(UNMATCHED, row_number, label, message="No room found")
+            continue
+        if len(candidates) > 1:
+            report.add(DUPLICATE, row_number, label,
+                       message="{} rooms share this key: {}".format(len(candidates),
+                                                                     ", ".join(r.Number for r in candidates)))
+            continue
+
+        room = candidates[0]
+        first_row = matched_rows.setdefault(room.Id.IntegerValue, row_number)
+        if first_row != row_number:
+            report.add(DUPLICATE, row_number, label, room.Number,
+                       "Room already matched by row {}".format(first_row))
+            continue
+        matches.append((row_number, room, new_number))
+    return matches
+
+
+@traced()
+def apply_room_mapping(matches, report):
+    """Write new numbers for matched rooms. Only rooms whose number changes are touched.
+    Must be called inside an open Transaction. Returns number of updated rooms."""
+    updated = 0
+    for row_number, room, new_number in matches:
+        old_number = room.Number
+        target = "{} {}".format(old_number, room_name(room)).strip()
+        if old_number == new_number:
+            report.add(UNCHANGED, row_number, new_number, target)
+            continue
+        try:
+            room.Number = new_number
+            report.add(UPDATED, row_number, new_number, target, "{} -> {}".format(old_number, new_number))
+            updated += 1
+        except Exception as e:
+            report.add(ERROR, row_number, new_number, target, str(e))
+    count("Room.Number", updated)
+    return updated
+
+
+#🏷️ ROOM TAGS
+#------------------------------
+@traced()
+def find_untagged_rooms(doc, view):
+    """Placed rooms visible in the view without a RoomTag in that view.
+    One collector returns both rooms and room tags of the view."""
+    cats = List[BuiltInCategory]([BuiltInCategory.OST_Rooms, BuiltInCategory.OST_RoomTags])
+    rooms, tagged = [], set()
+    for elem in FilteredElementCollector(doc, view.Id).WherePasses(ElementMulticategoryFilter(cats)).WhereElementIsNotElementType():
+        if elem.Category.Id.IntegerValue == int(BuiltInCategory.OST_RoomTags):
+            room_id = elem.TaggedLocalRoomId
+            if room_id != ElementId.InvalidElementId:
+                tagged.add(room_id.IntegerValue)
+        elif elem.Location is not None and elem.Area > 0:
+            rooms.append(elem)
+    return [room for room in rooms if room.Id.IntegerValue not in tagged]
+
+
+@traced()
+def tag_rooms(doc, view, rooms):
+    """Create a RoomTag at the location point of every room. Must be called inside an open Transaction.
+    Returns (created, errors) where errors is [(room, message)]."""
+    created, errors = 0, []
+    for room in rooms:
+        pt = room.Location.Point
+        try:
+            doc.Create.NewRoomTag(LinkElementId(room.Id), UV(pt.X, pt.Y), view.Id)
+            created += 1
+        except Exception as e:
+            errors.append((room, str(e)))
+    count("NewRoomTag", created)
+    return created, errors
+
+
+def batched(items, size=TAG_BATCH_SIZE):
+    """Split a list into chunks of size."""
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+#🔁 DUPLICATE NUMBERS
+#------------------------------
+def _letter_suffixes():
+    """A, B, ..., Z, AA, AB, ..."""
+    letters = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+    n = 0
+    while True:
+        suffix, i = "", n
+        while True:
+            suffix = letters[i % 26] + suffix
+            i = i // 26 - 1
+            if i < 0:
+                break
+        yield suffix
+        n += 1
+
+
+class RoomNumberIndex(object):
+    """number -> rooms, grouped by scope (phase, phase + level, or whole model). Built once in O(n).
+
+    e.g.
+    index = RoomNumberIndex(get_all_rooms(doc))
+    index.duplicates()                               # existing collisions
+    plan, resolutions = index.resolve(plan, POLICY_SUFFIX)  # fix a proposed numbering before writing it"""
+
+    def __init__(self, rooms, scope=SCOPE_PHASE):
+        self.scope   = scope
+        self.numbers = {}  # scope key -> {number: [room]}
+        for room in rooms:
+            self.numbers.setdefault(self.scope_key(room), {}).setdefault(room.Number or "", []).append(room)
+
+    def scope_key(self, room):
+        if self.scope == SCOPE_MODEL:
+            return None
+        phase = room.get_Parameter(BuiltInParameter.ROOM_PHASE_ID)
+        phase_id = phase.AsElementId().IntegerValue if phase else -1
+        if self.scope == SCOPE_PHASE:
+            return phase_id
+        return phase_id, room.LevelId.IntegerValue
+
+    def duplicates(self):
+        """Existing collisions: list of (scope key, number, [rooms]) sorted by number."""
+        result = []
+        for key, numbers in self.numbers.items():
+            for number, rooms in numbers.items():
+                if number and len(rooms) > 1:
+                    result.append((key, number, rooms))
+        return sorted(result, key=lambda d: (d[1], str(d[0])))
+
+    def _taken_after(self, plan):
+        """{scope key: set(numbers)} held by rooms that are not part of the plan."""
+        planned = set(room.Id.IntegerValue for room, _ in plan)
+        taken = {}
+        for key, numbers in self.numbers.items():
+            taken[key] = set(number for number, rooms in numbers.items()
+                             if any(r.Id.IntegerValue not in planned for r in rooms))
+        return taken
+
+    def validate(self, plan):
+        """Collisions a plan [(room, number)] would create. Returns [(room, number)] of colliding entries."""
+        taken = self._taken_after(plan)
+        collisions = []
+        for room, number in plan:
+            used = taken.setdefault(self.scope_key(room), set())
+            if number in used:
+                collisions.append((room, number))
+            used.add(number)
+        return collisions
+
+    @traced("RoomNumberIndex.resolve")
+    def resolve(self, plan, policy=POLICY_SUFFIX):
+        """Apply a collision policy to a plan [(room, number)].
+        Earlier entries of the plan and rooms outside the plan keep their numbers.
+        Skipped rooms keep their current number too, so it is reserved and the plan is resolved again:
+        an earlier entry that was given that number is then skipped (or re-suffixed) as well.
+
+        Returns (resolved plan, resolutions) where resolutions is [(room, proposed, final or None if skipped)]."""
+        skipped = set()
+        while True:
+            taken = self._taken_after(plan)
+            for room, _ in plan:
+                if room.Id.IntegerValue in skipped and room.Number:
+                    taken.setdefault(self.scope_key(room), set()).add(room.Number)
+
+            resolved, resolutions, newly_skipped = [], [], set()
+            for room, number in plan:
+                if room.Id.IntegerValue in skipped:
+                    resolutions.append((room, number, None))
+                    continue
+                used = taken.setdefault(self.scope_key(room), set())
+                final = number
+                if number in used:
+                    final = self._free_number(number, used, policy)
+                    resolutions.append((room, number, final))
+                if final is None:
+                    newly_skipped.add(room.Id.IntegerValue)
+                    continue
+                used.add(final)
+                resolved.append((room, final))
+            if not newly_skipped:
+                return resolved, resolutions
+            skipped |= newly_skipped
+
+    @staticmethod
+    def _free_number(number, used, policy):
+        if policy == POLICY_SKIP:
+            return None
+        match = re.match(r'^(.*?)(\d+)$', number)
+        if policy == POLICY_NEXT and match:
+            prefix, digits = match.groups()
+            n = int(digits)
+            while True:
+                n += 1
+                candidate = "{}{}".format(prefix, str(n).zfill(len(digits)))
+                if candidate not in used:
+                    return candidate
+        for suffix in _letter_suffixes():
+            candidate = number + suffix
+            if candidate not in used:
+                return candidate
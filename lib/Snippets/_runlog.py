@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+from __future__ import print_function
+
+#⬇️ IMPORTS
+#------------------------------
+from collections import OrderedDict
+from Autodesk.Revit.DB import BuiltInParameter
+
+
+#📦 VARIABLES
+#------------------------------
+SUMMARY = 0  # Counters only, nothing formatted per element
+NORMAL  = 1  # One line per element
+DEBUG   = 2  # One line per element incl. type names
+
+LEVEL_NAMES = {"summary": SUMMARY, "normal": NORMAL, "debug": DEBUG}
+
+# Outcomes counted per category
+APPLIED      = "applied"
+RESET        = "reset"
+NOT_HIDEABLE = "skipped-not-hideable"
+NO_BBOX      = "skipped-no-bbox"
+STRUCTURAL   = "skipped-structural"
+ERROR        = "error"
+
+
+# Reusable Snippets
+
+def level_from_name(name, default=SUMMARY):
+    """'summary' / 'normal' / 'debug' -> level constant."""
+    return LEVEL_NAMES.get(str(name).strip().lower(), default)
+
+
+class TypeNameCache(object):
+    """SYMBOL_NAME_PARAM lookups, resolved once per type."""
+
+    def __init__(self, doc):
+        self.doc    = doc
+        self._names = {}
+
+    def get(self, elem):
+        type_id = elem.GetTypeId()
+        key = type_id.IntegerValue
+        if key not in self._names:
+            elem_type = self.doc.GetElement(type_id)
+            param = elem_type.get_Parameter(BuiltInParameter.SYMBOL_NAME_PARAM) if elem_type else None
+            self._names[key] = (param.AsString() if param else None) or "Unknown"
+        return self._names[key]
+
+
+class RunLog(object):
+    """Leveled log with per-category counters.
+    At SUMMARY level nothing is formatted per element - only counters are incremented.
+    Type names are resolved only at DEBUG level.
+
+    e.g.
+    log = RunLog(doc, level=SUMMARY)
+    log.element(APPLIED, "OST_Walls", elem)
+    log.render(output)"""
+
+    def __init__(self, doc, level=SUMMARY, write=print):
+        self.level    = level
+        self.write    = write
+        self.counters = OrderedDict()  # category -> {outcome: count}
+        self.type_names = TypeNameCache(doc)
+
+    def is_enabled(self, level):
+        return self.level >= level
+
+    def count(self, category, outcome, n=1):
+        outcomes = self.counters.get(category)
+        if outcomes is None:
+            outcomes = self.counters[category] = OrderedDict()
+        outcomes[outcome] = outcomes.get(outcome, 0) + n
+
+    def log(self, level, message, *args):
+        """Print a message if level is enabled. Formatting is skipped otherwise."""
+        if self.level >= level:
+            self.write(message.format(*args) if args else message)
+
+    def element(self, outcome, category, elem, note=""):
+        """Count an element outcome and (depending on level) print one line for it."""
+        self.count(category, outcome)
+        if self.level < NORMAL:
+            return
+        line = "{0}: ID={1}, Category={2}".format(outcome, elem.Id.IntegerValue, category)
+        if self.level >= DEBUG:
+            line += ", Type={0}".format(self.type_names.get(elem))
+        if note:
+            line += ", " + note
+        self.write(line)
+
+    def render(self, output, title="Summary"):
+        """One table: categories as rows, outcomes as columns."""
+        outcomes = []
+        for counts in self.counters.values():
+            for outcome in counts:
+                if outcome not in outcomes:
+                    outcomes.append(outcome)
+        rows = [[category] + [counts.get(o, 0) for o in outcomes] for category, counts in self.counters.items()]
+        if rows:
+            output.print_table(table_data=rows, title=title, columns=["Category"] + outcomes)
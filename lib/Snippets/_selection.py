@@ -5,27 +5,96 @@
 # Regular + Autodesk
 from Autodesk.Revit.DB import *
 
+# .NET Imports
+import clr
+clr.AddReference("System")
+from System import Type
+from System.Collections.Generic import List
+
+# Custom Imports
+from Snippets._context import get_context
 
-#📦 VARIABLES
-#------------------------------
-doc   = __revit__.ActiveUIDocument.Document
-uidoc = __revit__.ActiveUIDocument
-app   = __revit__.Application
 
 # Reusable Snippets
 
+class SelectionService(object):
+    """Current selection, filtered natively.
+    Class and category filters run inside a FilteredElementCollector over the selected ids,
+    so large selections never go through doc.GetElement one id at a time.
+    Results are cached until the selection changes.
+
+    e.g.
+    selection = SelectionService(uidoc)
+    for wall in selection.elements(classes=[Wall]): ...
+    door_ids = selection.ids(categories=[BuiltInCategory.OST_Doors])"""
+
+    def __init__(self, uidoc):
+        self.uidoc      = uidoc
+        self._signature = None
+        self._cache     = {}
+
+    @property
+    def doc(self):
+        return self.uidoc.Document
+
+    def selected_ids(self):
+        """Raw selected ElementIds. Resets the cache when the selection has changed."""
+        ids = self.uidoc.Selection.GetElementIds()
+        signature = (self.doc.Title, frozenset(e_id.IntegerValue for e_id in ids))
+        if signature != self._signature:
+            self._signature = signature
+            self._cache = {}
+        return ids
+
+    def _collector(self, ids, classes, categories):
+        collector = FilteredElementCollector(self.doc, ids)
+        if classes:
+            clr_types = List[Type]([clr.GetClrType(c) for c in classes])
+            collector = collector.WherePasses(ElementMulticlassFilter(clr_types))
+        if categories:
+            collector = collector.WherePasses(ElementMulticategoryFilter(List[BuiltInCategory](categories)))
+        return collector
+
+    def ids(self, classes=None, categories=None):
+        """Selected ElementIds passing the class/category filters (a list, cached)."""
+        ids = self.selected_ids()
+        key = (tuple(classes or ()), tuple(categories or ()))
+        if key not in self._cache:
+            if ids.Count == 0:
+                self._cache[key] = []
+            elif not classes and not categories:
+                self._cache[key] = list(ids)
+            else:
+                try:
+                    self._cache[key] = list(self._collector(ids, classes, categories).ToElementIds())
+                except Exception:
+                    # Some API classes can't be used in a class filter (e.g. Room -> use SpatialElement)
+                    elements = self._collector(ids, None, categories)
+                    self._cache[key] = [e.Id for e in elements if isinstance(e, tuple(classes))]
+        return self._cache[key]
+
+    def elements(self, classes=None, categories=None):
+        """Selected elements passing the filters, fetched lazily while iterating."""
+        doc = self.doc
+        for e_id in self.ids(classes, categories):
+            elem = doc.GetElement(e_id)
+            if elem is not None:
+                yield elem
+
+
+def get_selection_service(uidoc=None):
+    """SelectionService for a UIDocument, or the shared one of the active document (kept per document)."""
+    if uidoc is not None:
+        return SelectionService(uidoc)
+    ctx = get_context()
+    return ctx.cache("selection_service", lambda: SelectionService(ctx.uidoc))
+
+
 def get_selected_elements(filter_types=None):
     """Get Selected Elements in Revit UI.
         You can provide a list of types for filter_types parameter (optionally)
+        Subclasses match too, e.g. [SpatialElement] returns rooms and areas.
 
     e.g.
     sel_walls = get_selected_elements([Wall])"""
-    print('Using Function from _selection.py')
-    selected_element_ids = uidoc.Selection.GetElementIds()
-    selected_elements = [doc.GetElement(e_id) for e_id in selected_element_ids]
-
-    # Filter Selection (Optionally)
-    if filter_types:
-        return [el for el in selected_elements if type(el) in filter_types]
-    return selected_elements
-
+    return list(get_selection_service().elements(classes=filter_types))
@@ -0,0 +1,297 @@
+# -*- coding: utf-8 -*-
+
+#⬇️ IMPORTS
+#------------------------------
+import re
+from Autodesk.Revit.DB import *
+from Snippets._excel import cell_to_text
+from Snippets._report import UPDATED, UNCHANGED, MISSING_LEGEND, ERROR
+from Snippets._trace import traced, count
+
+
+#📦 VARIABLES
+#------------------------------
+# Workbook columns that can be written back to sheets: (Column Header, Parameter Name)
+# Sheet Number is the join key. Project ID, Ser No, Revision Descriptions and the
+# Titleblock text (Pre., Check, Appro., Date) are derived values and stay export-only.
+EDITABLE_SHEET_COLUMNS = [
+    ("Sheet Name",        "Sheet Name"),
+    ("Sheet Issue Date",  "Sheet Issue Date"),
+    ("Drawn By",          "Drawn By"),
+    ("Checked By",        "Checked By"),
+    ("Designed By",       "Designed By"),
+    ("Approved By",       "Approved By"),
+    ("Orig.",             "Sheet No._Origin"),
+    ("Phas.",             "Sheet No._Project phase"),
+    ("Stag.",             "Sheet No._Stage"),
+    ("Area",              "Sheet No._Facility-Area"),
+    ("Zone",              "Sheet No._Floor-Zone-Street"),
+    ("Doc Type",          "Sheet No._Doc type"),
+    ("Disc",              "Sheet No._Discipline"),
+    ("Internal Revision", "Internal Revision"),
+    ("Sheet Revision",    "Sheet No._Revision"),
+]
+
+DOUBLE_TOLERANCE = 1e-9
+
+# Export workbook columns, in order
+SHEET_EXPORT_HEADERS = [
+    "Sheet Number", "Sheet Name", "Sheet Issue Date", "Drawn By", "Checked By", "Designed By", "Approved By",
+    "Project ID", "Orig.", "Phas.", "Stag.", "Area", "Zone", "Doc Type", "Disc", "Ser No",
+    "General Notes", "Internal Revision", "Sheet Revision", "Revision Descriptions", "Pre.", "Check", "Appro.", "Date"
+]
+
+# Export columns written as Text ("@"). In General format Excel turns "01" into 1 and "2024-02-01" into a date
+# serial, and the import would then see a change in every such cell.
+TEXT_EXPORT_COLUMNS = [i for i, header in enumerate(SHEET_EXPORT_HEADERS, 1)
+                       if header in ("Sheet Number", "Ser No") or header in dict(EDITABLE_SHEET_COLUMNS)]
+
+GENERAL_NOTES = "GENERAL NOTES"  # Legend views whose name contains this hold the General Notes
+
+
+# Reusable Snippets
+
+def normalize_sheet_number(value):
+    """Normalize a Sheet Number cell. Numeric cells come back as floats (e.g. 101.0 -> "101");
+    text cells are kept as typed, so "A1.0" stays "A1.0"."""
+    return cell_to_text(value).strip()
+
+
+@traced()
+def resolve_column_parameters(sheets, columns=EDITABLE_SHEET_COLUMNS):
+    """Resolve every column to a parameter Definition once.
+    Rows then use sheet.get_Parameter(definition) instead of a LookupParameter name scan per cell.
+
+    Returns {column_header: Definition}. Columns without a matching parameter are left out."""
+    resolved = {}
+    for header, param_name in columns:
+        for sheet in sheets:
+            param = sheet.LookupParameter(param_name)
+            if param:
+                resolved[header] = param.Definition
+                break
+    return resolved
+
+
+def diff_param_value(param, cell_value):
+    """Compare a workbook cell against the current parameter value.
+
+    Returns (changed, new_value) where new_value is already converted to the parameter StorageType.
+    Raises ValueError when the cell can't be converted."""
+    st   = param.StorageType
+    text = cell_to_text(cell_value)
+
+    if st == StorageType.String:
+        return text != (param.AsString() or ""), text
+
+    # Empty cells never clear numeric values
+    if not text.strip():
+        return False, None
+
+    if st == StorageType.Integer:
+        new_value = int(float(text))
+        return new_value != param.AsInteger(), new_value
+    elif st == StorageType.Double:
+        new_value = float(text)
+        return abs(new_value - param.AsDouble()) > DOUBLE_TOLERANCE, new_value
+    elif st == StorageType.ElementId:
+        new_value = ElementId(int(float(text)))
+        return new_value.IntegerValue != param.AsElementId().IntegerValue, new_value
+    return False, None
+
+
+def plan_sheet_parameter_changes(sheet, row, column_indexes, definitions):
+    """Collect the parameter writes needed to bring a sheet in line with a workbook row.
+
+    column_indexes - {column_header: index in row}
+    definitions    - result of resolve_column_parameters()
+
+    Returns (changes, errors):
+    changes - [(column_header, param, new_value)] only for values that actually differ
+    errors  - [(column_header, message)]"""
+    changes = []
+    errors  = []
+    for header, idx in column_indexes.items():
+        definition = definitions.get(header)
+        if definition is None or idx >= len(row):
+            continue
+        param = sheet.get_Parameter(definition)
+        if not param or param.IsReadOnly:
+            continue
+        try:
+            changed, new_value = diff_param_value(param, row[idx])
+        except ValueError:
+            errors.append((header, "Invalid value '{}'".format(cell_to_text(row[idx]))))
+            continue
+        if changed:
+            changes.append((header, param, new_value))
+    return changes, errors
+
+
+@traced()
+def apply_param_changes(changes):
+    """Write planned changes. Must be called inside an open Transaction.
+    Returns list of (column_header, message) for writes Revit refused."""
+    count("Parameter.Set", len(changes))
+    failed = []
+    for header, param, new_value in changes:
+        try:
+            if not param.Set(new_value):
+                failed.append((header, "Value was rejected"))
+        except Exception as e:
+            failed.append((header, str(e)))
+    return failed
+
+
+#📝 GENERAL NOTES
+#------------------------------
+def get_param_value(element, param_name, built_in_param=None):
+    """Parameter value as text ("" if missing). The built-in parameter is tried first, then the name."""
+    if not element:
+        return ""
+    if built_in_param:
+        param = element.get_Parameter(built_in_param)
+        if param and param.HasValue:
+            return param.AsString() or param.AsValueString() or ""
+    param = element.LookupParameter(param_name)
+    if param and not param.IsReadOnly:
+        if param.StorageType == StorageType.String:
+            return param.AsString() or ""
+        elif param.StorageType == StorageType.Integer:
+            return str(param.AsInteger())
+        elif param.StorageType == StorageType.Double:
+            return str(param.AsDouble())
+        elif param.StorageType == StorageType.ElementId:
+            return str(param.AsElementId().IntegerValue)
+    return ""
+
+
+def format_general_notes(text):
+    """Collapse whitespace and put every numbered item on its own line."""
+    text = re.sub(r'\s+', ' ', text or "").strip()
+    numbered_items = re.findall(r'\d+\.\s?.*?(?=(?:\d+\.\s?)|$)', text, re.DOTALL)
+    return "\n".join(item.strip() for item in numbered_items)
+
+
+def find_general_notes_view(doc, sheet):
+    """The General Notes legend placed on a sheet, or None."""
+    viewports = FilteredElementCollector(doc, sheet.Id).OfClass(Viewport).ToElements()
+    for vp in viewports:
+        view = doc.GetElement(vp.ViewId)
+        if isinstance(view, View) and view.ViewType == ViewType.Legend and GENERAL_NOTES in view.Name.upper():
+            return view
+    return None
+
+
+def get_general_notes(doc, view):
+    """TextNotes of a legend view, top to bottom and left to right."""
+    text_notes = FilteredElementCollector(doc, view.Id).WhereElementIsNotElementType().OfClass(TextNote).ToElements()
+    return sorted(text_notes, key=lambda x: (-x.Coord.Y, x.Coord.X))
+
+
+def read_general_notes(doc, sheet):
+    """Formatted General Notes of a sheet ("" without a General Notes legend)."""
+    view = find_general_notes_view(doc, sheet)
+    if view is None:
+        return ""
+    return format_general_notes(" ".join([tn.Text for tn in get_general_notes(doc, view)]))
+
+
+@traced()
+def update_general_notes(doc, sheet, sheet_number, row, general_notes_text, report):
+    """Replace the General Notes legend text on a sheet. Must run inside an open Transaction.
+    The outcome is recorded in report. Returns True if the notes were rewritten."""
+    target = "General Notes"
+    if not general_notes_text.strip():
+        report.add(UNCHANGED, row, sheet_number, target, "Empty or contains only whitespace")
+        return False
+
+    formatted_text = format_general_notes(general_notes_text)
+    if not formatted_text:
+        report.add(UNCHANGED, row, sheet_number, target, "No numbered items found")
+        return False
+
+    # Find the general notes legend view
+    general_notes_view = find_general_notes_view(doc, sheet)
+    if not general_notes_view:
+        report.add(MISSING_LEGEND, row, sheet_number, target, "General Notes legend view not found on sheet")
+        return False
+
+    # Skip if the General Notes haven't changed
+    text_notes_sorted = get_general_notes(doc, general_notes_view)
+    existing_notes = format_general_notes(" ".join([tn.Text for tn in text_notes_sorted]))
+    if formatted_text == existing_notes:
+        report.add(UNCHANGED, row, sheet_number, target)
+        return False
+
+    # SubTransaction keeps a failing sheet from rolling back the whole import
+    st = SubTransaction(doc)
+    st.Start()
+    try:
+        # Store properties of existing TextNotes
+        positions = [(tn.Coord.X, tn.Coord.Y) for tn in text_notes_sorted]
+        widths = [tn.Width for tn in text_notes_sorted]
+        alignments = [tn.HorizontalAlignment for tn in text_notes_sorted]
+        # Get the TextNoteType from existing notes or default
+        text_note_type_id = text_notes_sorted[
+            0].TextNoteType.Id if text_notes_sorted else FilteredElementCollector(doc).OfClass(
+            TextNoteType).FirstElement().Id
+
+        # Delete existing TextNotes (we only need one)
+        for tn in text_notes_sorted:
+            doc.Delete(tn.Id)
+
+        # Create a single TextNote with the formatted General Notes
+        x = positions[0][0] if positions else 0
+        y = positions[0][1] if positions else 0
+        text_note_options = TextNoteOptions(text_note_type_id)
+        text_note_options.HorizontalAlignment = alignments[0] if alignments else HorizontalTextAlignment.Left
+        new_note = TextNote.Create(doc, general_notes_view.Id, XYZ(x, y, 0), formatted_text, text_note_type_id)
+        new_note.Width = widths[0] if widths else 1.0  # Preserve original width or default to 1.0 feet
+        count("TextNote.Delete", len(text_notes_sorted))
+        count("TextNote.Create")
+
+        st.Commit()
+        report.add(UPDATED, row, sheet_number, target)
+        return True
+
+    except Exception as e:
+        st.RollBack()
+        report.add(ERROR, row, sheet_number, target, str(e))
+        return False
+
+
+#📤 EXPORT
+#------------------------------
+@traced()
+def sheet_export_row(doc, sheet, titleblock_text=None):
+    """Values of one sheet for the export workbook, in SHEET_EXPORT_HEADERS order.
+    titleblock_text - {"Project ID" / "Pre." / "Check" / "Appro." / "Date": text}, read once from the titleblock family"""
+    titleblock_text = titleblock_text or {}
+    rev_descs = [doc.GetElement(rev_id).Description for rev_id in sheet.GetAllRevisionIds()]
+    return [
+        sheet.SheetNumber,
+        sheet.Name,
+        get_param_value(sheet, "Sheet Issue Date"),
+        get_param_value(sheet, "Drawn By"),
+        get_param_value(sheet, "Checked By"),
+        get_param_value(sheet, "Designed By"),
+        get_param_value(sheet, "Approved By"),
+        titleblock_text.get("Project ID", ""),
+        get_param_value(sheet, "Sheet No._Origin"),
+        get_param_value(sheet, "Sheet No._Project phase"),
+        get_param_value(sheet, "Sheet No._Stage"),
+        get_param_value(sheet, "Sheet No._Facility-Area"),
+        get_param_value(sheet, "Sheet No._Floor-Zone-Street"),
+        get_param_value(sheet, "Sheet No._Doc type"),
+        get_param_value(sheet, "Sheet No._Discipline"),
+        sheet.SheetNumber,  # Ser No (same as Sheet Number)
+        read_general_notes(doc, sheet),
+        get_param_value(sheet, "Internal Revision"),
+        get_param_value(sheet, "Sheet No._Revision"),
+        "\n".join(rev_descs),
+        titleblock_text.get("Pre.", ""),
+        titleblock_text.get("Check", ""),
+        titleblock_text.get("Appro.", ""),
+        titleblock_text.get("Date", ""),
+    ]
@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+
+#⬇️ IMPORTS
+#------------------------------
+import datetime
+from Autodesk.Revit.DB import *
+
+# Custom Imports
+from Snippets._docstore import load_json, save_json
+from Snippets._overrides import override_signature, override_to_dict, override_from_dict, is_default_override
+from Snippets._trace import traced, count
+
+
+#📦 VARIABLES
+#------------------------------
+SNAPSHOT_FILE = "view_snapshots_{}.json"  # formatted with View UniqueId
+
+
+# Reusable Snippets
+
+class _Palette(object):
+    """Dedupes OverrideGraphicSettings: identical settings share one palette entry."""
+
+    def __init__(self):
+        self.entries  = []
+        self._indexes = {}
+
+    def index(self, override_settings):
+        signature = override_signature(override_settings)
+        idx = self._indexes.get(signature)
+        if idx is None:
+            idx = self._indexes[signature] = len(self.entries)
+            self.entries.append(override_to_dict(override_settings))
+        return idx
+
+
+def _all_categories(doc):
+    """Categories and their subcategories."""
+    for cat in doc.Settings.Categories:
+        yield cat
+        for sub in cat.SubCategories:
+            yield sub
+
+
+@traced()
+def capture_view_overrides(doc, view, name=""):
+    """Capture all non-default element- and category-level overrides of a view.
+
+    Returns a plain dict:
+    {"palette": [settings dict, ...],
+     "elements":   [[element id, palette index], ...],   sorted by id
+     "categories": [[category id, palette index], ...]}  sorted by id"""
+    palette = _Palette()
+
+    elements = []
+    for e_id in FilteredElementCollector(doc, view.Id).WhereElementIsNotElementType().ToElementIds():
+        override_settings = view.GetElementOverrides(e_id)
+        if not is_default_override(override_settings):
+            elements.append([e_id.IntegerValue, palette.index(override_settings)])
+
+    categories = []
+    for cat in _all_categories(doc):
+        if not view.IsCategoryOverridable(cat.Id):
+            continue
+        override_settings = view.GetCategoryOverrides(cat.Id)
+        if not is_default_override(override_settings):
+            categories.append([cat.Id.IntegerValue, palette.index(override_settings)])
+
+    return {"name":       name,
+            "view_id":    view.UniqueId,
+            "view_name":  view.Name,
+            "created":    datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "palette":    palette.entries,
+            "elements":   sorted(elements),
+            "categories": sorted(categories)}
+
+
+def _expand(snapshot, key):
+    """{id: settings signature} of one section of a snapshot."""
+    signatures = [override_signature(override_from_dict(entry)) for entry in snapshot["palette"]]
+    return {item_id: signatures[idx] for item_id, idx in snapshot.get(key, [])}
+
+
+def diff_snapshots(old, new):
+    """Compare two snapshots. Returns {"elements": {...}, "categories": {...}} with added/removed/changed id lists."""
+    result = {}
+    for key in ("elements", "categories"):
+        a, b = _expand(old, key), _expand(new, key)
+        result[key] = {"added":   sorted(set(b) - set(a)),
+                       "removed": sorted(set(a) - set(b)),
+                       "changed": sorted(i for i in set(a) & set(b) if a[i] != b[i])}
+    return result
+
+
+@traced()
+def restore_view_overrides(doc, view, snapshot):
+    """Bring a view back to a snapshot. Must be called inside an open Transaction.
+    Only the difference to the current state is written. Returns number of changed overrides."""
+    current  = capture_view_overrides(doc, view)
+    diff     = diff_snapshots(current, snapshot)
+    settings = [override_from_dict(entry) for entry in snapshot["palette"]]
+    reset    = OverrideGraphicSettings()
+    changes  = 0
+
+    elements = dict(snapshot.get("elements", []))
+    for e_id in diff["elements"]["removed"]:
+        view.SetElementOverrides(ElementId(e_id), reset)
+        changes += 1
+    for e_id in diff["elements"]["added"] + diff["elements"]["changed"]:
+        element_id = ElementId(e_id)
+        if doc.GetElement(element_id) is None:
+            continue  # Deleted since the snapshot
+        view.SetElementOverrides(element_id, settings[elements[e_id]])
+        changes += 1
+
+    categories = dict(snapshot.get("categories", []))
+    for cat_id in diff["categories"]["removed"]:
+        view.SetCategoryOverrides(ElementId(cat_id), reset)
+        changes += 1
+    for cat_id in diff["categories"]["added"] + diff["categories"]["changed"]:
+        view.SetCategoryOverrides(ElementId(cat_id), settings[categories[cat_id]])
+        changes += 1
+    count("View.Set*Overrides", changes)
+    return changes
+
+
+class SnapshotStore(object):
+    """Named snapshots of one view, stored in the document store.
+
+    e.g.
+    store = SnapshotStore(doc, view)
+    store.save("Before Overrides", capture_view_overrides(doc, view, "Before Overrides"))"""
+
+    def __init__(self, doc, view):
+        self.doc       = doc
+        self.file_name = SNAPSHOT_FILE.format(view.UniqueId)
+        self.snapshots = load_json(doc, self.file_name, {}) or {}
+
+    def names(self):
+        return sorted(self.snapshots)
+
+    def get(self, name):
+        return self.snapshots.get(name)
+
+    def save(self, name, snapshot):
+        self.snapshots[name] = snapshot
+        save_json(self.doc, self.file_name, self.snapshots)
+
+    def delete(self, name):
+        if self.snapshots.pop(name, None) is not None:
+            save_json(self.doc, self.file_name, self.snapshots)
@@ -0,0 +1,241 @@
+# -*- coding: utf-8 -*-
+"""Span timings and counters for button runs, flushed once to a Chrome trace file and a summary table.
+
+Tracing is off unless the PYANIRUDH_TRACE environment variable is set (1/true/yes) or start_trace(enabled=True).
+When off, span() returns a shared no-op object and count() returns right away.
+
+e.g.
+tracer = start_trace("Title-Block")
+with span("Export sheets", TRANSACTION):
+    for sheet in sheets:
+        with span("sheet_export_row"):
+            rows.append(sheet_export_row(doc, sheet))
+count("sheets", len(sheets))
+tracer.finish(output)   # -> %APPDATA%\\PyAnirudh\\traces\\Title-Block_20240115-093000.json
+
+Open the file in chrome://tracing or https://ui.perfetto.dev"""
+from __future__ import print_function
+
+#⬇️ IMPORTS
+#------------------------------
+import io
+import os
+import json
+import time
+import datetime
+import functools
+import threading
+from collections import deque
+
+from Snippets._docstore import get_store_root
+
+
+#📦 VARIABLES
+#------------------------------
+TRACE_ENV        = "PYANIRUDH_TRACE"
+TRACE_FOLDER     = "traces"
+DEFAULT_CAPACITY = 100000  # Spans kept in the ring buffer; the oldest are dropped first
+
+# Span categories
+BUTTON      = "button"
+FUNCTION    = "function"
+TRANSACTION = "transaction"
+IO          = "io"
+
+_clock = getattr(time, "perf_counter", None) or getattr(time, "clock", time.time)  # IronPython 2.7: time.clock
+
+
+# Reusable Snippets
+
+def trace_enabled_from_env():
+    return os.environ.get(TRACE_ENV, "").strip().lower() in ("1", "true", "yes", "on")
+
+
+class _NullSpan(object):
+    """Returned by span() while tracing is off."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span(object):
+    __slots__ = ("tracer", "name", "category", "args", "start")
+
+    def __init__(self, tracer, name, category, args):
+        self.tracer   = tracer
+        self.name     = name
+        self.category = category
+        self.args     = args
+
+    def __enter__(self):
+        self.start = _clock()
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        end = _clock()
+        if exc_type is not None:
+            self.args = dict(self.args or {}, error=exc_type.__name__)
+        self.tracer._add(self.name, self.category, self.start, end - self.start, self.args)
+        return False
+
+
+class Tracer(object):
+    """Spans and counters of one run, kept in memory until finish().
+    Spans are stored as (name, category, start, duration, thread id, args) in a ring buffer of capacity."""
+
+    def __init__(self, name, enabled=False, capacity=DEFAULT_CAPACITY):
+        self.name     = name
+        self.enabled  = enabled
+        self.spans    = deque(maxlen=capacity)
+        self.counters = {}
+        self.dropped  = 0
+        self.origin   = _clock()
+        self.started  = datetime.datetime.now()
+        self._root    = None
+
+    def span(self, name, category=FUNCTION, **args):
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, name, category, args or None)
+
+    def count(self, name, n=1):
+        if self.enabled:
+            self.counters[name] = self.counters.get(name, 0) + n
+
+    def _add(self, name, category, start, duration, args):
+        if len(self.spans) == self.spans.maxlen:
+            self.dropped += 1
+        self.spans.append((name, category, start, duration, threading.current_thread().ident, args))
+
+    # Output
+    def chrome_trace(self):
+        """Trace Event Format dict: one complete ("X") event per span, counters as a final "C" event."""
+        origin = self.origin
+        events = [{"name": "process_name", "ph": "M", "pid": 1, "args": {"name": self.name}}]
+        end = 0.0
+        for name, category, start, duration, tid, args in self.spans:
+            event = {"name": name, "cat": category, "ph": "X", "pid": 1, "tid": tid,
+                     "ts": round((start - origin) * 1e6, 3), "dur": round(duration * 1e6, 3)}
+            if args:
+                event["args"] = dict((k, v if isinstance(v, (int, float, bool)) else str(v)) for k, v in args.items())
+            events.append(event)
+            end = max(end, event["ts"] + event["dur"])
+        if self.counters:
+            events.append({"name": "counters", "ph": "C", "pid": 1, "ts": end, "args": dict(self.counters)})
+        return {"traceEvents": events, "displayTimeUnit": "ms",
+                "otherData": {"name": self.name, "started": self.started.isoformat(), "dropped_spans": self.dropped}}
+
+    def summary(self):
+        """[(name, category, calls, total s, mean s, max s)] sorted by total time (largest first)."""
+        totals = {}
+        for name, category, start, duration, tid, args in self.spans:
+            entry = totals.get((name, category))
+            if entry is None:
+                totals[(name, category)] = [1, duration, duration]
+            else:
+                entry[0] += 1
+                entry[1] += duration
+                entry[2] = max(entry[2], duration)
+        rows = [(name, category, calls, total, total / calls, longest)
+                for (name, category), (calls, total, longest) in totals.items()]
+        return sorted(rows, key=lambda row: -row[3])
+
+    def write(self, path=None):
+        """Write the Chrome trace JSON (default: <store root>/traces/<name>_<timestamp>.json). Returns the path."""
+        if path is None:
+            folder = os.path.join(get_store_root(), TRACE_FOLDER)
+            if not os.path.isdir(folder):
+                os.makedirs(folder)
+            safe_name = "".join(c if c.isalnum() or c in "-_" else "_" for c in self.name)
+            path = os.path.join(folder, "{}_{}.json".format(safe_name, self.started.strftime("%Y%m%d-%H%M%S")))
+        data = json.dumps(self.chrome_trace(), ensure_ascii=False)
+        with io.open(path, "w", encoding="utf-8") as f:
+            f.write(data if isinstance(data, type(u"")) else data.decode("utf-8"))
+        return path
+
+    def render(self, output=None, limit=30):
+        """Summary table (and counters) in the pyRevit output window, or printed without one."""
+        rows = [[name, category, calls, "{:.1f}".format(total * 1000), "{:.2f}".format(mean * 1000),
+                 "{:.1f}".format(longest * 1000)] for name, category, calls, total, mean, longest in self.summary()[:limit]]
+        columns = ["Span", "Category", "Calls", "Total ms", "Mean ms", "Max ms"]
+        counters = [[name, value] for name, value in sorted(self.counters.items())]
+        if output is not None:
+            if rows:
+                output.print_table(table_data=rows, title="Trace: {}".format(self.name), columns=columns)
+            if counters:
+                output.print_table(table_data=counters, title="Counters", columns=["Counter", "Count"])
+            return
+        for row in [columns] + rows:
+            print("  ".join(str(value) for value in row))
+        for name, value in counters:
+            print("{}: {}".format(name, value))
+
+    def finish(self, output=None, path=None):
+        """Close the root span, write the trace file and show the summary. Does nothing while disabled.
+        Returns the trace file path (None while disabled)."""
+        if not self.enabled:
+            return None
+        if self._root is not None:
+            self._root.__exit__(None, None, None)
+            self._root = None
+        path = self.write(path)
+        self.render(output)
+        if output is not None:
+            output.print_md("Trace written to `{}`".format(path))
+        else:
+            print("Trace written to {}".format(path))
+        return path
+
+
+_tracer = Tracer("PyAnirudh")
+
+
+def start_trace(name, enabled=None, capacity=DEFAULT_CAPACITY):
+    """New shared Tracer for a button run, with a root span covering the whole run.
+    enabled defaults to the PYANIRUDH_TRACE environment variable."""
+    global _tracer
+    _tracer = Tracer(name, trace_enabled_from_env() if enabled is None else enabled, capacity)
+    if _tracer.enabled:
+        _tracer._root = _tracer.span(name, BUTTON).__enter__()
+    return _tracer
+
+
+def get_tracer():
+    return _tracer
+
+
+def span(name, category=FUNCTION, **args):
+    """Span on the shared tracer: with span("Apply overrides", TRANSACTION, views=3): ..."""
+    return _tracer.span(name, category, **args)
+
+
+def count(name, n=1):
+    """Add n to a counter on the shared tracer, e.g. count("View.SetElementOverrides", len(ids))."""
+    if _tracer.enabled:
+        _tracer.counters[name] = _tracer.counters.get(name, 0) + n
+
+
+def traced(name=None, category=FUNCTION):
+    """Decorator: run the function inside a span named after it (or name).
+
+    e.g.
+    @traced()
+    def apply_rules(doc, view, rules): ..."""
+    def decorate(func):
+        label = name or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            tracer = _tracer
+            if not tracer.enabled:
+                return func(*args, **kwargs)
+            with _Span(tracer, label, category, None):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorate
@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+import os
+import sys
+
+import pytest
+
+# Snippets are imported as "Snippets._xxx", the way pyRevit puts lib/ on sys.path
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+LIB_DIR  = os.path.join(ROOT_DIR, "lib")
+for path in (LIB_DIR, ROOT_DIR):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+# Snippets import Autodesk.Revit.DB, clr and System at module level: use the stand-in API
+import fakerevit
+fakerevit.install()
+
+from fakerevit.model import generate_model
+
+
+@pytest.fixture
+def model():
+    """Small synthetic model: 1000 instances on 4 levels, 5 sheets."""
+    return generate_model(1000, levels=4, sheets=5)
+
+
+@pytest.fixture(autouse=True)
+def document_store(tmp_path, monkeypatch):
+    """Keep Snippets._docstore files (registries, journals) out of the real user folder."""
+    monkeypatch.setenv("APPDATA", str(tmp_path))
+    return tmp_path
@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+from collections import OrderedDict
+
+from benchmarks.runner import run_suite, save_run, load_run, latest_run_path, compare_runs
+from benchmarks.scenarios import SCENARIOS, Scenario
+
+
+def tiny(name, scale):
+    s = SCENARIOS[name]
+    return Scenario(s.name, s.button, s.unit, OrderedDict([("tiny", scale)]), s.setup, s.run)
+
+
+def test_every_scenario_runs_at_a_tiny_scale():
+    scenarios = [tiny(name, 5 if s.unit in ("sheets", "rows", "views") else 400) for name, s in SCENARIOS.items()]
+    run = run_suite(scenarios, ["tiny"], repeat=1, memory=False)
+    assert [r["scenario"] for r in run["results"]] == list(SCENARIOS)
+    for result in run["results"]:
+        assert result["items"] > 0, result["scenario"]
+        assert result["api_calls"] == sum(result["calls"].values()) > 0
+
+
+def test_results_round_trip_and_compare(tmp_path):
+    run = run_suite([tiny("parameter-apply", 400)], ["tiny"], repeat=1)
+    first = save_run(run, str(tmp_path))
+    second = save_run(run, str(tmp_path))  # Same second: must not overwrite
+    assert first != second
+    assert latest_run_path(str(tmp_path)) == second
+    assert load_run(first) == run
+
+    slower = load_run(first)
+    slower["results"][0]["wall_time"] += 1.0
+    rows = compare_runs(run, slower)
+    assert len(rows) == 1 and rows[0]["regression"]
+    assert not compare_runs(slower, run)[0]["regression"]
+
+    more_calls = load_run(first)
+    more_calls["results"][0]["api_calls"] += 1
+    assert compare_runs(run, more_calls)[0]["regression"]
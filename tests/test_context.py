@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+from Snippets import _context
+from Snippets._context import DocumentContext, StaticBackend, RevitBackend, VIEW_SCOPE, get_context, set_backend
+
+
+class StandInDocument(object):
+    def __init__(self, title, path=""):
+        self.Title    = title
+        self.PathName = path
+
+
+class StandInId(object):
+    def __init__(self, value):
+        self.IntegerValue = value
+
+
+class StandInView(object):
+    def __init__(self, value):
+        self.Id = StandInId(value)
+
+
+@pytest.fixture
+def backend():
+    return StaticBackend(StandInDocument("Model A", "C:/A.rvt"), active_view=StandInView(1))
+
+
+@pytest.fixture(autouse=True)
+def restore_shared_context():
+    yield
+    _context._context = None
+
+
+def test_nothing_is_resolved_before_first_access():
+    calls = []
+
+    class CountingBackend(StaticBackend):
+        def doc(self):
+            calls.append("doc")
+            return StaticBackend.doc(self)
+
+    ctx = DocumentContext(CountingBackend(StandInDocument("Model A")))
+    assert calls == []
+    assert ctx.doc.Title == "Model A"
+    assert calls == ["doc"]
+
+
+def test_document_cache_is_computed_once(backend):
+    ctx = DocumentContext(backend)
+    calls = []
+    factory = lambda: calls.append(1) or len(calls)
+    assert ctx.cache("value", factory) == 1
+    assert ctx.cache("value", factory) == 1
+    assert len(calls) == 1
+
+
+def test_document_switch_resets_caches(backend):
+    ctx = DocumentContext(backend)
+    ctx.cache("value", lambda: "A")
+    backend.doc_ = StandInDocument("Model B", "C:/B.rvt")
+    assert ctx.cache("value", lambda: "B") == "B"
+    assert ctx.doc.Title == "Model B"
+
+
+def test_view_switch_resets_only_view_caches(backend):
+    ctx = DocumentContext(backend)
+    ctx.cache("doc_value", lambda: "doc")
+    ctx.cache("view_value", lambda: "view 1", scope=VIEW_SCOPE)
+
+    backend.view_ = StandInView(2)
+    assert ctx.cache("view_value", lambda: "view 2", scope=VIEW_SCOPE) == "view 2"
+    assert ctx.cache("doc_value", lambda: "recomputed") == "doc"
+
+
+def test_reset_drops_everything(backend):
+    ctx = DocumentContext(backend)
+    ctx.cache("value", lambda: 1)
+    ctx.reset()
+    assert ctx.cache("value", lambda: 2) == 2
+
+
+def test_set_backend_replaces_shared_context(backend):
+    ctx = set_backend(backend)
+    assert get_context() is ctx
+    assert get_context().doc.Title == "Model A"
+
+
+def test_revit_backend_fails_clearly_without_revit():
+    ctx = DocumentContext(RevitBackend())
+    with pytest.raises(RuntimeError):
+        ctx.doc
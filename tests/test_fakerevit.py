@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+from Autodesk.Revit.DB import *
+from Autodesk.Revit.DB.Architecture import Room
+from Autodesk.Revit.Exceptions import ModificationOutsideTransactionException, ArgumentException
+from fakerevit import CALLS, reset_calls
+from fakerevit.model import generate_model, _split
+
+
+def first_door(doc):
+    return FilteredElementCollector(doc).OfCategory(BuiltInCategory.OST_Doors).WhereElementIsNotElementType().FirstElement()
+
+
+def test_generate_model_is_deterministic_and_sized():
+    a, b = generate_model(2000, seed=3), generate_model(2000, seed=3)
+    instances = FilteredElementCollector(a).WhereElementIsNotElementType().ToElements()
+    assert a.element_count == b.element_count
+    assert sum(count for _, count in _split(2000)) == 2000
+    assert len([e for e in instances if e.Category is not None and e.Category.CategoryType == CategoryType.Model]) == 2000
+
+
+def test_collector_filters(model):
+    walls = FilteredElementCollector(model).OfCategory(BuiltInCategory.OST_Walls).WhereElementIsNotElementType()
+    assert walls.GetElementCount() == 300
+    assert all(isinstance(w, Wall) for w in walls)
+
+    cats = ElementMulticategoryFilter([BuiltInCategory.OST_Doors, BuiltInCategory.OST_Windows])
+    doors_windows = FilteredElementCollector(model).WherePasses(cats).WhereElementIsNotElementType().ToElements()
+    assert len(doors_windows) == 280
+
+    wall_types = FilteredElementCollector(model).OfClass(WallType).ToElements()
+    assert all(t.is_type for t in wall_types) and wall_types
+
+
+def test_view_collector_and_visibility(model):
+    view  = model.ActiveView
+    level = view.GenLevel
+    in_view = FilteredElementCollector(model, view.Id).WhereElementIsNotElementType().ToElements()
+    model_elems = [e for e in in_view if e.OwnerViewId == ElementId.InvalidElementId]
+    assert model_elems and all(e.LevelId == level.Id for e in model_elems)
+
+    visible = FilteredElementCollector(model, view.Id).WherePasses(VisibleInViewFilter(model, view.Id)).ToElements()
+    assert len(visible) == len(in_view) - len(view.hidden_ids)
+
+
+def test_changes_need_a_transaction_and_roll_back(model):
+    door = first_door(model)
+    comments = door.LookupParameter("Comments")
+    with pytest.raises(ModificationOutsideTransactionException):
+        comments.Set("outside")
+
+    t = Transaction(model, "Edit")
+    t.Start()
+    assert comments.Set("inside")
+    assert not comments.Set(5)  # Wrong StorageType
+    t.RollBack()
+    assert comments.AsString() == "Synthetic 0"
+
+
+def test_subtransaction_rollback_keeps_outer_changes(model):
+    sheet = FilteredElementCollector(model).OfClass(ViewSheet).FirstElement()
+    t = Transaction(model, "Edit")
+    t.Start()
+    sheet.LookupParameter("Drawn By").Set("XX")
+    st = SubTransaction(model)
+    st.Start()
+    model.Delete(sheet.Id)
+    st.RollBack()
+    t.Commit()
+    assert model.GetElement(sheet.Id) is sheet
+    assert sheet.LookupParameter("Drawn By").AsString() == "XX"
+
+
+def test_class_filter_refuses_rooms(model):
+    with pytest.raises(ArgumentException):
+        FilteredElementCollector(model).WherePasses(ElementMulticlassFilter([Room]))
+
+
+def test_calls_are_counted(model):
+    reset_calls()
+    door = first_door(model)
+    door.LookupParameter("Mark")
+    assert CALLS["FilteredElementCollector"] == 1
+    assert CALLS["Element.LookupParameter"] == 1
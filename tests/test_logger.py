@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+import io
+import json
+import os
+import time
+
+from Snippets._logger import BufferedLogger, get_logger, get_log_dir, LOG_DIR_ENV, DEBUG
+
+
+def read_lines(path):
+    with io.open(path, "r", encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+def test_records_stay_in_memory_until_flushed(tmp_path):
+    path = str(tmp_path / "Parameters.jsonl")
+    log = BufferedLogger("Parameters", path=path, flush_interval=None)
+    log.info("Removing binding for parameter: {}", u"Brandklass", parameter=u"Brandklass")
+    log.error("Delete operation failed")
+    assert not os.path.exists(path)
+
+    assert log.flush() == 2
+    first, second = read_lines(path)
+    assert list(first) == ["ts", "level", "logger", "message", "parameter"]
+    assert first["message"] == u"Removing binding for parameter: Brandklass" and first["level"] == "info"
+    assert second["level"] == "error" and first["ts"] <= second["ts"]
+
+    log.info("appended")
+    log.close()
+    assert len(read_lines(path)) == 3
+
+
+def test_records_below_the_level_are_dropped(tmp_path):
+    path = str(tmp_path / "levels.jsonl")
+    log = BufferedLogger("levels", path=path, flush_interval=None)
+    log.debug("dropped")
+    log.info("kept")
+    log.warning("kept too")
+    assert len(log._buffer) == 2
+
+    verbose = BufferedLogger("levels", path=path, flush_interval=None, level=DEBUG)
+    verbose.debug("kept as well")
+    assert log.close() + verbose.close() == 3
+    assert [line["level"] for line in read_lines(path)] == ["info", "warning", "debug"]
+
+
+def test_rotates_by_size(tmp_path):
+    path = str(tmp_path / "rotate.jsonl")
+    log = BufferedLogger("rotate", path=path, max_bytes=300, backups=2, flush_interval=None)
+    for i in range(12):
+        log.info("message number {}", i)
+        log.flush()
+    assert os.path.exists(path + ".1") and os.path.exists(path + ".2") and not os.path.exists(path + ".3")
+    assert all(os.path.getsize(p) <= 300 for p in (path, path + ".1", path + ".2"))
+    assert read_lines(path)[-1]["message"] == "message number 11"
+
+
+def test_background_thread_flushes(tmp_path):
+    path = str(tmp_path / "bg.jsonl")
+    log = BufferedLogger("bg", path=path, flush_interval=0.01)
+    log.info("from the button")
+    deadline = time.time() + 2.0
+    while not os.path.exists(path) and time.time() < deadline:
+        time.sleep(0.01)
+    assert read_lines(path)[0]["message"] == "from the button"
+    log.close()
+
+
+def test_default_path_and_unwritable_folder(document_store, monkeypatch):
+    assert get_log_dir() == os.path.join(str(document_store), "PyAnirudh", "logs")
+    monkeypatch.setenv(LOG_DIR_ENV, str(document_store / "custom"))
+    log = get_logger("Custom", flush_interval=None)
+    assert log.path == os.path.join(str(document_store), "custom", "Custom.jsonl")
+    assert get_logger("Custom") is log
+    log.info("hello")
+    log.close()
+    assert get_logger("Custom") is not log
+
+    blocked = document_store / "blocked"
+    blocked.write_text(u"a file, not a folder")
+    broken = BufferedLogger("broken", path=str(blocked / "x.jsonl"), flush_interval=None)
+    broken.info("lost")
+    assert broken.close() == 0 and broken.write_errors == 1
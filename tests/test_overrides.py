@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+from Autodesk.Revit.DB import *
+from Snippets._overrides import (StructuralWallClassifier, OverrideRegistry, build_override_settings,
+                                 apply_element_overrides, reset_recorded_overrides, override_to_dict,
+                                 override_from_dict, is_default_override, get_solid_fill_pattern_id)
+from Snippets._runlog import RunLog, APPLIED, STRUCTURAL, NO_BBOX
+from Snippets._heatmap import ParameterReader
+from Snippets._overriderules import load_rules_config, compile_rules, apply_rules, RuleConfigError
+from fakerevit import CALLS, reset_calls
+from fakerevit.model import WALL_TYPES
+
+
+def test_structural_wall_types(model):
+    classifier = StructuralWallClassifier(model)
+    verdicts = dict((t.Name, classifier.is_structural_type(t.Id))
+                    for t in FilteredElementCollector(model).OfClass(WallType))
+    assert verdicts == {
+        "Generic - 200mm": False, "Exterior - Brick": False, "Partition - 100mm": False,
+        "Bearing - 300mm": True, "Retaining - 400mm": True, "Shear - Steel Stud": True, "Core - Concrete": True,
+    }
+    assert len(verdicts) == len(WALL_TYPES)
+
+
+def test_apply_element_overrides_skips_structural_walls_and_empty_models(model):
+    view = model.ActiveView
+    log = RunLog(model)
+    t = Transaction(model, "Overrides")
+    t.Start()
+    overridden = apply_element_overrides(model, view, build_override_settings(), StructuralWallClassifier(model), log)
+    t.Commit()
+
+    assert log.counters["OST_Walls"][STRUCTURAL] > 0
+    assert log.counters["OST_GenericModel"][NO_BBOX] > 0
+    assert sum(counts.get(APPLIED, 0) for counts in log.counters.values()) == len(overridden)
+    overridden_ids = set(e_id.IntegerValue for e_id in overridden)
+    assert not overridden_ids & view.hidden_ids
+    assert not is_default_override(view.GetElementOverrides(overridden[0]))
+
+
+def test_registry_reset_touches_recorded_elements_only(model):
+    view = model.ActiveView
+    registry = OverrideRegistry(model)
+    t = Transaction(model, "Overrides")
+    t.Start()
+    overridden = apply_element_overrides(model, view, build_override_settings(), StructuralWallClassifier(model),
+                                         RunLog(model))
+    registry.record(view, overridden)
+    registry.save()
+    assert reset_recorded_overrides(model, view, OverrideRegistry(model)) == len(overridden)
+    t.Commit()
+    assert all(is_default_override(view.GetElementOverrides(e_id)) for e_id in overridden)
+
+
+def test_override_dict_round_trip(model):
+    settings = build_override_settings((10, 20, 30), line_weight=3, transparency=40)
+    settings.SetSurfaceForegroundPatternId(get_solid_fill_pattern_id(model))
+    data = override_to_dict(settings)
+    assert data["projection_line_color"] == [10, 20, 30]
+    assert data["surface_transparency"] == 40
+    assert override_to_dict(override_from_dict(data)) == data
+    assert override_to_dict(OverrideGraphicSettings()) == {}
+
+
+def test_parameter_reader_scans_names_once_per_type(model):
+    elements = list(FilteredElementCollector(model).WhereElementIsNotElementType())
+    types = set((e.Category.Id.IntegerValue if e.Category else None, e.GetTypeId().IntegerValue) for e in elements)
+
+    def direct(elem, name):
+        param = elem.LookupParameter(name)
+        if param is None:
+            elem_type = model.GetElement(elem.GetTypeId())
+            param = elem_type.LookupParameter(name) if elem_type else None
+        return ParameterReader._value(param)
+
+    reader = ParameterReader(model, "Type Mark")
+    reset_calls()
+    values = [reader.read(e) for e in elements]
+    assert CALLS["Element.LookupParameter"] <= 2 * len(types)  # Instance miss + type read, once per category + type
+    assert values == [direct(e, "Type Mark") for e in elements]
+    assert any(value for _, value in values)
+
+    reader = ParameterReader(model, "Comments")  # Instance parameter: read through the Definition
+    assert [reader.read(e) for e in elements] == [direct(e, "Comments") for e in elements]
+
+
+def test_rule_without_matching_types_is_kept_and_validated(model):
+    no_types = {"name": "Curtain walls", "categories": ["OST_Walls"],
+                "types": [{"param": "SYMBOL_NAME_PARAM", "op": "contains", "value": "No such type"}],
+                "python": [{"predicate": "structural_wall"}],
+                "overrides": {"halftone": True}}
+    partitions = {"name": "Partitions", "categories": ["OST_Walls"],
+                  "types": [{"param": "SYMBOL_NAME_PARAM", "op": "contains", "value": "Partition"}],
+                  "overrides": {"projection_line_weight": 3}}
+    rules = compile_rules(model, {"rules": [no_types, partitions]})
+    assert [rule.name for rule in rules] == ["Curtain walls", "Partitions"]
+
+    t = Transaction(model, "Rules")
+    t.Start()
+    matches, overridden = apply_rules(model, model.ActiveView, rules)
+    t.Commit()
+    assert matches[0] == ("Curtain walls", 0)
+    assert matches[1][1] == len(overridden) > 0
+
+    typo = dict(no_types, python=[{"predicate": "structual_wall"}])
+    with pytest.raises(RuleConfigError):
+        compile_rules(model, {"rules": [typo]})
+
+
+def test_yaml_syntax_errors_are_config_errors(tmp_path):
+    pytest.importorskip("yaml")
+    good = tmp_path / "rules.yaml"
+    good.write_text(u"name: Walls\nrules:\n  - name: Fire\n    categories: [Walls]\n")
+    assert load_rules_config(str(good))["rules"][0]["categories"] == ["Walls"]
+
+    bad = tmp_path / "bad.yml"
+    bad.write_text(u"name: Walls\nrules: [unclosed\n")
+    with pytest.raises(RuleConfigError):
+        load_rules_config(str(bad))
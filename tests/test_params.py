@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+from Autodesk.Revit.DB import *
+from Snippets._params import safe_set_value, has_value, collect_similar_elements, apply_parameter_values
+
+
+def doors(doc):
+    return list(FilteredElementCollector(doc).OfCategory(BuiltInCategory.OST_Doors).WhereElementIsNotElementType())
+
+
+@pytest.fixture
+def transaction(model):
+    t = Transaction(model, "Test")
+    t.Start()
+    yield t
+    if t.GetStatus() == TransactionStatus.Started:
+        t.RollBack()
+
+
+@pytest.mark.parametrize("name, value, expected", [
+    ("Fire Rating", 60, "60"),
+    ("Is Existing", "Yes", 1),
+    ("Is Existing", "Vertical", 0),
+    ("Cost", "1,250.50 EUR", 1250.5),
+    ("Cost", "n/a", None),
+])
+def test_safe_set_value_converts_to_storage_type(model, transaction, name, value, expected):
+    param = doors(model)[0].LookupParameter(name)
+    safe_set_value(param, value)
+    actual = {StorageType.String: param.AsString, StorageType.Integer: param.AsInteger,
+              StorageType.Double: param.AsDouble}[param.StorageType]()
+    assert actual == (expected if expected is not None else 0.0)
+
+
+def test_has_value(model, transaction):
+    door = doors(model)[1]
+    assert not has_value(door.LookupParameter("Comments"))
+    assert has_value(door.LookupParameter("Is Existing"))  # Integers always have a value
+    door.LookupParameter("Comments").Set("  ")
+    assert not has_value(door.LookupParameter("Comments"))
+    assert has_value(door.LookupParameter("Type"))
+
+
+def test_collect_similar_elements_matches_category_and_type(model):
+    base = doors(model)[0]
+    similar = collect_similar_elements(model, base)
+    expected = [d for d in doors(model) if d.GetTypeId() == base.GetTypeId()]
+    assert [e.Id for e in similar] == [e.Id for e in expected]
+    assert base.Id in [e.Id for e in similar]
+
+
+def test_apply_parameter_values_writes_every_element_once(model, transaction):
+    similar = collect_similar_elements(model, doors(model)[0])
+    written = apply_parameter_values(similar, {"Fire Rating": "60 min", "Cost": "12.5", "Type": "1"})
+    transaction.Commit()
+    assert written == 2 * len(similar)  # "Type" is read-only
+    assert all(d.LookupParameter("Fire Rating").AsString() == "60 min" for d in similar)
+    assert all(d.LookupParameter("Cost").AsDouble() == 12.5 for d in similar)
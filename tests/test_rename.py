@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+import io
+
+from Autodesk.Revit.DB import *
+from Snippets._rename import (NamePlanner, RENAME_TARGETS, RenameRule, RuleChain, TokenResolver, get_name,
+                              set_name, write_names, journal_entries, RenameJournal, plan_revert)
+
+
+def plans(doc):
+    """Floor plans 'Level 1' .. 'Level 4'."""
+    return sorted((v for v in FilteredElementCollector(doc).OfClass(ViewPlan) if v.ViewType == ViewType.FloorPlan),
+                  key=lambda v: v.Name)
+
+
+def rename(doc, renames, writer=set_name):
+    """Plan and write [(view, new name)] in one Transaction. Returns (plan, errors)."""
+    plan = RENAME_TARGETS["Views"].plan(doc, [(v, v.Name, new) for v, new in renames])
+    t = Transaction(doc, "Rename")
+    t.Start()
+    errors = write_names(plan, writer)
+    t.Commit()
+    return plan, errors
+
+
+def failing_on(elem, name):
+    """set_name that refuses to give elem the given name."""
+    def writer(e, n):
+        if e.Id == elem.Id and n == name:
+            raise InvalidOperationException("refused")
+        set_name(e, n)
+    return writer
+
+
+def test_failed_write_after_parking_keeps_the_element_revertable(model):
+    a, b = plans(model)[:2]
+    plan, errors = rename(model, [(a, "Level 2"), (b, "Level 1")], failing_on(a, "Level 2"))
+    # B took 'Level 1', so A can't get its old name back either: it stays parked
+    assert (a.Name, b.Name) == ("Level 2 ~renaming", "Level 1")
+    assert [(e.Id, current, new) for e, current, new, _ in errors] == [(a.Id, "Level 2 ~renaming", "Level 2")]
+    assert sorted(journal_entries(plan, errors)) == sorted([(a.UniqueId, "Level 1", "Level 2 ~renaming"),
+                                                            (b.UniqueId, "Level 2", "Level 1")])
+
+
+def test_parked_element_gets_its_old_name_back_when_it_is_free(model):
+    a, b = plans(model)[:2]
+    plan, errors = rename(model, [(a, "Level 2"), (b, "Level 1")], failing_on(b, "Level 1"))
+    # B's write failed, so 'Level 2' stays taken: A's final write fails and A is moved back
+    assert (a.Name, b.Name) == ("Level 1", "Level 2")
+    assert sorted(current for _, current, _, _ in errors) == ["Level 1", "Level 2"]
+    assert journal_entries(plan, errors) == []
+
+
+def test_swap_and_three_cycle(model):
+    a, b, c, d = plans(model)
+    plan, errors = rename(model, [(a, "Level 2"), (b, "Level 1")])
+    assert errors == [] and (a.Name, b.Name) == ("Level 2", "Level 1")
+
+    plan, errors = rename(model, [(a, "Level 3"), (c, "Level 4"), (d, "Level 2")])  # a -> c -> d -> a
+    assert errors == []
+    assert (a.Name, c.Name, d.Name) == ("Level 3", "Level 4", "Level 2")
+    assert not any("~renaming" in v.Name for v in plans(model))
+
+
+def test_failed_write_without_parking_keeps_the_old_name(model):
+    a, b = plans(model)[:2]
+    plan, errors = rename(model, [(a, "Ground"), (b, "First")], failing_on(a, "Ground"))
+    assert (a.Name, b.Name) == ("Level 1", "First")
+    assert [(e.Id, current) for e, current, _, _ in errors] == [(a.Id, "Level 1")]
+    assert journal_entries(plan, errors) == [(b.UniqueId, "Level 2", "First")]
+
+
+def test_name_planner_suffixes_collisions():
+    planner = NamePlanner([("FloorPlan", "Plan"), ("FloorPlan", "Plan (2)"), ("CeilingPlan", "Other")])
+    plan = planner.plan([("v1", "FloorPlan", "A", "Plan"),
+                         ("v2", "FloorPlan", "B", "Plan"),
+                         ("v3", "CeilingPlan", "C", "Plan"),   # Other namespace: no clash
+                         ("v4", "FloorPlan", "D", "D"),        # Unchanged: left out, keeps its name
+                         ("v5", "FloorPlan", "E", "D")])
+    assert plan == [("v1", "FloorPlan", "A", "Plan (3)"), ("v2", "FloorPlan", "B", "Plan (4)"),
+                    ("v3", "CeilingPlan", "C", "Plan"), ("v5", "FloorPlan", "E", "D (2)")]
+
+
+def test_name_planner_lets_names_move_within_a_batch():
+    planner = NamePlanner([("FloorPlan", "A"), ("FloorPlan", "B")])
+    plan = planner.plan([("v1", "FloorPlan", "A", "B"), ("v2", "FloorPlan", "B", "A")])
+    assert [final for _, _, _, final in plan] == ["B", "A"]
+
+
+def test_tokens_and_rule_chain(model):
+    tokens = TokenResolver(model)
+    view = plans(model)[0]
+    sheet = sorted(FilteredElementCollector(model).OfClass(ViewSheet).ToElements(), key=lambda s: s.SheetNumber)[0]
+    assert tokens.resolve(view, "level") == view.GenLevel.Name
+    assert tokens.resolve(view, "scale") == str(view.Scale)
+    assert tokens.resolve(view, "view_type") == "FloorPlan"
+    assert tokens.resolve(sheet, "sheet_number") == sheet.SheetNumber
+    assert tokens.resolve(sheet, "scale") == ""
+    assert tokens.resolve(view, "name") == get_name(view)
+
+    chain = RuleChain([RenameRule(r"^Level (\d+)$", r"L\1 {scale}"),
+                       RenameRule("L", "Lvl", regex=False)], prefix="{view_type} - ")
+    assert chain.apply(view.Name, view, tokens) == "FloorPlan - Lvl1 {}".format(view.Scale)
+    assert RenameRule(r"\d", r"{level}").apply("X1", view, tokens) == "X" + view.GenLevel.Name
+    assert RenameRule("a.b", "[c]", regex=False).apply("a.b axb") == "[c] axb"
+
+    preview = chain.preview(model, [view])
+    assert preview == [(view, view.Name, "FloorPlan - Lvl1 {}".format(view.Scale))]
+
+
+def journaled(doc, renames):
+    """rename() and append the batch to a fresh RenameJournal. Returns the batch number."""
+    plan, errors = rename(doc, renames)
+    return RenameJournal(doc).append("Views", journal_entries(plan, errors))
+
+
+def test_journal_round_trip_and_revert_after_a_later_batch(model):
+    a, b, c = plans(model)[:3]
+    first = journaled(model, [(a, "Ground"), (b, "First")])
+    second = journaled(model, [(a, "Ground Floor"), (c, "Second")])
+
+    journal = RenameJournal(model)  # Reopened: index and entries come from the document store
+    assert [info["batch"] for info in journal.batches] == [first, second] == [1, 2]
+    assert journal.read(first) == [(a.UniqueId, "Level 1", "Ground"), (b.UniqueId, "Level 2", "First")]
+    assert journal.read(second) == [(a.UniqueId, "Ground", "Ground Floor"), (c.UniqueId, "Level 3", "Second")]
+
+    plan, conflicts = plan_revert(model, journal, first)
+    assert conflicts == [(a.UniqueId, "Level 1", "Ground", "Renamed since to 'Ground Floor'")]
+    assert [(elem.Id, final) for elem, _, _, final in plan] == [(b.Id, "Level 2")]
+
+    t = Transaction(model, "Revert")
+    t.Start()
+    errors = write_names(plan, set_name)
+    t.Commit()
+    revert = journal.append("Views", journal_entries(plan, errors), reverts=first)
+    assert (a.Name, b.Name, c.Name) == ("Ground Floor", "Level 2", "Second")
+    assert RenameJournal(model).get(first)["reverted_by"] == revert == 3
+
+
+def test_journal_appends_after_a_partial_trailing_line(model):
+    a, b = plans(model)[:2]
+    first = journaled(model, [(a, "Ground")])
+    journal = RenameJournal(model)
+    with io.open(journal.path, "ab") as f:
+        f.write(b'[9,"cut short')  # A batch whose write was interrupted and never made the index
+    size = len(io.open(journal.path, "rb").read())
+
+    second = journaled(model, [(b, "First")])
+    journal = RenameJournal(model)
+    assert journal.get(second)["offset"] == size + 1
+    assert journal.read(first) == [(a.UniqueId, "Level 1", "Ground")]
+    assert journal.read(second) == [(b.UniqueId, "Level 2", "First")]
@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+from Autodesk.Revit.DB import *
+from fakerevit.model import generate_model
+from Snippets._rooms import (RoomNumberIndex, get_all_rooms, get_placed_rooms, apply_room_numbers, level_prefix,
+                             level_prefixes, plan_room_numbers, POLICY_SUFFIX, POLICY_NEXT, POLICY_SKIP)
+
+
+@pytest.fixture
+def rooms(model):
+    """(outside, a, b): three rooms of the same phase numbered 101, 102 and 999. Every other room gets R<id>."""
+    all_rooms = get_all_rooms(model)
+    t = Transaction(model, "Numbers")
+    t.Start()
+    for room in all_rooms:
+        room.Number = "R{}".format(room.Id.IntegerValue)
+    outside, a, b = all_rooms[:3]
+    outside.Number, a.Number, b.Number = "101", "102", "999"
+    t.Commit()
+    return outside, a, b
+
+
+def apply(model, plan):
+    t = Transaction(model, "Renumber")
+    t.Start()
+    apply_room_numbers(plan)
+    t.Commit()
+    return RoomNumberIndex(get_all_rooms(model)).duplicates()
+
+
+def test_validate_reports_collisions_with_rooms_outside_the_plan(model, rooms):
+    outside, a, b = rooms
+    index = RoomNumberIndex(get_all_rooms(model))
+    assert index.validate([(b, "101"), (a, "102")]) == [(b, "101")]
+    assert index.validate([(b, "102"), (a, "999")]) == []  # Swapping numbers inside the plan is fine
+
+
+def test_suffix_policy(model, rooms):
+    outside, a, b = rooms
+    plan, resolutions = RoomNumberIndex(get_all_rooms(model)).resolve([(b, "101"), (a, "101")], POLICY_SUFFIX)
+    assert [number for _, number in plan] == ["101A", "101B"]
+    assert [(proposed, final) for _, proposed, final in resolutions] == [("101", "101A"), ("101", "101B")]
+    assert apply(model, plan) == []
+
+
+def test_next_free_number_policy(model, rooms):
+    outside, a, b = rooms
+    plan, resolutions = RoomNumberIndex(get_all_rooms(model)).resolve([(b, "101"), (a, "101")], POLICY_NEXT)
+    assert [number for _, number in plan] == ["102", "103"]
+    assert len(resolutions) == 2
+    assert apply(model, plan) == []
+
+
+def test_skip_policy_reserves_the_numbers_skipped_rooms_keep(model, rooms):
+    outside, a, b = rooms
+    # A is skipped and keeps 102, so B may not take 102 either
+    plan, resolutions = RoomNumberIndex(get_all_rooms(model)).resolve([(b, "102"), (a, "101")], POLICY_SKIP)
+    assert plan == []
+    assert [(room.Id, proposed, final) for room, proposed, final in resolutions] == [(b.Id, "102", None),
+                                                                                    (a.Id, "101", None)]
+    assert apply(model, plan) == []
+    assert (a.Number, b.Number) == ("102", "999")
+
+
+def test_skip_policy_keeps_entries_that_do_not_collide(model, rooms):
+    outside, a, b = rooms
+    plan, resolutions = RoomNumberIndex(get_all_rooms(model)).resolve([(b, "500"), (a, "101")], POLICY_SKIP)
+    assert plan == [(b, "500")]
+    assert [final for _, _, final in resolutions] == [None]
+    assert apply(model, plan) == []
+
+
+def test_level_prefixes_fall_back_to_elevation_order_when_numbers_repeat(model):
+    levels = sorted(FilteredElementCollector(model).OfClass(Level), key=lambda l: l.Elevation)
+    assert list(level_prefixes(model).values()) == ["1", "2", "3", "4"]
+    assert level_prefix("Roof", 7) == "7"
+
+    t = Transaction(model, "Rename levels")
+    t.Start()
+    levels[0].Name, levels[1].Name, levels[3].Name = "B1", "Level 1", "Level 7"
+    t.Commit()
+    assert list(level_prefixes(model).values()) == ["1", "2", "3", "4"]
+
+    plan = plan_room_numbers(model, get_placed_rooms(model))
+    numbers = [number for _, number in plan]
+    assert len(set(numbers)) == len(numbers)
+
+
+def test_level_prefix_fallback_is_padded_to_one_width():
+    model = generate_model(200, levels=12, sheets=2)
+    levels = sorted(FilteredElementCollector(model).OfClass(Level), key=lambda l: l.Elevation)
+    t = Transaction(model, "Rename levels")
+    t.Start()
+    levels[1].Name = "Level 01"
+    t.Commit()
+    prefixes = list(level_prefixes(model).values())
+    assert prefixes[:2] == ["01", "02"] and prefixes[-1] == "12"
+
+    # '{level}{n}' would give '111' for room 11 on level 1 and room 1 on level 11 without the padding
+    plan = plan_room_numbers(model, get_placed_rooms(model), pattern="{level}{n}")
+    numbers = [number for _, number in plan]
+    assert len(set(numbers)) == len(numbers)
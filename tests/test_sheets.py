@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+import datetime
+
+import pytest
+
+from Autodesk.Revit.DB import *
+from Snippets._report import ImportReport, UPDATED, UNCHANGED
+from Snippets._sheets import (SHEET_EXPORT_HEADERS, EDITABLE_SHEET_COLUMNS, TEXT_EXPORT_COLUMNS,
+                              normalize_sheet_number, resolve_column_parameters, plan_sheet_parameter_changes,
+                              apply_param_changes, format_general_notes, read_general_notes, update_general_notes,
+                              sheet_export_row)
+
+
+def sheets(doc):
+    return sorted(FilteredElementCollector(doc).OfClass(ViewSheet).ToElements(), key=lambda s: s.SheetNumber)
+
+
+def excel_value2(value, text_format):
+    """What Value2 returns for a written string: General format parses numbers and ISO dates (as serials)."""
+    if text_format or not isinstance(value, str):
+        return value
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    try:
+        return float((datetime.datetime.strptime(value, "%Y-%m-%d") - datetime.datetime(1899, 12, 30)).days)
+    except ValueError:
+        return value
+
+
+def test_normalize_sheet_number():
+    assert normalize_sheet_number(101.0) == "101"
+    assert normalize_sheet_number(" A101 ") == "A101"
+    assert normalize_sheet_number("A1.0") == "A1.0"
+    assert normalize_sheet_number(u"1.0") == "1.0"
+
+
+def test_format_general_notes():
+    assert format_general_notes("1. Keep   dry. 2. Use\nboots.") == "1. Keep dry.\n2. Use boots."
+    assert format_general_notes("no numbers") == ""
+
+
+def test_plan_only_writes_changed_values(model):
+    all_sheets = sheets(model)
+    headers = ["Sheet Number", "Drawn By", "Checked By", "Sheet Name"]
+    column_indexes = {"Drawn By": 1, "Checked By": 2, "Sheet Name": 3}
+    definitions = resolve_column_parameters(all_sheets)
+
+    sheet = all_sheets[0]
+    row = [sheet.SheetNumber, "AP", "ZZ", "Renamed"]  # Drawn By is unchanged
+    changes, errors = plan_sheet_parameter_changes(sheet, row, column_indexes, definitions)
+    assert errors == []
+    assert sorted(header for header, _, _ in changes) == ["Checked By", "Sheet Name"]
+
+    t = Transaction(model, "Import")
+    t.Start()
+    assert apply_param_changes(changes) == []
+    t.Commit()
+    assert sheet.LookupParameter("Checked By").AsString() == "ZZ"
+    assert sheet.Name == "Renamed"
+    assert headers[0] == "Sheet Number"
+
+
+def test_read_and_update_general_notes(model):
+    sheet = sheets(model)[0]
+    assert read_general_notes(model, sheet).startswith("1. General note 1 for sheet A001\n2.")
+
+    report = ImportReport("Notes")
+    t = Transaction(model, "Import")
+    t.Start()
+    assert update_general_notes(model, sheet, sheet.SheetNumber, 2, "1. New first. 2. New second.", report)
+    assert not update_general_notes(model, sheet, sheet.SheetNumber, 3, "1. New first.  2. New second.", report)
+    t.Commit()
+
+    assert [r["status"] for r in report.records] == [UPDATED, UNCHANGED]
+    assert read_general_notes(model, sheet) == "1. New first.\n2. New second."
+
+
+def test_sheet_export_row(model):
+    sheet = sheets(model)[0]
+    row = sheet_export_row(model, sheet, {"Project ID": "P-1"})
+    assert len(row) == len(SHEET_EXPORT_HEADERS)
+    values = dict(zip(SHEET_EXPORT_HEADERS, row))
+    assert values["Sheet Number"] == values["Ser No"] == "A001"
+    assert values["Drawn By"] == "AP"
+    assert values["Project ID"] == "P-1"
+    assert values["Revision Descriptions"] == "Issued for Review\nIssued for Construction"
+    assert values["General Notes"].count("\n") == 2
+
+
+def test_export_then_import_changes_nothing(model):
+    all_sheets = sheets(model)
+    t = Transaction(model, "Codes")
+    t.Start()
+    for sheet in all_sheets:
+        sheet.LookupParameter("Sheet No._Project phase").Set("01")
+        sheet.LookupParameter("Sheet No._Stage").Set("00")
+        sheet.LookupParameter("Sheet Issue Date").Set("2024-02-01")
+    t.Commit()
+
+    column_indexes = dict((header, SHEET_EXPORT_HEADERS.index(header)) for header, _ in EDITABLE_SHEET_COLUMNS)
+    definitions = resolve_column_parameters(all_sheets)
+
+    def round_trip(text_columns):
+        report = ImportReport("Sheet Data Import")
+        for row_idx, sheet in enumerate(all_sheets, start=2):
+            exported = sheet_export_row(model, sheet)
+            row = [excel_value2(value, col in text_columns) for col, value in enumerate(exported, 1)]
+            assert normalize_sheet_number(row[0]) == sheet.SheetNumber
+            changes, errors = plan_sheet_parameter_changes(sheet, row, column_indexes, definitions)
+            assert errors == []
+            report.add(UPDATED if changes else UNCHANGED, row_idx, sheet.SheetNumber)
+        return [r["status"] for r in report.records]
+
+    assert UPDATED not in round_trip(TEXT_EXPORT_COLUMNS)
+    assert set(round_trip([])) == {UPDATED}  # General format would rewrite "01" as "1"
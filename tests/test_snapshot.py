@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+from Autodesk.Revit.DB import *
+from Snippets._overrides import build_override_settings
+from Snippets._snapshot import capture_view_overrides, diff_snapshots, restore_view_overrides, SnapshotStore
+from fakerevit import CALLS, reset_calls
+
+
+def set_overrides(doc, view, elements=(), categories=()):
+    """[(element id, settings)] and [(category id, settings)] in one Transaction."""
+    t = Transaction(doc, "Overrides")
+    t.Start()
+    for e_id, settings in elements:
+        view.SetElementOverrides(e_id, settings)
+    for cat_id, settings in categories:
+        view.SetCategoryOverrides(cat_id, settings)
+    t.Commit()
+
+
+def test_capture_diff_restore(model):
+    view = model.ActiveView
+    e0, e1, e2, e3, e4 = sorted(FilteredElementCollector(model, view.Id).WhereElementIsNotElementType()
+                                .ToElementIds(), key=lambda e_id: e_id.IntegerValue)[:5]
+    cat_id = next(cat.Id for cat in model.Settings.Categories if view.IsCategoryOverridable(cat.Id))
+    red, blue = build_override_settings((255, 0, 0)), build_override_settings((0, 0, 255))
+    reset = OverrideGraphicSettings()
+
+    set_overrides(model, view, [(e0, red), (e1, red), (e2, red), (e3, blue)], [(cat_id, red)])
+    before = capture_view_overrides(model, view, "Before")
+    assert len(before["palette"]) == 2  # Four elements and a category share two settings
+    assert [e_id for e_id, _ in before["elements"]] == [e.IntegerValue for e in (e0, e1, e2, e3)]
+    assert before["categories"] == [[cat_id.IntegerValue, before["elements"][0][1]]]
+
+    SnapshotStore(model, view).save("Before", before)
+    assert SnapshotStore(model, view).get("Before") == before
+
+    set_overrides(model, view, [(e0, blue), (e3, reset), (e4, red)], [(cat_id, reset)])
+    diff = diff_snapshots(before, capture_view_overrides(model, view))
+    assert diff["elements"] == {"added": [e4.IntegerValue], "removed": [e3.IntegerValue],
+                                "changed": [e0.IntegerValue]}
+    assert diff["categories"] == {"added": [], "removed": [cat_id.IntegerValue], "changed": []}
+
+    reset_calls()
+    t = Transaction(model, "Restore")
+    t.Start()
+    assert restore_view_overrides(model, view, SnapshotStore(model, view).get("Before")) == 4
+    t.Commit()
+    assert CALLS["View.SetElementOverrides"] == 3 and CALLS["View.SetCategoryOverrides"] == 1
+
+    after = capture_view_overrides(model, view, "Before")
+    assert diff_snapshots(before, after) == {key: {"added": [], "removed": [], "changed": []}
+                                             for key in ("elements", "categories")}
+    assert (after["palette"], after["elements"], after["categories"]) == \
+        (before["palette"], before["elements"], before["categories"])
+    assert view.GetElementOverrides(e0) == red and view.GetElementOverrides(e4) == reset
@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+import json
+
+import pytest
+
+from Autodesk.Revit.DB import *
+from Snippets import _trace
+from Snippets._trace import start_trace, get_tracer, span, count, traced, TRANSACTION, BUTTON
+from Snippets._overrides import StructuralWallClassifier, build_override_settings, apply_element_overrides
+from Snippets._runlog import RunLog
+
+
+@pytest.fixture(autouse=True)
+def disabled_afterwards():
+    yield
+    start_trace("tests", enabled=False)
+
+
+@traced()
+def double(x):
+    return x * 2
+
+
+def test_disabled_tracer_records_nothing():
+    tracer = start_trace("Off", enabled=False)
+    with span("outer") as s:
+        count("calls", 5)
+        assert double(2) == 4
+    assert s is _trace._NULL_SPAN
+    assert len(tracer.spans) == 0 and tracer.counters == {}
+    assert tracer.finish() is None
+
+
+def test_nested_spans_counters_and_chrome_trace(tmp_path):
+    tracer = start_trace("Button", enabled=True)
+    with span("Import", TRANSACTION, rows=3):
+        for i in range(3):
+            double(i)
+        count("Parameter.Set", 3)
+    with pytest.raises(ValueError):
+        with span("failing"):
+            raise ValueError("boom")
+
+    path = tracer.finish(path=str(tmp_path / "trace.json"))
+    events = json.load(open(path))["traceEvents"]
+    spans = [e for e in events if e["ph"] == "X"]
+    assert [e["name"] for e in spans] == ["double", "double", "double", "Import", "failing", "Button"]
+    by_name = dict((e["name"], e) for e in spans)
+    assert by_name["Import"]["cat"] == TRANSACTION and by_name["Import"]["args"] == {"rows": 3}
+    assert by_name["failing"]["args"] == {"error": "ValueError"}
+    assert by_name["Button"]["cat"] == BUTTON
+    # Children lie inside their parent
+    outer, inner = by_name["Import"], spans[0]
+    assert outer["ts"] <= inner["ts"] and inner["ts"] + inner["dur"] <= outer["ts"] + outer["dur"]
+    assert [e for e in events if e["ph"] == "C"][0]["args"] == {"Parameter.Set": 3}
+
+    summary = dict((row[0], row) for row in tracer.summary())
+    assert summary["double"][2] == 3
+
+
+def test_ring_buffer_keeps_newest_spans():
+    tracer = start_trace("Ring", enabled=True, capacity=5)
+    for i in range(8):
+        with span("s{}".format(i)):
+            pass
+    assert [s[0] for s in tracer.spans] == ["s3", "s4", "s5", "s6", "s7"]
+    assert tracer.dropped == 3
+
+
+def test_snippets_report_spans_and_api_counts(model):
+    tracer = start_trace("Graphic Overrides", enabled=True)
+    t = Transaction(model, "Overrides")
+    t.Start()
+    overridden = apply_element_overrides(model, model.ActiveView, build_override_settings(),
+                                         StructuralWallClassifier(model), RunLog(model))
+    t.Commit()
+    names = [s[0] for s in get_tracer().spans]
+    assert "apply_element_overrides" in names and "collect_target_elements" in names
+    assert tracer.counters["View.SetElementOverrides"] == len(overridden)